@@ -0,0 +1,45 @@
+"""Add attorney_dashboards read model
+
+Revision ID: add_attorney_dashboards
+Revises: add_trigram_search_indexes
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_attorney_dashboards'
+down_revision: Union[str, Sequence[str], None] = 'add_trigram_search_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Сводки заполняются лениво при первом открытии дашборда
+    op.create_table(
+        'attorney_dashboards',
+        sa.Column('attorney_id', sa.Integer(), nullable=False),
+        sa.Column('summary', postgresql.JSONB(), nullable=True),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column(
+            'refreshed_version', sa.Integer(), nullable=False, server_default='0'
+        ),
+        sa.Column('valid_until', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['attorney_id'], ['attorneys.id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('attorney_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('attorney_dashboards')
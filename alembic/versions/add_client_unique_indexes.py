@@ -0,0 +1,46 @@
+"""Make client email/phone/personal_info unique per attorney
+
+Revision ID: add_client_unique_indexes
+Revises: add_composite_query_indexes
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_client_unique_indexes'
+down_revision: Union[str, Sequence[str], None] = 'add_composite_query_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CLIENT_UNIQUE_FIELDS = ('email', 'phone', 'personal_info')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Миграция упадет, если у юриста уже есть дубликаты - их нужно
+    # разобрать вручную до обновления
+    for field in CLIENT_UNIQUE_FIELDS:
+        name = f'ix_clients_owner_attorney_id_{field}'
+        op.drop_index(name, table_name='clients')
+        op.create_index(
+            name,
+            'clients',
+            ['owner_attorney_id', field],
+            unique=True,
+            postgresql_where=sa.text(f"{field} <> ''"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for field in CLIENT_UNIQUE_FIELDS:
+        name = f'ix_clients_owner_attorney_id_{field}'
+        op.drop_index(name, table_name='clients')
+        op.create_index(name, 'clients', ['owner_attorney_id', field], unique=False)
@@ -0,0 +1,100 @@
+"""Add composite and partial indexes for hot query shapes
+
+Revision ID: add_composite_query_indexes
+Revises: add_attorney_dashboards
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_composite_query_indexes'
+down_revision: Union[str, Sequence[str], None] = 'add_attorney_dashboards'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (таблица, колонка владельца) - индекс ix_<table>_<column>_created_at
+# на (column, created_at, id) для выборок «новые первыми» и keyset-пагинации
+KEYSET_INDEXES = (
+    ('cases', 'attorney_id'),
+    ('clients', 'owner_attorney_id'),
+    ('contacts', 'attorney_id'),
+    ('contacts', 'case_id'),
+    ('documents', 'case_id'),
+    ('documents', 'attorney_id'),
+    ('events', 'attorney_id'),
+    ('events', 'case_id'),
+    ('client_payments', 'attorney_id'),
+)
+
+# (имя, таблица, колонки)
+COMPOSITE_INDEXES = (
+    ('ix_events_attorney_id_event_date', 'events', ['attorney_id', 'event_date']),
+    ('ix_clients_owner_attorney_id_email', 'clients', ['owner_attorney_id', 'email']),
+    ('ix_clients_owner_attorney_id_phone', 'clients', ['owner_attorney_id', 'phone']),
+    (
+        'ix_clients_owner_attorney_id_personal_info',
+        'clients',
+        ['owner_attorney_id', 'personal_info'],
+    ),
+)
+
+# (имя, колонка, статус) - частичные индексы очереди outbox
+OUTBOX_INDEXES = (
+    ('ix_outbox_pending_created_at', 'created_at', 'pending'),
+    ('ix_outbox_processing_locked_until', 'locked_until', 'processing'),
+)
+
+# Одноколоночные индексы, которые стали префиксом составных
+SUPERSEDED_INDEXES = (
+    ('ix_cases_attorney_id', 'cases', 'attorney_id'),
+    ('ix_clients_owner_attorney_id', 'clients', 'owner_attorney_id'),
+    ('ix_contacts_attorney_id', 'contacts', 'attorney_id'),
+    ('ix_contacts_case_id', 'contacts', 'case_id'),
+    ('ix_documents_case_id', 'documents', 'case_id'),
+    ('ix_documents_attorney_id', 'documents', 'attorney_id'),
+    ('ix_events_attorney_id', 'events', 'attorney_id'),
+    ('ix_events_case_id', 'events', 'case_id'),
+    ('ix_client_payments_attorney_id', 'client_payments', 'attorney_id'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in KEYSET_INDEXES:
+        op.create_index(
+            f'ix_{table}_{column}_created_at',
+            table,
+            [column, 'created_at', 'id'],
+            unique=False,
+        )
+    for name, table, columns in COMPOSITE_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    for name, column, status in OUTBOX_INDEXES:
+        op.create_index(
+            name,
+            'outbox',
+            [column],
+            unique=False,
+            postgresql_where=sa.text(f"status = '{status}'"),
+        )
+    for name, table, _ in SUPERSEDED_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, column in SUPERSEDED_INDEXES:
+        op.create_index(name, table, [column], unique=False)
+    for name, _, _ in OUTBOX_INDEXES:
+        op.drop_index(name, table_name='outbox')
+    for name, table, _ in COMPOSITE_INDEXES:
+        op.drop_index(name, table_name=table)
+    for table, column in KEYSET_INDEXES:
+        op.drop_index(f'ix_{table}_{column}_created_at', table_name=table)
@@ -0,0 +1,67 @@
+"""Add content-addressed document_blobs
+
+Revision ID: add_document_blobs
+Revises: add_payment_pdf_status
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_document_blobs'
+down_revision: Union[str, Sequence[str], None] = 'add_payment_pdf_status'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'document_blobs',
+        sa.Column('sha256', sa.String(length=64), nullable=False),
+        sa.Column('storage_path', sa.String(length=1000), nullable=False),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column(
+            'created_at',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('sha256'),
+    )
+    # Старые документы остаются со своими файлами (content_hash = NULL)
+    op.add_column(
+        'documents', sa.Column('content_hash', sa.String(length=64), nullable=True)
+    )
+    op.create_index(
+        op.f('ix_documents_content_hash'), 'documents', ['content_hash'], unique=False
+    )
+    op.create_foreign_key(
+        'fk_documents_content_hash_document_blobs',
+        'documents',
+        'document_blobs',
+        ['content_hash'],
+        ['sha256'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        'fk_documents_content_hash_document_blobs', 'documents', type_='foreignkey'
+    )
+    op.drop_index(op.f('ix_documents_content_hash'), table_name='documents')
+    op.drop_column('documents', 'content_hash')
+    op.drop_table('document_blobs')
@@ -0,0 +1,47 @@
+"""Add full-text search vector to documents
+
+Revision ID: add_document_search
+Revises: add_document_blobs
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_document_search'
+down_revision: Union[str, Sequence[str], None] = 'add_document_blobs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'documents', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True)
+    )
+    op.add_column(
+        'documents',
+        sa.Column('text_indexed_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        'ix_documents_search_vector',
+        'documents',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+    # Уже загруженные документы индексируются скриптом
+    # scripts/index_documents.py (ставит события в Outbox)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_documents_search_vector', table_name='documents')
+    op.drop_column('documents', 'text_indexed_at')
+    op.drop_column('documents', 'search_vector')
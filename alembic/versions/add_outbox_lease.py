@@ -0,0 +1,32 @@
+"""Add outbox lease column
+
+Revision ID: add_outbox_lease
+Revises: cf91bc83320c
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_outbox_lease'
+down_revision: Union[str, Sequence[str], None] = 'cf91bc83320c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'outbox',
+        sa.Column('locked_until', sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('outbox', 'locked_until')
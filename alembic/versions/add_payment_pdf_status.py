@@ -0,0 +1,37 @@
+"""Add pdf_status to client_payments
+
+Revision ID: add_payment_pdf_status
+Revises: add_outbox_lease
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_payment_pdf_status'
+down_revision: Union[str, Sequence[str], None] = 'add_outbox_lease'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Существующие платежи считаем готовыми: их PDF генерировался синхронно,
+    # а отсутствующий файл пересоздаётся при скачивании
+    op.add_column(
+        'client_payments',
+        sa.Column(
+            'pdf_status', sa.String(length=20), nullable=False, server_default='ready'
+        ),
+    )
+    op.alter_column('client_payments', 'pdf_status', server_default='pending')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('client_payments', 'pdf_status')
@@ -0,0 +1,51 @@
+"""Add pg_trgm indexes for fuzzy search
+
+Revision ID: add_trigram_search_indexes
+Revises: add_document_search
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_trigram_search_indexes'
+down_revision: Union[str, Sequence[str], None] = 'add_document_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (таблица, колонка) - для каждой GIN индекс триграмм ix_<table>_<column>_trgm
+TRGM_COLUMNS = (
+    ('clients', 'name'),
+    ('clients', 'phone'),
+    ('clients', 'email'),
+    ('cases', 'name'),
+    ('cases', 'description'),
+    ('contacts', 'name'),
+    ('contacts', 'phone'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, column in TRGM_COLUMNS:
+        op.create_index(
+            f'ix_{table}_{column}_trgm',
+            table,
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in TRGM_COLUMNS:
+        op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
+    # Расширение не удаляем: им могут пользоваться другие объекты БД
@@ -3,6 +3,7 @@ from typing import Optional
 from datetime import datetime
 
 from backend.domain.entities.auxiliary import CaseStatus
+from backend.core.pagination import DEFAULT_PAGE_LIMIT
 
 
 # ====== COMMANDS (write операции) ======
@@ -41,9 +42,9 @@ class GetCaseByIdQuery:
 @dataclass
 class GetCasesForAttorneyQuery:
     attorney_id: int
-    # если потом добавить пагинацию/фильтры:
-    # page: int = 1
-    # page_size: int = 20
+    # keyset-пагинация
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: Optional[str] = None
 
 
 @dataclass
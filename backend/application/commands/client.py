@@ -3,6 +3,7 @@ from typing import Optional
 from datetime import datetime
 
 from backend.domain.entities.auxiliary import Messenger
+from backend.core.pagination import DEFAULT_PAGE_LIMIT
 
 # ====== COMMANDS (write операции) ======
 
@@ -52,6 +53,6 @@ class GetClientByIdQuery:
 @dataclass
 class GetClientsForAttorneyQuery:
     owner_attorney_id: int
-    # если потом добавить пагинацию/фильтры:
-    # page: int = 1
-    # page_size: int = 20
+    # keyset-пагинация
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: Optional[str] = None
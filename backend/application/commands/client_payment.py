@@ -3,6 +3,7 @@ from typing import Optional
 from datetime import datetime, date
 
 from backend.domain.entities.auxiliary import PaymentStatus
+from backend.core.pagination import DEFAULT_PAGE_LIMIT
 
 
 # ====== COMMANDS (write операции) ======
@@ -50,6 +51,8 @@ class GetСlientPaymentByIdQuery:
 @dataclass
 class GetСlientPaymentForAttorneyQuery:
     attorney_id: int
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: Optional[str] = None
 
 
 @dataclass
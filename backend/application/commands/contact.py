@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
+from backend.core.pagination import DEFAULT_PAGE_LIMIT
+
 
 @dataclass
 class CreateContactCommand:
@@ -38,3 +40,5 @@ class GetContactByIdQuery:
 @dataclass
 class GetContactsForAttorneyQuery:
     attorney_id: int
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: Optional[str] = None
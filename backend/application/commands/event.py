@@ -4,6 +4,7 @@ from datetime import datetime
 from backend.domain.entities.auxiliary import EventType
 
 from backend.domain.entities.auxiliary import CaseStatus
+from backend.core.pagination import DEFAULT_PAGE_LIMIT
 
 # ====== COMMANDS (write операции) ======
 
@@ -45,8 +46,12 @@ class DeleteEventCommand:
 @dataclass
 class GetEventsForAttorneyQuery:
     attorney_id: int
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: Optional[str] = None
 
 
 @dataclass
 class GetEventsForCaseQuery:
     case_id: int
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: Optional[str] = None
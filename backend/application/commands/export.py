@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+# ====== QUERIES (read операции) ======
+
+
+@dataclass
+class ExportAttorneyDataQuery:
+    '''Запрос на полную выгрузку данных юриста (NDJSON).'''
+
+    attorney_id: int  # из JWT
+    compress: bool = False  # gzip поверх NDJSON
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+# ====== QUERIES (read операции) ======
+
+
+@dataclass
+class GlobalSearchQuery:
+    '''Запрос нечеткого поиска по клиентам, делам и контактам юриста.'''
+
+    attorney_id: int  # из JWT
+    query: str
+    limit: int
+    offset: int = 0
@@ -1,7 +1,7 @@
 from backend.domain.entities.auxiliary import CaseStatus
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, SecretStr
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -131,15 +131,34 @@ class CaseListItemDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class DashboardEventItem(BaseModel):
+    '''Предстоящее событие в сводке дашборда'''
+
+    id: int
+    name: str
+    event_type: str
+    event_date: datetime
+    case_id: int
+
+
+class DashboardDocumentItem(BaseModel):
+    '''Недавно загруженный документ в сводке дашборда'''
+
+    id: int
+    file_name: str
+    case_id: Optional[int] = None
+    created_at: datetime
+
+
 class DashboardResponse(BaseModel):
-    '''DTO для данных дашборда'''
-
-    case_name: str
-    client_name: str
-    client_phone: str
-    contact_name: str
-    contact_phone: str
-    event_name: str | None
-    pending_payments_count: int
+    '''DTO сводки дашборда юриста'''
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    cases_total: int
+    cases_by_status: Dict[str, int]
+    upcoming_events: List[DashboardEventItem]
+    pending_payments_count: int
+    pending_payments_total: float
+    overdue_payments_count: int
+    overdue_payments_total: float
+    recent_documents: List[DashboardDocumentItem]
+    refreshed_at: datetime
@@ -4,7 +4,7 @@ from typing import Optional, Union
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, SecretStr, field_validator
 
 
-from backend.domain.entities.auxiliary import PaymentStatus
+from backend.domain.entities.auxiliary import PaymentStatus, PdfStatus
 
 
 class PaymentClientCreateRequest(BaseModel):
@@ -163,6 +163,7 @@ class PaymentClientResponse(BaseModel):
     status: PaymentStatus
     taxable: bool = False
     condition: Optional[str] = None
+    pdf_status: PdfStatus = PdfStatus.pending
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -194,5 +195,9 @@ class FullPaymentResponse(BaseModel):
     pdf_path: Optional[str] = Field(
         None, description='Путь к сгенерированному PDF документу'
     )
+    pdf_status: PdfStatus = Field(
+        PdfStatus.pending,
+        description='Готовность PDF: pending - генерируется в фоне, ready - готов',
+    )
 
     model_config = ConfigDict(from_attributes=True)
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
@@ -44,11 +45,32 @@ class DocumentListResponse(BaseModel):
     '''DTO для списка документов'''
 
     documents: list[DocumentResponse] = Field(..., description='Список документов')
-    total: int = Field(..., description='Общее количество документов')
+    total: int = Field(..., description='Количество документов на странице')
+    next_cursor: Optional[str] = Field(
+        None, description='Курсор следующей страницы, null если это последняя'
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class DocumentSearchResult(DocumentResponse):
+    '''DTO найденного документа'''
+
+    rank: float = Field(..., description='Релевантность (ts_rank_cd)')
+
+
+class DocumentSearchResponse(BaseModel):
+    '''DTO результатов полнотекстового поиска по документам'''
+
+    documents: list[DocumentSearchResult] = Field(
+        ..., description='Документы по убыванию релевантности'
+    )
+    total: int = Field(..., description='Количество документов на странице')
+    next_offset: Optional[int] = Field(
+        None, description='Смещение следующей страницы, null если это последняя'
+    )
+
+
 # Для внутреннего использования (старое DTO)
 class CreateDocumentDTO(BaseModel):
     '''Внутренний DTO для создания документа (используется в валидаторах)'''
@@ -59,3 +81,13 @@ class CreateDocumentDTO(BaseModel):
     case_id: int
     description: str = ''
     mime_type: Optional[str] = None
+
+
+@dataclass
+class DocumentFile:
+    '''Описание файла документа для потоковой отдачи (без содержимого)'''
+
+    file_name: str
+    mime_type: str
+    storage_path: str
+    file_size: int
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class PageResponse(BaseModel, Generic[T]):
+    '''DTO страницы списка с курсором на следующую страницу (keyset-пагинация)'''
+
+    items: List[T] = Field(..., description='Элементы текущей страницы')
+    next_cursor: Optional[str] = Field(
+        None,
+        description='Курсор следующей страницы (передаётся в ?cursor=), '
+        'null если это последняя страница',
+    )
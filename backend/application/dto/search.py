@@ -0,0 +1,26 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Literal, Optional
+
+
+class SearchResult(BaseModel):
+    '''DTO найденной сущности'''
+
+    type: Literal['client', 'case', 'contact'] = Field(..., description='Тип сущности')
+    id: int = Field(..., description='ID сущности')
+    title: str = Field(..., description='Имя клиента/контакта или название дела')
+    subtitle: Optional[str] = Field(None, description='Телефон или описание дела')
+    score: float = Field(..., description='Похожесть на запрос (0..1)')
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SearchResponse(BaseModel):
+    '''DTO результатов общего поиска'''
+
+    results: list[SearchResult] = Field(
+        ..., description='Найденные сущности по убыванию похожести'
+    )
+    total: int = Field(..., description='Количество результатов на странице')
+    next_offset: Optional[int] = Field(
+        None, description='Смещение следующей страницы, null если это последняя'
+    )
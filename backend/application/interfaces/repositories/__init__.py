@@ -2,16 +2,24 @@ from .attorney_repo import IAttorneyRepository
 from .case_repo import ICaseRepository
 from .client_repo import IClientRepository
 from .contact_repo import IContactRepository
+from .dashboard_repo import IDashboardRepository
 from .document_repo import IDocumentMetadataRepository
+from .document_blob_repo import IDocumentBlobRepository
 from .event_repo import IEventRepository
+from .export_repo import IExportRepository
 from .local_storage import IFileStorage
+from .search_repo import ISearchRepository
 
 __all__ = [
     'IAttorneyRepository',
     'ICaseRepository',
     'IClientRepository',
     'IContactRepository',
+    'IDashboardRepository',
     'IDocumentMetadataRepository',
+    'IDocumentBlobRepository',
     'IEventRepository',
+    'IExportRepository',
     'IFileStorage',
+    'ISearchRepository',
 ]
@@ -8,6 +8,11 @@ from backend.domain.entities.attorney import Attorney
 class IAttorneyRepository(IBaseRepository[Attorney]):
     '''Специфичный интерфейс для Attorney'''
 
+    @abstractmethod
+    async def get_cached(self, id: int) -> Optional['Attorney']:
+        '''Получить юриста через кэш (без hashed_password).'''
+        ...
+
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional['Attorney']: ...
 
@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import Sequence, List, Dict, Any
+from typing import Optional, Sequence, List, Dict, Any
 
 from backend.application.interfaces.repositories.base_repo import IBaseRepository
+from backend.core.pagination import Page
 from backend.domain.entities.case import Case
 
 # Seauence - упорядоченная коллекция элементов, к которым можно обращаться по индексу
@@ -17,4 +18,6 @@ class ICaseRepository(IBaseRepository['Case']):
     async def get_all_for_attorney(self, attorney_id: int) -> Sequence['Case']: ...
 
     @abstractmethod
-    async def get_dashboard_data(self, attorney_id: int) -> List[Dict[str, Any]]: ...
+    async def get_page_for_attorney_with_relations(
+        self, attorney_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page[Any]: ...
@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import Sequence
+from typing import Dict, Optional, Sequence
 
 from backend.application.interfaces.repositories.base_repo import IBaseRepository
+from backend.core.pagination import Page
 from backend.domain.entities.client import Client
 
 # Seauence - упорядоченная коллекция элементов, к которым можно обращаться по индексу
@@ -15,3 +16,28 @@ class IClientRepository(IBaseRepository['Client']):
 
     @abstractmethod
     async def get_all_for_attorney(self, attorney_id: int) -> Sequence['Client']: ...
+
+    @abstractmethod
+    async def get_page_for_attorney(
+        self, attorney_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['Client']: ...
+
+    @abstractmethod
+    async def find_conflicts(
+        self,
+        owner_id: int,
+        values: Dict[str, str],
+        exclude_id: Optional[int] = None,
+    ) -> Dict[str, int]:
+        '''
+        Найти клиентов юриста, у которых совпадает любое из уникальных полей.
+
+        Args:
+            owner_id: ID юриста-владельца
+            values: Поле (email, phone, personal_info) -> проверяемое значение
+            exclude_id: ID клиента, которого не учитывать (при обновлении)
+
+        Returns:
+            Поле -> ID клиента, у которого такое значение уже есть
+        '''
+        ...
@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import Sequence
+from typing import Optional, Sequence
 
 from backend.application.interfaces.repositories.base_repo import IBaseRepository
+from backend.core.pagination import Page
 from backend.domain.entities.contact import Contact
 
 
@@ -12,3 +13,8 @@ class IContactRepository(IBaseRepository['Contact']):
 
     @abstractmethod
     async def get_all_for_case(self, id: int) -> Sequence['Contact']: ...
+
+    @abstractmethod
+    async def get_page_for_attorney(
+        self, attorney_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['Contact']: ...
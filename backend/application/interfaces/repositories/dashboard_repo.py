@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class IDashboardRepository(ABC):
+    '''Готовые сводки дашборда юристов (read model)'''
+
+    @abstractmethod
+    async def get_fresh(self, attorney_id: int) -> Optional[Dict[str, Any]]:
+        '''
+        Вернуть сводку одним чтением по первичному ключу.
+
+        Returns:
+            Сводка или None, если ее нет или она устарела
+        '''
+        ...
+
+    @abstractmethod
+    async def refresh(self, attorney_id: int) -> Dict[str, Any]:
+        '''Пересчитать сводку юриста, сохранить и вернуть ее.'''
+        ...
+
+    @abstractmethod
+    async def mark_stale(self, attorney_id: int) -> None:
+        '''Пометить сводку устаревшей (данные юриста изменились).'''
+        ...
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class IDocumentBlobRepository(ABC):
+    '''Учет ссылок на файлы контентно-адресуемого хранилища документов'''
+
+    @abstractmethod
+    async def acquire(self, sha256: str, storage_path: str, size: int) -> int:
+        '''
+        Добавить ссылку на файл (создав запись, если файла еще нет).
+
+        Returns:
+            Число ссылок после добавления (1 - файл новый)
+        '''
+        ...
+
+    @abstractmethod
+    async def release(self, sha256: str) -> int:
+        '''
+        Убрать ссылку на файл. Запись с нулем ссылок остается до purge().
+
+        Returns:
+            Число оставшихся ссылок (0 - файл больше никому не нужен)
+        '''
+        ...
+
+    @abstractmethod
+    async def purge(self, sha256: str) -> Optional[str]:
+        '''
+        Удалить запись о файле, если ссылок на него по-прежнему нет.
+
+        Вызывается отдельной транзакцией после commit удаления документов.
+        Строка блокируется до конца транзакции: файл нужно удалить с диска
+        до ее commit, тогда параллельная загрузка того же файла запишет его
+        заново.
+
+        Returns:
+            Путь файла, который можно удалить, или None
+        '''
+        ...
@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import Sequence
+from typing import List, Optional, Sequence, Tuple
 
 from backend.application.interfaces.repositories.base_repo import IBaseRepository
+from backend.core.pagination import Page
 from backend.domain.entities.document import Document
 
 
@@ -12,3 +13,47 @@ class IDocumentMetadataRepository(IBaseRepository['Document']):
 
     @abstractmethod
     async def get_all_for_case(self, id: int) -> Sequence['Document']: ...
+
+    @abstractmethod
+    async def get_page_for_case(
+        self, case_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['Document']: ...
+
+    @abstractmethod
+    async def needs_text_index(self, id: int) -> bool:
+        '''Документ новый или изменился после последней индексации текста.'''
+        ...
+
+    @abstractmethod
+    async def get_ids_for_text_index(self, limit: int, after_id: int = 0) -> List[int]:
+        '''ID документов (больше after_id), которым нужна индексация текста.'''
+        ...
+
+    @abstractmethod
+    async def set_search_text(self, id: int, text: str, config: str) -> None:
+        '''Построить поисковый вектор из имени, описания и текста файла.'''
+        ...
+
+    @abstractmethod
+    async def delete_for_case(self, case_id: int) -> List[Tuple[Optional[str], str]]:
+        '''
+        Удалить документы дела и снять их ссылки на файлы.
+
+        Returns:
+            (content_hash, storage_path) файлов, оставшихся без ссылок
+        '''
+        ...
+
+    @abstractmethod
+    async def delete_for_attorney(
+        self, attorney_id: int
+    ) -> List[Tuple[Optional[str], str]]:
+        '''Удалить документы юриста и снять их ссылки на файлы (как delete_for_case).'''
+        ...
+
+    @abstractmethod
+    async def search(
+        self, attorney_id: int, query: str, config: str, limit: int, offset: int = 0
+    ) -> List[Tuple['Document', float]]:
+        '''Полнотекстовый поиск по документам юриста: (документ, ранг).'''
+        ...
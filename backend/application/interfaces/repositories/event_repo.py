@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import Sequence
+from typing import Optional, Sequence
 
 from backend.application.interfaces.repositories.base_repo import IBaseRepository
+from backend.core.pagination import Page
 from backend.domain.entities.event import Event
 
 # Seauence - упорядоченная коллекция элементов, к которым можно обращаться по индексу
@@ -19,6 +20,16 @@ class IEventRepository(IBaseRepository['Event']):
     @abstractmethod
     async def get_all_for_attorney(self, attorney_id: int) -> Sequence['Event']: ...
 
+    @abstractmethod
+    async def get_page_for_case(
+        self, case_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['Event']: ...
+
+    @abstractmethod
+    async def get_page_for_attorney(
+        self, attorney_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['Event']: ...
+
     @abstractmethod
     async def get_nearest_for_attorney(
         self, attorney_id: int, count: int
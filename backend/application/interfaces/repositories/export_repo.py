@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict
+
+# Разделы выгрузки в том порядке, в котором они попадают в файл
+EXPORT_SECTIONS = (
+    'clients',
+    'cases',
+    'contacts',
+    'events',
+    'payments',
+    'documents',
+)
+
+
+class IExportRepository(ABC):
+    '''Интерфейс потоковой выгрузки данных юриста (без материализации списков).'''
+
+    @abstractmethod
+    def stream_for_attorney(
+        self, section: str, attorney_id: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        '''
+        Построчно отдать записи раздела, принадлежащие юристу.
+
+        Args:
+            section: Один из EXPORT_SECTIONS
+            attorney_id: ID юриста-владельца
+
+        Yields:
+            Dict[str, Any]: Колонки строки таблицы
+        '''
+        ...
@@ -1,8 +1,24 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Optional
 import os
 
 
+# Размер чанка потокового чтения по умолчанию
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    '''Результат потоковой записи файла в хранилище'''
+
+    path: str  # Относительный путь в хранилище
+    size: int  # Размер в байтах
+    sha256: str  # Хеш содержимого (hex)
+    head: bytes  # Первые байты файла - для определения MIME типа
+
+
 # Интерфейс для работы с файлами (можешь менять реализацию!)
 class IFileStorage(ABC):
     '''Абстракция для хранения файлов. Не важно где - на диске или в облаке'''
@@ -12,6 +28,53 @@ class IFileStorage(ABC):
         '''Сохранить файл и вернуть путь/ID'''
         pass
 
+    @abstractmethod
+    async def save_stream(
+        self,
+        file_path: str,
+        chunks: AsyncIterable[bytes],
+        max_size: Optional[int] = None,
+    ) -> StoredFile:
+        '''
+        Сохранить файл из потока чанков (память не зависит от размера файла).
+
+        Файл появляется по file_path только целиком: при ошибке или
+        превышении max_size частично записанные данные удаляются.
+
+        Raises:
+            ValidationException: Файл пуст или больше max_size
+        '''
+        pass
+
+    @abstractmethod
+    async def stage_stream(
+        self, chunks: AsyncIterable[bytes], max_size: Optional[int] = None
+    ) -> StoredFile:
+        '''
+        Записать поток во временный файл хранилища.
+
+        Итоговый путь зависит от содержимого (хеша), поэтому файл сначала
+        пишется во временное место; StoredFile.path указывает на него.
+        Дальше файл переносится через promote() или удаляется delete_file().
+
+        Raises:
+            ValidationException: Файл пуст или больше max_size
+        '''
+        pass
+
+    @abstractmethod
+    async def promote(self, staged_path: str, file_path: str) -> bool:
+        '''
+        Атомарно перенести временный файл в file_path.
+
+        Если file_path уже существует (тот же контент), временный файл
+        удаляется без записи.
+
+        Returns:
+            True - файл записан, False - уже был в хранилище
+        '''
+        pass
+
     @abstractmethod
     async def get_file(self, file_path: str) -> bytes:
         '''Получить содержимое файла'''
@@ -21,3 +84,32 @@ class IFileStorage(ABC):
     async def delete_file(self, file_path: str) -> bool:
         '''Удалить файл'''
         pass
+
+    @abstractmethod
+    async def get_size(self, file_path: str) -> int:
+        '''Размер файла в байтах'''
+        pass
+
+    @abstractmethod
+    def iter_chunks(
+        self,
+        file_path: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        '''
+        Читать файл чанками (память не зависит от размера файла).
+
+        Args:
+            start: Первый байт (включительно)
+            end: Последний байт (включительно), None - до конца файла
+        '''
+        pass
+
+    def local_path(self, file_path: str) -> Optional[Path]:
+        '''
+        Путь в локальной ФС, если хранилище может отдать файл напрямую
+        (FileResponse/sendfile). Облачные хранилища возвращают None.
+        '''
+        return None
@@ -31,6 +31,35 @@ class IOutboxRepository:
         """
         ...
 
+    @abstractmethod
+    async def claim_pending_events(
+        self, limit: int = 10, lease_seconds: int = 60, max_retries: int = 3
+    ) -> Sequence[Any]:
+        """
+        Атомарно забрать события в обработку (FOR UPDATE SKIP LOCKED).
+
+        Args:
+            limit: Максимальное количество событий
+            lease_seconds: Время аренды; по истечении событие снова доступно
+            max_retries: Лимит попыток; повторный захват по истекшей аренде
+                тоже считается попыткой
+
+        Returns:
+            Список событий, переведенных в PROCESSING, и событий, переведенных
+            в FAILED из-за исчерпания лимита попыток
+        """
+        ...
+
+    @abstractmethod
+    async def extend_lease(self, event_id: int, lease_seconds: int = 60) -> bool:
+        """
+        Продлить аренду обрабатываемого события.
+
+        Returns:
+            False, если событие уже не в PROCESSING
+        """
+        ...
+
     @abstractmethod
     async def mark_as_processing(self, event_id: int) -> None:
         """Пометить событие как обрабатываемое."""
@@ -1,7 +1,9 @@
 from abc import abstractmethod
-from typing import Sequence
+from typing import Optional, Sequence
 
 from backend.application.interfaces.repositories.base_repo import IBaseRepository
+from backend.core.pagination import Page
+from backend.domain.entities.auxiliary import PdfStatus
 from backend.domain.entities.client_payment import ClientPayment
 
 
@@ -12,3 +14,11 @@ class IPaymentRepository(IBaseRepository['ClientPayment']):
     async def get_all_for_attorney(
         self, attorney_id: int
     ) -> Sequence['ClientPayment']: ...
+
+    @abstractmethod
+    async def get_page_for_attorney(
+        self, attorney_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['ClientPayment']: ...
+
+    @abstractmethod
+    async def set_pdf_status(self, payment_id: int, status: PdfStatus) -> None: ...
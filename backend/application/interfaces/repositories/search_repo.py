@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Типы сущностей в результатах общего поиска
+SEARCH_ENTITY_TYPES = ('client', 'case', 'contact')
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    '''Найденная сущность (клиент, дело или контакт)'''
+
+    type: str  # Один из SEARCH_ENTITY_TYPES
+    id: int
+    title: str  # Имя клиента/контакта или название дела
+    subtitle: Optional[str]  # Телефон или описание дела
+    score: float  # Похожесть (0..1), по ней сортируется выдача
+
+
+class ISearchRepository(ABC):
+    '''Интерфейс нечеткого поиска по клиентам, делам и контактам юриста.'''
+
+    @abstractmethod
+    async def search(
+        self, attorney_id: int, query: str, limit: int, offset: int = 0
+    ) -> List[SearchHit]:
+        '''
+        Найти сущности юриста, похожие на query, по убыванию похожести.
+
+        Args:
+            attorney_id: ID юриста-владельца
+            query: Строка поиска (часть имени, телефона, email...)
+        '''
+        ...
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from backend.application.interfaces.repositories.attorney_repo import (
     IAttorneyRepository,
 )
@@ -8,6 +10,7 @@ from backend.application.commands.attorney import (
 )
 
 from backend.core.exceptions import ValidationException, EntityNotFoundException
+from backend.domain.entities.attorney import Attorney
 from backend.core.logger import logger
 
 
@@ -52,14 +55,22 @@ class AttorneyPolicy:
         # 5. Валидировать email формат
         self._validate_email(cmd.email)
 
-    async def on_update(self, attorney_id: int, cmd: UpdateAttorneyCommand) -> None:
+    async def on_update(
+        self,
+        attorney_id: int,
+        cmd: UpdateAttorneyCommand,
+        attorney: Optional['Attorney'] = None,
+    ) -> None:
         '''
         Валидация при обновлении:
         - Юрист существует
         - Новый license_id (если изменяется) не занят
+
+        attorney - юрист, уже загруженный сценарием: повторно из БД не читается.
         '''
         # 1. Проверить существование юриста
-        attorney = await self.repo.get(attorney_id)
+        if attorney is None:
+            attorney = await self.repo.get(attorney_id)
         if not attorney:
             raise EntityNotFoundException(f'Адвокат с ID {attorney_id} не найден')
 
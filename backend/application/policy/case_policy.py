@@ -1,3 +1,5 @@
+from typing import Optional
+
 from backend.application.interfaces.repositories.attorney_repo import (
     IAttorneyRepository,
 )
@@ -9,6 +11,7 @@ from backend.application.commands.case import (
     DeleteCaseCommand,
 )
 from backend.core.exceptions import ValidationException, EntityNotFoundException
+from backend.domain.entities.case import Case
 from backend.core.logger import logger
 
 
@@ -25,7 +28,7 @@ class CasePolicy:
 
     async def _check_attorney_exists(self, attorney_id: int) -> None:
         '''Проверить, существует ли адвокат и активен ли он.'''
-        attorney = await self.attorney_repo.get(attorney_id)
+        attorney = await self.attorney_repo.get_cached(attorney_id)
         if not attorney:
             logger.warning(f'Юрист {attorney_id} не найден')
             raise EntityNotFoundException(f'Юрист не найден')
@@ -56,9 +59,17 @@ class CasePolicy:
         # 3. Проверка юриста
         await self._check_attorney_exists(cmd.attorney_id)
 
-    async def on_update(self, cmd: UpdateCaseCommand) -> None:
+    async def on_update(
+        self, cmd: UpdateCaseCommand, case: Optional['Case'] = None
+    ) -> None:
+        '''
+        Валидировать данные при обновлении дела.
+
+        case - дело, уже загруженное сценарием: повторно из БД не читается.
+        '''
         # 1. Проверить, что дело существует
-        case = await self.case_repo.get(cmd.case_id)
+        if case is None:
+            case = await self.case_repo.get(cmd.case_id)
         if not case:
             logger.warning(f'Дело не найдено: ID = {cmd.case_id}')
             raise EntityNotFoundException(f'Дело не найдено')
@@ -1,3 +1,5 @@
+from typing import Dict, Optional
+
 from backend.application.interfaces.repositories.attorney_repo import (
     IAttorneyRepository,
 )
@@ -27,7 +29,7 @@ class ClientPolicy:
     # ТУТ МОЖНО БУДЕТ ПОЗЖЕ ДОБАВИТЬ НОВУЮ ЛОГИКУ!!!
     async def _check_attorney_exists(self, attorney_id: int) -> None:
         '''Проверить, существует ли адвокат и активен ли он.'''
-        attorney = await self.attorney_repo.get(attorney_id)
+        attorney = await self.attorney_repo.get_cached(attorney_id)
         if not attorney:
             logger.warning(f'Юрист {attorney_id} не найден')
             raise EntityNotFoundException(f'Юрист с ID {attorney_id} не найден')
@@ -40,36 +42,34 @@ class ClientPolicy:
             logger.warning(f'Юрист не верифицирован: ID={attorney_id}')
             raise ValidationException('Attorney account is not verified')
 
-    async def _check_unique_field(
+    async def _check_unique_fields(
         self,
-        field_value: str,
-        field_name: str,
         owner_attorney_id: int,
-        client_id: int = None,
+        values: Dict[str, Optional[str]],
+        client_id: Optional[int] = None,
     ) -> None:
-        '''Проверка уникальности поля для клиента (email, phone, personal_info)'''
-        if field_name == 'email':
-            existing = await self.client_repo.get_by_email_for_owner(
-                field_value, owner_attorney_id
-            )
-        elif field_name == 'phone':
-            existing = await self.client_repo.get_by_phone_for_owner(
-                field_value, owner_attorney_id
-            )
-        elif field_name == 'personal_info':
-            existing = await self.client_repo.get_by_personal_info_for_owner(
-                field_value, owner_attorney_id
-            )
-        else:
-            raise ValidationException(f'Unknown field {field_name}')
+        '''
+        Проверка уникальности полей клиента (email, phone, personal_info)
+        одним запросом. Сообщает обо всех занятых полях сразу.
+        '''
+        conflicts = await self.client_repo.find_conflicts(
+            owner_attorney_id, values, exclude_id=client_id
+        )
+        if not conflicts:
+            return
 
-        if existing and (client_id is None or existing.id != client_id):
+        for field_name, existing_id in conflicts.items():
             logger.warning(
-                f'{field_name.capitalize()} {field_value} уже используется клиентом ID={existing.id} у юриста {owner_attorney_id}'
+                f'{field_name.capitalize()} {values[field_name]} уже используется '
+                f'клиентом ID={existing_id} у юриста {owner_attorney_id}'
             )
-            raise ValidationException(
-                f'{field_name.capitalize()} {field_value} уже используется другим клиентом этого юриста'
+        raise ValidationException(
+            '; '.join(
+                f'{field_name.capitalize()} {values[field_name]} уже используется '
+                f'другим клиентом этого юриста'
+                for field_name in conflicts
             )
+        )
 
     async def on_create(self, cmd: CreateClientCommand) -> None:
         '''Валидировать данные при создании клиента.'''
@@ -78,15 +78,23 @@ class ClientPolicy:
         await self._check_attorney_exists(cmd.owner_attorney_id)
 
         # 2. Уникальность
-        if cmd.email:
-            await self._check_unique_field(cmd.email, 'email', cmd.owner_attorney_id)
-        if cmd.phone:
-            await self._check_unique_field(cmd.phone, 'phone', cmd.owner_attorney_id)
-        if cmd.personal_info:
-            await self._check_unique_field(
-                cmd.personal_info, 'personal_info', cmd.owner_attorney_id
-            )
+        await self._check_unique_fields(
+            cmd.owner_attorney_id,
+            {
+                'email': cmd.email,
+                'phone': cmd.phone,
+                'personal_info': cmd.personal_info,
+            },
+        )
 
     async def on_update(self, cmd: UpdateClientCommand) -> None:
         '''Валидировать при обновлении (проверить уникальность)'''
-        pass
+        await self._check_unique_fields(
+            cmd.owner_attorney_id,
+            {
+                'email': cmd.email,
+                'phone': cmd.phone,
+                'personal_info': cmd.personal_info,
+            },
+            client_id=cmd.client_id,
+        )
@@ -36,7 +36,7 @@ class DocumentValidator:
 
         # Юрист должен существовать (если указан)
         if dto.attorney_id:
-            attorney = await self.attorney_repo.get(dto.attorney_id)
+            attorney = await self.attorney_repo.get_cached(dto.attorney_id)
             if not attorney:
                 logger.warning(f'Юрист {dto.attorney_id} не найден')
                 raise EntityNotFoundException(f'Юрист с ID {dto.attorney_id} не найден')
@@ -34,7 +34,7 @@ class EventValidator:
             raise EntityNotFoundException(f'Дело с ID {dto.case_id} не найдено')
 
         # Юрист должен существовать
-        attorney = await self.attorney_repo.get(dto.attorney_id)
+        attorney = await self.attorney_repo.get_cached(dto.attorney_id)
         if not attorney:
             logger.warning(f'Юрист {dto.attorney_id} не найден')
             raise EntityNotFoundException(f'Юрист с ID {dto.attorney_id} не найден')
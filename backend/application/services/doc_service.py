@@ -1,11 +1,15 @@
 from backend.application.interfaces.repositories.document_repo import (
     IDocumentMetadataRepository,
 )
+from backend.application.interfaces.repositories.document_blob_repo import (
+    IDocumentBlobRepository,
+)
 from backend.application.interfaces.repositories.local_storage import IFileStorage
+from backend.application.dto.document import DocumentFile
 from backend.infrastructure.tools.file_metadata import FileMetadataExtractor
+from backend.infrastructure.tools.uow import AsyncUnitOfWork
 from backend.core.logger import logger
-import uuid
-from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, List, Optional, Tuple
 
 
 class DocumentService:
@@ -15,11 +19,18 @@ class DocumentService:
     '''
 
     def __init__(
-        self, document_repo: IDocumentMetadataRepository, file_storage: IFileStorage
+        self,
+        document_repo: IDocumentMetadataRepository,
+        file_storage: IFileStorage,
+        blob_repo: IDocumentBlobRepository,
     ):
         self.document_repo = document_repo
         self.file_storage = file_storage
+        self.blob_repo = blob_repo
         self.metadata_extractor = FileMetadataExtractor()
+        # Файлы, оставшиеся без ссылок: (content_hash, storage_path).
+        # Удаляются с диска только purge_released() после commit
+        self._released: List[Tuple[Optional[str], str]] = []
 
     async def upload_document(
         self,
@@ -30,40 +41,69 @@ class DocumentService:
         description: str = '',
     ) -> 'Document':
         '''
-        Загружает документ в систему.
+        Загружает документ, содержимое которого уже в памяти.
+
+        Обертка над upload_document_stream для небольших файлов.
+        '''
+
+        async def single_chunk() -> AsyncIterator[bytes]:
+            yield file_content
+
+        return await self.upload_document_stream(
+            case_id=case_id,
+            attorney_id=attorney_id,
+            file_name=file_name,
+            chunks=single_chunk(),
+            description=description,
+        )
+
+    async def upload_document_stream(
+        self,
+        case_id: int,
+        attorney_id: int,
+        file_name: str,
+        chunks: AsyncIterable[bytes],
+        description: str = '',
+        max_size: Optional[int] = None,
+    ) -> 'Document':
+        '''
+        Загружает документ в систему из потока чанков.
+
+        Файлы хранятся по SHA-256 содержимого (blobs/ab/cd/<sha256>):
+        одинаковый файл, прикрепленный к разным делам, лежит на диске один раз,
+        а document_blobs считает ссылки на него. В памяти держится один чанк.
 
         Args:
             case_id: ID дела, к которому прикрепляется документ
             attorney_id: ID юриста, владельца документа
             file_name: Оригинальное имя файла
-            file_content: Содержимое файла в байтах
+            chunks: Содержимое файла чанками
             description: Описание документа
+            max_size: Максимальный размер файла в байтах
 
         Returns:
             Сохраненный объект Document
         '''
+        # 1. Пишем поток во временный файл (размер, SHA-256, первые байты)
+        staged = await self.file_storage.stage_stream(chunks, max_size)
+        storage_path = self.blob_path(staged.sha256)
+        mime_type = self.metadata_extractor.get_mime_type(staged.head, file_name)
+        written = False
+
         try:
-            # 1. Извлекаем метаданные файла
-            metadata = self.metadata_extractor.extract_all_metadata(
-                file_content, file_name
-            )
-            mime_type = metadata['mime_type']
-            file_size = metadata['file_size']
-
-            # 2. Генерируем уникальное имя файла для хранения
-            # Это предотвращает коллизии имен и обеспечивает безопасность
-            file_extension = Path(file_name).suffix
-            unique_file_name = f'{uuid.uuid4()}{file_extension}'
-            storage_path = f'cases/{case_id}/{unique_file_name}'
-
-            # 3. Сохраняем файл в хранилище
-            saved_path = await self.file_storage.save_file(
-                file_path=storage_path, file_content=file_content
+            # 2. Ссылка на файл. Строка blob блокируется до конца транзакции:
+            # purge_released() параллельного удаления либо уже удалил файл,
+            # либо увидит нашу ссылку и файл оставит - проверка ниже корректна
+            ref_count = await self.blob_repo.acquire(
+                staged.sha256, storage_path, staged.size
             )
 
+            # 3. Переносим файл на место; дубликат просто отбрасываем
+            written = await self.file_storage.promote(staged.path, storage_path)
             logger.info(
-                f'Файл сохранен: {saved_path}, '
-                f'MIME: {mime_type}, Размер: {file_size} байт'
+                f'Файл сохранен: {storage_path}, MIME: {mime_type}, '
+                f'Размер: {staged.size} байт, ссылок: {ref_count}'
+                + ('' if written else ' (дубликат, запись пропущена)')
             )
 
             # 4. Создаем доменную сущность документа
@@ -71,26 +111,41 @@ class DocumentService:
 
             document = Document.create(
                 file_name=file_name,  # Оригинальное имя для пользователя
-                storage_path=saved_path,
-                file_size=file_size,
+                storage_path=storage_path,
+                file_size=str(staged.size),
                 case_id=case_id,
                 attorney_id=attorney_id,
                 description=description,
                 mime_type=mime_type,
+                content_hash=staged.sha256,
             )
 
             # 5. Сохраняем метаданные в БД
             saved_document = await self.document_repo.save(document)
 
-            logger.info(f'Документ создан: ID={saved_document.id}, Файл={file_name}')
-            return saved_document
-
         except Exception as e:
-            logger.error(f'Ошибка при загрузке документа: {e}')
-            # Если файл был сохранен, но ошибка при сохранении в БД,
-            # можно добавить логику удаления файла
+            logger.error(f'Ошибка при сохранении документа {file_name}: {e}')
+            # Транзакция откатится: убираем временный файл и только что
+            # записанный blob (на существующий ссылаются другие документы)
+            await self._delete_quietly(staged.path)
+            if written:
+                await self._delete_quietly(storage_path)
             raise
 
+        logger.info(f'Документ создан: ID={saved_document.id}, Файл={file_name}')
+        return saved_document
+
+    @staticmethod
+    def blob_path(sha256: str) -> str:
+        '''Путь файла в контентно-адресуемом хранилище'''
+        return f'blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}'
+
+    async def _delete_quietly(self, file_path: str) -> None:
+        try:
+            await self.file_storage.delete_file(file_path)
+        except Exception as e:
+            logger.warning(f'Не удалось удалить файл {file_path}: {e}')
+
     async def get_document_file(self, document_id: int) -> tuple[bytes, str, str]:
         '''
         Получает содержимое файла документа.
@@ -117,34 +172,121 @@ class DocumentService:
             document.mime_type or 'application/octet-stream',
         )
 
-    async def delete_document(self, document_id: int) -> bool:
+    async def get_document_file_info(self, document_id: int) -> DocumentFile:
         '''
-        Удаляет документ (файл и метаданные).
+        Получает описание файла документа для потоковой отдачи.
+
+        Содержимое не читается: его отдает роутер чанками из хранилища.
 
         Args:
             document_id: ID документа
 
         Returns:
-            True если удаление прошло успешно
+            DocumentFile (имя, MIME тип, путь в хранилище, размер)
         '''
-        # 1. Получаем метаданные для получения пути к файлу
+        # 1. Получаем метаданные документа из БД
         document = await self.document_repo.get(document_id)
         if not document:
             from backend.core.exceptions import EntityNotFoundException
 
             raise EntityNotFoundException(f'Документ с ID {document_id} не найден')
 
-        # 2. Удаляем файл из хранилища
-        try:
-            await self.file_storage.delete_file(document.storage_path)
-        except Exception as e:
-            logger.warning(
-                f'Ошибка при удалении файла {document.storage_path}: {e}. '
-                'Продолжаем удаление метаданных.'
-            )
+        # 2. Актуальный размер берем из хранилища (заодно проверяем наличие файла)
+        file_size = await self.file_storage.get_size(document.storage_path)
 
-        # 3. Удаляем метаданные из БД
+        return DocumentFile(
+            file_name=document.file_name,
+            mime_type=document.mime_type or 'application/octet-stream',
+            storage_path=document.storage_path,
+            file_size=file_size,
+        )
+
+    async def delete_document(
+        self, document_id: int, document: Optional['Document'] = None
+    ) -> bool:
+        '''
+        Удаляет метаданные документа и снимает ссылку на его файл.
+
+        Args:
+            document_id: ID документа
+            document: Уже загруженные метаданные (тогда повторно не читаются)
+
+        Returns:
+            True если удаление прошло успешно
+        '''
+        # 1. Получаем метаданные для получения пути к файлу
+        if document is None:
+            document = await self.document_repo.get(document_id)
+        if not document:
+            from backend.core.exceptions import EntityNotFoundException
+
+            raise EntityNotFoundException(f'Документ с ID {document_id} не найден')
+
+        # 2. Удаляем метаданные из БД
         await self.document_repo.delete(document_id)
 
+        # 3. Снимаем ссылку на файл (документы до дедупликации владеют своим
+        # файлом единолично). Сам файл - только purge_released() после commit:
+        # при откате документ должен остаться с файлом
+        remaining = 0
+        if document.content_hash:
+            remaining = await self.blob_repo.release(document.content_hash)
+
+        if remaining > 0:
+            logger.info(f'Файл {document.storage_path} оставлен: ссылок - {remaining}')
+        else:
+            self._released.append((document.content_hash, document.storage_path))
+
         logger.info(f'Документ удален: ID={document_id}')
         return True
+
+    async def delete_case_documents(self, case_id: int) -> None:
+        '''Удаляет документы дела; файлы - через purge_released() после commit.'''
+        self._released += await self.document_repo.delete_for_case(case_id)
+
+    async def delete_attorney_documents(self, attorney_id: int) -> None:
+        '''Удаляет документы юриста; файлы - через purge_released() после commit.'''
+        self._released += await self.document_repo.delete_for_attorney(attorney_id)
+
+    async def purge_released(self) -> int:
+        '''
+        Удаляет с диска файлы, оставшиеся без ссылок после удаления документов.
+
+        Вызывается после commit удаления, в новой транзакции, которую затем
+        нужно зафиксировать. purge() блокирует строку document_blobs и
+        проверяет, что ссылок по-прежнему нет: параллельная загрузка того же
+        файла либо уже добавила ссылку (файл остается), либо ждет блокировку
+        и после commit запишет файл заново.
+
+        Returns:
+            Количество удаленных файлов
+        '''
+        released, self._released = self._released, []
+        deleted = 0
+        for content_hash, storage_path in released:
+            if content_hash:
+                storage_path = await self.blob_repo.purge(content_hash)
+                if storage_path is None:
+                    continue
+            # Удаляем, пока строка заблокирована
+            await self._delete_quietly(storage_path)
+            deleted += 1
+        return deleted
+
+
+async def purge_released_files(
+    uow: AsyncUnitOfWork, doc_service: DocumentService
+) -> None:
+    '''
+    Удаляет файлы, освобожденные doc_service, в новой транзакции uow.
+
+    Вызывается после commit удаления. Ошибка только логируется: документы
+    уже удалены, а строка с нулем ссылок останется и будет переиспользована
+    следующей загрузкой того же файла.
+    '''
+    try:
+        await doc_service.purge_released()
+        await uow.commit()
+    except Exception as e:
+        logger.warning(f'Не удалось удалить освобожденные файлы: {e}')
+        await uow.rollback()
@@ -1,4 +1,5 @@
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
+from typing import Optional
 
 from backend.application.usecases.payment_detail import (
     CreatePaymentDetailUseCase,
@@ -63,9 +64,9 @@ from backend.application.dto.client_payment import (
     PaymentClientResponse,
 )
 
-from backend.infrastructure.pdf.pdf_generator import PDFGenerator
 from backend.application.interfaces.repositories.local_storage import IFileStorage
 from backend.core.settings import settings
+from backend.core.pagination import DEFAULT_PAGE_LIMIT
 
 from backend.core.logger import logger
 
@@ -124,43 +125,8 @@ class PaymentService:
             create_client_payment_cmd
         )
 
-        # Генерация PDF документа
-        pdf_path = None
-        try:
-            # Получаем entity объекты для генерации PDF
-            async with self.uow_factory.create() as uow:
-                # Получаем entity объекты
-                payment_entity = await uow.payment_repo.get(payment_data.id)
-                payment_detail_entity = await uow.payment_detail_repo.get_for_attorney(
-                    attorney_id
-                )
-
-                if payment_entity and payment_detail_entity:
-                    # Создаем генератор PDF
-                    pdf_generator = PDFGenerator()
-
-                    # Генерируем PDF
-                    pdf_bytes = pdf_generator.fill_invoice_template(
-                        payment=payment_entity, payment_detail=payment_detail_entity
-                    )
-
-                    # Сохраняем PDF в файловую систему
-                    pdf_file_path = (
-                        f'payments/{payment_data.id}/invoice_{payment_data.id}.pdf'
-                    )
-                    pdf_path = await self.file_storage.save_file(
-                        file_path=pdf_file_path, file_content=pdf_bytes
-                    )
-
-                    logger.info(f'PDF документ успешно сохранен: {pdf_path}')
-                else:
-                    logger.warning(
-                        f'Не удалось получить entity объекты для генерации PDF. Payment ID: {payment_data.id}'
-                    )
-        except Exception as e:
-            # Логируем ошибку, но не прерываем создание платежа
-            logger.error(f'Ошибка при генерации PDF документа: {e}')
-            pdf_path = None
+        # PDF документ генерируется воркером Outbox по событию PAYMENT_CREATED,
+        # готовность - в pdf_status (см. download_payment_pdf)
 
         full_payment_data = {
             'payment_id': payment_data.id,
@@ -182,7 +148,8 @@ class PaymentService:
             'corr_account': attorney_payment_data.correspondent_account,
             'bik': attorney_payment_data.bik,
             'bank_recipient': attorney_payment_data.bank_recipient,
-            'pdf_path': pdf_path,
+            'pdf_path': None,
+            'pdf_status': payment_data.pdf_status,
         }
         return full_payment_data
 
@@ -191,9 +158,16 @@ class PaymentService:
         result = await self.get_client_payment_use_case.execute(get_payment_cmd)
         return result
 
-    async def get_all_payments_for_attorney(self, attorney_id: int):
+    async def get_all_payments_for_attorney(
+        self,
+        attorney_id: int,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+    ):
         get_all_payments_for_attorney_cmd = GetСlientPaymentForAttorneyQuery(
             attorney_id=attorney_id,
+            limit=limit,
+            cursor=cursor,
         )
         result = await self.get_all_payments_for_attorney_use_case.execute(
             get_all_payments_for_attorney_cmd,
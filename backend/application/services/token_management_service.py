@@ -1,8 +1,11 @@
 from backend.core.settings import settings
 from backend.infrastructure.redis.client import redis_client
 from backend.infrastructure.redis.keys import RedisKeys
+from backend.infrastructure.redis.revocation import revocation_registry
+from backend.infrastructure.redis.sliding_window import SlidingWindowRateLimiter
 from backend.core.logger import logger
 from backend.core.exceptions import ValidationException
+from backend.core.token_cache import token_hash
 
 
 class TokenManagementService:
@@ -12,8 +15,8 @@ class TokenManagementService:
     ⚠️ Этот Service используется в РАЗНЫХ UseCase'ах:
     - SignInUseCase → save_refresh_token()
     - SignOutUseCase → revoke_token()
-    - Middleware → is_token_revoked()
-    - SignInUseCase → record_failed_attempt()
+    - get_current_attorney_id → is_token_revoked()
+    - SignInUseCase → record_failed_attempt(), complete_sign_in()
     '''
 
     # ========== REFRESH TOKEN ==========
@@ -59,36 +62,46 @@ class TokenManagementService:
         Добавить access token в чёрный список.
 
         Используется в: SignOutUseCase (для дополнительной безопасности)
+
+        Отзыв рассылается всем процессам через pub/sub (RevocationRegistry).
         '''
         ttl = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-        await redis_client.set(
-            RedisKeys.token_blacklist(token),
-            '1',  # Redis не может хранить boolean! сохраняем как Строку
-            ttl=ttl,
-        )
+        await revocation_registry.revoke(token_hash(token), ttl)
         logger.debug(f'Access token добавлен в чёрный список')
 
     async def is_token_revoked(self, token: str) -> bool:
         '''
         Проверить, в чёрном ли списке токен.
 
-        Используется в: Middleware для проверки валидности токена
+        Используется в: get_current_attorney_id (каждый защищенный запрос)
+
+        Обычно проверка идет по локальному bloom-фильтру без обращения
+        к Redis; EXISTS - только при совпадении в фильтре.
         '''
-        return await redis_client.exists(RedisKeys.token_blacklist(token))
+        return await revocation_registry.is_revoked(token_hash(token))
 
     # ========== RATE LIMITING ==========
 
+    # Неудачные входы: MAX_LOGIN_ATTEMPTS-я неудача за окно уже блокирует,
+    # поэтому без блокировки в окне помещается на одну попытку меньше
+    login_limiter = SlidingWindowRateLimiter(
+        'login',
+        limit=settings.MAX_LOGIN_ATTEMPTS - 1,
+        window_seconds=settings.LOGIN_ATTEMPTS_WINDOW_MINUTES * 60,
+        lockout_seconds=settings.LOCKOUT_DURATION_MINUTES * 60,
+    )
+
     async def check_rate_limit(self, email: str) -> None:
         '''
         Проверить, не заблокирован ли адвокат по rate limit.
 
-        Используется в: SignInUseCase
+        Используется в: SignInUseCase (до проверки пароля - заблокированный
+        перебор не нагружает пул хеширования)
 
         Raises:
             ValidationException: Если заблокирован
         '''
-        lockout_key = RedisKeys.login_lockout(email)
-        if await redis_client.exists(lockout_key):
+        if await self.login_limiter.locked_for(email):
             raise ValidationException(
                 f'Слишком много попыток входа. '
                 f'Попробуйте позже ({settings.LOCKOUT_DURATION_MINUTES} минут)'
@@ -101,30 +114,17 @@ class TokenManagementService:
 
         Используется в: SignInUseCase (при ошибке пароля)
 
-        Logic:
-        1. Инкрементировать счётчик попыток
-        2. Если первая попытка - установить TTL (15 минут)
-        3. Если превышен лимит - заблокировать
+        Счетчик, TTL окна, проверка порога и блокировка - один Lua-скрипт
+        (SlidingWindowRateLimiter), то есть один round trip без гонок.
 
         Raises:
             ValidationException: Если превышен лимит попыток
         '''
-        attempts_key = RedisKeys.login_attempts(email)
-        attempts = await redis_client.increment(attempts_key, amount=1)
-
-        # Если первая попытка - установить TTL (15 минут)
-        if attempts == 1:
-            await redis_client.expire(attempts_key, 900)
-
-        # Если превышено максимум - заблокировать
-        if attempts >= settings.MAX_LOGIN_ATTEMPTS:
-            await redis_client.set(
-                RedisKeys.login_lockout(email),
-                '1',  # Redis не может хранить boolean! сохраняем как Строку
-                ttl=settings.LOCKOUT_DURATION_MINUTES * 60,
-            )
+        result = await self.login_limiter.hit(email)
+        if not result.allowed:
             logger.warning(
-                f'Адвокат заблокирован по rate limit: {email} ' f'({attempts} попыток)'
+                f'Адвокат заблокирован по rate limit: {email} '
+                f'(повтор через {result.retry_after:.0f} с)'
             )
             raise ValidationException(
                 f'Учетная запись заблокирована на '
@@ -133,9 +133,28 @@ class TokenManagementService:
 
     async def clear_failed_attempts(self, email: str) -> None:
         '''
-        Очистить счётчик попыток при успешном входе.
+        Очистить счётчик попыток входа.
 
-        Используется в: SignInUseCase (при успехе)
+        При успешном входе счетчик очищается в complete_sign_in().
         '''
-        await redis_client.delete(RedisKeys.login_attempts(email))
+        await self.login_limiter.reset(email)
         logger.debug(f'Счётчик попыток очищен для {email}')
+
+    async def complete_sign_in(
+        self, attorney_id: int, refresh_token: str, email: str
+    ) -> None:
+        '''
+        Сохранить refresh token и очистить счетчик попыток одним pipeline.
+
+        Используется в: SignInUseCase (при успехе)
+        '''
+        ttl = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
+        async with redis_client.pipeline() as pipe:
+            pipe.setex(
+                RedisKeys.refresh_token(attorney_id),
+                ttl,
+                redis_client.codec.encode(refresh_token),
+            )
+            pipe.delete(RedisKeys.rate_limit(self.login_limiter.name, email))
+            await pipe.execute()
+        logger.debug(f'Refresh token сохранён для юриста {attorney_id}')
@@ -30,7 +30,7 @@ class ChangePasswordUseCase:
                     )
 
                 # 2. Проверить текущий пароль
-                if not SecurityService.verify_password(
+                if not await SecurityService.verify_password(
                     cmd.old_password, attorney.hashed_password
                 ):
                     raise ValidationException('Текущий пароль неправильный')
@@ -46,7 +46,7 @@ class ChangePasswordUseCase:
                     )
 
                 # 5. Захешировать и сохранить
-                attorney.hashed_password = SecurityService.hash_password(
+                attorney.hashed_password = await SecurityService.hash_password(
                     cmd.new_password
                 )
                 await uow.attorney_repo.update(attorney)
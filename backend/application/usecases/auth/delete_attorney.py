@@ -1,13 +1,19 @@
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.core.security import SecurityService
+from backend.application.services.doc_service import (
+    DocumentService,
+    purge_released_files,
+)
+from backend.application.interfaces.repositories.local_storage import IFileStorage
 from backend.application.commands.attorney import DeleteAttorneyAccountCommand
 from backend.core.exceptions import ValidationException, EntityNotFoundException
 from backend.core.logger import logger
 
 
 class DeleteAttorneyAccountUseCase:
-    def __init__(self, uow_factory: UnitOfWorkFactory):
+    def __init__(self, uow_factory: UnitOfWorkFactory, file_storage: IFileStorage):
         self.uow_factory = uow_factory
+        self.file_storage = file_storage
 
     async def execute(self, cmd: DeleteAttorneyAccountCommand) -> dict:
         '''
@@ -16,7 +22,8 @@ class DeleteAttorneyAccountUseCase:
         Flow:
         1. Получить юриста
         2. Проверить пароль (подтверждение)
-        3. Удалить адвоката (каскадное удаление через БД)
+        3. Удалить документы и адвоката (каскадное удаление через БД)
+        4. Удалить файлы, оставшиеся без ссылок
         '''
         async with self.uow_factory.create() as uow:
             try:
@@ -28,18 +35,28 @@ class DeleteAttorneyAccountUseCase:
                     )
 
                 # 2. Проверить пароль
-                if not SecurityService.verify_password(
+                if not await SecurityService.verify_password(
                     cmd.password, attorney.hashed_password
                 ):
                     raise ValidationException('Пароль неправильный')
 
                 # 3. Удалить
+                doc_service = DocumentService(
+                    document_repo=uow.doc_meta_repo,
+                    file_storage=self.file_storage,
+                    blob_repo=uow.blob_repo,
+                )
+                await doc_service.delete_attorney_documents(cmd.attorney_id)
                 await uow.attorney_repo.delete(cmd.attorney_id)
+                await uow.commit()
 
             except (ValidationException, EntityNotFoundException) as e:
                 logger.error(f'Ошибка при удалении аккаунта: {e}')
                 raise
 
+            # 4. Файлы без ссылок - в новой транзакции после commit
+            await purge_released_files(uow, doc_service)
+
         logger.warning(f'Учетная запись адвоката удалена: ID {cmd.attorney_id}')
 
         return {'message': 'Учетная запись успешно удалена'}
@@ -42,7 +42,7 @@ class ResetPasswordUseCase:
                     raise ValidationException('Некорректный email')
 
                 # 3. Захешировать пароль
-                hashed_password = SecurityService.hash_password(cmd.new_password)
+                hashed_password = await SecurityService.hash_password(cmd.new_password)
 
                 attorney.hashed_password = hashed_password
 
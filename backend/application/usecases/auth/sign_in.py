@@ -48,7 +48,7 @@ class SignInUseCase:
                 raise ValidationException('Некорректный email или пароль')
 
             # 3. Проверить пароль
-            if not SecurityService.verify_password(
+            if not await SecurityService.verify_password(
                 cmd.password, attorney.hashed_password
             ):
                 # Записать попытку
@@ -66,11 +66,10 @@ class SignInUseCase:
         access_token = SecurityService.create_access_token(str(attorney.id))
         refresh_token = SecurityService.create_refresh_token(str(attorney.id))
 
-        # 6. Сохранить refresh token в Redis
-        await self.token_service.save_refresh_token(attorney.id, refresh_token)
-
-        # 7. Очистить счётчик попыток при успешном входе
-        await self.token_service.clear_failed_attempts(cmd.email)
+        # 6. Сохранить refresh token и очистить счётчик попыток (один pipeline)
+        await self.token_service.complete_sign_in(
+            attorney.id, refresh_token, cmd.email
+        )
 
         logger.info(f'Адвокат успешно вошел: {cmd.email} (ID: {attorney.id})')
 
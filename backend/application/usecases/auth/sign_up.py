@@ -32,7 +32,7 @@ class SignUpUseCase:
                 await policy.on_register(cmd)
 
                 # 2. Захешировать пароль
-                hashed_password = SecurityService.hash_password(cmd.password)
+                hashed_password = await SecurityService.hash_password(cmd.password)
 
                 # 3. Создать Entity
                 attorney = Attorney.create(
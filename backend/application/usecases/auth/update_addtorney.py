@@ -15,23 +15,23 @@ class UpdateAttorneyUseCase:
         Обновить профиль адвоката (PATCH).
 
         Flow:
-        1. Валидировать через Policy
+        1. Получить юриста и валидировать через Policy
         2. Обновить только переданные поля
         3. Сохранить в БД
         '''
         async with self.uow_factory.create() as uow:
             try:
-                # 1. Валидировать
-                policy = AttorneyPolicy(uow.attorney_repo)
-                await policy.on_update(cmd.attorney_id, cmd)
-
-                # 2. Получить юриста
+                # 1. Получить юриста
                 attorney = await uow.attorney_repo.get(cmd.attorney_id)
                 if not attorney:
                     raise EntityNotFoundException(
                         f'Адвокат с ID {cmd.attorney_id} не найден'
                     )
 
+                # 2. Валидировать (юрист уже загружен - повторно не читается)
+                policy = AttorneyPolicy(uow.attorney_repo)
+                await policy.on_update(cmd.attorney_id, cmd, attorney)
+
                 # 3. Обновить только переданные поля через доменный метод
                 attorney.update(cmd)
 
@@ -1,12 +1,17 @@
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
-from backend.application.policy.case_policy import CasePolicy
 from backend.application.commands.case import DeleteCaseCommand
+from backend.application.services.doc_service import (
+    DocumentService,
+    purge_released_files,
+)
+from backend.application.interfaces.repositories.local_storage import IFileStorage
 from backend.core.logger import logger
 
 
 class DeleteCaseUseCase:
-    def __init__(self, uow_factory: UnitOfWorkFactory):
+    def __init__(self, uow_factory: UnitOfWorkFactory, file_storage: IFileStorage):
         self.uow_factory = uow_factory
+        self.file_storage = file_storage
 
     async def execute(
         self,
@@ -14,20 +19,26 @@ class DeleteCaseUseCase:
     ) -> bool:
         async with self.uow_factory.create() as uow:
             try:
-                # 1. Валидация (проверка уникальности, существования адвоката)
-                validator = CasePolicy(
-                    attorney_repo=uow.attorney_repo,
-                    client_repo=uow.client_repo,
-                    case_repo=uow.case_repo,
+                doc_service = DocumentService(
+                    document_repo=uow.doc_meta_repo,
+                    file_storage=self.file_storage,
+                    blob_repo=uow.blob_repo,
                 )
-                await validator.on_delete(cmd)
 
-                # 3. Удалить дело
-                await uow.case_repo.delete(cmd.case_id)
+                # 1. Удалить документы дела со ссылками на их файлы
+                await doc_service.delete_case_documents(cmd.case_id)
 
-                logger.info(f'Дело с ID {cmd.case_id} удалено.')
-                return True
+                # 2. Удалить дело (если его нет - репозиторий
+                # выбросит EntityNotFoundException)
+                await uow.case_repo.delete(cmd.case_id)
+                await uow.commit()
 
             except Exception as e:
                 logger.error(f'Ошибка при удалении дела: {e}')
                 raise e
+
+            # 3. Файлы без ссылок - в новой транзакции после commit
+            await purge_released_files(uow, doc_service)
+
+            logger.info(f'Дело с ID {cmd.case_id} удалено.')
+            return True
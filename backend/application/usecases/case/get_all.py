@@ -1,10 +1,9 @@
 from backend.application.dto.case import CaseResponse
+from backend.application.dto.pagination import PageResponse
 from backend.application.commands.case import GetCasesForAttorneyQuery
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.core.logger import logger
 
-from typing import List
-
 
 class GetlAllCasesUseCase:
     '''Сценарий: юрист получает все дела.'''
@@ -15,28 +14,30 @@ class GetlAllCasesUseCase:
     async def execute(
         self,
         cmd: GetCasesForAttorneyQuery,
-    ) -> List['CaseResponse']:
+    ) -> PageResponse['CaseResponse']:
         async with self.uow_factory.create() as uow:
             try:
-                # 1. Получаем ORM объекты с загруженными связями
-                orm_cases = await uow.case_repo.get_all_for_attorney_with_relations(
-                    cmd.attorney_id
+                # 1. Получаем страницу ORM объектов с загруженными связями
+                page = await uow.case_repo.get_page_for_attorney_with_relations(
+                    cmd.attorney_id, limit=cmd.limit, cursor=cmd.cursor
                 )
-                if not orm_cases:
+                if not page.items:
                     logger.info(f'Нет дел для юриста с ID {cmd.attorney_id}')
-                    return []
+                    return PageResponse[CaseResponse](items=[], next_cursor=None)
 
-                # 3. Маппим каждый ORM объект в DTO
+                # 2. Маппим каждый ORM объект в DTO
                 # Pydantic автоматически обработает вложенные client и contacts
                 case_responses = [
-                    CaseResponse.model_validate(orm_case) for orm_case in orm_cases
+                    CaseResponse.model_validate(orm_case) for orm_case in page.items
                 ]
 
                 logger.info(
                     f'Получено {len(case_responses)} дел для юриста {cmd.attorney_id}'
                 )
 
-                return case_responses
+                return PageResponse[CaseResponse](
+                    items=case_responses, next_cursor=page.next_cursor
+                )
 
             except Exception as e:
                 logger.error(
@@ -3,39 +3,30 @@ from backend.application.commands.case import GetDashboardQuery
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.core.logger import logger
 
-from typing import List
-
 
 class GetDashboardUseCase:
-    '''Сценарий: получение данных дашборда для адвоката.'''
+    '''
+    Сценарий: получение сводки дашборда для адвоката.
+
+    Сводка хранится готовой (attorney_dashboards) и читается по ключу;
+    пересчитывается только после изменения данных юриста или когда
+    наступило ближайшее событие / срок оплаты.
+    '''
 
     def __init__(self, uow_factory: UnitOfWorkFactory):
         self.uow_factory = uow_factory
 
-    async def execute(
-        self,
-        cmd: GetDashboardQuery,
-    ) -> List['DashboardResponse']:
+    async def execute(self, cmd: GetDashboardQuery) -> 'DashboardResponse':
         async with self.uow_factory.create() as uow:
             try:
-                # 1. Получаем данные дашборда из репозитория
-                dashboard_data = await uow.case_repo.get_dashboard_data(cmd.attorney_id)
-
-                if not dashboard_data:
-                    logger.info(f'Нет данных для дашборда адвоката с ID {cmd.attorney_id}')
-                    return []
+                # 1. Актуальная сводка - одним чтением
+                summary = await uow.dashboard_repo.get_fresh(cmd.attorney_id)
 
-                # 2. Преобразуем словари в DTO
-                dashboard_responses = [
-                    DashboardResponse(**data) for data in dashboard_data
-                ]
+                # 2. Нет или устарела - пересчитываем и сохраняем
+                if summary is None:
+                    summary = await uow.dashboard_repo.refresh(cmd.attorney_id)
 
-                logger.info(
-                    f'Получено {len(dashboard_responses)} записей для дашборда '
-                    f'адвоката {cmd.attorney_id}'
-                )
-
-                return dashboard_responses
+                return DashboardResponse(**summary)
 
             except Exception as e:
                 logger.error(
@@ -43,4 +34,3 @@ class GetDashboardUseCase:
                     f'с ID {cmd.attorney_id}: {e}'
                 )
                 raise e
-
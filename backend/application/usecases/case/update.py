@@ -32,7 +32,7 @@ class UpdateCaseUseCase:
                     client_repo=uow.client_repo,
                     case_repo=uow.case_repo,
                 )
-                await validator.on_update(cmd)
+                await validator.on_update(cmd, case)
 
                 # 2. Применяем изменения через метод update доменной сущности
                 case.update(cmd)
@@ -1,5 +1,4 @@
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
-from backend.core.exceptions import EntityNotFoundException
 from backend.application.commands.client import DeleteClientCommand
 from backend.core.logger import logger
 
@@ -16,15 +15,8 @@ class DeleteClientUseCase:
     ) -> bool:
         async with self.uow_factory.create() as uow:
             try:
-                # 1. Получить клиента
-                client = await uow.client_repo.get(cmd.client_id)
-
-                if not client:
-                    raise EntityNotFoundException(
-                        f'Клиент с ID {cmd.client_id} не найден.'
-                    )
-
-                # 3. Удалить клиента
+                # 1. Удалить клиента (если его нет - репозиторий
+                # выбросит EntityNotFoundException)
                 await uow.client_repo.delete(cmd.client_id)
 
                 logger.info(f'Клиент с ID {cmd.client_id} удалён.')
@@ -1,13 +1,12 @@
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.application.dto.client import ClientResponse
+from backend.application.dto.pagination import PageResponse
 from backend.application.commands.client import GetClientsForAttorneyQuery
 from backend.core.logger import logger
 
-from typing import List
-
 
 class GetClientsForAttorneyUseCase:
-    '''Сценарий: юрист получает всех своих клиентов.'''
+    '''Сценарий: юрист получает своих клиентов (постранично).'''
 
     def __init__(self, uow_factory: UnitOfWorkFactory):
         self.uow_factory = uow_factory
@@ -15,17 +14,20 @@ class GetClientsForAttorneyUseCase:
     async def execute(
         self,
         cmd: GetClientsForAttorneyQuery,
-    ) -> List[ClientResponse]:
+    ) -> PageResponse[ClientResponse]:
         async with self.uow_factory.create() as uow:
             try:
-                # 1. Получить всех клиентов этого адвоката
-                clients = await uow.client_repo.get_all_for_attorney(
-                    cmd.owner_attorney_id
+                # 1. Получить страницу клиентов этого адвоката
+                page = await uow.client_repo.get_page_for_attorney(
+                    cmd.owner_attorney_id, limit=cmd.limit, cursor=cmd.cursor
                 )
                 logger.info(
-                    f'Получено {len(clients)} клиентов для юриста {cmd.owner_attorney_id}'
+                    f'Получено {len(page.items)} клиентов для юриста {cmd.owner_attorney_id}'
+                )
+                return PageResponse[ClientResponse](
+                    items=[ClientResponse.model_validate(c) for c in page.items],
+                    next_cursor=page.next_cursor,
                 )
-                return [ClientResponse.model_validate(client) for client in clients]
 
             except Exception as e:
                 logger.error(
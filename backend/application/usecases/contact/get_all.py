@@ -1,7 +1,7 @@
 from backend.application.dto.contact import ContactResponse
+from backend.application.dto.pagination import PageResponse
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.application.commands.contact import GetContactsForAttorneyQuery
-from typing import List
 from backend.core.logger import logger
 
 
@@ -14,20 +14,21 @@ class GetAllContactsUseCase:
     async def execute(
         self,
         cmd: GetContactsForAttorneyQuery,
-    ) -> List['ContactResponse']:
+    ) -> PageResponse['ContactResponse']:
         async with self.uow_factory.create() as uow:
             try:
-                # 1. Получить все контакты юриста
-                contacts = await uow.contact_repo.get_all_for_attorney(cmd.attorney_id)
-
-                # Проверка, что контакты существуют
-                if not contacts:
-                    return []
+                # 1. Получить страницу контактов юриста
+                page = await uow.contact_repo.get_page_for_attorney(
+                    cmd.attorney_id, limit=cmd.limit, cursor=cmd.cursor
+                )
 
                 logger.info(
-                    f'Получено {len(contacts)} контактов для юриста {cmd.attorney_id}'
+                    f'Получено {len(page.items)} контактов для юриста {cmd.attorney_id}'
+                )
+                return PageResponse[ContactResponse](
+                    items=[ContactResponse.model_validate(c) for c in page.items],
+                    next_cursor=page.next_cursor,
                 )
-                return [ContactResponse.model_validate(contact) for contact in contacts]
 
             except Exception as e:
                 logger.error(
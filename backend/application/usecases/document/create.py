@@ -1,10 +1,14 @@
+from datetime import datetime, timezone
 from backend.application.dto.document import DocumentResponse
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.application.services.doc_service import DocumentService
 from backend.application.interfaces.repositories.local_storage import IFileStorage
 from backend.application.policy.document_policy import DocumentValidator
 from backend.core.exceptions import ValidationException, EntityNotFoundException
+from backend.domain.events.document_uploaded import DocumentUploadedEvent
+from backend.infrastructure.models.outbox import OutboxEventType
 from backend.core.logger import logger
+from typing import AsyncIterable, Optional
 
 
 class CreateDocumentUseCase:
@@ -19,9 +23,14 @@ class CreateDocumentUseCase:
         case_id: int,
         attorney_id: int,
         file_name: str,
-        file_content: bytes,
+        file_chunks: AsyncIterable[bytes],
         description: str = '',
+        max_size: Optional[int] = None,
     ) -> 'DocumentResponse':
+        '''
+        Содержимое файла передается потоком чанков и пишется в хранилище
+        по мере чтения, не загружаясь в память целиком.
+        '''
         async with self.uow_factory.create() as uow:
             try:
                 # 1. Валидация
@@ -45,16 +54,19 @@ class CreateDocumentUseCase:
 
                 # 2. Создаем DocumentService с зависимостями
                 doc_service = DocumentService(
-                    document_repo=uow.doc_meta_repo, file_storage=self.file_storage
+                    document_repo=uow.doc_meta_repo,
+                    file_storage=self.file_storage,
+                    blob_repo=uow.blob_repo,
                 )
 
                 # 3. Загружаем документ (файл + метаданные)
-                saved_document = await doc_service.upload_document(
+                saved_document = await doc_service.upload_document_stream(
                     case_id=case_id,
                     attorney_id=attorney_id,
                     file_name=file_name,
-                    file_content=file_content,
+                    chunks=file_chunks,
                     description=description,
+                    max_size=max_size,
                 )
 
                 logger.info(
@@ -62,7 +74,19 @@ class CreateDocumentUseCase:
                     f'Файл={file_name}, Дело={case_id}'
                 )
 
-                # 4. Возвращаем Response
+                # 4. Событие в Outbox (в той же транзакции): текст для поиска
+                # извлечет воркер, запрос не ждет разбора PDF/DOCX
+                event = DocumentUploadedEvent(
+                    document_id=saved_document.id,
+                    attorney_id=attorney_id,
+                    occurred_at=datetime.now(timezone.utc),
+                )
+                await uow.outbox_repo.save_event(
+                    event_type=OutboxEventType.DOCUMENT_UPLOADED.value,
+                    payload=event.to_dict(),
+                )
+
+                # 5. Возвращаем Response
                 return DocumentResponse.model_validate(saved_document)
 
             except (ValidationException, EntityNotFoundException) as e:
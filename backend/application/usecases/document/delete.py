@@ -1,5 +1,8 @@
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
-from backend.application.services.doc_service import DocumentService
+from backend.application.services.doc_service import (
+    DocumentService,
+    purge_released_files,
+)
 from backend.application.interfaces.repositories.local_storage import IFileStorage
 from backend.core.exceptions import EntityNotFoundException, AccessDeniedException
 from backend.core.logger import logger
@@ -27,11 +30,17 @@ class DeleteDocumentUseCase:
 
                 # 2. Создаем DocumentService для удаления файла и метаданных
                 doc_service = DocumentService(
-                    document_repo=uow.doc_meta_repo, file_storage=self.file_storage
+                    document_repo=uow.doc_meta_repo,
+                    file_storage=self.file_storage,
+                    blob_repo=uow.blob_repo,
                 )
 
-                # 3. Удаляем документ (файл + метаданные)
-                await doc_service.delete_document(document_id)
+                # 3. Удаляем метаданные и фиксируем удаление
+                await doc_service.delete_document(document_id, document)
+                await uow.commit()
+
+                # 4. Файл - в новой транзакции, только если ссылок не осталось
+                await purge_released_files(uow, doc_service)
 
                 logger.info(f'Документ удален: ID={document_id}')
                 return True
@@ -1,6 +1,7 @@
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.application.services.doc_service import DocumentService
 from backend.application.interfaces.repositories.local_storage import IFileStorage
+from backend.application.dto.document import DocumentFile
 from backend.core.exceptions import EntityNotFoundException, AccessDeniedException
 from backend.core.logger import logger
 
@@ -12,14 +13,12 @@ class DownloadDocumentUseCase:
         self.uow_factory = uow_factory
         self.file_storage = file_storage
 
-    async def execute(
-        self, document_id: int, attorney_id: int
-    ) -> tuple[bytes, str, str]:
+    async def execute(self, document_id: int, attorney_id: int) -> DocumentFile:
         '''
-        Возвращает содержимое файла, имя файла и MIME тип.
+        Возвращает описание файла документа (имя, MIME тип, путь, размер).
 
-        Returns:
-            Кортеж (file_content, file_name, mime_type)
+        Содержимое не загружается в память: роутер отдает файл потоком
+        из хранилища, в том числе по диапазонам (HTTP Range).
         '''
         async with self.uow_factory.create() as uow:
             try:
@@ -35,21 +34,30 @@ class DownloadDocumentUseCase:
 
                 # 2. Создаем DocumentService для получения файла
                 doc_service = DocumentService(
-                    document_repo=uow.doc_meta_repo, file_storage=self.file_storage
+                    document_repo=uow.doc_meta_repo,
+                    file_storage=self.file_storage,
+                    blob_repo=uow.blob_repo,
                 )
 
-                # 3. Получаем файл
-                file_content, file_name, mime_type = (
-                    await doc_service.get_document_file(document_id)
-                )
+                # 3. Получаем описание файла
+                document_file = await doc_service.get_document_file_info(document_id)
 
-                logger.info(f'Документ скачан: ID={document_id}, Файл={file_name}')
-                return file_content, file_name, mime_type
+                logger.info(
+                    f'Документ отдается: ID={document_id}, '
+                    f'Файл={document_file.file_name}'
+                )
+                return document_file
 
             except (EntityNotFoundException, AccessDeniedException) as e:
                 logger.error(f'Ошибка при скачивании документа: {e}')
                 raise e
 
+            except FileNotFoundError as e:
+                logger.error(f'Файл документа {document_id} отсутствует: {e}')
+                raise EntityNotFoundException(
+                    f'Файл документа с ID {document_id} не найден'
+                )
+
             except Exception as e:
                 logger.error(f'Неизвестная ошибка при скачивании документа: {e}')
                 raise Exception('Ошибка при скачивании документа')
@@ -1,8 +1,15 @@
 from backend.application.dto.document import DocumentListResponse, DocumentResponse
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
-from backend.core.exceptions import EntityNotFoundException, AccessDeniedException
+from backend.core.exceptions import (
+    EntityNotFoundException,
+    AccessDeniedException,
+    ValidationException,
+)
+from backend.core.pagination import DEFAULT_PAGE_LIMIT
 from backend.core.logger import logger
 
+from typing import Optional
+
 
 class GetDocumentsForCaseUseCase:
     '''Сценарий: получение всех документов для дела.'''
@@ -10,7 +17,13 @@ class GetDocumentsForCaseUseCase:
     def __init__(self, uow_factory: UnitOfWorkFactory):
         self.uow_factory = uow_factory
 
-    async def execute(self, case_id: int, attorney_id: int) -> 'DocumentListResponse':
+    async def execute(
+        self,
+        case_id: int,
+        attorney_id: int,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+    ) -> 'DocumentListResponse':
         async with self.uow_factory.create() as uow:
             try:
                 # 1. Проверяем, что дело существует и принадлежит юристу
@@ -21,24 +34,32 @@ class GetDocumentsForCaseUseCase:
                 if case.attorney_id != attorney_id:
                     raise AccessDeniedException('У вас нет доступа к этому делу')
 
-                # 2. Получаем все документы для дела
-                documents = await uow.doc_meta_repo.get_all_for_case(case_id)
+                # 2. Получаем страницу документов для дела
+                page = await uow.doc_meta_repo.get_page_for_case(
+                    case_id, limit=limit, cursor=cursor
+                )
 
                 logger.info(
                     f'Получены документы для дела {case_id}: '
-                    f'найдено {len(documents)} документов'
+                    f'найдено {len(page.items)} документов'
                 )
 
                 # 3. Преобразуем в Response
                 document_responses = [
-                    DocumentResponse.model_validate(doc) for doc in documents
+                    DocumentResponse.model_validate(doc) for doc in page.items
                 ]
 
                 return DocumentListResponse(
-                    documents=document_responses, total=len(document_responses)
+                    documents=document_responses,
+                    total=len(document_responses),
+                    next_cursor=page.next_cursor,
                 )
 
-            except (EntityNotFoundException, AccessDeniedException) as e:
+            except (
+                EntityNotFoundException,
+                AccessDeniedException,
+                ValidationException,
+            ) as e:
                 logger.error(f'Ошибка при получении документов: {e}')
                 raise e
 
@@ -0,0 +1,64 @@
+from backend.application.dto.document import (
+    DocumentResponse,
+    DocumentSearchResponse,
+    DocumentSearchResult,
+)
+from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
+from backend.core.exceptions import ValidationException
+from backend.core.pagination import DEFAULT_PAGE_LIMIT
+from backend.core.settings import settings
+from backend.core.logger import logger
+
+
+class SearchDocumentsUseCase:
+    '''Сценарий: полнотекстовый поиск по документам юриста.'''
+
+    def __init__(self, uow_factory: UnitOfWorkFactory):
+        self.uow_factory = uow_factory
+
+    async def execute(
+        self,
+        attorney_id: int,
+        query: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        offset: int = 0,
+    ) -> 'DocumentSearchResponse':
+        # 1. Пустой запрос не отправляем в БД
+        query = query.strip()
+        if not query:
+            raise ValidationException('Поисковый запрос не может быть пустым')
+
+        async with self.uow_factory.create() as uow:
+            try:
+                # 2. Берем на одну запись больше - так узнаем о следующей странице
+                hits = await uow.doc_meta_repo.search(
+                    attorney_id,
+                    query,
+                    config=settings.DOCUMENT_SEARCH_CONFIG,
+                    limit=limit + 1,
+                    offset=offset,
+                )
+                has_more = len(hits) > limit
+                hits = hits[:limit]
+
+                logger.info(
+                    f'Поиск документов юриста {attorney_id}: '
+                    f'запрос "{query}", найдено {len(hits)}'
+                )
+
+                # 3. Преобразуем в Response
+                documents = [
+                    DocumentSearchResult(
+                        **DocumentResponse.model_validate(doc).model_dump(), rank=rank
+                    )
+                    for doc, rank in hits
+                ]
+                return DocumentSearchResponse(
+                    documents=documents,
+                    total=len(documents),
+                    next_offset=offset + limit if has_more else None,
+                )
+
+            except Exception as e:
+                logger.error(f'Неизвестная ошибка при поиске документов: {e}')
+                raise Exception('Ошибка при поиске документов')
@@ -1,6 +1,5 @@
 from backend.application.dto.event import EventResponse
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
-from backend.core.exceptions import EntityNotFoundException
 from backend.application.commands.event import (
     DeleteEventCommand,
 )
@@ -21,15 +20,9 @@ class DeleteEventUseCase:
     ) -> 'EventResponse':
         async with self.uow_factory.create() as uow:
             try:
-                # 1. Получить дело по его ID - event_id
-                event = await uow.event_repo.get(cmd.event_id)
-
-                if not event:
-                    logger.error(f'Событие {cmd.event_id} не найдено.')
-                    raise EntityNotFoundException(f'События не найдены.')
-
-                # 3. Удалить событие
-                await uow.event_repo.delete(event.id)
+                # 1. Удалить событие (если его нет - репозиторий
+                # выбросит EntityNotFoundException)
+                await uow.event_repo.delete(cmd.event_id)
 
                 logger.info(f'Событие с ID {cmd.event_id} удалено.')
                 return True
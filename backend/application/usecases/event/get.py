@@ -1,4 +1,5 @@
 from backend.application.dto.event import EventResponse
+from backend.application.dto.pagination import PageResponse
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.core.exceptions import EntityNotFoundException
 from backend.application.commands.event import (
@@ -47,21 +48,25 @@ class GetEventByAttorneyUseCase:
     async def execute(
         self,
         cmd: GetEventsForAttorneyQuery,
-    ) -> 'EventResponse':
+    ) -> PageResponse['EventResponse']:
         async with self.uow_factory.create() as uow:
             try:
-                events = await uow.event_repo.get_all_for_attorney(cmd.attorney_id)
+                page = await uow.event_repo.get_page_for_attorney(
+                    cmd.attorney_id, limit=cmd.limit, cursor=cmd.cursor
+                )
 
-                if not events:
+                if not page.items:
                     logger.warning(f'События для юриста {cmd.attorney_id} не найдены.')
-                    return []
 
                 logger.info(
-                    f'Получено {len(events)} событий для юриста {cmd.attorney_id}'
+                    f'Получено {len(page.items)} событий для юриста {cmd.attorney_id}'
                 )
 
                 # ПРЕОБРАЗУЕМ КАЖДЫЙ ЭЛЕМЕНТ СПИСКА ОТДЕЛЬНО!
-                return [EventResponse.model_validate(event) for event in events]
+                return PageResponse[EventResponse](
+                    items=[EventResponse.model_validate(event) for event in page.items],
+                    next_cursor=page.next_cursor,
+                )
 
             except Exception as e:
                 logger.error(
@@ -115,20 +120,26 @@ class GetEventByCaseUseCase:
     async def execute(
         self,
         cmd: GetEventsForCaseQuery,
-    ) -> 'EventResponse':
+    ) -> PageResponse['EventResponse']:
         async with self.uow_factory.create() as uow:
             try:
-                # 1. Получить дело по CASE_ID
-                events = await uow.event_repo.get_for_case(cmd.case_id)
+                # 1. Получить страницу событий по CASE_ID
+                page = await uow.event_repo.get_page_for_case(
+                    cmd.case_id, limit=cmd.limit, cursor=cmd.cursor
+                )
 
-                if not events:
-                    logger.error(f'События для дела {cmd.attorney_id} не найдены.')
-                    return []
+                if not page.items:
+                    logger.warning(f'События для дела {cmd.case_id} не найдены.')
 
-                logger.info(f'Получено {len(events)} событий для дела {cmd.case_id}')
+                logger.info(
+                    f'Получено {len(page.items)} событий для дела {cmd.case_id}'
+                )
 
                 # ПРЕОБРАЗУЕМ КАЖДЫЙ ЭЛЕМЕНТ СПИСКА ОТДЕЛЬНО!
-                return [EventResponse.model_validate(event) for event in events]
+                return PageResponse[EventResponse](
+                    items=[EventResponse.model_validate(event) for event in page.items],
+                    next_cursor=page.next_cursor,
+                )
 
             except Exception as e:
                 logger.error(f'Ошибка при получении события с ID {cmd.case_id}: {e}')
@@ -0,0 +1,5 @@
+from .export_attorney_data import ExportAttorneyDataUseCase
+
+__all__ = [
+    'ExportAttorneyDataUseCase',
+]
@@ -0,0 +1,55 @@
+from typing import AsyncIterator
+
+from backend.application.commands.export import ExportAttorneyDataQuery
+from backend.application.interfaces.repositories.export_repo import EXPORT_SECTIONS
+from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
+from backend.infrastructure.tools.ndjson import encode_ndjson_line, gzip_stream
+from backend.core.logger import logger
+
+
+class ExportAttorneyDataUseCase:
+    '''
+    Сценарий: юрист выгружает все свои данные одним потоком.
+
+    Формат - NDJSON, одна строка на запись: {"type": <раздел>, "data": {...}}.
+    Строки накапливаются в буфер до FLUSH_SIZE байт и отдаются чанками,
+    поэтому память не зависит от количества записей.
+    '''
+
+    FLUSH_SIZE = 64 * 1024
+
+    def __init__(self, uow_factory: UnitOfWorkFactory):
+        self.uow_factory = uow_factory
+
+    def execute(self, cmd: ExportAttorneyDataQuery) -> AsyncIterator[bytes]:
+        stream = self._stream_ndjson(cmd.attorney_id)
+        return gzip_stream(stream) if cmd.compress else stream
+
+    async def _stream_ndjson(self, attorney_id: int) -> AsyncIterator[bytes]:
+        # UoW открывается внутри генератора: сессия живёт, пока клиент читает ответ
+        async with self.uow_factory.create() as uow:
+            try:
+                buffer = bytearray()
+                total = 0
+
+                # 1. Разделы выгружаются последовательно, каждый своим курсором
+                for section in EXPORT_SECTIONS:
+                    async for row in uow.export_repo.stream_for_attorney(
+                        section, attorney_id
+                    ):
+                        buffer += encode_ndjson_line({'type': section, 'data': row})
+                        total += 1
+
+                        # 2. Отдаём накопленное, не дожидаясь конца раздела
+                        if len(buffer) >= self.FLUSH_SIZE:
+                            yield bytes(buffer)
+                            buffer.clear()
+
+                if buffer:
+                    yield bytes(buffer)
+
+                logger.info(f'Выгрузка для юриста {attorney_id} завершена: {total} строк')
+
+            except Exception as e:
+                logger.error(f'Ошибка при выгрузке данных юриста {attorney_id}: {e}')
+                raise e
@@ -1,8 +1,11 @@
+from datetime import datetime, timezone
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.application.commands.client_payment import (
     CreateClientPaymentCommand,
 )
 from backend.domain.entities.client_payment import ClientPayment
+from backend.domain.events.payment_created import PaymentCreatedEvent
+from backend.infrastructure.models.outbox import OutboxEventType
 from backend.core.exceptions import ValidationException, EntityNotFoundException
 from backend.core.logger import logger
 
@@ -45,7 +48,19 @@ class CreatePaymentUseCase:
                     f'Клиент = {saved_payment.client_id} '
                 )
 
-                # 4. Возврат Response
+                # 4. Событие в Outbox (в той же транзакции): PDF счета
+                # сгенерирует воркер, запрос не ждёт pypdf/reportlab
+                event = PaymentCreatedEvent(
+                    payment_id=saved_payment.id,
+                    attorney_id=saved_payment.attorney_id,
+                    occurred_at=datetime.now(timezone.utc),
+                )
+                await uow.outbox_repo.save_event(
+                    event_type=OutboxEventType.PAYMENT_CREATED.value,
+                    payload=event.to_dict(),
+                )
+
+                # 5. Возврат Response
                 return PaymentClientResponse.model_validate(saved_payment)
 
             except (ValidationException, EntityNotFoundException) as e:
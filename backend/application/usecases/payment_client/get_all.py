@@ -7,8 +7,7 @@ from backend.core.logger import logger
 from backend.application.dto.client_payment import (
     PaymentClientResponse,
 )
-
-from typing import List
+from backend.application.dto.pagination import PageResponse
 
 
 class GetAllPaymentsUseCase:
@@ -20,31 +19,30 @@ class GetAllPaymentsUseCase:
     async def execute(
         self,
         cmd: GetСlientPaymentForAttorneyQuery,
-    ) -> List['PaymentClientResponse']:
+    ) -> PageResponse['PaymentClientResponse']:
         async with self.uow_factory.create() as uow:
             try:
-                # 1. Получить все платежи для указанного юриста
-                payments = await uow.payment_repo.get_all_for_attorney(cmd.attorney_id)
+                # 1. Получить страницу платежей для указанного юриста
+                page = await uow.payment_repo.get_page_for_attorney(
+                    cmd.attorney_id, limit=cmd.limit, cursor=cmd.cursor
+                )
 
                 # Проверка, что платежи существуют
-                if not payments:
+                if not page.items:
                     logger.warning(f'Нет платежей для юриста с ID {cmd.attorney_id}')
-                    return []
-
-                logger.info(
-                    f'Получено {len(payments)} платежей для юриста {cmd.attorney_id}'
-                )
 
-                # 2. Возвращаем список платежей в нужном формате
+                # 2. Возвращаем страницу платежей в нужном формате
                 payment_responses = [
                     PaymentClientResponse.model_validate(payment)
-                    for payment in payments
+                    for payment in page.items
                 ]
 
                 logger.info(
-                    f'Получено {len(payments)} платежей для юриста с ID {cmd.attorney_id}'
+                    f'Получено {len(payment_responses)} платежей для юриста с ID {cmd.attorney_id}'
+                )
+                return PageResponse[PaymentClientResponse](
+                    items=payment_responses, next_cursor=page.next_cursor
                 )
-                return payment_responses
 
             except Exception as e:
                 logger.error(
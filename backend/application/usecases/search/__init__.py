@@ -0,0 +1,5 @@
+from .global_search import GlobalSearchUseCase
+
+__all__ = [
+    'GlobalSearchUseCase',
+]
@@ -0,0 +1,50 @@
+from backend.application.commands.search import GlobalSearchQuery
+from backend.application.dto.search import SearchResponse, SearchResult
+from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
+from backend.core.exceptions import ValidationException
+from backend.core.logger import logger
+
+# Короче двух символов триграммы почти ничего не отсекают
+MIN_QUERY_LENGTH = 2
+
+
+class GlobalSearchUseCase:
+    '''Сценарий: юрист ищет клиента, дело или контакт по части строки.'''
+
+    def __init__(self, uow_factory: UnitOfWorkFactory):
+        self.uow_factory = uow_factory
+
+    async def execute(self, cmd: GlobalSearchQuery) -> 'SearchResponse':
+        # 1. Валидация запроса до обращения к БД
+        query = cmd.query.strip()
+        if len(query) < MIN_QUERY_LENGTH:
+            raise ValidationException(
+                f'Поисковый запрос должен содержать '
+                f'не менее {MIN_QUERY_LENGTH} символов'
+            )
+
+        async with self.uow_factory.create() as uow:
+            try:
+                # 2. Берем на одну запись больше - так узнаем о следующей странице
+                hits = await uow.search_repo.search(
+                    cmd.attorney_id, query, limit=cmd.limit + 1, offset=cmd.offset
+                )
+                has_more = len(hits) > cmd.limit
+                hits = hits[: cmd.limit]
+
+                logger.info(
+                    f'Поиск юриста {cmd.attorney_id}: запрос "{query}", '
+                    f'найдено {len(hits)}'
+                )
+
+                # 3. Преобразуем в Response
+                results = [SearchResult.model_validate(hit) for hit in hits]
+                return SearchResponse(
+                    results=results,
+                    total=len(results),
+                    next_offset=cmd.offset + cmd.limit if has_more else None,
+                )
+
+            except Exception as e:
+                logger.error(f'Неизвестная ошибка при поиске: {e}')
+                raise Exception('Ошибка при поиске')
@@ -10,6 +10,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
 
 from backend.core.security import SecurityService
+from backend.application.services.token_management_service import (
+    TokenManagementService,
+)
 from backend.infrastructure.redis.session_storage import SessionStorage
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.core.db.database import DataBaseConnection
@@ -46,6 +49,7 @@ async def get_uow_factory() -> UnitOfWorkFactory:
 # ========== JWT AUTHENTICATION ==========
 
 security = HTTPBearer()
+token_service = TokenManagementService()
 
 
 async def get_current_attorney_id(
@@ -90,13 +94,25 @@ async def get_current_attorney_id(
                 headers={'WWW-Authenticate': 'Bearer'},
             )
 
-        # 3. Получаем attorney_id из токена
+        # 3. Проверяем, что токен не отозван (logout)
+        if await token_service.is_token_revoked(token):
+            logger.warning('Попытка использовать отозванный токен')
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail='Токен отозван. Выполните вход заново',
+                headers={'WWW-Authenticate': 'Bearer'},
+            )
+
+        # 4. Получаем attorney_id из токена
         attorney_id_str = SecurityService.get_subject_from_token(payload)
         attorney_id = int(attorney_id_str)
 
         logger.debug(f'Attorney {attorney_id} автентифицирован')
         return attorney_id
 
+    except HTTPException:
+        raise
+
     except ValueError as e:
         logger.warning(f'JWT validation error: {str(e)}')
         raise HTTPException(
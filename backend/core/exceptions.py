@@ -71,6 +71,12 @@ class ValidationException(BaseCustomException):
         super().__init__(self.message)
 
 
+class ServiceBusyException(BaseCustomException):
+    '''Сервис перегружен, запрос можно повторить позже.'''
+
+    pass
+
+
 class FileStorageException(BaseCustomException):
     '''Ошибка сохранения файла.'''
 
@@ -81,3 +87,9 @@ class FileNotFound(BaseCustomException):
 
 class FileAlreadyExists(BaseCustomException):
     pass
+
+
+class RangeNotSatisfiableException(BaseCustomException):
+    '''Запрошенный диапазон байтов (HTTP Range) вне файла.'''
+
+    pass
@@ -0,0 +1,61 @@
+from typing import Optional, Tuple
+
+from backend.core.exceptions import RangeNotSatisfiableException
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    '''
+    Разобрать заголовок Range для файла размером size байт.
+
+    Поддерживается один диапазон: bytes=START-END, bytes=START- и bytes=-SUFFIX.
+    Несколько диапазонов и нераспознанный заголовок игнорируются (отдаётся
+    весь файл), как разрешает RFC 9110.
+
+    Returns:
+        (start, end) включительно или None, если отдавать файл целиком
+
+    Raises:
+        RangeNotSatisfiableException: Диапазон целиком за пределами файла
+            (в том числе любой диапазон для пустого файла)
+    '''
+    if not header:
+        return None
+
+    unit, _, ranges = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in ranges:
+        return None
+
+    start_str, sep, end_str = ranges.strip().partition('-')
+    if not sep:
+        return None
+
+    try:
+        if start_str == '':
+            # bytes=-N: последние N байт
+            suffix = int(end_str)
+            if suffix <= 0:
+                raise RangeNotSatisfiableException(f'Некорректный диапазон: {header}')
+            if size == 0:
+                # У пустого файла нет ни одного байта для диапазона
+                raise RangeNotSatisfiableException(
+                    f'Диапазон {header} вне файла размером {size} байт'
+                )
+            return max(size - suffix, 0), size - 1
+
+        start = int(start_str)
+        end = int(end_str) if end_str else size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiableException(
+            f'Диапазон {header} вне файла размером {size} байт'
+        )
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def content_range(start: int, end: int, size: int) -> str:
+    '''Значение заголовка Content-Range для ответа 206.'''
+    return f'bytes {start}-{end}/{size}'
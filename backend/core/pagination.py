@@ -0,0 +1,47 @@
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, List, Optional, Tuple, TypeVar
+
+from backend.core.exceptions import ValidationException
+
+T = TypeVar('T')
+
+# Размер страницы по умолчанию и верхняя граница для списковых эндпоинтов
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+
+@dataclass
+class Page(Generic[T]):
+    '''
+    Страница результатов keyset-пагинации.
+
+    next_cursor - непрозрачный курсор для запроса следующей страницы,
+    None если записей больше нет.
+    '''
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    '''Закодировать позицию (created_at, id) последней записи страницы в курсор.'''
+    raw = json.dumps({'c': created_at.isoformat(), 'i': id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    '''
+    Раскодировать курсор в позицию (created_at, id).
+
+    Raises:
+        ValidationException: Если курсор повреждён или подделан
+    '''
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(data['c']), int(data['i'])
+    except (ValueError, KeyError, TypeError, UnicodeError) as e:
+        raise ValidationException(f'Некорректный курсор пагинации: {cursor}') from e
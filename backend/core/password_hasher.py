@@ -0,0 +1,161 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import bcrypt
+
+from backend.core.exceptions import ServiceBusyException
+from backend.core.logger import logger
+from backend.core.settings import settings
+
+
+# ========== SYNC BCRYPT (выполняется внутри пула) ==========
+# Функции уровня модуля - чтобы их можно было передать в ProcessPoolExecutor
+
+
+def _bcrypt_hash(password: str, rounds: int) -> str:
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def _bcrypt_verify(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode('utf-8'), hashed_password.encode('utf-8')
+        )
+    except Exception:
+        return False
+
+
+class PasswordHasher:
+    '''
+    Асинхронный bcrypt в выделенном пуле потоков/процессов.
+
+    bcrypt занимает ~250 мс CPU на вызов; в event loop это блокирует все
+    остальные запросы воркера. Здесь хеширование уходит в отдельный пул,
+    а семафор ограничивает число задач в работе и в очереди (backpressure):
+    при переполнении вызывающий ждёт, а после queue_timeout получает
+    ServiceBusyException вместо бесконечного роста очереди.
+    '''
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        queue_timeout: float,
+        rounds: int = 12,
+        executor_type: str = 'thread',
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self.rounds = rounds
+        self.executor_type = executor_type
+
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        # Метрики
+        self._waiting = 0  # ждут свободного слота
+        self._in_flight = 0  # переданы в пул (в очереди пула или выполняются)
+        self._completed = 0
+        self._rejected = 0
+        self._last_latency = 0.0
+        self._max_latency = 0.0
+        self._total_latency = 0.0
+
+    # ========== LIFECYCLE ==========
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='bcrypt'
+                )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # Создаётся лениво: семафор должен принадлежать работающему event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        return self._slots
+
+    def shutdown(self) -> None:
+        '''Остановить пул (вызывается при завершении приложения).'''
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._slots = None
+
+    # ========== API ==========
+
+    async def hash(self, password: str) -> str:
+        '''Захешировать пароль (bcrypt).'''
+        return await self._run(_bcrypt_hash, password, self.rounds)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        '''Проверить пароль.'''
+        return await self._run(_bcrypt_verify, plain_password, hashed_password)
+
+    def metrics(self) -> Dict[str, Any]:
+        '''Снимок метрик пула: глубина очереди, задачи в работе, латентность.'''
+        avg = self._total_latency / self._completed if self._completed else 0.0
+        return {
+            'executor': self.executor_type,
+            'max_workers': self.max_workers,
+            'max_pending': self.max_pending,
+            'queue_depth': self._waiting + max(self._in_flight - self.max_workers, 0),
+            'in_flight': self._in_flight,
+            'waiting': self._waiting,
+            'completed': self._completed,
+            'rejected': self._rejected,
+            'latency_ms_last': round(self._last_latency * 1000, 2),
+            'latency_ms_avg': round(avg * 1000, 2),
+            'latency_ms_max': round(self._max_latency * 1000, 2),
+        }
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        slots = self._get_slots()
+
+        # 1. Backpressure: ждём слот не дольше queue_timeout
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            logger.warning(
+                f'Пул хеширования паролей перегружен: {self.metrics()}'
+            )
+            raise ServiceBusyException(
+                'Сервис временно перегружен, повторите попытку позже'
+            )
+        finally:
+            self._waiting -= 1
+
+        # 2. Выполнение в пуле с замером латентности (включая ожидание в пуле)
+        self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._in_flight -= 1
+            self._completed += 1
+            self._last_latency = elapsed
+            self._total_latency += elapsed
+            self._max_latency = max(self._max_latency, elapsed)
+            slots.release()
+
+
+# Singleton - один пул на процесс приложения
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    max_pending=settings.PASSWORD_HASHER_MAX_PENDING,
+    queue_timeout=settings.PASSWORD_HASHER_QUEUE_TIMEOUT,
+    rounds=settings.PASSWORD_HASHER_BCRYPT_ROUNDS,
+    executor_type=settings.PASSWORD_HASHER_EXECUTOR,
+)
@@ -0,0 +1,134 @@
+import math
+import re
+from typing import Optional, Sequence
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.core.logger import logger
+from backend.core.security import SecurityService
+from backend.core.settings import settings
+from backend.infrastructure.redis.rate_limiter import (
+    ApiRateLimiter,
+    RateLimitRule,
+    api_rate_limiter,
+)
+
+API_PREFIX = '/api/v0'
+
+
+def default_rules() -> Sequence[RateLimitRule]:
+    '''
+    Лимиты маршрутов API (первое совпадение выигрывает).
+
+    Тяжелые эндпоинты (загрузка, скачивание, экспорт, поиск) держат
+    соединение с БД или диск дольше остальных - у них свои, более строгие
+    лимиты; все прочие маршруты /api делят общий лимит.
+    '''
+    route = RateLimitRule.route
+    return (
+        route(
+            'upload',
+            f'{API_PREFIX}/cases/{{case_id}}/documents',
+            settings.RATE_LIMIT_UPLOAD_PER_MINUTE,
+            method='POST',
+        ),
+        route(
+            'download',
+            f'{API_PREFIX}/documents/{{document_id}}/download',
+            settings.RATE_LIMIT_DOWNLOAD_PER_MINUTE,
+            method='GET',
+        ),
+        route(
+            'download',
+            f'{API_PREFIX}/download-payment-pdf/{{payment_id}}',
+            settings.RATE_LIMIT_DOWNLOAD_PER_MINUTE,
+            method='GET',
+        ),
+        route('export', f'{API_PREFIX}/export', settings.RATE_LIMIT_EXPORT_PER_MINUTE),
+        route('search', f'{API_PREFIX}/search', settings.RATE_LIMIT_SEARCH_PER_MINUTE),
+        route(
+            'search',
+            f'{API_PREFIX}/documents/search',
+            settings.RATE_LIMIT_SEARCH_PER_MINUTE,
+        ),
+        RateLimitRule(
+            'api', re.compile(f'{API_PREFIX}/.*'), settings.RATE_LIMIT_API_PER_MINUTE
+        ),
+    )
+
+
+def request_identity(scope: Scope) -> str:
+    '''
+    Кому засчитывается запрос: юрист из access token, иначе IP клиента.
+
+    Токен проверяется целиком (подпись, срок) - иначе подделанный sub
+    позволил бы исчерпать лимит чужого юриста.
+    '''
+    for name, value in scope.get('headers', ()):
+        if name == b'authorization':
+            scheme, _, token = value.decode('latin-1').partition(' ')
+            if scheme.lower() == 'bearer' and token:
+                try:
+                    payload = SecurityService.decode_token(token)
+                    if SecurityService.verify_token_type(payload, 'access'):
+                        return f'attorney:{payload["sub"]}'
+                except (ValueError, KeyError):
+                    pass
+            break
+
+    client = scope.get('client')
+    return f'ip:{client[0] if client else "unknown"}'
+
+
+class RateLimitMiddleware:
+    '''
+    ASGI middleware: лимит запросов по маршруту и юристу (429 + Retry-After).
+
+    Проверка идет до роутинга и зависимостей, поэтому отклоненный запрос
+    не берет соединение из пула БД.
+    '''
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: Optional[Sequence[RateLimitRule]] = None,
+        limiter: ApiRateLimiter = api_rate_limiter,
+    ):
+        self.app = app
+        self.rules = tuple(rules) if rules is not None else default_rules()
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not settings.RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        rule = self._match(scope['method'], scope['path'])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        identity = request_identity(scope)
+        result = await self.limiter.hit(rule, identity)
+        if result.allowed:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = max(math.ceil(result.retry_after), 1)
+        logger.warning(
+            f'[RATE LIMIT] {identity}: превышен лимит {rule.name} '
+            f'({rule.limit}/{rule.window_seconds:.0f} с) на {scope["path"]}'
+        )
+        response = JSONResponse(
+            status_code=429,
+            content={'detail': 'Слишком много запросов. Повторите позже'},
+            headers={'Retry-After': str(retry_after)},
+        )
+        await response(scope, receive, send)
+
+    def _match(self, method: str, path: str) -> Optional[RateLimitRule]:
+        for rule in self.rules:
+            if rule.matches(method, path):
+                return rule
+        return None
@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
-import bcrypt
 import jwt
 from backend.core.settings import settings
 from backend.core.logger import logger
+from backend.core.password_hasher import password_hasher
+from backend.core.token_cache import token_claims_cache, token_hash
 
 
 class SecurityService:
@@ -12,21 +13,14 @@ class SecurityService:
     # ========== PASSWORD ==========
 
     @staticmethod
-    def hash_password(password: str) -> str:
-        '''Захешировать пароль (bcrypt)'''
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+    async def hash_password(password: str) -> str:
+        '''Захешировать пароль (bcrypt в пуле, не блокирует event loop)'''
+        return await password_hasher.hash(password)
 
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        '''Проверить пароль'''
-        try:
-            return bcrypt.checkpw(
-                plain_password.encode('utf-8'), hashed_password.encode('utf-8')
-            )
-        except Exception:
-            return False
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        '''Проверить пароль (bcrypt в пуле, не блокирует event loop)'''
+        return await password_hasher.verify(plain_password, hashed_password)
 
     # ========== JWT TOKEN ==========
 
@@ -116,14 +110,23 @@ class SecurityService:
         Returns:
             Декодированный payload
 
+        Проверенные claims кэшируются до exp (token_claims_cache): повторные
+        запросы с тем же токеном не проверяют подпись заново.
+
         Raises:
             ValueError: Если токен истёк или невалиден
         '''
+        key = token_hash(token)
+        payload = token_claims_cache.get(key)
+        if payload is not None:
+            return payload
+
         try:
             payload = jwt.decode(
                 token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
             )
             logger.debug(f'Token декодирован для: {payload.get('sub')}')
+            token_claims_cache.put(key, payload)
             return payload
 
         except jwt.ExpiredSignatureError:
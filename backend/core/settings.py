@@ -2,6 +2,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from sqlalchemy.engine import URL
 from backend.core.logger import logger
 from pydantic import Field
+from typing import List
 
 
 class Settings(BaseSettings):
@@ -31,24 +32,169 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = Field(default='redis://localhost:6379')
     REDIS_DEFAULT_TTL: int = 3600  # 1 час
+    REDIS_MAX_CONNECTIONS: int = Field(
+        default=50, description='Размер пула соединений Redis на процесс'
+    )
+    REDIS_POOL_TIMEOUT: float = Field(
+        default=2.0,
+        description='Сколько ждать свободное соединение пула (секунды)',
+    )
+    REDIS_SOCKET_TIMEOUT: float = Field(
+        default=2.0, description='Таймаут команды Redis (секунды)'
+    )
+    REDIS_CONNECT_TIMEOUT: float = Field(
+        default=2.0, description='Таймаут подключения к Redis (секунды)'
+    )
+    REDIS_HEALTH_CHECK_INTERVAL: int = Field(
+        default=30,
+        description='PING простаивающего соединения перед использованием (секунды)',
+    )
+    REDIS_RETRY_ATTEMPTS: int = Field(
+        default=3, description='Повторы при ошибке соединения или таймауте'
+    )
+    REDIS_RETRY_BACKOFF_BASE: float = Field(
+        default=0.05, description='Базовая пауза между повторами (секунды)'
+    )
+    REDIS_RETRY_BACKOFF_CAP: float = Field(
+        default=1.0, description='Максимальная пауза между повторами (секунды)'
+    )
+    REDIS_CODEC: str = Field(
+        default='msgpack',
+        description='Формат значений: msgpack (строки как есть, остальное '
+        'с тегом) или json (прежний)',
+    )
+    REDIS_CODEC_LEGACY_JSON: bool = Field(
+        default=False,
+        description='Только на время перехода с json: значения без тега вида '
+        '{...}/[...] читаются как JSON. Выключить, когда истечет TTL старых записей',
+    )
+    # Клиентский кэш горячих ключей с инвалидацией от Redis (CLIENT TRACKING)
+    REDIS_CLIENT_CACHE_ENABLED: bool = False
+    REDIS_CLIENT_CACHE_PREFIXES: List[str] = Field(
+        default=['attorney:', 'session:'],
+        description='Префиксы ключей, которые кэшируются в памяти процесса',
+    )
+    REDIS_CLIENT_CACHE_SIZE: int = 10_000
+    REDIS_CLIENT_CACHE_TTL: float = Field(
+        default=60.0,
+        description='Страховочный TTL локальной копии (секунды)',
+    )
+    ATTORNEY_CACHE_TTL: int = Field(
+        default=300,
+        description='TTL кэша профиля юриста в Redis (секунды). '
+        'Ограничивает время жизни устаревшего значения, если сброс кэша не прошёл',
+    )
 
     # === JWT ===
     JWT_ALGORITHM: str = 'HS256'
     JWT_SECRET_KEY: str = Field(default='your-secret-key-change-in-production')
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    TOKEN_CLAIMS_CACHE_SIZE: int = Field(
+        default=10_000, description='Сколько проверенных JWT держать в памяти'
+    )
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = Field(
+        default=100_000,
+        description='Расчетное число отозванных токенов в bloom-фильтре',
+    )
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE: float = Field(
+        default=0.001,
+        description='Доля ложных срабатываний bloom-фильтра (проверяются в Redis)',
+    )
 
     # Security
     PASSWORD_MIN_LENGTH: int = 8
     MAX_LOGIN_ATTEMPTS: int = 5
+    LOGIN_ATTEMPTS_WINDOW_MINUTES: int = 15
     LOCKOUT_DURATION_MINUTES: int = 15
 
+    # === Rate limiting API (скользящее окно, лимиты за минуту на юриста/IP) ===
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_API_PER_MINUTE: int = Field(
+        default=300, description='Лимит по умолчанию для всех маршрутов /api'
+    )
+    RATE_LIMIT_UPLOAD_PER_MINUTE: int = Field(
+        default=20, description='Загрузка документов'
+    )
+    RATE_LIMIT_DOWNLOAD_PER_MINUTE: int = Field(
+        default=60, description='Скачивание документов и PDF платежей'
+    )
+    RATE_LIMIT_EXPORT_PER_MINUTE: int = Field(default=10, description='Экспорт')
+    RATE_LIMIT_SEARCH_PER_MINUTE: int = Field(
+        default=60, description='Полнотекстовый поиск'
+    )
+    RATE_LIMIT_REDIS_TIMEOUT: float = Field(
+        default=0.05,
+        description='Сколько ждать Redis (секунды), дальше - локальный лимит',
+    )
+    RATE_LIMIT_REDIS_RETRY_SECONDS: float = Field(
+        default=5.0,
+        description='Сколько не обращаться к Redis после сбоя или таймаута',
+    )
+
+    # === Password hashing (bcrypt в отдельном пуле) ===
+    PASSWORD_HASHER_EXECUTOR: str = Field(
+        default='thread',
+        description='Тип пула для bcrypt: thread или process',
+    )
+    PASSWORD_HASHER_WORKERS: int = Field(
+        default=4, description='Количество воркеров пула хеширования'
+    )
+    PASSWORD_HASHER_MAX_PENDING: int = Field(
+        default=32,
+        description='Максимум задач хеширования в работе и очереди (backpressure)',
+    )
+    PASSWORD_HASHER_QUEUE_TIMEOUT: float = Field(
+        default=5.0,
+        description='Сколько секунд ждать свободного слота до отказа (503)',
+    )
+    PASSWORD_HASHER_BCRYPT_ROUNDS: int = Field(
+        default=12, description='Cost factor bcrypt для новых хешей'
+    )
+
+    # === Outbox воркер ===
+    OUTBOX_BATCH_SIZE: int = Field(
+        default=20, description='Сколько событий воркер забирает за один claim'
+    )
+    OUTBOX_CONCURRENCY: int = Field(
+        default=5, description='Сколько событий обрабатывается параллельно'
+    )
+    OUTBOX_LEASE_SECONDS: int = Field(
+        default=60,
+        description='Время аренды события (секунды). PROCESSING с истёкшей арендой '
+        'снова забирается воркером',
+    )
+    OUTBOX_POLL_INTERVAL: float = Field(
+        default=5.0,
+        description='Пауза между опросами пустой очереди без LISTEN (секунды)',
+    )
+    OUTBOX_LISTEN_ENABLED: bool = Field(
+        default=True,
+        description='Будить воркер через LISTEN/NOTIFY вместо частого опроса',
+    )
+    OUTBOX_FALLBACK_POLL_INTERVAL: float = Field(
+        default=60.0,
+        description='Резервный опрос очереди при активном LISTEN (секунды)',
+    )
+    OUTBOX_MAX_RETRIES: int = Field(
+        default=3, description='Максимальное количество попыток обработки события'
+    )
+
     # === Email (для сброса пароля) ===
     SMTP_HOST: str = 'smtp.gmail.com'
     SMTP_PORT: int = 587
     SMTP_USER: str
     SMTP_PASSWORD: str
     SMTP_FROM: str = 'noreply@attorney-crm.com'
+    SMTP_USE_TLS: bool = Field(default=True, description='STARTTLS после подключения')
+    SMTP_TIMEOUT: float = Field(default=10.0, description='Таймаут SMTP (секунды)')
+    SMTP_POOL_SIZE: int = Field(
+        default=4, description='Максимум одновременно открытых SMTP соединений'
+    )
+    SMTP_POOL_IDLE_TIMEOUT: float = Field(
+        default=60.0,
+        description='Сколько секунд простаивающее SMTP соединение держится открытым',
+    )
 
     # === File Storage ===
     FILE_STORAGE_BASE_PATH: str = Field(
@@ -65,6 +211,22 @@ class Settings(BaseSettings):
         description='Абсолютный путь к PDF шаблону для генерации платежных документов. '
         'Пример: C:\\Projects\\bloom\\backend\\infrastructure\\pdf\\template\\check_template.pdf',
     )
+    DOCUMENT_MAX_FILE_SIZE: int = Field(
+        default=50 * 1024 * 1024,
+        description='Максимальный размер загружаемого документа (байты)',
+    )
+    DOCUMENT_UPLOAD_CHUNK_SIZE: int = Field(
+        default=1024 * 1024,
+        description='Размер чанка при потоковой записи загружаемого файла (байты)',
+    )
+    DOCUMENT_SEARCH_CONFIG: str = Field(
+        default='russian',
+        description='Конфигурация полнотекстового поиска Postgres (regconfig)',
+    )
+    DOCUMENT_TEXT_MAX_CHARS: int = Field(
+        default=500_000,
+        description='Сколько символов текста документа попадает в поисковый индекс',
+    )
 
     model_config = SettingsConfigDict(
         env_file='.env',
@@ -92,6 +254,10 @@ class Settings(BaseSettings):
     def url(self) -> str:
         return f'{self.DRIVER}://{self.USER}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DB_NAME}'
 
+    def asyncpg_dsn(self) -> str:
+        '''DSN для прямого asyncpg-соединения (LISTEN/NOTIFY), без драйвера SQLAlchemy.'''
+        return f'postgresql://{self.USER}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DB_NAME}'
+
     def alembic_url(self) -> str:
         '''Строка для подключения к БД ТОЛЬКО для выполнения Alembic миграций.'''
         url = f'{self.SYNC_DRIVER}://{self.USER}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DB_NAME}'
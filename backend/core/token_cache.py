@@ -0,0 +1,70 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from backend.core.settings import settings
+
+
+def token_hash(token: str) -> str:
+    '''SHA-256 токена: ключ кэша и черного списка (сам токен не хранится).'''
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class TokenClaimsCache:
+    '''
+    LRU-кэш проверенных claims JWT в памяти процесса.
+
+    Клиент шлет один и тот же access token в каждом запросе - повторная
+    проверка подписи и разбор payload не нужны. Запись живет до exp токена,
+    поэтому истекший токен из кэша не выдается; размер ограничен max_size,
+    вытесняются давно не использованные токены.
+
+    Отзыв токена кэш не отслеживает - его проверяет TokenManagementService.
+    '''
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._claims: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        '''Claims токена или None (промах или истек).'''
+        entry = self._claims.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, claims = entry
+        if expires_at <= time.time():
+            del self._claims[key]
+            self.misses += 1
+            return None
+
+        self._claims.move_to_end(key)
+        self.hits += 1
+        return dict(claims)
+
+    def put(self, key: str, claims: Dict[str, Any]) -> None:
+        '''Запомнить claims до exp (токены без exp не кэшируются).'''
+        expires_at = claims.get('exp')
+        if not isinstance(expires_at, (int, float)):
+            return
+
+        self._claims[key] = (float(expires_at), dict(claims))
+        self._claims.move_to_end(key)
+        if len(self._claims) > self.max_size:
+            self._claims.popitem(last=False)
+
+    def clear(self) -> None:
+        self._claims.clear()
+
+    def metrics(self) -> Dict[str, int]:
+        return {'size': len(self._claims), 'hits': self.hits, 'misses': self.misses}
+
+
+# Singleton
+token_claims_cache = TokenClaimsCache(settings.TOKEN_CLAIMS_CACHE_SIZE)
@@ -30,6 +30,14 @@ class EventType(str, Enum):
     other = 'Другое'
 
 
+class PdfStatus(str, Enum):
+    '''Готовность PDF документа платежа (генерируется фоновым воркером).'''
+
+    pending = 'pending'  # ожидает генерации
+    ready = 'ready'  # сгенерирован и сохранён
+    failed = 'failed'  # генерация не удалась
+
+
 class PaymentStatus(str, Enum):
     draft = 'Черновик'  # черновик
     issued = 'Выставлен'  # выставлен (сформирован счет/платёж)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime, date
 from typing import Optional
-from backend.domain.entities.auxiliary import PaymentStatus
+from backend.domain.entities.auxiliary import PaymentStatus, PdfStatus
 from backend.application.commands.client_payment import (
     UpdateСlientPaymentCommand,
     ChangeClientPaymentStatusCommand,
@@ -21,6 +21,7 @@ class ClientPayment:
     status: PaymentStatus
     taxable: bool = False
     condition: Optional[str] = None
+    pdf_status: PdfStatus = PdfStatus.pending
 
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
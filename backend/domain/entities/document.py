@@ -13,6 +13,7 @@ class Document:
     attorney_id: int
     description: str
     mime_type: Optional[str] = None
+    content_hash: Optional[str] = None  # SHA-256 содержимого (файл в document_blobs)
 
     # Необязательные атрибуты
     created_at: Optional[datetime] = None
@@ -28,6 +29,7 @@ class Document:
         attorney_id: int,
         description: str = '',
         mime_type: Optional[str] = None,
+        content_hash: Optional[str] = None,
     ) -> 'Document':
         '''Фабричный метод для создания нового документа.'''
         return Document(
@@ -39,4 +41,5 @@ class Document:
             attorney_id=attorney_id,
             description=description,
             mime_type=mime_type,
+            content_hash=content_hash,
         )
@@ -1,5 +1,7 @@
 """Доменные события (Domain Events) для DDD паттерна."""
 
 from backend.domain.events.attorney_registered import AttorneyRegisteredEvent
+from backend.domain.events.document_uploaded import DocumentUploadedEvent
+from backend.domain.events.payment_created import PaymentCreatedEvent
 
-__all__ = ['AttorneyRegisteredEvent']
+__all__ = ['AttorneyRegisteredEvent', 'DocumentUploadedEvent', 'PaymentCreatedEvent']
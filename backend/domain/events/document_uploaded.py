@@ -0,0 +1,26 @@
+"""Доменное событие: загружен документ."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class DocumentUploadedEvent:
+    """
+    Доменное событие загрузки документа.
+
+    Используется для Outbox Pattern - текст документа для полнотекстового
+    поиска извлекает фоновый воркер, а не HTTP запрос загрузки.
+    """
+
+    document_id: int
+    attorney_id: int
+    occurred_at: datetime
+
+    def to_dict(self) -> dict:
+        """Сериализация события в словарь для сохранения в Outbox."""
+        return {
+            'document_id': self.document_id,
+            'attorney_id': self.attorney_id,
+            'occurred_at': self.occurred_at.isoformat(),
+        }
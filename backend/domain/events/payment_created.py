@@ -0,0 +1,26 @@
+"""Доменное событие: создан платеж клиента."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class PaymentCreatedEvent:
+    """
+    Доменное событие создания платежа.
+
+    Используется для Outbox Pattern - PDF счета генерируется фоновым
+    воркером, а не в HTTP запросе создания платежа.
+    """
+
+    payment_id: int
+    attorney_id: int
+    occurred_at: datetime
+
+    def to_dict(self) -> dict:
+        """Сериализация события в словарь для сохранения в Outbox."""
+        return {
+            'payment_id': self.payment_id,
+            'attorney_id': self.attorney_id,
+            'occurred_at': self.occurred_at.isoformat(),
+        }
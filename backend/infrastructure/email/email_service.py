@@ -1,10 +1,25 @@
-import smtplib
+from dataclasses import dataclass
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from backend.core.settings import settings
 from backend.core.logger import logger
-import asyncio
-from typing import Optional
+from backend.infrastructure.email.smtp_pool import smtp_pool
+from backend.infrastructure.email.template_registry import (
+    PASSWORD_RESET_TEMPLATE,
+    VERIFICATION_TEMPLATE,
+    email_templates,
+)
+from typing import List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class OutgoingEmail:
+    '''Письмо для пакетной отправки.'''
+
+    to_email: str
+    subject: str
+    html_content: str
+    text_content: Optional[str] = None
 
 
 class EmailService:
@@ -15,57 +30,14 @@ class EmailService:
         email: str, verification_code: str, first_name: str
     ) -> bool:
         '''Отправить код верификации по email'''
-
-        subject = 'Подтвердите вашу почту в Attorney CRM'
-
-        # HTML письмо
-        html_content = f'''
-        <html>
-            <head>
-                <style>
-                    body {{ font-family: Arial, sans-serif; background-color: #f5f5f5; }}
-                    .container {{ max-width: 600px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; }}
-                    .header {{ text-align: center; color: #333; margin-bottom: 20px; }}
-                    .code-box {{ 
-                        background: #f0f0f0; 
-                        border: 2px solid #007bff; 
-                        border-radius: 8px; 
-                        padding: 20px; 
-                        text-align: center; 
-                        margin: 20px 0;
-                    }}
-                    .code {{ font-size: 32px; font-weight: bold; color: #007bff; letter-spacing: 5px; }}
-                    .footer {{ text-align: center; color: #999; font-size: 12px; margin-top: 20px; }}
-                    .warning {{ color: #d9534f; font-size: 12px; margin-top: 10px; }}
-                </style>
-            </head>
-            <body>
-                <div class='container'>
-                    <div class='header'>
-                        <h1>Добро пожаловать в Attorney CRM! 👨‍⚖️</h1>
-                    </div>
-                    
-                    <p>Привет, {first_name}!</p>
-                    <p>Спасибо за регистрацию. Для завершения регистрации подтвердите вашу почту, введя код ниже:</p>
-                    
-                    <div class='code-box'>
-                        <div class='code'>{verification_code}</div>
-                    </div>
-                    
-                    <p>Этот код действителен <strong>15 минут</strong>.</p>
-                    <p>Если вы не регистрировались, просто проигнорируйте это письмо.</p>
-                    
-                    <div class='footer'>
-                        <p>&copy; 2025 Attorney CRM. Все права защищены.</p>
-                        <p class='warning'>⚠️ Не делитесь этим кодом никому!</p>
-                    </div>
-                </div>
-            </body>
-        </html>
-        '''
-
+        rendered = email_templates.render(
+            VERIFICATION_TEMPLATE, first_name=first_name, code=verification_code
+        )
         return await EmailService._send_email(
-            to_email=email, subject=subject, html_content=html_content
+            to_email=email,
+            subject=rendered.subject,
+            html_content=rendered.html_content,
+            text_content=rendered.text_content,
         )
 
     @staticmethod
@@ -73,70 +45,86 @@ class EmailService:
         email: str, reset_code: str, first_name: str
     ) -> bool:
         '''Отправить код сброса пароля'''
+        rendered = email_templates.render(
+            PASSWORD_RESET_TEMPLATE, first_name=first_name, code=reset_code
+        )
+        return await EmailService._send_email(
+            to_email=email,
+            subject=rendered.subject,
+            html_content=rendered.html_content,
+            text_content=rendered.text_content,
+        )
 
-        subject = 'Сброс пароля в Attorney CRM'
-
-        html_content = f'''
-        <html>
-            <head>
-                <style>
-                    body {{ font-family: Arial, sans-serif; }}
-                    .container {{ max-width: 600px; margin: 0 auto; background: white; padding: 20px; }}
-                    .code-box {{ background: #f0f0f0; padding: 20px; text-align: center; border-radius: 8px; }}
-                    .code {{ font-size: 28px; font-weight: bold; color: #d9534f; letter-spacing: 3px; }}
-                </style>
-            </head>
-            <body>
-                <div class='container'>
-                    <h2>Сброс пароля</h2>
-                    <p>Привет, {first_name}!</p>
-                    <p>Вы запросили сброс пароля. Используйте код ниже:</p>
-                    
-                    <div class='code-box'>
-                        <div class='code'>{reset_code}</div>
-                    </div>
-                    
-                    <p>Код действителен <strong>30 минут</strong>.</p>
-                </div>
-            </body>
-        </html>
+    @staticmethod
+    def render(template: str, to_email: str, **context: object) -> OutgoingEmail:
         '''
+        Подготовить письмо по шаблону из реестра (для send_batch).
 
-        return await EmailService._send_email(
-            to_email=email, subject=subject, html_content=html_content
+        Args:
+            template: Имя зарегистрированного шаблона
+            to_email: Адрес получателя
+            context: Значения подстановок шаблона
+        '''
+        rendered = email_templates.render(template, **context)
+        return OutgoingEmail(
+            to_email=to_email,
+            subject=rendered.subject,
+            html_content=rendered.html_content,
+            text_content=rendered.text_content,
+        )
+
+    @staticmethod
+    async def send_batch(emails: Sequence[OutgoingEmail]) -> List[bool]:
+        '''
+        Отправить пачку писем через одно SMTP соединение из пула.
+
+        Используется для массовых рассылок (например, воркером Outbox):
+        STARTTLS и LOGIN выполняются один раз на всю пачку.
+
+        Returns:
+            Результат по каждому письму в порядке emails
+        '''
+        messages = [
+            EmailService._build_message(
+                e.to_email, e.subject, e.html_content, e.text_content
+            )
+            for e in emails
+        ]
+        results = await smtp_pool.send_many(messages)
+        logger.info(
+            f'[EMAIL] Пачка писем отправлена: {sum(results)}/{len(results)} успешно'
         )
+        return results
+
+    @staticmethod
+    def _build_message(
+        to_email: str,
+        subject: str,
+        html_content: str,
+        text_content: Optional[str] = None,
+    ) -> MIMEMultipart:
+        '''Собрать MIME письмо (текстовая версия - первой, HTML - предпочтительной).'''
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = settings.SMTP_FROM
+        msg['To'] = to_email
+
+        if text_content:
+            msg.attach(MIMEText(text_content, 'plain', 'utf-8'))
+        msg.attach(MIMEText(html_content, 'html', 'utf-8'))
+        return msg
 
     @staticmethod
-    async def _send_email(to_email: str, subject: str, html_content: str) -> bool:
-        '''Отправить email в отдельном потоке (не блокирует приложение)'''
-
-        def send_sync():
-            try:
-                # Создаём письмо
-                msg = MIMEMultipart('alternative')
-                msg['Subject'] = subject
-                msg['From'] = settings.SMTP_FROM
-                msg['To'] = to_email
-
-                # Добавляем HTML
-                msg.attach(MIMEText(html_content, 'html'))
-
-                # Подключаемся к SMTP серверу
-                with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-                    server.starttls()  # Включаем шифрование TLS
-                    server.login(
-                        settings.SMTP_USER, settings.SMTP_PASSWORD
-                    )  # Аутентификация
-                    server.send_message(msg)  # Отправка
-
-                logger.info(f'[EMAIL] Письмо отправлено на {to_email}')
-                return True
-
-            except Exception as e:
-                logger.error(f'[EMAIL] Ошибка отправки письма {to_email}: {e}')
-                return False
-
-        # Запустить в отдельном потоке (не блокирует async)
-        loop = asyncio.get_event_loop()
-        # Запускает синхронный код (send_sync) в отдельном потоке, чтобы не блокировать асинхронный цикл.
-        return await loop.run_in_executor(None, send_sync)
+    async def _send_email(
+        to_email: str,
+        subject: str,
+        html_content: str,
+        text_content: Optional[str] = None,
+    ) -> bool:
+        '''Отправить email через пул постоянных SMTP соединений'''
+        msg = EmailService._build_message(to_email, subject, html_content, text_content)
+
+        if await smtp_pool.send(msg):
+            logger.info(f'[EMAIL] Письмо отправлено на {to_email}')
+            return True
+        return False
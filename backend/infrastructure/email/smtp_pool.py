@@ -0,0 +1,280 @@
+import asyncio
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.message import Message
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from backend.core.logger import logger
+from backend.core.settings import settings
+
+
+def _is_connection_error(error: Exception) -> bool:
+    '''
+    Ошибка, после которой соединение непригодно и его нужно пересоздать.
+
+    Отказ сервера по конкретному письму (SMTPRecipientsRefused и т.п.) сюда
+    не входит: соединение остаётся рабочим, неудачным считается только письмо.
+    '''
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    # 421 - сервер закрывает канал (лимит времени/писем на сессию)
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code == 421
+    # SMTPException наследуется от OSError - сетевые ошибки проверяем последними
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+@dataclass
+class _PooledConnection:
+    smtp: smtplib.SMTP
+    last_used: float
+
+
+class SMTPConnectionPool:
+    '''
+    Пул постоянных SMTP-соединений.
+
+    Каждое соединение проходит STARTTLS и LOGIN один раз и затем
+    переиспользуется для многих писем. Простаивающие дольше idle_timeout
+    соединения закрываются; простаивающие дольше health_check_interval
+    перед выдачей проверяются NOOP. Оборванное соединение пересоздаётся,
+    а письмо отправляется повторно.
+
+    smtplib блокирующий, поэтому сетевой обмен идёт в собственном пуле
+    потоков размера max_size, а не в executor по умолчанию.
+    '''
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        max_size: int = 4,
+        idle_timeout: float = 60.0,
+        health_check_interval: float = 15.0,
+        timeout: float = 10.0,
+        connection_factory: Optional[Callable[[], smtplib.SMTP]] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+        self._connection_factory = connection_factory or self._connect
+
+        self._idle: List[_PooledConnection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Метрики
+        self._created = 0
+        self._reused = 0
+        self._reconnects = 0
+        self._sent = 0
+        self._failed = 0
+
+    # ========== LIFECYCLE ==========
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_size, thread_name_prefix='smtp'
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # Создаётся лениво: семафор должен принадлежать работающему event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_size)
+        return self._slots
+
+    async def close(self) -> None:
+        '''Закрыть все простаивающие соединения и пул потоков.'''
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._run(self._quit, pooled.smtp)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._slots = None
+
+    # ========== API ==========
+
+    async def send(self, message: Message) -> bool:
+        '''Отправить одно письмо через соединение из пула.'''
+        return (await self.send_many([message]))[0]
+
+    async def send_many(self, messages: Sequence[Message]) -> List[bool]:
+        '''
+        Отправить пачку писем через одно соединение.
+
+        Returns:
+            Результат по каждому письму в порядке messages
+        '''
+        results: List[bool] = []
+        if not messages:
+            return results
+
+        async with self._get_slots():
+            try:
+                pooled = await self._acquire()
+            except Exception as e:
+                logger.error(f'[EMAIL] Не удалось подключиться к SMTP: {e}')
+                self._failed += len(messages)
+                return [False] * len(messages)
+
+            try:
+                for message in messages:
+                    ok, pooled = await self._send_one(pooled, message)
+                    results.append(ok)
+                    if pooled is None:
+                        # Переподключиться не удалось - сервер недоступен,
+                        # остальные письма не пытаемся отправлять по одному
+                        remaining = len(messages) - len(results)
+                        self._failed += remaining
+                        results.extend([False] * remaining)
+                        break
+            finally:
+                if pooled is not None:
+                    self._release(pooled)
+
+        return results
+
+    def metrics(self) -> Dict[str, Any]:
+        '''Снимок метрик пула.'''
+        return {
+            'max_size': self.max_size,
+            'idle': len(self._idle),
+            'created': self._created,
+            'reused': self._reused,
+            'reconnects': self._reconnects,
+            'sent': self._sent,
+            'failed': self._failed,
+        }
+
+    # ========== INTERNAL ==========
+
+    async def _send_one(
+        self, pooled: _PooledConnection, message: Message
+    ) -> tuple[bool, Optional[_PooledConnection]]:
+        '''Отправить письмо; при обрыве - пересоздать соединение и повторить раз.'''
+        try:
+            await self._run(pooled.smtp.send_message, message)
+            self._sent += 1
+            return True, pooled
+
+        except Exception as e:
+            if not _is_connection_error(e):
+                self._failed += 1
+                logger.error(f'[EMAIL] Ошибка отправки письма {message["To"]}: {e}')
+                return False, pooled
+
+            logger.warning(f'[EMAIL] SMTP соединение оборвано: {e}, переподключаемся')
+            await self._run(self._quit, pooled.smtp)
+
+        # Повтор на свежем соединении
+        try:
+            pooled = await self._open()
+            self._reconnects += 1
+        except Exception as e:
+            self._failed += 1
+            logger.error(f'[EMAIL] Не удалось переподключиться к SMTP: {e}')
+            return False, None
+
+        try:
+            await self._run(pooled.smtp.send_message, message)
+            self._sent += 1
+            return True, pooled
+        except Exception as e:
+            self._failed += 1
+            logger.error(f'[EMAIL] Ошибка отправки письма {message["To"]}: {e}')
+            if _is_connection_error(e):
+                await self._run(self._quit, pooled.smtp)
+                return False, None
+            return False, pooled
+
+    async def _acquire(self) -> _PooledConnection:
+        # Берём самое свежее соединение: у него меньше шансов быть закрытым сервером
+        while self._idle:
+            pooled = self._idle.pop()
+            idle_for = time.monotonic() - pooled.last_used
+
+            if idle_for > self.idle_timeout:
+                await self._run(self._quit, pooled.smtp)
+                continue
+            if idle_for > self.health_check_interval and not await self._run(
+                self._is_alive, pooled.smtp
+            ):
+                await self._run(self._quit, pooled.smtp)
+                continue
+
+            self._reused += 1
+            return pooled
+
+        return await self._open()
+
+    async def _open(self) -> _PooledConnection:
+        smtp = await self._run(self._connection_factory)
+        self._created += 1
+        logger.debug(f'[EMAIL] Открыто SMTP соединение ({self._created} всего)')
+        return _PooledConnection(smtp=smtp, last_used=time.monotonic())
+
+    def _release(self, pooled: _PooledConnection) -> None:
+        pooled.last_used = time.monotonic()
+        self._idle.append(pooled)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    # ========== SYNC SMTP (выполняется в пуле потоков) ==========
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()  # Включаем шифрование TLS
+            if self.username:
+                server.login(self.username, self.password or '')
+        except Exception:
+            self._quit(server)
+            raise
+        return server
+
+    @staticmethod
+    def _is_alive(smtp: smtplib.SMTP) -> bool:
+        try:
+            return smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except Exception:
+            try:
+                smtp.close()
+            except Exception:
+                pass
+
+
+# Singleton - один пул на процесс
+smtp_pool = SMTPConnectionPool(
+    host=settings.SMTP_HOST,
+    port=settings.SMTP_PORT,
+    username=settings.SMTP_USER,
+    password=settings.SMTP_PASSWORD,
+    use_tls=settings.SMTP_USE_TLS,
+    max_size=settings.SMTP_POOL_SIZE,
+    idle_timeout=settings.SMTP_POOL_IDLE_TIMEOUT,
+    timeout=settings.SMTP_TIMEOUT,
+)
@@ -0,0 +1,132 @@
+import html
+from dataclasses import dataclass
+from pathlib import Path
+from string import Template
+from typing import Dict, List, Optional
+
+from backend.core.logger import logger
+
+
+TEMPLATES_DIR = Path(__file__).parent / 'templates'
+
+
+class CompiledTemplate:
+    '''
+    Шаблон, разобранный один раз на статические куски и имена подстановок.
+
+    Синтаксис - как у string.Template (${name}, $$ для знака доллара),
+    но разбор выполняется при загрузке: рендер сводится к одному join
+    без повторного поиска плейсхолдеров в большом HTML.
+    '''
+
+    def __init__(self, source: str, escape: bool = False):
+        self.escape = escape
+        self._static: List[str] = []
+        self._names: List[str] = []
+
+        position = 0
+        chunk = ''
+        for match in Template.pattern.finditer(source):
+            chunk += source[position : match.start()]
+            position = match.end()
+
+            if match.group('escaped') is not None:
+                chunk += '$'
+                continue
+
+            name = match.group('named') or match.group('braced')
+            if name is None:
+                raise ValueError(f'Некорректный плейсхолдер в шаблоне: {match.group()}')
+
+            self._static.append(chunk)
+            self._names.append(name)
+            chunk = ''
+
+        self._static.append(chunk + source[position:])
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def render(self, context: Dict[str, object]) -> str:
+        parts = [self._static[0]]
+        for name, static in zip(self._names, self._static[1:]):
+            value = str(context[name])
+            parts.append(html.escape(value) if self.escape else value)
+            parts.append(static)
+        return ''.join(parts)
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    subject: str
+    html_content: str
+    text_content: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class EmailTemplate:
+    name: str
+    subject: CompiledTemplate
+    html: CompiledTemplate
+    text: Optional[CompiledTemplate] = None
+
+    def render(self, **context: object) -> RenderedEmail:
+        return RenderedEmail(
+            subject=self.subject.render(context),
+            html_content=self.html.render(context),
+            text_content=self.text.render(context) if self.text else None,
+        )
+
+
+class EmailTemplateRegistry:
+    '''
+    Реестр скомпилированных шаблонов писем.
+
+    Шаблон - пара файлов <name>.html и (необязательно) <name>.txt
+    в каталоге templates. Значения в HTML экранируются, в текстовой
+    версии - нет. Для новых типов событий достаточно положить файлы
+    и вызвать register().
+    '''
+
+    def __init__(self, directory: Path = TEMPLATES_DIR):
+        self.directory = directory
+        self._templates: Dict[str, EmailTemplate] = {}
+
+    def register(self, name: str, subject: str) -> EmailTemplate:
+        '''Загрузить и скомпилировать шаблон name из каталога.'''
+        html_path = self.directory / f'{name}.html'
+        text_path = self.directory / f'{name}.txt'
+
+        template = EmailTemplate(
+            name=name,
+            subject=CompiledTemplate(subject),
+            html=CompiledTemplate(html_path.read_text(encoding='utf-8'), escape=True),
+            text=(
+                CompiledTemplate(text_path.read_text(encoding='utf-8'))
+                if text_path.exists()
+                else None
+            ),
+        )
+        self._templates[name] = template
+        logger.debug(f'[EMAIL] Шаблон письма загружен: {name}')
+        return template
+
+    def get(self, name: str) -> EmailTemplate:
+        try:
+            return self._templates[name]
+        except KeyError:
+            raise KeyError(f'Шаблон письма не зарегистрирован: {name}')
+
+    def render(self, name: str, **context: object) -> RenderedEmail:
+        return self.get(name).render(**context)
+
+
+# Имена шаблонов
+VERIFICATION_TEMPLATE = 'verification'
+PASSWORD_RESET_TEMPLATE = 'password_reset'
+
+# Singleton - шаблоны компилируются один раз при импорте
+email_templates = EmailTemplateRegistry()
+email_templates.register(VERIFICATION_TEMPLATE, 'Подтвердите вашу почту в Attorney CRM')
+email_templates.register(PASSWORD_RESET_TEMPLATE, 'Сброс пароля в Attorney CRM')
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from backend.domain.entities.attorney import Attorney
 from backend.infrastructure.models import AttorneyORM
 
@@ -42,19 +44,27 @@ class AttorneyMapper:
         )
 
     @staticmethod
-    def update_orm(orm: 'AttorneyORM', domain: 'Attorney') -> None:
+    def update_values(domain: 'Attorney') -> Dict[str, Any]:
         '''
-        Обновляет существующий ORM объект значениями из доменной сущности.
-        Не обновляет id, created_at, updated_at (они управляются отдельно).
+        Значения колонок для UPDATE ... RETURNING из доменной сущности.
+        Не включает id, created_at, updated_at (они управляются отдельно).
         '''
-        orm.license_id = domain.license_id
-        orm.first_name = domain.first_name
-        orm.last_name = domain.last_name
-        orm.patronymic = domain.patronymic
-        orm.email = domain.email
-        orm.telegram_username = domain.telegram_username
-        orm.phone = domain.phone
-        orm.hashed_password = domain.hashed_password
-        orm.is_active = domain.is_active
-        orm.is_superuser = domain.is_superuser
-        orm.is_verified = domain.is_verified
+        return {
+            'license_id': domain.license_id,
+            'first_name': domain.first_name,
+            'last_name': domain.last_name,
+            'patronymic': domain.patronymic,
+            'email': domain.email,
+            'telegram_username': domain.telegram_username,
+            'phone': domain.phone,
+            'hashed_password': domain.hashed_password,
+            'is_active': domain.is_active,
+            'is_superuser': domain.is_superuser,
+            'is_verified': domain.is_verified,
+        }
+
+    @staticmethod
+    def update_orm(orm: 'AttorneyORM', domain: 'Attorney') -> None:
+        '''Обновляет существующий ORM объект значениями из доменной сущности.'''
+        for field, value in AttorneyMapper.update_values(domain).items():
+            setattr(orm, field, value)
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from backend.domain.entities.case import Case
 from backend.infrastructure.models import CaseORM
 
@@ -30,12 +32,20 @@ class CaseMapper:
         )
 
     @staticmethod
-    def update_orm(orm: CaseORM, domain: 'Case') -> None:
+    def update_values(domain: 'Case') -> Dict[str, Any]:
         '''
-        Обновляет существующий ORM объект значениями из доменной сущности.
-        Не обновляет id, created_at, updated_at, attorney_id (они управляются отдельно).
+        Значения колонок для UPDATE ... RETURNING из доменной сущности.
+        Не включает id, created_at, updated_at, attorney_id (они управляются отдельно).
         '''
-        orm.name = domain.name
-        orm.client_id = domain.client_id
-        orm.status = domain.status
-        orm.description = domain.description
+        return {
+            'name': domain.name,
+            'client_id': domain.client_id,
+            'status': domain.status,
+            'description': domain.description,
+        }
+
+    @staticmethod
+    def update_orm(orm: CaseORM, domain: 'Case') -> None:
+        '''Обновляет существующий ORM объект значениями из доменной сущности.'''
+        for field, value in CaseMapper.update_values(domain).items():
+            setattr(orm, field, value)
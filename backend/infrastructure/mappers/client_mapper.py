@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from backend.domain.entities.client import Client
 from backend.infrastructure.models import ClientORM
 
@@ -38,16 +40,25 @@ class ClientMapper:
         )
 
     @staticmethod
-    def update_orm(orm: ClientORM, domain: 'Client') -> None:
+    def update_values(domain: 'Client') -> Dict[str, Any]:
         '''
-        Обновляет существующий ORM объект значениями из доменной сущности.
-        Не обновляет id, created_at, updated_at, owner_attorney_id (они управляются отдельно).
+        Значения колонок для UPDATE ... RETURNING из доменной сущности.
+        Не включает id, created_at, updated_at, owner_attorney_id
+        (они управляются отдельно).
         '''
-        orm.name = domain.name
-        orm.type = domain.type
-        orm.email = domain.email
-        orm.phone = domain.phone
-        orm.personal_info = domain.personal_info
-        orm.address = domain.address
-        orm.messenger = domain.messenger
-        orm.messenger_handle = domain.messenger_handle
+        return {
+            'name': domain.name,
+            'type': domain.type,
+            'email': domain.email,
+            'phone': domain.phone,
+            'personal_info': domain.personal_info,
+            'address': domain.address,
+            'messenger': domain.messenger,
+            'messenger_handle': domain.messenger_handle,
+        }
+
+    @staticmethod
+    def update_orm(orm: ClientORM, domain: 'Client') -> None:
+        '''Обновляет существующий ORM объект значениями из доменной сущности.'''
+        for field, value in ClientMapper.update_values(domain).items():
+            setattr(orm, field, value)
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from backend.domain.entities.contact import Contact
 from backend.infrastructure.models import ContactORM
 
@@ -32,13 +34,21 @@ class ContactMapper:
         )
 
     @staticmethod
-    def update_orm(orm: ContactORM, domain: 'Contact') -> None:
+    def update_values(domain: 'Contact') -> Dict[str, Any]:
         '''
-        Обновляет существующий ORM объект значениями из доменной сущности.
-        Не обновляет id, created_at, updated_at, attorney_id (они управляются отдельно).
+        Значения колонок для UPDATE ... RETURNING из доменной сущности.
+        Не включает id, created_at, updated_at, attorney_id (они управляются отдельно).
         '''
-        orm.name = domain.name
-        orm.personal_info = domain.personal_info
-        orm.phone = domain.phone
-        orm.email = domain.email
-        orm.case_id = domain.case_id
+        return {
+            'name': domain.name,
+            'personal_info': domain.personal_info,
+            'phone': domain.phone,
+            'email': domain.email,
+            'case_id': domain.case_id,
+        }
+
+    @staticmethod
+    def update_orm(orm: ContactORM, domain: 'Contact') -> None:
+        '''Обновляет существующий ORM объект значениями из доменной сущности.'''
+        for field, value in ContactMapper.update_values(domain).items():
+            setattr(orm, field, value)
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from backend.domain.entities.document import Document
 from backend.infrastructure.models import DocumentORM
 
@@ -15,6 +17,7 @@ class DocumentMapper:
             attorney_id=orm.attorney_id,
             description=orm.description,
             mime_type=orm.mime_type,
+            content_hash=orm.content_hash,
             created_at=orm.created_at,
             updated_at=orm.updated_at,
         )
@@ -31,6 +34,7 @@ class DocumentMapper:
             attorney_id=domain.attorney_id,
             description=domain.description,
             mime_type=domain.mime_type,
+            content_hash=domain.content_hash,
         )
         # Устанавливаем id только если он не None
         if domain.id is not None:
@@ -42,13 +46,23 @@ class DocumentMapper:
         return orm_doc
 
     @staticmethod
-    def update_orm(orm: DocumentORM, domain: 'Document') -> None:
+    def update_values(domain: 'Document') -> Dict[str, Any]:
         '''
-        Обновляет существующий ORM объект значениями из доменной сущности.
-        Не обновляет id, created_at, updated_at, case_id, attorney_id (они управляются отдельно).
+        Значения колонок для UPDATE ... RETURNING из доменной сущности.
+        Не включает id, created_at, updated_at, case_id, attorney_id
+        (они управляются отдельно).
         '''
-        orm.file_name = domain.file_name
-        orm.storage_path = domain.storage_path
-        orm.file_size = domain.file_size
-        orm.description = domain.description
-        orm.mime_type = domain.mime_type
+        return {
+            'file_name': domain.file_name,
+            'storage_path': domain.storage_path,
+            'file_size': domain.file_size,
+            'description': domain.description,
+            'mime_type': domain.mime_type,
+            'content_hash': domain.content_hash,
+        }
+
+    @staticmethod
+    def update_orm(orm: DocumentORM, domain: 'Document') -> None:
+        '''Обновляет существующий ORM объект значениями из доменной сущности.'''
+        for field, value in DocumentMapper.update_values(domain).items():
+            setattr(orm, field, value)
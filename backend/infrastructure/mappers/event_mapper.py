@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from backend.domain.entities.event import Event
 from backend.infrastructure.models import EventORM
 
@@ -30,12 +32,21 @@ class EventMapper:
         )
 
     @staticmethod
-    def update_orm(orm: EventORM, domain: 'Event') -> None:
+    def update_values(domain: 'Event') -> Dict[str, Any]:
         '''
-        Обновляет существующий ORM объект значениями из доменной сущности.
-        Не обновляет id, created_at, updated_at, case_id, attorney_id (они управляются отдельно).
+        Значения колонок для UPDATE ... RETURNING из доменной сущности.
+        Не включает id, created_at, updated_at, case_id, attorney_id
+        (они управляются отдельно).
         '''
-        orm.name = domain.name
-        orm.description = domain.description
-        orm.event_type = domain.event_type
-        orm.event_date = domain.event_date
+        return {
+            'name': domain.name,
+            'description': domain.description,
+            'event_type': domain.event_type,
+            'event_date': domain.event_date,
+        }
+
+    @staticmethod
+    def update_orm(orm: EventORM, domain: 'Event') -> None:
+        '''Обновляет существующий ORM объект значениями из доменной сущности.'''
+        for field, value in EventMapper.update_values(domain).items():
+            setattr(orm, field, value)
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from backend.domain.entities.payment_detail import PaymentDetail
 from backend.infrastructure.models.payment_detail import PaymentDetailORM
 
@@ -38,16 +40,24 @@ class PaymentDetailMapper:
         )
 
     @staticmethod
-    def update_orm(orm: PaymentDetailORM, domain: 'PaymentDetail') -> None:
+    def update_values(domain: 'PaymentDetail') -> Dict[str, Any]:
         '''
-        Обновляет существующий ORM объект значениями из доменной сущности.
-        Не обновляет id, created_at, updated_at, attorney_id (они управляются отдельно).
+        Значения колонок для UPDATE ... RETURNING из доменной сущности.
+        Не включает id, created_at, updated_at, attorney_id (они управляются отдельно).
         '''
-        orm.inn = domain.inn
-        orm.kpp = domain.kpp
-        orm.index_address = domain.index_address
-        orm.address = domain.address
-        orm.bank_account = domain.bank_account
-        orm.correspondent_account = domain.correspondent_account
-        orm.bik = domain.bik
-        orm.bank_recipient = domain.bank_recipient
+        return {
+            'inn': domain.inn,
+            'kpp': domain.kpp,
+            'index_address': domain.index_address,
+            'address': domain.address,
+            'bank_account': domain.bank_account,
+            'correspondent_account': domain.correspondent_account,
+            'bik': domain.bik,
+            'bank_recipient': domain.bank_recipient,
+        }
+
+    @staticmethod
+    def update_orm(orm: PaymentDetailORM, domain: 'PaymentDetail') -> None:
+        '''Обновляет существующий ORM объект значениями из доменной сущности.'''
+        for field, value in PaymentDetailMapper.update_values(domain).items():
+            setattr(orm, field, value)
@@ -1,4 +1,6 @@
 from datetime import datetime, date
+from typing import Any, Dict
+
 from backend.domain.entities.client_payment import ClientPayment
 from backend.infrastructure.models import ClientPaymentORM
 
@@ -27,6 +29,7 @@ class ClientPaymentMapper:
             status=orm.status,
             taxable=orm.taxable,
             condition=orm.condition,
+            pdf_status=orm.pdf_status,
             created_at=orm.created_at,
             updated_at=orm.updated_at,
         )
@@ -57,13 +60,15 @@ class ClientPaymentMapper:
             status=domain.status,
             taxable=domain.taxable,
             condition=domain.condition,
+            pdf_status=domain.pdf_status,
         )
 
     @staticmethod
-    def update_orm(orm: ClientPaymentORM, domain: 'ClientPayment') -> None:
+    def update_values(domain: 'ClientPayment') -> Dict[str, Any]:
         '''
-        Обновляет существующий ORM объект значениями из доменной сущности.
-        Не обновляет id, created_at, updated_at, client_id, attorney_id (они управляются отдельно).
+        Значения колонок для UPDATE ... RETURNING из доменной сущности.
+        Не включает id, created_at, updated_at, client_id, attorney_id
+        (они управляются отдельно).
         '''
         # Преобразуем date в datetime для paid_deadline (если нужно)
         paid_deadline_datetime = None
@@ -76,11 +81,19 @@ class ClientPaymentMapper:
             elif isinstance(domain.paid_deadline, datetime):
                 paid_deadline_datetime = domain.paid_deadline
 
-        orm.name = domain.name
-        orm.paid = domain.paid
-        orm.paid_str = domain.paid_str
-        orm.pade_date = domain.pade_date
-        orm.paid_deadline = paid_deadline_datetime
-        orm.status = domain.status
-        orm.taxable = domain.taxable
-        orm.condition = domain.condition
+        return {
+            'name': domain.name,
+            'paid': domain.paid,
+            'paid_str': domain.paid_str,
+            'pade_date': domain.pade_date,
+            'paid_deadline': paid_deadline_datetime,
+            'status': domain.status,
+            'taxable': domain.taxable,
+            'condition': domain.condition,
+        }
+
+    @staticmethod
+    def update_orm(orm: ClientPaymentORM, domain: 'ClientPayment') -> None:
+        '''Обновляет существующий ORM объект значениями из доменной сущности.'''
+        for field, value in ClientPaymentMapper.update_values(domain).items():
+            setattr(orm, field, value)
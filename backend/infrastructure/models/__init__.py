@@ -1,9 +1,11 @@
 from backend.infrastructure.models._base import Base
 from backend.infrastructure.models.attorney import AttorneyORM
+from backend.infrastructure.models.attorney_dashboard import AttorneyDashboardORM
 from backend.infrastructure.models.case import CaseORM
 from backend.infrastructure.models.client import ClientORM
 from backend.infrastructure.models.contact import ContactORM
 from backend.infrastructure.models.document import DocumentORM
+from backend.infrastructure.models.document_blob import DocumentBlobORM
 from backend.infrastructure.models.event import EventORM
 from backend.infrastructure.models.outbox import OutboxORM
 from backend.infrastructure.models.mixins import TimeStampMixin
@@ -17,10 +19,12 @@ from backend.infrastructure.models.payment_detail import PaymentDetailORM
 __all__ = [
     'Base',
     'AttorneyORM',
+    'AttorneyDashboardORM',
     'ClientORM',
     'ContactORM',
     'CaseORM',
     'DocumentORM',
+    'DocumentBlobORM',
     'EventORM',
     'OutboxORM',
     'TimeStampMixin',
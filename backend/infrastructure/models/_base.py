@@ -1,3 +1,4 @@
+from sqlalchemy import DDL, Index, event
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -13,3 +14,29 @@ class Base(DeclarativeBase):
     '''
 
     pass
+
+
+# Индексам trgm_index нужно расширение pg_trgm. В БД его ставит миграция,
+# здесь - для Base.metadata.create_all (тестовая БД)
+event.listen(
+    Base.metadata, 'before_create', DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+)
+
+
+def trgm_index(table: str, column: str) -> Index:
+    '''GIN индекс триграмм (pg_trgm) для нечеткого поиска ILIKE / % по колонке.'''
+    return Index(
+        f'ix_{table}_{column}_trgm',
+        column,
+        postgresql_using='gin',
+        postgresql_ops={column: 'gin_trgm_ops'},
+    )
+
+
+def keyset_index(table: str, column: str) -> Index:
+    '''
+    Составной индекс (column, created_at, id) для выборок «записи владельца,
+    новые первыми»: обслуживает и фильтр, и сортировку keyset-пагинации
+    без отдельного шага Sort (индекс читается в обратном порядке).
+    '''
+    return Index(f'ix_{table}_{column}_created_at', column, 'created_at', 'id')
@@ -0,0 +1,34 @@
+# backend/infrastructure/models/attorney_dashboard.py
+from __future__ import annotations
+from datetime import datetime
+from typing import Any
+from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from backend.infrastructure.models._base import Base
+
+
+class AttorneyDashboardORM(Base):
+    '''
+    Готовая сводка дашборда юриста (read model).
+
+    Запись дел, событий, платежей и документов увеличивает version;
+    сводка актуальна, пока refreshed_version == version и не наступил
+    valid_until (ближайшее событие или срок оплаты, после которого
+    меняются «предстоящие» и «просроченные»).
+    '''
+
+    __tablename__ = 'attorney_dashboards'
+
+    attorney_id: Mapped[int] = mapped_column(
+        ForeignKey('attorneys.id', ondelete='CASCADE'), primary_key=True
+    )
+    summary: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default='1'
+    )
+    refreshed_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default='0'
+    )
+    valid_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    refreshed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from sqlalchemy import String, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.infrastructure.models._base import Base
+from backend.infrastructure.models._base import Base, keyset_index, trgm_index
 from backend.infrastructure.models.mixins import TimeStampMixin
 from typing import TYPE_CHECKING
 
@@ -18,6 +18,11 @@ if TYPE_CHECKING:
 
 class CaseORM(TimeStampMixin, Base):
     __tablename__ = 'cases'
+    __table_args__ = (
+        trgm_index('cases', 'name'),
+        trgm_index('cases', 'description'),
+        keyset_index('cases', 'attorney_id'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -25,7 +30,7 @@ class CaseORM(TimeStampMixin, Base):
         ForeignKey('clients.id', ondelete='RESTRICT'), nullable=False, index=True
     )
     attorney_id: Mapped[int] = mapped_column(
-        ForeignKey('attorneys.id', ondelete='RESTRICT'), nullable=False, index=True
+        ForeignKey('attorneys.id', ondelete='RESTRICT'), nullable=False
     )
     status: Mapped[str] = mapped_column(String(50), nullable=False)
     description: Mapped[str | None] = mapped_column(String(255))
@@ -1,7 +1,7 @@
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import Index, String, ForeignKey, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from backend.domain.entities.auxiliary import Messenger
-from backend.infrastructure.models._base import Base
+from backend.infrastructure.models._base import Base, keyset_index, trgm_index
 from backend.infrastructure.models.mixins import TimeStampMixin
 from typing import TYPE_CHECKING
 
@@ -14,8 +14,33 @@ if TYPE_CHECKING:
     )
 
 
+# Поля, уникальные среди клиентов одного юриста. Пустые значения не участвуют
+CLIENT_UNIQUE_FIELDS = ('email', 'phone', 'personal_info')
+
+
+def client_unique_index_name(field: str) -> str:
+    return f'ix_clients_owner_attorney_id_{field}'
+
+
 class ClientORM(TimeStampMixin, Base):
     __tablename__ = 'clients'
+    __table_args__ = (
+        trgm_index('clients', 'name'),
+        trgm_index('clients', 'phone'),
+        trgm_index('clients', 'email'),
+        keyset_index('clients', 'owner_attorney_id'),
+        # Уникальность в пределах юриста; по ним же идет проверка ClientPolicy
+        *(
+            Index(
+                client_unique_index_name(field),
+                'owner_attorney_id',
+                field,
+                unique=True,
+                postgresql_where=text(f"{field} <> ''"),
+            )
+            for field in CLIENT_UNIQUE_FIELDS
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -28,7 +53,7 @@ class ClientORM(TimeStampMixin, Base):
     messenger_handle: Mapped[str] = mapped_column(String(50))
 
     owner_attorney_id: Mapped[int] = mapped_column(
-        ForeignKey('attorneys.id', ondelete='RESTRICT'), nullable=False, index=True
+        ForeignKey('attorneys.id', ondelete='RESTRICT'), nullable=False
     )
 
     # связи
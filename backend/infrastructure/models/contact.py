@@ -1,7 +1,7 @@
 from __future__ import annotations
 from sqlalchemy import String, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.infrastructure.models._base import Base
+from backend.infrastructure.models._base import Base, keyset_index, trgm_index
 from backend.infrastructure.models.mixins import TimeStampMixin
 from typing import TYPE_CHECKING
 
@@ -11,6 +11,12 @@ if TYPE_CHECKING:
 
 class ContactORM(TimeStampMixin, Base):
     __tablename__ = 'contacts'
+    __table_args__ = (
+        trgm_index('contacts', 'name'),
+        trgm_index('contacts', 'phone'),
+        keyset_index('contacts', 'attorney_id'),
+        keyset_index('contacts', 'case_id'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -20,13 +26,11 @@ class ContactORM(TimeStampMixin, Base):
     attorney_id: Mapped[int] = mapped_column(
         ForeignKey('attorneys.id', ondelete='CASCADE'),
         nullable=False,
-        index=True,
     )
     attorney: Mapped['AttorneyORM'] = relationship(back_populates='contacts')
 
     case_id: Mapped[int] = mapped_column(
         ForeignKey('cases.id', ondelete='CASCADE'),
         nullable=False,
-        index=True,
     )
     case: Mapped['CaseORM'] = relationship(back_populates='contacts')
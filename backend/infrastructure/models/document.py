@@ -1,8 +1,10 @@
 # backend/infrastructure/models/document.py
 from __future__ import annotations
-from sqlalchemy import String, ForeignKey
+from datetime import datetime
+from sqlalchemy import DateTime, Index, String, ForeignKey
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.infrastructure.models._base import Base
+from backend.infrastructure.models._base import Base, keyset_index
 from backend.infrastructure.models.mixins import TimeStampMixin
 from typing import TYPE_CHECKING
 
@@ -12,6 +14,11 @@ if TYPE_CHECKING:
 
 class DocumentORM(TimeStampMixin, Base):
     __tablename__ = 'documents'
+    __table_args__ = (
+        Index('ix_documents_search_vector', 'search_vector', postgresql_using='gin'),
+        keyset_index('documents', 'case_id'),
+        keyset_index('documents', 'attorney_id'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     file_name: Mapped[str] = mapped_column(String(300), nullable=False)
@@ -19,12 +26,20 @@ class DocumentORM(TimeStampMixin, Base):
     file_size: Mapped[str | None] = mapped_column(String(64))
     description: Mapped[str] = mapped_column(String(500))
     mime_type: Mapped[str | None] = mapped_column(String(100))
-
-    case_id: Mapped[int] = mapped_column(
-        ForeignKey('cases.id', ondelete='SET NULL'), index=True
+    # SHA-256 содержимого; у документов до дедупликации - NULL
+    content_hash: Mapped[str | None] = mapped_column(
+        ForeignKey('document_blobs.sha256'), index=True
     )
+    # Полнотекстовый индекс: имя (A), описание (B), текст файла (C).
+    # Заполняется воркером Outbox; deferred - не грузим в обычных запросах
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, deferred=True)
+    text_indexed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), deferred=True
+    )
+
+    case_id: Mapped[int] = mapped_column(ForeignKey('cases.id', ondelete='SET NULL'))
     attorney_id: Mapped[int] = mapped_column(
-        ForeignKey('attorneys.id', ondelete='SET NULL'), index=True
+        ForeignKey('attorneys.id', ondelete='SET NULL')
     )
 
     case: Mapped['CaseORM'] = relationship(back_populates='documents')
@@ -0,0 +1,24 @@
+# backend/infrastructure/models/document_blob.py
+from __future__ import annotations
+from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from backend.infrastructure.models._base import Base
+from backend.infrastructure.models.mixins import TimeStampMixin
+
+
+class DocumentBlobORM(TimeStampMixin, Base):
+    '''
+    Файл в контентно-адресуемом хранилище.
+
+    Один и тот же файл, прикрепленный к нескольким делам, хранится один раз;
+    ref_count - число документов, ссылающихся на него.
+    '''
+
+    __tablename__ = 'document_blobs'
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    storage_path: Mapped[str] = mapped_column(String(1000), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    ref_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default='1'
+    )
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from datetime import datetime
-from sqlalchemy import String, ForeignKey, DateTime
+from sqlalchemy import Index, String, ForeignKey, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.infrastructure.models._base import Base
+from backend.infrastructure.models._base import Base, keyset_index
 from backend.infrastructure.models.mixins import TimeStampMixin
 from typing import TYPE_CHECKING
 
@@ -12,6 +12,12 @@ if TYPE_CHECKING:
 
 class EventORM(TimeStampMixin, Base):
     __tablename__ = 'events'
+    __table_args__ = (
+        keyset_index('events', 'attorney_id'),
+        keyset_index('events', 'case_id'),
+        # Ближайшие события юриста: attorney_id = ? AND event_date >= now()
+        Index('ix_events_attorney_id_event_date', 'attorney_id', 'event_date'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -22,10 +28,10 @@ class EventORM(TimeStampMixin, Base):
     )
 
     case_id: Mapped[int] = mapped_column(
-        ForeignKey('cases.id', ondelete='CASCADE'), nullable=False, index=True
+        ForeignKey('cases.id', ondelete='CASCADE'), nullable=False
     )
     attorney_id: Mapped[int] = mapped_column(
-        ForeignKey('attorneys.id', ondelete='RESTRICT'), nullable=False, index=True
+        ForeignKey('attorneys.id', ondelete='RESTRICT'), nullable=False
     )
 
     case: Mapped['CaseORM'] = relationship(back_populates='events')
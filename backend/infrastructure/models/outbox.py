@@ -1,13 +1,17 @@
 """ORM модель для Outbox Pattern."""
 
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, DateTime
+from sqlalchemy import DateTime, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 from enum import Enum
 from backend.infrastructure.models._base import Base
 from backend.infrastructure.models.mixins import TimeStampMixin
 
 
+# Канал LISTEN/NOTIFY, в который сообщается о новых событиях
+OUTBOX_NOTIFY_CHANNEL = 'outbox_events'
+
+
 class OutboxStatus(str, Enum):
     """Статусы обработки события в Outbox."""
 
@@ -21,12 +25,28 @@ class OutboxEventType(str, Enum):
     """Типы событий в Outbox."""
 
     ATTORNEY_REGISTERED = 'attorney_registered'  # Регистрация адвоката
+    PAYMENT_CREATED = 'payment_created'  # Создан платеж (нужен PDF счета)
+    DOCUMENT_UPLOADED = 'document_uploaded'  # Загружен документ (индексация текста)
 
 
 class OutboxORM(TimeStampMixin, Base):
     """ORM модель для таблицы outbox."""
 
     __tablename__ = 'outbox'
+    __table_args__ = (
+        # Очередь воркера: частичные индексы покрывают только живые события,
+        # поэтому не растут вместе с историей обработанных
+        Index(
+            'ix_outbox_pending_created_at',
+            'created_at',
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index(
+            'ix_outbox_processing_locked_until',
+            'locked_until',
+            postgresql_where=text("status = 'processing'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     event_type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
@@ -39,3 +59,8 @@ class OutboxORM(TimeStampMixin, Base):
     processed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Аренда события воркером: пока не истекла, другие воркеры его не берут.
+    # Просроченная аренда PROCESSING означает, что воркер упал посреди обработки.
+    locked_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import String, ForeignKey, Date, DateTime, Boolean, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from backend.infrastructure.models._base import Base
+from backend.infrastructure.models._base import Base, keyset_index
 from backend.infrastructure.models.mixins import TimeStampMixin
 
 
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 
 class ClientPaymentORM(TimeStampMixin, Base):
     __tablename__ = 'client_payments'
+    __table_args__ = (keyset_index('client_payments', 'attorney_id'),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -27,7 +28,6 @@ class ClientPaymentORM(TimeStampMixin, Base):
     attorney_id: Mapped[int] = mapped_column(
         ForeignKey('attorneys.id', ondelete='RESTRICT'),
         nullable=False,
-        index=True,
     )
 
     # Денежные поля
@@ -43,6 +43,11 @@ class ClientPaymentORM(TimeStampMixin, Base):
     taxable: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     condition: Mapped[str | None] = mapped_column(String(255))
 
+    # Готовность PDF счета (PdfStatus): генерируется воркером Outbox
+    pdf_status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default='pending', server_default='pending'
+    )
+
     # Отношения
     attorney: Mapped['AttorneyORM'] = relationship(back_populates='client_payments')
     client: Mapped['ClientORM'] = relationship(back_populates='client_payments')
@@ -1,3 +1,3 @@
-from backend.infrastructure.pdf.pdf_generator import PDFGenerator
+from backend.infrastructure.pdf.pdf_generator import PDFGenerator, pdf_generator
 
-__all__ = ['PDFGenerator']
+__all__ = ['PDFGenerator', 'pdf_generator']
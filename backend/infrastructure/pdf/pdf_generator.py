@@ -3,9 +3,12 @@
 Использует pypdf для работы с PDF файлами.
 '''
 
+import asyncio
 import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from datetime import date, datetime
 
 from pypdf import PdfReader, PdfWriter
@@ -31,19 +34,30 @@ class PDFGenerator:
     3. Overlay накладывается на шаблон
     4. Возвращается готовый PDF документ
 
+    Шаблон и конфиг держатся в памяти и перечитываются только при изменении
+    mtime файла, поэтому используется долгоживущий экземпляр pdf_generator.
+
     Использование:
-        generator = PDFGenerator()
-        pdf_bytes = generator.fill_invoice_template(
+        pdf_bytes = pdf_generator.fill_invoice_template(
             payment=payment_entity,
             payment_detail=payment_detail_entity
         )
+        pdf_files = pdf_generator.render_many([(payment, detail), ...])
     '''
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(
+        self,
+        config_path: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+        template_path: Optional[Path] = None,
+    ):
         '''
         Args:
             config_path: Путь к конфиг-файлу с координатами полей.
                         По умолчанию: backend/infrastructure/pdf/config/invoice_fields.json
+            template_path: Путь к PDF шаблону (по умолчанию - FILE_STORAGE_TEMPLATE)
+            max_workers: Размер пула процессов для render_many
+                        (по умолчанию - число CPU)
         '''
         if config_path is None:
             base_dir = Path(__file__).parent.parent.parent
@@ -52,8 +66,49 @@ class PDFGenerator:
             )
 
         self.config_path = Path(config_path)
-        self.config = self._load_config()
         self.base_dir = Path(__file__).parent.parent.parent.parent
+        self.max_workers = max_workers
+        self.template_path = Path(template_path) if template_path else None
+
+        # Кэш: (mtime_ns, значение). Сбрасывается, когда файл на диске меняется
+        self._config_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._template_cache: Optional[Tuple[Path, int, PdfReader]] = None
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    # ========== КЭШ КОНФИГА И ШАБЛОНА ==========
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        '''Конфигурация полей; перечитывается только при изменении файла.'''
+        mtime = self._mtime(self.config_path)
+        cached = self._config_cache
+        if cached is None or cached[0] != mtime:
+            with self._lock:
+                self._config_cache = (mtime, self._load_config())
+            cached = self._config_cache
+        return cached[1]
+
+    def _get_template_reader(self) -> PdfReader:
+        '''Разобранный PDF шаблон; перечитывается только при изменении файла.'''
+        template_path = self._get_template_path()
+        mtime = self._mtime(template_path)
+        cached = self._template_cache
+        if cached is None or cached[0] != template_path or cached[1] != mtime:
+            with self._lock:
+                # Читаем в память целиком: reader не держит файл открытым
+                reader = PdfReader(BytesIO(template_path.read_bytes()))
+                self._template_cache = (template_path, mtime, reader)
+            logger.info(f'PDF шаблон загружен в кэш: {template_path}')
+            cached = self._template_cache
+        return cached[2]
+
+    @staticmethod
+    def _mtime(path: Path) -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f'Файл не найден: {path}')
 
     def _load_config(self) -> Dict[str, Any]:
         '''Загружает конфигурацию полей из JSON файла.'''
@@ -71,8 +126,8 @@ class PDFGenerator:
 
     def _get_template_path(self) -> Path:
         '''Возвращает путь к PDF шаблону из настроек (.env).'''
-        # Берем путь из настроек (FILE_STORAGE_TEMPLATE)
-        template_path_str = settings.FILE_STORAGE_TEMPLATE
+        # Явно заданный путь или путь из настроек (FILE_STORAGE_TEMPLATE)
+        template_path_str = self.template_path or settings.FILE_STORAGE_TEMPLATE
 
         if not template_path_str:
             raise ValidationException(
@@ -87,7 +142,6 @@ class PDFGenerator:
                 f'Проверьте путь FILE_STORAGE_TEMPLATE в .env файле'
             )
 
-        logger.info(f'Используется PDF шаблон: {template_path}')
         return template_path
 
     def _format_date(self, date_value: date) -> str:
@@ -243,24 +297,26 @@ class PDFGenerator:
             bytes: Готовый PDF документ в виде байтов
         '''
         try:
-            # Загружаем шаблон
-            template_path = self._get_template_path()
-            template_reader = PdfReader(str(template_path))
+            # Шаблон из кэша; add_page клонирует страницы, кэш не изменяется
+            template_reader = self._get_template_reader()
             template_writer = PdfWriter()
 
-            # Копируем страницы шаблона
-            for page in template_reader.pages:
-                template_writer.add_page(page)
+            # Копируем страницы шаблона. Reader общий для потоков и читает
+            # из одного буфера - клонирование страниц сериализуем
+            with self._lock:
+                for page in template_reader.pages:
+                    template_writer.add_page(page)
 
             # Подготавливаем данные
             static_data = self._prepare_static_data(payment_detail)
             dynamic_data = self._prepare_dynamic_data(payment)
 
             # Объединяем все данные
+            config = self.config
             all_data = {**static_data, **dynamic_data}
             all_fields_config = {
-                **self.config['fields']['static'],
-                **self.config['fields']['dynamic'],
+                **config['fields']['static'],
+                **config['fields']['dynamic'],
             }
 
             # Создаем overlay PDF с текстом
@@ -286,3 +342,90 @@ class PDFGenerator:
         except Exception as e:
             logger.error(f'Ошибка при генерации PDF: {e}')
             raise Exception(f'Ошибка при генерации PDF документа: {e}')
+
+    # ========== ГЕНЕРАЦИЯ ВНЕ EVENT LOOP ==========
+
+    async def render(self, payment: Any, payment_detail: Any) -> bytes:
+        '''
+        Сгенерировать счет в пуле процессов, не блокируя event loop.
+
+        Используется воркером Outbox: pypdf и reportlab занимают CPU
+        на сотни миллисекунд.
+        '''
+        if self.max_workers == 1:
+            return await asyncio.to_thread(
+                self.fill_invoice_template, payment, payment_detail
+            )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), _render_in_worker, (payment, payment_detail)
+        )
+
+    # ========== ПАКЕТНАЯ ГЕНЕРАЦИЯ ==========
+
+    def render_many(
+        self, invoices: Sequence[Tuple[Any, Any]], chunksize: int = 8
+    ) -> List[bytes]:
+        '''
+        Сгенерировать много счетов параллельно в пуле процессов.
+
+        pypdf и reportlab - чистый Python под GIL, поэтому для массовых
+        выгрузок (ежемесячное выставление счетов) используются процессы.
+        Каждый процесс пула держит свой PDFGenerator с кэшем шаблона.
+
+        Args:
+            invoices: Пары (payment, payment_detail)
+            chunksize: Сколько счетов передавать процессу за раз
+
+        Returns:
+            PDF документы в порядке invoices
+        '''
+        if len(invoices) < 2 or self.max_workers == 1:
+            return [self.fill_invoice_template(p, d) for p, d in invoices]
+
+        executor = self._get_executor()
+        return list(executor.map(_render_in_worker, invoices, chunksize=chunksize))
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                # Путь к шаблону передаём явно: процесс может не унаследовать настройки
+                initargs=(str(self.config_path), str(self._get_template_path())),
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        '''Остановить пул процессов render_many.'''
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def invoice_file_path(payment_id: int) -> str:
+    '''Путь PDF счета платежа в файловом хранилище.'''
+    return f'payments/{payment_id}/invoice_{payment_id}.pdf'
+
+
+# ========== ПРОЦЕСС ПУЛА render / render_many ==========
+# Функции уровня модуля - чтобы их можно было передать в ProcessPoolExecutor
+
+_worker_generator: Optional[PDFGenerator] = None
+
+
+def _init_worker(config_path: str, template_path: str) -> None:
+    global _worker_generator
+    _worker_generator = PDFGenerator(
+        Path(config_path), max_workers=1, template_path=Path(template_path)
+    )
+
+
+def _render_in_worker(invoice: Tuple[Any, Any]) -> bytes:
+    payment, payment_detail = invoice
+    return _worker_generator.fill_invoice_template(payment, payment_detail)
+
+
+# Singleton - долгоживущий генератор с кэшем шаблона и конфига
+pdf_generator = PDFGenerator()
@@ -0,0 +1,72 @@
+from dataclasses import asdict
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+
+from backend.core.logger import logger
+from backend.core.settings import settings
+from backend.domain.entities.attorney import Attorney
+from backend.infrastructure.redis.cache import cached_object
+from backend.infrastructure.redis.client import redis_client
+from backend.infrastructure.redis.keys import RedisKeys
+
+
+class AttorneyCache:
+    '''
+    Read-through кэш профиля юриста в Redis.
+
+    hashed_password в кэш не попадает: закэшированная сущность подходит
+    для проверок прав и отдачи профиля, но не для проверки пароля.
+    '''
+
+    # Поля, которые никогда не кладём в Redis
+    _EXCLUDED_FIELDS = ('hashed_password',)
+    _DATETIME_FIELDS = ('created_at', 'updated_at')
+
+    @staticmethod
+    def _dump(attorney: Attorney) -> dict:
+        '''Компактная сериализация: без секретов и без пустых полей.'''
+        data = {}
+        for field, value in asdict(attorney).items():
+            if field in AttorneyCache._EXCLUDED_FIELDS or value is None:
+                continue
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            data[field] = value
+        return data
+
+    @staticmethod
+    def _load(data: dict) -> Attorney:
+        data = dict(data)
+        for field in AttorneyCache._DATETIME_FIELDS:
+            if data.get(field):
+                data[field] = datetime.fromisoformat(data[field])
+        data.setdefault('patronymic', None)
+        return Attorney(hashed_password='', **data)
+
+    @staticmethod
+    async def get_or_load(
+        attorney_id: int, loader: Callable[[], Awaitable[Optional[Attorney]]]
+    ) -> Optional[Attorney]:
+        '''Вернуть юриста из кэша, при промахе - через loader (из БД).'''
+
+        async def load_dict() -> Optional[dict]:
+            attorney = await loader()
+            return AttorneyCache._dump(attorney) if attorney else None
+
+        data = await cached_object(
+            redis_client,
+            RedisKeys.attorney_cache(attorney_id),
+            settings.ATTORNEY_CACHE_TTL,
+            load_dict,
+        )
+        return AttorneyCache._load(data) if data else None
+
+    @staticmethod
+    async def invalidate(attorney_id: int) -> None:
+        '''Сбросить кэш юриста (после изменения или удаления записи).'''
+        try:
+            await redis_client.delete(RedisKeys.attorney_cache(attorney_id))
+            logger.debug(f'Кэш ЮРИСТА сброшен. ID - {attorney_id}')
+        except Exception as e:
+            # Запись в БД важнее кэша: устаревшее значение проживёт не дольше TTL
+            logger.warning(f'Не удалось сбросить кэш ЮРИСТА ID={attorney_id}: {e}')
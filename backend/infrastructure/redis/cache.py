@@ -1,24 +1,41 @@
-import json
-from typing import Callable, TypeVar, Awaitable
+from typing import Callable, TypeVar, Awaitable, TYPE_CHECKING
 
-from redis.asyncio import Redis
+from backend.core.logger import logger
+
+if TYPE_CHECKING:
+    from backend.infrastructure.redis.client import RedisClient
 
 T = TypeVar('T')
 
 
-async def cached_json(
-    redis: Redis,
+async def cached_object(
+    redis: 'RedisClient',
     key: str,
     ttl: int,
     loader: Callable[[], Awaitable[dict | None]],
 ) -> dict | None:
-    raw = await redis.get(key)
-    if raw:
-        return json.loads(raw)
+    '''
+    Read-through кэш для объектов (dict).
+
+    Сериализацию выполняет кодек RedisClient (msgpack с тегом типа).
+
+    Ищет значение по ключу, при промахе вызывает loader и кладёт результат
+    в Redis на ttl секунд. Недоступность Redis не ломает запрос - данные
+    просто читаются из источника.
+    '''
+    try:
+        data = await redis.get(key)
+        if isinstance(data, dict):
+            return data
+    except Exception as e:
+        logger.warning(f'Redis недоступен при чтении {key}: {e}')
 
     data = await loader()
     if data is None:
         return None
 
-    await redis.set(key, json.dumps(data), ex=ttl)
+    try:
+        await redis.set(key, data, ttl)
+    except Exception as e:
+        logger.warning(f'Redis недоступен при записи {key}: {e}')
     return data
@@ -1,38 +1,125 @@
 import redis.asyncio as redis
-from typing import Optional, Any
-import json
+from redis.asyncio.client import Pipeline, PubSub
+from redis.asyncio.connection import BlockingConnectionPool
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialWithJitterBackoff
+from redis.commands.core import AsyncScript
+from typing import Dict, List, Mapping, Optional, Any
 
 from backend.core.settings import settings
+from backend.infrastructure.redis.client_cache import ClientSideCache
+from backend.infrastructure.redis.codec import RedisCodec, get_codec
 
 
 class RedisClient:
     def __init__(self):
         self._client: Optional[redis.Redis] = None
+        self._scripts: Dict[str, AsyncScript] = {}
+        # Формат значений set/get (строки - как есть, остальное - с тегом)
+        self.codec: RedisCodec = get_codec(
+            settings.REDIS_CODEC, legacy_json=settings.REDIS_CODEC_LEGACY_JSON
+        )
+        self.client_cache = ClientSideCache(
+            prefixes=settings.REDIS_CLIENT_CACHE_PREFIXES,
+            max_size=settings.REDIS_CLIENT_CACHE_SIZE,
+            ttl=settings.REDIS_CLIENT_CACHE_TTL,
+        )
 
     async def connect(self) -> None:
-        self._client = await redis.from_url(settings.REDIS_URL, decode_responses=True)
+        '''
+        Пул соединений с таймаутами, повторами и проверкой простаивающих.
+
+        BlockingConnectionPool при исчерпании ждет свободное соединение
+        REDIS_POOL_TIMEOUT секунд, а не падает с "Too many connections".
+        Ошибки соединения и таймауты повторяются с экспоненциальной паузой
+        (с jitter - чтобы воркеры не переподключались синхронно).
+        '''
+        pool = BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+            socket_keepalive=True,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            retry=Retry(
+                ExponentialWithJitterBackoff(
+                    cap=settings.REDIS_RETRY_BACKOFF_CAP,
+                    base=settings.REDIS_RETRY_BACKOFF_BASE,
+                ),
+                settings.REDIS_RETRY_ATTEMPTS,
+            ),
+            decode_responses=True,
+        )
+        self._client = redis.Redis.from_pool(pool)
+        self._scripts = {}
+
+        if settings.REDIS_CLIENT_CACHE_ENABLED:
+            await self.client_cache.start(pool)
 
     async def disconnect(self) -> None:
+        await self.client_cache.stop()
         if self._client:
-            await self._client.close()
+            await self._client.aclose()
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         ttl = ttl or settings.REDIS_DEFAULT_TTL
-        if isinstance(value, dict):
-            value = json.dumps(value)
-        return await self._client.setex(key, ttl, value)
+        result = await self._client.setex(key, ttl, self.codec.encode(value))
+        # Свой процесс видит запись сразу, не дожидаясь инвалидации от Redis
+        self.client_cache.invalidate([key])
+        return result
 
     async def get(self, key: str) -> Optional[Any]:
-        value = await self._client.get(key)
-        if value is None:
-            return None
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            return value
+        hit, value = self.client_cache.lookup(key)
+        if not hit:
+            marker = self.client_cache.begin(key)
+            # Байты без декодирования соединением: их разбирает кодек
+            value = await self._client.execute_command('GET', key, NEVER_DECODE=True)
+            self.client_cache.finish(key, marker, value)
+        return self.codec.decode(value)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        '''
+        Значения нескольких ключей (None для отсутствующих) в порядке keys.
+
+        Ключи из клиентского кэша в Redis не запрашиваются, остальные -
+        одним MGET.
+        '''
+        values: Dict[str, Any] = {}
+        missing: List[str] = []
+        for key in keys:
+            hit, value = self.client_cache.lookup(key)
+            if hit:
+                values[key] = value
+            else:
+                missing.append(key)
+
+        if missing:
+            markers = [self.client_cache.begin(key) for key in missing]
+            fetched = await self._client.execute_command(
+                'MGET', *missing, NEVER_DECODE=True
+            )
+            for key, marker, value in zip(missing, markers, fetched):
+                self.client_cache.finish(key, marker, value)
+                values[key] = value
+
+        return [self.codec.decode(values[key]) for key in keys]
+
+    async def set_many(
+        self, items: Mapping[str, Any], ttl: Optional[int] = None
+    ) -> None:
+        '''Записать несколько ключей с одним TTL (SETEX в одном pipeline).'''
+        ttl = ttl or settings.REDIS_DEFAULT_TTL
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.setex(key, ttl, self.codec.encode(value))
+            await pipe.execute()
+        self.client_cache.invalidate(items)
 
     async def delete(self, key: str) -> bool:
-        return bool(await self._client.delete(key))
+        result = bool(await self._client.delete(key))
+        self.client_cache.invalidate([key])
+        return result
 
     async def increment(self, key: str, amount: int = 1) -> int:
         return await self._client.incrby(key, amount)
@@ -40,6 +127,33 @@ class RedisClient:
     async def exists(self, key: str) -> bool:
         return bool(await self._client.exists(key))
 
+    async def pttl(self, key: str) -> int:
+        '''Оставшийся TTL ключа в мс (-2 - ключа нет, -1 - без TTL).'''
+        return await self._client.pttl(key)
+
+    async def eval_script(self, source: str, keys: List[str], args: List[Any]) -> Any:
+        '''
+        Выполнить Lua-скрипт атомарно на стороне Redis.
+
+        Скрипт загружается один раз, дальше вызывается по SHA (EVALSHA);
+        после SCRIPT FLUSH или рестарта Redis загружается заново.
+        '''
+        script = self._scripts.get(source)
+        if script is None:
+            script = self._scripts[source] = self._client.register_script(source)
+        return await script(keys=keys, args=args)
+
+    def pipeline(self, transaction: bool = False) -> Pipeline:
+        '''Пачка команд за один round trip (async with ... as pipe).'''
+        return self._client.pipeline(transaction=transaction)
+
+    async def zrangebyscore(self, key: str, min: Any, max: Any) -> List[str]:
+        return await self._client.zrangebyscore(key, min, max)
+
+    def pubsub(self) -> PubSub:
+        '''Подписка pub/sub (отдельное соединение из пула).'''
+        return self._client.pubsub()
+
 
 # Singleton
 redis_client = RedisClient()
@@ -0,0 +1,198 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from redis.asyncio.connection import ConnectionPool
+
+from backend.core.logger import logger
+
+# Канал, в который Redis шлет инвалидации при CLIENT TRACKING ... REDIRECT
+INVALIDATE_CHANNEL = '__redis__:invalidate'
+
+
+class ClientSideCache:
+    '''
+    Локальный кэш значений Redis с инвалидацией со стороны сервера.
+
+    Ключи с префиксами prefixes (профиль юриста, сессии - читаются часто,
+    меняются редко) после первого GET отдаются из памяти процесса. Redis
+    сам сообщает об изменении или удалении таких ключей (CLIENT TRACKING
+    в режиме BCAST), поэтому устаревшее значение живет не дольше доставки
+    сообщения; ttl - страховка сверху.
+
+    Сообщения принимает отдельное соединение, подписанное на
+    __redis__:invalidate; трекинг включается на втором соединении
+    с REDIRECT на первое. Так схема работает и с RESP2, и с RESP3:
+    асинхронный redis-py сам клиентский кэш не поддерживает.
+
+    Пока подписка не активна, кэш выключен (все чтения идут в Redis),
+    при потере соединения он очищается.
+    '''
+
+    def __init__(
+        self,
+        prefixes: Sequence[str],
+        max_size: int,
+        ttl: float,
+        reconnect_delay: float = 5.0,
+        ping_interval: float = 5.0,
+    ):
+        self.prefixes = tuple(prefixes)
+        self.max_size = max_size
+        self.ttl = ttl
+        self.reconnect_delay = reconnect_delay
+        self.ping_interval = ping_interval
+        self._values: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        # Ключи, которые сейчас читаются из Redis: инвалидация во время
+        # чтения отменяет запись прочитанного (уже устаревшего) значения
+        self._inflight: Dict[str, object] = {}
+        self._active = False
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def _cacheable(self, key: str) -> bool:
+        return self._active and key.startswith(self.prefixes)
+
+    # ========== ЧТЕНИЕ И ИНВАЛИДАЦИЯ ==========
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        '''(True, значение) при попадании, иначе (False, None).'''
+        if not self._cacheable(key):
+            return False, None
+
+        entry = self._values.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self._values.pop(key, None)
+            self.misses += 1
+            return False, None
+
+        self._values.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def begin(self, key: str) -> Optional[object]:
+        '''Отметить начало чтения key из Redis (маркер для finish).'''
+        if not self._cacheable(key):
+            return None
+        marker = self._inflight[key] = object()
+        return marker
+
+    def finish(self, key: str, marker: Optional[object], value: Any) -> None:
+        '''Запомнить прочитанное, если за время чтения не было инвалидации.'''
+        if marker is None or self._inflight.get(key) is not marker:
+            return
+        del self._inflight[key]
+        if value is None or not self._active:
+            return
+
+        self._values[key] = (time.monotonic() + self.ttl, value)
+        self._values.move_to_end(key)
+        if len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._values.pop(key, None)
+            self._inflight.pop(key, None)
+
+    def flush(self) -> None:
+        self._values.clear()
+        self._inflight.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'active': self._active,
+            'size': len(self._values),
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+        }
+
+    # ========== ПОДПИСКА НА ИНВАЛИДАЦИИ ==========
+
+    async def start(self, pool: ConnectionPool) -> None:
+        '''Запустить подписку (соединения - с параметрами пула клиента).'''
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(pool))
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _on_message(self, message: Any) -> None:
+        # ['message', '__redis__:invalidate', [ключи]]; None - FLUSHALL/FLUSHDB
+        if not isinstance(message, list) or message[0] != 'message':
+            return
+        keys = message[2]
+        self.invalidations += 1
+        if keys is None:
+            self.flush()
+        else:
+            self.invalidate(keys)
+
+    async def _run(self, pool: ConnectionPool) -> None:
+        # Вне пула и без health check: PING в режиме подписки сломал бы разбор
+        kwargs = {**pool.connection_kwargs, 'health_check_interval': 0}
+        while True:
+            listener = pool.connection_class(**kwargs)
+            tracker = pool.connection_class(**kwargs)
+            try:
+                # 1. Соединение для сообщений: узнаем его ID и подписываемся
+                await listener.connect()
+                await listener.send_command('CLIENT', 'ID')
+                client_id = await listener.read_response()
+                await listener.send_command('SUBSCRIBE', INVALIDATE_CHANNEL)
+                await listener.read_response()
+
+                # 2. Трекинг по префиксам с пересылкой сообщений в listener.
+                # Трекинг живет, пока открыто соединение tracker
+                await tracker.connect()
+                prefixes = [arg for p in self.prefixes for arg in ('PREFIX', p)]
+                tracking = ['CLIENT', 'TRACKING', 'ON', 'REDIRECT', client_id, 'BCAST']
+                await tracker.send_command(*tracking, *prefixes)
+                await tracker.read_response()
+
+                self.flush()
+                self._active = True
+                logger.info(f'[REDIS CACHE] Клиентский кэш активен: {self.prefixes}')
+
+                # 3. Инвалидации; tracker периодически проверяем PING
+                ping_at = time.monotonic() + self.ping_interval
+                while True:
+                    message = await listener.read_response(timeout=1.0)
+                    if message is not None:
+                        self._on_message(message)
+                    if time.monotonic() >= ping_at:
+                        await tracker.send_command('PING')
+                        await tracker.read_response()
+                        ping_at = time.monotonic() + self.ping_interval
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f'[REDIS CACHE] Инвалидации недоступны ({e}), кэш выключен '
+                    f'до переподключения через {self.reconnect_delay} с'
+                )
+            finally:
+                self._active = False
+                self.flush()
+                for connection in (listener, tracker):
+                    try:
+                        await connection.disconnect()
+                    except Exception:
+                        pass
+
+            await asyncio.sleep(self.reconnect_delay)
@@ -0,0 +1,113 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Union
+
+import msgpack
+
+RawValue = Union[bytes, str]
+
+
+class RedisCodec(ABC):
+    '''Как значения хранилищ Redis превращаются в байты и обратно.'''
+
+    name: str
+
+    @abstractmethod
+    def encode(self, value: Any) -> RawValue: ...
+
+    @abstractmethod
+    def decode(self, raw: Optional[bytes]) -> Any: ...
+
+
+class JsonCodec(RedisCodec):
+    '''
+    Прежний формат: dict - JSON-текст, остальное - как есть.
+
+    При чтении json.loads пробуется для любого значения, поэтому строка
+    '123456' возвращается числом. Оставлен для сравнения и отката.
+    '''
+
+    name = 'json'
+
+    def encode(self, value: Any) -> RawValue:
+        if isinstance(value, dict):
+            return json.dumps(value)
+        return value
+
+    def decode(self, raw: Optional[bytes]) -> Any:
+        if raw is None:
+            return None
+        value = raw.decode() if isinstance(raw, bytes) else raw
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return value
+
+
+class TaggedCodec(RedisCodec):
+    '''
+    Строки хранятся как есть, остальные значения - с тегом формата.
+
+    Токены, коды подтверждения и прочие строки пишутся в Redis без изменений
+    и читаются без попытки разбора. Словари, списки и числа кодируются
+    msgpack (или, с use_msgpack=False, компактным JSON) с префиксом
+    TAG + буква формата, так что тип при чтении восстанавливается точно.
+    Строка, которая сама начинается с TAG, тоже пишется с тегом.
+
+    Значения без тега всегда возвращаются строкой. Только с legacy_json
+    (на время перехода с JsonCodec, пока не истек TTL старых записей)
+    значения вида {...} и [...] читаются через json - тогда так же
+    разбирается и обычная строка, начинающаяся с { или [.
+    '''
+
+    name = 'msgpack'
+
+    TAG = b'\x00'
+    MSGPACK = TAG + b'm'
+    JSON = TAG + b'j'
+
+    def __init__(self, use_msgpack: bool = True, legacy_json: bool = False):
+        self.use_msgpack = use_msgpack
+        self.legacy_json = legacy_json
+
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, str) and not value.startswith('\x00'):
+            return value.encode()
+        if self.use_msgpack:
+            return self.MSGPACK + msgpack.packb(value, use_bin_type=True)
+        return self.JSON + json.dumps(
+            value, separators=(',', ':'), ensure_ascii=False
+        ).encode()
+
+    def decode(self, raw: Optional[bytes]) -> Any:
+        if raw is None:
+            return None
+        if isinstance(raw, str):
+            raw = raw.encode()
+
+        prefix = raw[:2]
+        if prefix == self.MSGPACK:
+            return msgpack.unpackb(raw[2:], raw=False)
+        if prefix == self.JSON:
+            return json.loads(raw[2:])
+
+        value = raw.decode()
+        if self.legacy_json and value[:1] in ('{', '['):
+            try:
+                return json.loads(value)
+            except json.JSONDecodeError:
+                pass
+        return value
+
+
+def get_codec(name: str, legacy_json: bool = False) -> RedisCodec:
+    '''
+    Кодек по имени из настроек (REDIS_CODEC): msgpack или json.
+
+    legacy_json (REDIS_CODEC_LEGACY_JSON) - читать записи прежнего формата.
+    '''
+    if name == JsonCodec.name:
+        return JsonCodec()
+    if name == TaggedCodec.name:
+        return TaggedCodec(legacy_json=legacy_json)
+    raise ValueError(f'Неизвестный кодек Redis: {name}')
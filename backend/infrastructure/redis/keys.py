@@ -11,19 +11,23 @@ class RedisKeys:
     def refresh_token(attorney_id: int) -> str:
         return f'refresh_token:attorney:{attorney_id}'
 
-    # Blacklist для revoked токенов
+    # Blacklist для revoked токенов (по SHA-256 токена)
     @staticmethod
-    def token_blacklist(token: str) -> str:
-        return f'token_blacklist:{token}'
+    def token_blacklist(token_hash: str) -> str:
+        return f'token_blacklist:{token_hash}'
 
-    # Rate limiting
+    # Журнал отзывов (ZSET: хеш токена -> истечение) и канал pub/sub
+    TOKEN_REVOCATIONS = 'token_revocations'
+    TOKEN_REVOCATIONS_CHANNEL = 'token_revocations'
+
+    # Rate limiting (SlidingWindowRateLimiter)
     @staticmethod
-    def login_attempts(email: str) -> str:
-        return f'login_attempts:{email}'
+    def rate_limit(name: str, identity: str) -> str:
+        return f'rate_limit:{name}:{identity}'
 
     @staticmethod
-    def login_lockout(email: str) -> str:
-        return f'login_lockout:{email}'
+    def rate_limit_lockout(name: str, identity: str) -> str:
+        return f'rate_limit_lockout:{name}:{identity}'
 
     # User cache
     @staticmethod
@@ -1,20 +1,136 @@
-from fastapi import HTTPException, status, Request
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Pattern, Tuple
+
+from backend.core.logger import logger
 from backend.core.settings import settings
-from backend.infrastructure.redis.client import get_redis
+from backend.infrastructure.redis.sliding_window import (
+    RateLimitResult,
+    SlidingWindowRateLimiter,
+)
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    '''
+    Лимит для группы маршрутов.
+
+    method=None - любой метод; pattern сопоставляется с путем целиком.
+    '''
+
+    name: str
+    pattern: Pattern[str]
+    limit: int
+    window_seconds: float = 60
+    method: Optional[str] = None
+
+    @classmethod
+    def route(
+        cls,
+        name: str,
+        path: str,
+        limit: int,
+        window_seconds: float = 60,
+        method: Optional[str] = None,
+    ) -> 'RateLimitRule':
+        '''Правило по шаблону пути FastAPI: /documents/{document_id}/download'''
+        regex = re.sub(r'\\{[^/]+\\}', '[^/]+', re.escape(path))
+        return cls(name, re.compile(regex), limit, window_seconds, method)
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.method is not None and self.method != method:
+            return False
+        return self.pattern.fullmatch(path) is not None
+
+
+class LocalTokenBucket:
+    '''Token bucket в памяти процесса: limit токенов, пополнение за window.'''
+
+    def __init__(self, limit: int, window_seconds: float):
+        self.capacity = float(limit)
+        self.rate = limit / window_seconds  # токенов в секунду
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
 
+    def take(self) -> RateLimitResult:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return RateLimitResult(allowed=True, count=0, retry_after=0)
+        return RateLimitResult(
+            allowed=False, count=0, retry_after=(1 - self.tokens) / self.rate
+        )
 
-async def rate_limit_login(request: Request):
-    redis = await get_redis()
-    client_ip = request.client.host
-    key = f'rl:login:{client_ip}'
 
-    # atomically: INCR + set TTL
-    current = await redis.incr(key)
-    if current == 1:
-        await redis.expire(key, settings.LOGIN_RATE_PERIOD_SECONDS)
+class ApiRateLimiter:
+    '''
+    Лимиты API: скользящее окно в Redis, при сбое - локальные бакеты.
 
-    if current > settings.LOGIN_RATE_LIMIT:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail='Too many login attempts, try again later.',
+    Основной путь - SlidingWindowRateLimiter (один EVALSHA на запрос),
+    общий для всех воркеров. Если Redis не ответил за RATE_LIMIT_REDIS_TIMEOUT
+    или вернул ошибку, запрос проверяется локальным token bucket, а Redis
+    не опрашивается RATE_LIMIT_REDIS_RETRY_SECONDS - медленный Redis не
+    добавляет задержку к каждому запросу. Локальный лимит действует на процесс,
+    то есть при сбое общий лимит мягче в число воркеров раз.
+    '''
+
+    def __init__(self, max_local_buckets: int = 10_000):
+        self._limiters: Dict[str, SlidingWindowRateLimiter] = {}
+        self._buckets: 'OrderedDict[Tuple[str, str], LocalTokenBucket]' = (
+            OrderedDict()
         )
+        self._max_local_buckets = max_local_buckets
+        self._redis_retry_at = 0.0
+
+    async def hit(self, rule: RateLimitRule, identity: str) -> RateLimitResult:
+        '''Учесть запрос identity по правилу rule.'''
+        if time.monotonic() >= self._redis_retry_at:
+            try:
+                return await asyncio.wait_for(
+                    self._limiter(rule).hit(identity),
+                    timeout=settings.RATE_LIMIT_REDIS_TIMEOUT,
+                )
+            except Exception as e:
+                self._redis_retry_at = (
+                    time.monotonic() + settings.RATE_LIMIT_REDIS_RETRY_SECONDS
+                )
+                logger.warning(
+                    f'[RATE LIMIT] Redis недоступен ({type(e).__name__}), '
+                    f'локальный лимит на {settings.RATE_LIMIT_REDIS_RETRY_SECONDS} с'
+                )
+
+        return self._bucket(rule, identity).take()
+
+    def _limiter(self, rule: RateLimitRule) -> SlidingWindowRateLimiter:
+        limiter = self._limiters.get(rule.name)
+        if limiter is None:
+            limiter = self._limiters[rule.name] = SlidingWindowRateLimiter(
+                f'api:{rule.name}', rule.limit, rule.window_seconds
+            )
+        return limiter
+
+    def _bucket(self, rule: RateLimitRule, identity: str) -> LocalTokenBucket:
+        key = (rule.name, identity)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = LocalTokenBucket(
+                rule.limit, rule.window_seconds
+            )
+            # Память ограничена: вытесняем давно не использованные бакеты
+            if len(self._buckets) > self._max_local_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+
+# Singleton
+api_rate_limiter = ApiRateLimiter()
@@ -0,0 +1,193 @@
+import asyncio
+import hashlib
+import math
+import time
+from typing import Dict, Iterable, Optional
+
+from backend.core.logger import logger
+from backend.core.settings import settings
+from backend.infrastructure.redis.client import RedisClient, redis_client
+from backend.infrastructure.redis.keys import RedisKeys
+
+
+class BloomFilter:
+    '''
+    Bloom-фильтр строк: "точно нет" или "возможно есть".
+
+    Размер и число хешей считаются из capacity и error_rate; позиции -
+    двойное хеширование по одному BLAKE2b (k позиций из двух 64-битных).
+    '''
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+class RevocationRegistry:
+    '''
+    Отозванные access token: черный список в Redis + локальное зеркало.
+
+    Источник истины - ключи token_blacklist:<sha256> с TTL до истечения
+    токена. Чтобы не делать EXISTS на каждый запрос, каждый процесс держит
+    bloom-фильтр отозванных хешей:
+
+    - при старте (и при переподключении) фильтр строится из ZSET
+      token_revocations, где лежат все еще не истекшие отзывы;
+    - новые отзывы приходят через pub/sub канал token_revocations;
+    - раз в rebuild_interval фильтр перестраивается, истекшие отзывы
+      из него уходят (из bloom-фильтра нельзя удалять).
+
+    Проверка: хеша нет в фильтре - токен не отозван, без обращения к Redis.
+    Есть (отзыв или ложное срабатывание) - подтверждаем через EXISTS.
+    Пока подписка не активна, зеркало может отставать, поэтому проверка
+    всегда идет в Redis.
+    '''
+
+    def __init__(
+        self,
+        client: RedisClient = redis_client,
+        reconnect_delay: float = 5.0,
+        rebuild_interval: Optional[float] = None,
+    ):
+        self._client = client
+        self.reconnect_delay = reconnect_delay
+        self.rebuild_interval = (
+            rebuild_interval or settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        )
+        self._bloom = self._new_bloom()
+        self._synced = False
+        self._task: Optional[asyncio.Task] = None
+        self.local_checks = 0
+        self.redis_checks = 0
+
+    @staticmethod
+    def _new_bloom() -> BloomFilter:
+        return BloomFilter(
+            settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+            settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+        )
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    # ========== ОТЗЫВ И ПРОВЕРКА ==========
+
+    async def revoke(self, token_hash: str, ttl: int) -> None:
+        '''Отозвать токен на ttl секунд: ключ, журнал и публикация - один pipeline.'''
+        now = time.time()
+        async with self._client.pipeline() as pipe:
+            pipe.setex(RedisKeys.token_blacklist(token_hash), ttl, '1')
+            pipe.zadd(RedisKeys.TOKEN_REVOCATIONS, {token_hash: now + ttl})
+            pipe.zremrangebyscore(RedisKeys.TOKEN_REVOCATIONS, '-inf', now)
+            pipe.publish(RedisKeys.TOKEN_REVOCATIONS_CHANNEL, token_hash)
+            await pipe.execute()
+
+        # Свой процесс видит отзыв сразу, не дожидаясь сообщения
+        self._bloom.add(token_hash)
+
+    async def is_revoked(self, token_hash: str) -> bool:
+        if self._synced and token_hash not in self._bloom:
+            self.local_checks += 1
+            return False
+
+        self.redis_checks += 1
+        return await self._client.exists(RedisKeys.token_blacklist(token_hash))
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            'synced': self._synced,
+            'revoked': self._bloom.count,
+            'local_checks': self.local_checks,
+            'redis_checks': self.redis_checks,
+        }
+
+    # ========== ЗЕРКАЛО ==========
+
+    async def start(self) -> None:
+        '''Запустить фоновую подписку на отзывы.'''
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        self._synced = False
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def reload(self) -> None:
+        '''Перестроить фильтр из журнала не истекших отзывов.'''
+        hashes = await self._client.zrangebyscore(
+            RedisKeys.TOKEN_REVOCATIONS, time.time(), '+inf'
+        )
+        bloom = self._new_bloom()
+        for token_hash in hashes:
+            bloom.add(token_hash)
+        self._bloom = bloom
+        logger.debug(f'[REVOCATION] Фильтр отзывов перестроен: {len(hashes)}')
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                # 1. Сначала подписка, потом загрузка журнала: отзывы между
+                # ними придут сообщением и не потеряются
+                await pubsub.subscribe(RedisKeys.TOKEN_REVOCATIONS_CHANNEL)
+                await self.reload()
+                self._synced = True
+                logger.info('[REVOCATION] Подписка на отзывы токенов активна')
+
+                # 2. Новые отзывы - в фильтр; периодически перестраиваем
+                rebuild_at = time.monotonic() + self.rebuild_interval
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None:
+                        self._bloom.add(message['data'])
+                    if time.monotonic() >= rebuild_at:
+                        await self.reload()
+                        rebuild_at = time.monotonic() + self.rebuild_interval
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._synced = False
+                logger.warning(
+                    f'[REVOCATION] Подписка потеряна ({e}), '
+                    f'повтор через {self.reconnect_delay} с'
+                )
+                await asyncio.sleep(self.reconnect_delay)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+# Singleton
+revocation_registry = RevocationRegistry()
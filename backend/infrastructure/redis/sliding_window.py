@@ -0,0 +1,114 @@
+import secrets
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from backend.infrastructure.redis.client import RedisClient, redis_client
+from backend.infrastructure.redis.keys import RedisKeys
+
+# Скользящее окно (журнал событий в ZSET) + необязательная блокировка.
+# Все шаги выполняются атомарно на стороне Redis за один round trip:
+# гонок между INCR/EXPIRE/SET нет, а каждый записанный ключ получает TTL.
+#
+# KEYS[1] - журнал событий, KEYS[2] - ключ блокировки
+# ARGV: now_ms, window_ms, limit, lockout_ms, member
+# Возвращает {allowed (1/0), count, retry_after_ms}
+SLIDING_WINDOW_SCRIPT = '''
+local lock_ttl = redis.call('PTTL', KEYS[2])
+if lock_ttl > 0 then
+    return {0, 0, lock_ttl}
+end
+
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local lockout = tonumber(ARGV[4])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+
+if count >= limit then
+    if lockout > 0 then
+        redis.call('SET', KEYS[2], '1', 'PX', lockout)
+        redis.call('DEL', KEYS[1])
+        return {0, count, lockout}
+    end
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    local retry = window
+    if oldest[2] then
+        retry = tonumber(oldest[2]) + window - now
+    end
+    return {0, count, retry}
+end
+
+redis.call('ZADD', KEYS[1], now, ARGV[5])
+redis.call('PEXPIRE', KEYS[1], window)
+return {1, count + 1, 0}
+'''
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    '''Результат проверки лимита.'''
+
+    allowed: bool
+    count: int  # событий в окне (включая текущее, если оно записано)
+    retry_after: float  # секунд до следующей разрешенной попытки (0 - сразу)
+
+
+class SlidingWindowRateLimiter:
+    '''
+    Ограничитель частоты событий со скользящим окном.
+
+    hit() записывает событие, если в окне window_seconds их меньше limit,
+    иначе отказывает. С lockout_seconds превышение лимита ставит блокировку
+    на это время (журнал при этом очищается): пока она действует, hit()
+    отказывает без записи.
+
+    Пример: неудачные входы - limit попыток за 15 минут, дальше блокировка.
+    '''
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        window_seconds: float,
+        lockout_seconds: Optional[float] = None,
+        client: RedisClient = redis_client,
+    ):
+        self.name = name
+        self.limit = limit
+        self.window_ms = int(window_seconds * 1000)
+        self.lockout_ms = int((lockout_seconds or 0) * 1000)
+        self._client = client
+
+    async def hit(self, identity: str) -> RateLimitResult:
+        '''Записать событие и проверить лимит (один EVALSHA).'''
+        now_ms = int(time.time() * 1000)
+        # Уникальный элемент ZSET: одновременные события не схлопываются
+        member = f'{now_ms}:{secrets.token_hex(4)}'
+
+        allowed, count, retry_after_ms = await self._client.eval_script(
+            SLIDING_WINDOW_SCRIPT,
+            keys=[
+                RedisKeys.rate_limit(self.name, identity),
+                RedisKeys.rate_limit_lockout(self.name, identity),
+            ],
+            args=[now_ms, self.window_ms, self.limit, self.lockout_ms, member],
+        )
+        return RateLimitResult(
+            allowed=bool(allowed),
+            count=int(count),
+            retry_after=max(int(retry_after_ms), 0) / 1000,
+        )
+
+    async def locked_for(self, identity: str) -> float:
+        '''Сколько секунд еще действует блокировка (0 - не заблокирован).'''
+        ttl_ms = await self._client.pttl(
+            RedisKeys.rate_limit_lockout(self.name, identity)
+        )
+        return max(ttl_ms, 0) / 1000
+
+    async def reset(self, identity: str) -> None:
+        '''Очистить журнал событий (блокировку не снимает).'''
+        await self._client.delete(RedisKeys.rate_limit(self.name, identity))
@@ -2,20 +2,28 @@ from .attorney_repo import AttorneyRepository
 from .case_repo import CaseRepository
 from .client_repo import ClientRepository
 from .contact_repo import ContactRepository
+from .dashboard_repo import DashboardRepository
 from .document_repo import DocumentMetadataRepository
+from .document_blob_repo import DocumentBlobRepository
 from .event_repo import EventRepository
+from .export_repo import ExportRepository
 from .outbox_repo import OutboxRepository
 from .payment_repo import ClientPaymentRepository
 from .payment_detail_repo import PaymentDetailRepository
+from .search_repo import SearchRepository
 
 __all__ = [
     'AttorneyRepository',
     'CaseRepository',
     'ClientRepository',
     'ContactRepository',
+    'DashboardRepository',
     'DocumentMetadataRepository',
+    'DocumentBlobRepository',
     'EventRepository',
+    'ExportRepository',
     'OutboxRepository',
     'ClientPaymentRepository',
     'PaymentDetailRepository',
+    'SearchRepository',
 ]
@@ -1,6 +1,6 @@
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,7 +8,11 @@ from backend.core.logger import logger
 from backend.core.exceptions import DatabaseErrorException, EntityNotFoundException
 from backend.domain.entities.attorney import Attorney
 from backend.infrastructure.mappers import AttorneyMapper
-from backend.infrastructure.models import AttorneyORM
+from backend.infrastructure.models import AttorneyORM, DocumentORM
+from backend.infrastructure.redis.attorney_cache import AttorneyCache
+from backend.infrastructure.repositories.document_repo import delete_documents
+from backend.infrastructure.tools.after_commit import after_commit
+from backend.infrastructure.tools.entity_cache import entity_cache
 from backend.application.interfaces.repositories.attorney_repo import (
     IAttorneyRepository,
 )
@@ -58,6 +62,14 @@ class AttorneyRepository(IAttorneyRepository):
             raise DatabaseErrorException(f'Ошибка при сохранении ЮРИСТА: {str(e)}')
 
     async def get(self, id: int) -> Optional['Attorney']:
+        # Повторное чтение в той же транзакции - из кэша сущностей
+        cached = entity_cache(self.session).get(Attorney, id)
+        if cached is not None:
+            return cached
+        return await self._load(id)
+
+    async def _load(self, id: int) -> Optional['Attorney']:
+        '''Прочитать юриста из БД (полностью) и запомнить в кэше сущностей.'''
         try:
             stmt = select(AttorneyORM).where(AttorneyORM.id == id)
             result = await self.session.execute(stmt)
@@ -68,12 +80,25 @@ class AttorneyRepository(IAttorneyRepository):
 
             attorney = AttorneyMapper.to_domain(orm_attorney)
             logger.info(f'ЮРИСТ успешно получен. ID - {attorney.id}')
-            return attorney
+            return entity_cache(self.session).put(attorney)
 
         except SQLAlchemyError as e:
             logger.error(f'Ошибка БД при получении ЮРИСТА ID={id}: {e}')
             raise DatabaseErrorException(f'Ошибка БД при получении ЮРИСТА: {str(e)}')
 
+    async def get_cached(self, id: int) -> Optional['Attorney']:
+        '''
+        Получить юриста через read-through кэш Redis.
+
+        Для проверок прав и профиля. hashed_password в результате пустой -
+        для проверки пароля используйте get(). Если юрист уже прочитан в этой
+        транзакции, Redis не запрашивается.
+        '''
+        cached = entity_cache(self.session).get(Attorney, id)
+        if cached is not None:
+            return cached
+        return await AttorneyCache.get_or_load(id, lambda: self._load(id))
+
     async def get_by_email(self, email: str) -> Optional['Attorney']:
         return await self._get_by_field(AttorneyORM.email == email, 'email', email)
 
@@ -89,10 +114,15 @@ class AttorneyRepository(IAttorneyRepository):
 
     async def update(self, updated_attorney: Attorney) -> 'Attorney':
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(AttorneyORM).where(AttorneyORM.id == updated_attorney.id)
-            result = await self.session.execute(stmt)
-            orm_attorney = result.scalar_one_or_none()
+            # 1. Обновление одной командой UPDATE ... RETURNING
+            stmt = (
+                update(AttorneyORM)
+                .where(AttorneyORM.id == updated_attorney.id)
+                .values(**AttorneyMapper.update_values(updated_attorney))
+                .returning(AttorneyORM)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            orm_attorney = (await self.session.execute(stmt)).scalar_one_or_none()
 
             # 2. Проверка наличия записи в БД
             if not orm_attorney:
@@ -101,15 +131,13 @@ class AttorneyRepository(IAttorneyRepository):
                     f'Юрист с ID {updated_attorney.id} не найден.'
                 )
 
-            # 3. Обновление полей ORM-объекта из доменной сущности
-            AttorneyMapper.update_orm(orm_attorney, updated_attorney)
+            await self._invalidate_cache(updated_attorney.id)
 
-            # 4. Сохранение в БД
-            await self.session.flush()  # или session.commit() если нужна транзакция
-
-            # 5. Возврат доменного объекта
+            # 3. Возврат доменного объекта
             logger.info(f'Юрист обновлен. ID = {updated_attorney.id}')
-            return AttorneyMapper.to_domain(orm_attorney)
+            return entity_cache(self.session).put(
+                AttorneyMapper.to_domain(orm_attorney)
+            )
 
         except SQLAlchemyError as e:
             logger.error(
@@ -132,9 +160,19 @@ class AttorneyRepository(IAttorneyRepository):
                     f'ЮРИСТ с ID {id} не найден при удалении.'
                 )
 
-            # 2. Удаление
+            # 2. Документы юриста. В БД documents.attorney_id - SET NULL:
+            # удаляем их сами, чтобы снять ссылки на файлы (файлы с диска
+            # удаляет DocumentService в сценарии удаления учетной записи)
+            await delete_documents(self.session, DocumentORM.attorney_id == id)
+
+            # 3. Удаление
             await self.session.delete(orm_attorney)
             await self.session.flush()
+            await self._invalidate_cache(id)
+
+            # Каскад удалил реквизиты и платежи юриста - кэш сущностей
+            # транзакции проще сбросить целиком
+            entity_cache(self.session).clear()
 
             logger.info(f'ЮРИСТ с ID {id} успешно удален.')
             return True
@@ -154,6 +192,15 @@ class AttorneyRepository(IAttorneyRepository):
             attorney_id, 'is_active', is_active, 'активности'
         )
 
+    async def _invalidate_cache(self, attorney_id: int) -> None:
+        '''
+        Сбросить кэш Redis после commit транзакции.
+
+        Сброс до commit позволил бы параллельному get_cached вернуть в кэш
+        старую строку, а откат оставил бы кэш без изменений в БД.
+        '''
+        await after_commit(self.session, lambda: AttorneyCache.invalidate(attorney_id))
+
     async def _get_by_field(
         self, condition, field_name: str, field_value: str
     ) -> Optional['Attorney']:
@@ -220,9 +267,12 @@ class AttorneyRepository(IAttorneyRepository):
 
             setattr(orm_attorney, field_name, field_value)
             await self.session.flush()
+            await self._invalidate_cache(attorney_id)
 
             logger.info(f'Юрист обновлен. ID = {orm_attorney.id}')
-            return AttorneyMapper.to_domain(orm_attorney)
+            return entity_cache(self.session).put(
+                AttorneyMapper.to_domain(orm_attorney)
+            )
 
         except SQLAlchemyError as e:
             logger.error(f'Ошибка БД при обновлении ЮРИСТА ID={attorney_id}: {e}')
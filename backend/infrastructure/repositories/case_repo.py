@@ -1,16 +1,24 @@
-from typing import TYPE_CHECKING, List, Dict, Any
+from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import select, text
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.logger import logger
 from backend.core.exceptions import DatabaseErrorException, EntityNotFoundException
+from backend.core.pagination import Page
 from backend.domain.entities.case import Case
+from backend.domain.entities.contact import Contact
+from backend.domain.entities.document import Document
+from backend.domain.entities.event import Event
 from backend.infrastructure.mappers import CaseMapper
-from backend.infrastructure.models import CaseORM
+from backend.infrastructure.models import CaseORM, DocumentORM
 from backend.application.interfaces.repositories.case_repo import ICaseRepository
+from backend.infrastructure.tools.entity_cache import entity_cache
+from backend.infrastructure.tools.pagination import paginate_keyset
+from backend.infrastructure.repositories.dashboard_repo import mark_dashboard_stale
+from backend.infrastructure.repositories.document_repo import delete_documents
 
 if TYPE_CHECKING:
     from backend.domain.entities.case import Case
@@ -35,6 +43,7 @@ class CaseRepository(ICaseRepository):
 
             # 3. flush() — отправляем в БД, получаем ID
             await self.session.flush()
+            await mark_dashboard_stale(self.session, orm_case.attorney_id)
 
             # 4. Обновляем ID в доменном объекте
             case.id = orm_case.id
@@ -51,6 +60,11 @@ class CaseRepository(ICaseRepository):
             raise DatabaseErrorException(f'Ошибка при сохранении ДЕЛА: {str(e)}')
 
     async def get(self, id: int) -> 'Case':
+        # Повторное чтение в той же транзакции - из кэша сущностей
+        cached = entity_cache(self.session).get(Case, id)
+        if cached is not None:
+            return cached
+
         try:
             # 1. Получение записи из базы данных
             stmt = select(CaseORM).where(CaseORM.id == id)
@@ -66,7 +80,7 @@ class CaseRepository(ICaseRepository):
             case = CaseMapper.to_domain(orm_case)
 
             logger.info(f'ДЕЛО получено. ID - {case.id}')
-            return case
+            return entity_cache(self.session).put(case)
 
         except SQLAlchemyError as e:
             logger.error(f'Ошибка БД при получении дела ID = {id}: {e}')
@@ -128,27 +142,57 @@ class CaseRepository(ICaseRepository):
 
     # ===============================================================================================
 
+    async def get_page_for_attorney_with_relations(
+        self, attorney_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['CaseORM']:
+        '''Получить страницу дел адвоката с загруженными client и contacts.'''
+        try:
+            # 1. Базовый запрос с фильтром по адвокату и eager loading связей
+            stmt = (
+                select(CaseORM)
+                .where(CaseORM.attorney_id == attorney_id)
+                .options(
+                    selectinload(CaseORM.client),
+                    selectinload(CaseORM.contacts),
+                )
+            )
+            # 2. Выборка страницы (ORM объекты, БЕЗ маппинга в доменную сущность)
+            page = await paginate_keyset(self.session, stmt, CaseORM, limit, cursor)
+
+            logger.info(
+                f'Получено {len(page.items)} дел для адвоката {attorney_id} '
+                f'(страница, есть продолжение: {page.next_cursor is not None})'
+            )
+            return page
+
+        except SQLAlchemyError as e:
+            logger.error(
+                f'Ошибка БД при получении страницы дел для адвоката {attorney_id}: {str(e)}'
+            )
+            raise DatabaseErrorException(f'Ошибка при получении ДЕЛ: {str(e)}')
+
     async def update(self, updated_case: Case) -> 'Case':
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(CaseORM).where(CaseORM.id == updated_case.id)
-            result = await self.session.execute(stmt)
-            orm_case = result.scalars().first()
+            # 1. Обновление одной командой UPDATE ... RETURNING
+            stmt = (
+                update(CaseORM)
+                .where(CaseORM.id == updated_case.id)
+                .values(**CaseMapper.update_values(updated_case))
+                .returning(CaseORM)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            orm_case = (await self.session.execute(stmt)).scalar_one_or_none()
 
             # 2. Проверка наличия записи в БД
             if not orm_case:
                 logger.error(f'Дело с ID {updated_case.id} не найдено.')
                 raise EntityNotFoundException(f'Дело с ID {updated_case.id} не найдено')
 
-            # 3. Обновление полей ORM-объекта из доменной сущности
-            CaseMapper.update_orm(orm_case, updated_case)
-
-            # 4. Сохранение в БД
-            await self.session.flush()  # или session.commit() если нужна транзакция
+            await mark_dashboard_stale(self.session, orm_case.attorney_id)
 
-            # 5. Возврат доменного объекта
+            # 3. Возврат доменного объекта
             logger.info(f'Дело обновлено. ID = {updated_case.id}')
-            return CaseMapper.to_domain(orm_case)
+            return entity_cache(self.session).put(CaseMapper.to_domain(orm_case))
 
         except SQLAlchemyError as e:
             logger.error(f'Ошибка БД при обновлении дела ID = {updated_case.id}: {e}')
@@ -156,83 +200,36 @@ class CaseRepository(ICaseRepository):
 
     async def delete(self, id: int) -> bool:
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(CaseORM).where(CaseORM.id == id)
-            result = await self.session.execute(stmt)
-            orm_case = result.scalar_one_or_none()
+            # 1. Документы дела. В БД documents.case_id - SET NULL, а каскад
+            # delete-orphan у связи CaseORM.documents удалял их вместе с делом;
+            # ссылки на файлы снимаются, события и контакты удалит ON DELETE
+            # CASCADE. Файлы с диска удаляет DocumentService: сценарий удаляет
+            # документы через него до удаления дела
+            await delete_documents(self.session, DocumentORM.case_id == id)
+
+            # 2. Само дело одной командой DELETE ... RETURNING
+            stmt = (
+                delete(CaseORM)
+                .where(CaseORM.id == id)
+                .returning(CaseORM.id, CaseORM.attorney_id)
+            )
+            deleted = (await self.session.execute(stmt)).first()
 
-            if not orm_case:
+            if not deleted:
                 logger.warning(f'Дело с ID {id} не найдено при удалении.')
                 raise EntityNotFoundException(f'Дело с ID {id} не найдено')
 
-            # 2. Удаление
-            await self.session.delete(orm_case)
-            await self.session.flush()
+            # 3. Сводка дашборда юриста устарела
+            await mark_dashboard_stale(self.session, deleted.attorney_id)
+
+            # 4. Дело и удаленные вместе с ним документы, события и контакты
+            # больше не читаются из кэша сущностей
+            cache = entity_cache(self.session)
+            cache.evict(Case, id)
+            cache.evict_all(Document, Event, Contact)
 
             # logger.info(f'Дело с ID {id} успешно удалено.')
             return True
 
         except SQLAlchemyError as e:
             raise DatabaseErrorException(f'Ошибка при удалении ДЕЛА: {str(e)}')
-
-    async def get_dashboard_data(self, attorney_id: int) -> List[Dict[str, Any]]:
-        '''
-        Получение данных для дашборда по указанному адвокату.
-        Возвращает список словарей с данными о делах, клиентах, контактах, событиях и платежах.
-        '''
-        try:
-            query = text("""
-                SELECT 
-                    c.name AS case_name,
-                    cl.name AS client_name,
-                    cl.phone AS client_phone,
-                    co.name AS contact_name,
-                    co.phone AS contact_phone,
-                    e.name AS event_name,
-                    COUNT(cp.id) AS pending_payments_count
-                FROM cases c
-                INNER JOIN clients cl ON c.client_id = cl.id
-                INNER JOIN contacts co ON co.case_id = c.id
-                INNER JOIN attorneys a ON c.attorney_id = a.id
-                LEFT JOIN events e ON e.case_id = c.id 
-                    AND e.id = (
-                        SELECT id FROM events 
-                        WHERE case_id = c.id 
-                        ORDER BY event_date ASC 
-                        LIMIT 1
-                    )
-                LEFT JOIN client_payments cp ON cp.client_id = cl.id 
-                    AND cp.status = 'pending'
-                WHERE c.attorney_id = :attorney_id
-                GROUP BY c.id, cl.id, co.id, e.id
-                LIMIT 1
-            """)
-
-            result = await self.session.execute(query, {'attorney_id': attorney_id})
-            rows = result.fetchall()
-
-            # Преобразуем результат в список словарей
-            dashboard_data = []
-            for row in rows:
-                dashboard_data.append({
-                    'case_name': row.case_name,
-                    'client_name': row.client_name,
-                    'client_phone': row.client_phone,
-                    'contact_name': row.contact_name,
-                    'contact_phone': row.contact_phone,
-                    'event_name': row.event_name,
-                    'pending_payments_count': row.pending_payments_count,
-                })
-
-            logger.info(
-                f'Получено {len(dashboard_data)} записей для дашборда адвоката {attorney_id}'
-            )
-            return dashboard_data
-
-        except SQLAlchemyError as e:
-            logger.error(
-                f'Ошибка БД при получении данных дашборда для адвоката {attorney_id}: {str(e)}'
-            )
-            raise DatabaseErrorException(
-                f'Ошибка при получении данных дашборда: {str(e)}'
-            )
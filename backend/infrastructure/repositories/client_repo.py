@@ -1,15 +1,27 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.logger import logger
-from backend.core.exceptions import DatabaseErrorException, EntityNotFoundException
+from backend.core.exceptions import (
+    DatabaseErrorException,
+    EntityNotFoundException,
+    ValidationException,
+)
+from backend.core.pagination import Page
 from backend.domain.entities.client import Client
 from backend.infrastructure.mappers import ClientMapper
 from backend.infrastructure.models import ClientORM, CaseORM
+from backend.infrastructure.models.client import (
+    CLIENT_UNIQUE_FIELDS,
+    client_unique_index_name,
+)
 from backend.application.interfaces.repositories.client_repo import IClientRepository
+from backend.infrastructure.tools.entity_cache import entity_cache
+from backend.infrastructure.tools.pagination import paginate_keyset
+from backend.infrastructure.repositories.dashboard_repo import mark_dashboard_stale
 
 if TYPE_CHECKING:
     from backend.domain.entities.client import Client
@@ -43,6 +55,7 @@ class ClientRepository(IClientRepository):
 
         except IntegrityError as e:
             logger.error(f'Ошибка при сохранении КЛИЕНТА: {str(e)}')
+            self._raise_if_duplicate(e, client)
             raise DatabaseErrorException(f'Ошибка при сохранении КЛИЕНТА: {str(e)}')
 
         except SQLAlchemyError as e:
@@ -50,6 +63,11 @@ class ClientRepository(IClientRepository):
             raise DatabaseErrorException(f'Ошибка при сохранении КЛИЕНТА: {str(e)}')
 
     async def get(self, id: int) -> 'Client':
+        # Повторное чтение в той же транзакции - из кэша сущностей
+        cached = entity_cache(self.session).get(Client, id)
+        if cached is not None:
+            return cached
+
         try:
             # 1. Получение записи из базы данных
             stmt = select(ClientORM).where(ClientORM.id == id)
@@ -64,7 +82,7 @@ class ClientRepository(IClientRepository):
             client = ClientMapper.to_domain(orm_client)
 
             logger.info(f'КЛИЕНТ получен. ID - {client.id}')
-            return client
+            return entity_cache(self.session).put(client)
 
         except SQLAlchemyError as e:
             logger.error(f'Ошибка БД при получении КЛИЕНТА ID={id}: {e}')
@@ -88,6 +106,25 @@ class ClientRepository(IClientRepository):
             logger.error(f'Ошибка БД при получении КЛИЕНТА ID={id}: {e}')
             raise DatabaseErrorException(f'Ошибка при получении КЛИЕНТА: {str(e)}')
 
+    async def get_page_for_attorney(
+        self, attorney_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['Client']:
+        '''Получить страницу клиентов адвоката (keyset по created_at, id).'''
+        try:
+            # 1. Выборка страницы из базы данных
+            stmt = select(ClientORM).where(ClientORM.owner_attorney_id == attorney_id)
+            page = await paginate_keyset(self.session, stmt, ClientORM, limit, cursor)
+
+            # 2. Преобразование ORM объектов в доменные сущности
+            page.items = [ClientMapper.to_domain(orm_client) for orm_client in page.items]
+            return page
+
+        except SQLAlchemyError as e:
+            logger.error(
+                f'Ошибка БД при получении страницы КЛИЕНТОВ для адвоката {attorney_id}: {e}'
+            )
+            raise DatabaseErrorException(f'Ошибка при получении КЛИЕНТОВ: {str(e)}')
+
     async def get_for_case(self, case_id: int) -> List['Client']:
         try:
             # 1. Получение клиента через связь с делом
@@ -110,10 +147,15 @@ class ClientRepository(IClientRepository):
 
     async def update(self, updated_client: Client) -> 'Client':
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(ClientORM).where(ClientORM.id == updated_client.id)
-            result = await self.session.execute(stmt)
-            orm_client = result.scalars().first()
+            # 1. Обновление одной командой UPDATE ... RETURNING
+            stmt = (
+                update(ClientORM)
+                .where(ClientORM.id == updated_client.id)
+                .values(**ClientMapper.update_values(updated_client))
+                .returning(ClientORM)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            orm_client = (await self.session.execute(stmt)).scalar_one_or_none()
 
             # 2. Проверка наличия записи в БД
             if not orm_client:
@@ -122,15 +164,19 @@ class ClientRepository(IClientRepository):
                     f'КЛИЕНТ с ID {updated_client.id} не найден.'
                 )
 
-            # 3. Обновление полей ORM-объекта из доменной сущности
-            ClientMapper.update_orm(orm_client, updated_client)
-
-            # 4. Сохранение в БД
-            await self.session.flush()  # или session.commit() если нужна транзакция
 
-            # 5. Возврат доменного объекта
+            # 3. Возврат доменного объекта
             logger.info(f'КЛИЕНТ обновлен. ID= {updated_client.id}')
-            return ClientMapper.to_domain(orm_client)
+            return entity_cache(self.session).put(ClientMapper.to_domain(orm_client))
+
+        except IntegrityError as e:
+            logger.error(
+                f'Ошибка БД при обновлении КЛИЕНТА. ID={updated_client.id}: {e}'
+            )
+            self._raise_if_duplicate(e, updated_client)
+            raise DatabaseErrorException(
+                f'Ошибка БД при обновлении КЛИЕНТА. ID={updated_client.id}: {e}'
+            )
 
         except SQLAlchemyError as e:
             logger.error(
@@ -156,6 +202,11 @@ class ClientRepository(IClientRepository):
             # 2. Удаление
             await self.session.delete(orm_client)
             await self.session.flush()
+            await mark_dashboard_stale(self.session, orm_client.owner_attorney_id)
+
+            # Каскад удалил дела и платежи клиента (и их связи) - кэш сущностей
+            # транзакции проще сбросить целиком
+            entity_cache(self.session).clear()
 
             logger.info(f'КЛИЕНТ с ID {id} успешно удален.')
             return True
@@ -163,6 +214,65 @@ class ClientRepository(IClientRepository):
         except SQLAlchemyError as e:
             raise DatabaseErrorException(f'Ошибка при удалении КЛИЕНТА: {str(e)}')
 
+    async def find_conflicts(
+        self,
+        owner_id: int,
+        values: Dict[str, str],
+        exclude_id: Optional[int] = None,
+    ) -> Dict[str, int]:
+        try:
+            # 1. Пустые значения не уникальны (см. индексы CLIENT_UNIQUE_FIELDS)
+            values = {
+                field: value
+                for field, value in values.items()
+                if field in CLIENT_UNIQUE_FIELDS and value
+            }
+            if not values:
+                return {}
+
+            # 2. Один запрос: OR по полям, каждое - по своему уникальному индексу
+            columns = {field: getattr(ClientORM, field) for field in values}
+            stmt = select(ClientORM.id, *columns.values()).where(
+                ClientORM.owner_attorney_id == owner_id,
+                or_(*(columns[field] == value for field, value in values.items())),
+            )
+            if exclude_id is not None:
+                stmt = stmt.where(ClientORM.id != exclude_id)
+            rows = (await self.session.execute(stmt)).mappings().all()
+
+            # 3. Какое поле с каким клиентом совпало
+            conflicts: Dict[str, int] = {}
+            for row in rows:
+                for field, value in values.items():
+                    if row[field] == value:
+                        conflicts.setdefault(field, row['id'])
+            return conflicts
+
+        except SQLAlchemyError as e:
+            logger.error(
+                f'Ошибка БД при проверке уникальности КЛИЕНТА '
+                f'для адвоката {owner_id}: {e}'
+            )
+            raise DatabaseErrorException(
+                f'Ошибка БД при проверке уникальности КЛИЕНТА: {str(e)}'
+            )
+
+    @staticmethod
+    def _raise_if_duplicate(error: IntegrityError, client: Client) -> None:
+        '''
+        Нарушение уникального индекса поля клиента -> ValidationException.
+
+        Срабатывает, когда параллельный запрос успел создать такого же клиента
+        между проверкой ClientPolicy и вставкой.
+        '''
+        message = str(error.orig)
+        for field in CLIENT_UNIQUE_FIELDS:
+            if client_unique_index_name(field) in message:
+                raise ValidationException(
+                    f'{field.capitalize()} {getattr(client, field)} уже используется '
+                    f'другим клиентом этого юриста'
+                )
+
     async def get_by_email_for_owner(self, email: str, owner_id: int) -> 'Client':
         '''Получить клиента по email для конкретного адвоката.'''
         return await self._get_by_field_for_owner(
@@ -1,15 +1,18 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.logger import logger
 from backend.core.exceptions import DatabaseErrorException, EntityNotFoundException
+from backend.core.pagination import Page
 from backend.domain.entities.contact import Contact
 from backend.infrastructure.mappers import ContactMapper
 from backend.infrastructure.models import ContactORM
 from backend.application.interfaces.repositories.contact_repo import IContactRepository
+from backend.infrastructure.tools.entity_cache import entity_cache
+from backend.infrastructure.tools.pagination import paginate_keyset
 
 if TYPE_CHECKING:
     from backend.domain.entities.contact import Contact
@@ -54,6 +57,11 @@ class ContactRepository(IContactRepository):
             )
 
     async def get(self, id: int) -> 'Contact':
+        # Повторное чтение в той же транзакции - из кэша сущностей
+        cached = entity_cache(self.session).get(Contact, id)
+        if cached is not None:
+            return cached
+
         try:
             # 1. Получение записи из базы данных
             stmt = select(ContactORM).where(ContactORM.id == id)
@@ -68,7 +76,7 @@ class ContactRepository(IContactRepository):
             contact = ContactMapper.to_domain(orm_contact)
 
             logger.info(f'СВЯЗАННЫЙ КОНТАКТ получен. ID - {contact.id}')
-            return contact
+            return entity_cache(self.session).put(contact)
 
         except SQLAlchemyError as e:
             logger.error(f'Ошибка БД при получении СВЯЗАННОГО КОНТАКТА ID = {id}: {e}')
@@ -79,7 +87,11 @@ class ContactRepository(IContactRepository):
     async def get_all_for_attorney(self, attorney_id: int) -> List['Contact']:
         try:
             # 1. Получение записи из базы данных
-            stmt = select(ContactORM).where(ContactORM.attorney_id == attorney_id)
+            stmt = (
+                select(ContactORM)
+                .where(ContactORM.attorney_id == attorney_id)
+                .order_by(ContactORM.created_at.desc(), ContactORM.id.desc())
+            )
             result = await self.session.execute(stmt)
             orm_contacts = result.scalars().all()
 
@@ -101,6 +113,29 @@ class ContactRepository(IContactRepository):
                 f'Ошибка при получении СВЯЗАННОГО КОНТАКТА: {str(e)}'
             )
 
+    async def get_page_for_attorney(
+        self, attorney_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['Contact']:
+        '''Получить страницу связанных контактов адвоката (keyset по created_at, id).'''
+        try:
+            # 1. Выборка страницы из базы данных
+            stmt = select(ContactORM).where(ContactORM.attorney_id == attorney_id)
+            page = await paginate_keyset(self.session, stmt, ContactORM, limit, cursor)
+
+            # 2. Преобразование ORM объектов в доменные сущности
+            page.items = [
+                ContactMapper.to_domain(orm_contact) for orm_contact in page.items
+            ]
+            return page
+
+        except SQLAlchemyError as e:
+            logger.error(
+                f'Ошибка БД при получении страницы СВЯЗАННЫХ КОНТАКТОВ для адвоката {attorney_id}: {e}'
+            )
+            raise DatabaseErrorException(
+                f'Ошибка при получении СВЯЗАННОГО КОНТАКТА: {str(e)}'
+            )
+
     async def get_all_for_case(self, id: int) -> List['Contact']:
         try:
             # 1. Получение записей из базы данных
@@ -125,10 +160,15 @@ class ContactRepository(IContactRepository):
 
     async def update(self, updated_contact: Contact) -> 'Contact':
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(ContactORM).where(ContactORM.id == updated_contact.id)
-            result = await self.session.execute(stmt)
-            orm_contact = result.scalars().first()
+            # 1. Обновление одной командой UPDATE ... RETURNING
+            stmt = (
+                update(ContactORM)
+                .where(ContactORM.id == updated_contact.id)
+                .values(**ContactMapper.update_values(updated_contact))
+                .returning(ContactORM)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            orm_contact = (await self.session.execute(stmt)).scalar_one_or_none()
 
             # 2. Проверка наличия записи в БД
             if not orm_contact:
@@ -137,15 +177,10 @@ class ContactRepository(IContactRepository):
                     f'СВЯЗАННЫЙ КОНТАКТ с ID {updated_contact.id} не найден.'
                 )
 
-            # 3. Обновление полей ORM-объекта из доменной сущности
-            ContactMapper.update_orm(orm_contact, updated_contact)
-
-            # 4. Сохранение в БД
-            await self.session.flush()  # или session.commit() если нужна транзакция
 
-            # 5. Возврат доменного объекта
+            # 3. Возврат доменного объекта
             logger.info(f'СВЯЗАННЫЙ КОНТАКТ обновлен. ID= {updated_contact.id}')
-            return ContactMapper.to_domain(orm_contact)
+            return entity_cache(self.session).put(ContactMapper.to_domain(orm_contact))
 
         except SQLAlchemyError as e:
             logger.error(
@@ -157,20 +192,21 @@ class ContactRepository(IContactRepository):
 
     async def delete(self, id: int) -> bool:
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(ContactORM).where(ContactORM.id == id)
-            result = await self.session.execute(stmt)
-            orm_contact = result.scalars().first()
+            # 1. Удаление одной командой DELETE ... RETURNING
+            stmt = (
+                delete(ContactORM)
+                .where(ContactORM.id == id)
+                .returning(ContactORM.id)
+            )
+            deleted = (await self.session.execute(stmt)).first()
 
-            if not orm_contact:
+            if not deleted:
                 logger.warning(f'СВЯЗАННЫЙ КОНТАКТ с ID {id} не найден при удалении.')
                 raise EntityNotFoundException(
                     f'СВЯЗАННЫЙ КОНТАКТ с ID {id} не найден при удалении.'
                 )
 
-            # 2. Удаление
-            await self.session.delete(orm_contact)
-            await self.session.flush()
+            entity_cache(self.session).evict(Contact, id)
 
             logger.info(f'СВЯЗАННЫЙ КОНТАКТ с ID {id} успешно удален.')
             return True
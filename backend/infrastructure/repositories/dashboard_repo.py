@@ -0,0 +1,235 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, func, not_, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.exceptions import DatabaseErrorException
+from backend.core.logger import logger
+from backend.domain.entities.auxiliary import PaymentStatus
+from backend.infrastructure.models import (
+    AttorneyDashboardORM,
+    CaseORM,
+    ClientPaymentORM,
+    DocumentORM,
+    EventORM,
+)
+from backend.application.interfaces.repositories.dashboard_repo import (
+    IDashboardRepository,
+)
+
+# Платежи, которые еще ждут оплаты (пока не прошел paid_deadline)
+OPEN_PAYMENT_STATUSES = (
+    PaymentStatus.issued.value,
+    PaymentStatus.sent.value,
+    PaymentStatus.pending.value,
+    PaymentStatus.partially_paid.value,
+)
+
+
+async def mark_dashboard_stale(session: AsyncSession, attorney_id: int) -> None:
+    '''
+    Увеличить версию данных юриста: сводка дашборда станет устаревшей.
+
+    Вызывается репозиториями дел, событий, платежей и документов в той же
+    транзакции, что и сама запись, поэтому откатывается вместе с ней.
+    '''
+    if attorney_id is None:
+        return
+    stmt = (
+        insert(AttorneyDashboardORM)
+        .values(attorney_id=attorney_id, version=1, refreshed_version=0)
+        .on_conflict_do_update(
+            index_elements=[AttorneyDashboardORM.attorney_id],
+            set_={'version': AttorneyDashboardORM.version + 1},
+        )
+    )
+    await session.execute(stmt)
+
+
+class DashboardRepository(IDashboardRepository):
+    '''
+    Сводка дашборда юриста, хранимая в таблице attorney_dashboards.
+
+    Чтение - один запрос по первичному ключу. Пересчет выполняется только
+    для устаревшей сводки и состоит из агрегатов по индексам attorney_id;
+    версия данных читается до агрегатов, так что запись, попавшая между
+    ними, оставит сводку устаревшей и ее пересчитают при следующем чтении.
+    '''
+
+    UPCOMING_EVENTS_LIMIT = 10
+    RECENT_DOCUMENTS_LIMIT = 5
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_fresh(self, attorney_id: int) -> Optional[Dict[str, Any]]:
+        try:
+            stmt = select(AttorneyDashboardORM.summary).where(
+                AttorneyDashboardORM.attorney_id == attorney_id,
+                AttorneyDashboardORM.summary.is_not(None),
+                AttorneyDashboardORM.refreshed_version
+                == AttorneyDashboardORM.version,
+                or_(
+                    AttorneyDashboardORM.valid_until.is_(None),
+                    AttorneyDashboardORM.valid_until > func.now(),
+                ),
+            )
+            return (await self.session.execute(stmt)).scalar_one_or_none()
+
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка при получении СВОДКИ ДАШБОРДА {attorney_id}: {e}')
+            raise DatabaseErrorException(
+                f'Ошибка при получении СВОДКИ ДАШБОРДА: {str(e)}'
+            )
+
+    async def mark_stale(self, attorney_id: int) -> None:
+        try:
+            await mark_dashboard_stale(self.session, attorney_id)
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка при сбросе СВОДКИ ДАШБОРДА {attorney_id}: {e}')
+            raise DatabaseErrorException(
+                f'Ошибка при сбросе СВОДКИ ДАШБОРДА: {str(e)}'
+            )
+
+    async def refresh(self, attorney_id: int) -> Dict[str, Any]:
+        try:
+            now = datetime.now(timezone.utc)
+
+            # 1. Версия данных, для которой строится сводка
+            version = (
+                await self.session.execute(
+                    select(AttorneyDashboardORM.version).where(
+                        AttorneyDashboardORM.attorney_id == attorney_id
+                    )
+                )
+            ).scalar_one_or_none() or 0
+
+            # 2. Агрегаты
+            cases_by_status = await self._cases_by_status(attorney_id)
+            upcoming_events, next_event = await self._upcoming_events(
+                attorney_id, now
+            )
+            payments, next_deadline = await self._payments(attorney_id, now)
+            recent_documents = await self._recent_documents(attorney_id)
+
+            summary = {
+                'cases_total': sum(cases_by_status.values()),
+                'cases_by_status': cases_by_status,
+                'upcoming_events': upcoming_events,
+                **payments,
+                'recent_documents': recent_documents,
+                'refreshed_at': now.isoformat(),
+            }
+
+            # 3. Сводка меняется сама по себе, когда наступает ближайшее
+            # событие или срок оплаты - до этого момента она и актуальна
+            moments = [m for m in (next_event, next_deadline) if m is not None]
+            valid_until = min(moments) if moments else None
+
+            # 4. Сохранение; более старый пересчет не затирает более новый
+            values = {
+                'summary': summary,
+                'refreshed_version': version,
+                'valid_until': valid_until,
+                'refreshed_at': now,
+            }
+            stmt = insert(AttorneyDashboardORM).values(
+                attorney_id=attorney_id, version=version, **values
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[AttorneyDashboardORM.attorney_id],
+                set_=values,
+                where=AttorneyDashboardORM.refreshed_version <= version,
+            )
+            await self.session.execute(stmt)
+
+            logger.info(
+                f'СВОДКА ДАШБОРДА пересчитана. ЮРИСТ - {attorney_id}, '
+                f'версия - {version}'
+            )
+            return summary
+
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка при пересчете СВОДКИ ДАШБОРДА {attorney_id}: {e}')
+            raise DatabaseErrorException(
+                f'Ошибка при пересчете СВОДКИ ДАШБОРДА: {str(e)}'
+            )
+
+    async def _cases_by_status(self, attorney_id: int) -> Dict[str, int]:
+        stmt = (
+            select(CaseORM.status, func.count())
+            .where(CaseORM.attorney_id == attorney_id)
+            .group_by(CaseORM.status)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return {status: count for status, count in rows}
+
+    async def _upcoming_events(
+        self, attorney_id: int, now: datetime
+    ) -> tuple[list[Dict[str, Any]], Optional[datetime]]:
+        stmt = (
+            select(
+                EventORM.id,
+                EventORM.name,
+                EventORM.event_type,
+                EventORM.event_date,
+                EventORM.case_id,
+            )
+            .where(EventORM.attorney_id == attorney_id, EventORM.event_date >= now)
+            .order_by(EventORM.event_date, EventORM.id)
+            .limit(self.UPCOMING_EVENTS_LIMIT)
+        )
+        rows = (await self.session.execute(stmt)).mappings().all()
+        events = [{**row, 'event_date': row['event_date'].isoformat()} for row in rows]
+        return events, rows[0]['event_date'] if rows else None
+
+    async def _payments(
+        self, attorney_id: int, now: datetime
+    ) -> tuple[Dict[str, Any], Optional[datetime]]:
+        is_open = ClientPaymentORM.status.in_(OPEN_PAYMENT_STATUSES)
+        past_deadline = and_(
+            ClientPaymentORM.paid_deadline.is_not(None),
+            ClientPaymentORM.paid_deadline < now,
+        )
+        pending = and_(is_open, not_(past_deadline))
+        overdue = or_(
+            ClientPaymentORM.status == PaymentStatus.overdue.value,
+            and_(is_open, past_deadline),
+        )
+
+        stmt = select(
+            func.count().filter(pending),
+            func.coalesce(func.sum(ClientPaymentORM.paid).filter(pending), 0),
+            func.count().filter(overdue),
+            func.coalesce(func.sum(ClientPaymentORM.paid).filter(overdue), 0),
+            func.min(ClientPaymentORM.paid_deadline).filter(pending),
+        ).where(ClientPaymentORM.attorney_id == attorney_id)
+        row = (await self.session.execute(stmt)).one()
+
+        payments = {
+            'pending_payments_count': row[0],
+            'pending_payments_total': float(row[1]),
+            'overdue_payments_count': row[2],
+            'overdue_payments_total': float(row[3]),
+        }
+        return payments, row[4]
+
+    async def _recent_documents(self, attorney_id: int) -> list[Dict[str, Any]]:
+        stmt = (
+            select(
+                DocumentORM.id,
+                DocumentORM.file_name,
+                DocumentORM.case_id,
+                DocumentORM.created_at,
+            )
+            .where(DocumentORM.attorney_id == attorney_id)
+            .order_by(DocumentORM.created_at.desc(), DocumentORM.id.desc())
+            .limit(self.RECENT_DOCUMENTS_LIMIT)
+        )
+        rows = (await self.session.execute(stmt)).mappings().all()
+        return [
+            {**row, 'created_at': row['created_at'].isoformat()} for row in rows
+        ]
@@ -0,0 +1,102 @@
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.exceptions import DatabaseErrorException
+from backend.core.logger import logger
+from backend.infrastructure.models import DocumentBlobORM
+from backend.application.interfaces.repositories.document_blob_repo import (
+    IDocumentBlobRepository,
+)
+
+
+class DocumentBlobRepository(IDocumentBlobRepository):
+    '''
+    Счетчики ссылок на файлы документов (таблица document_blobs).
+
+    Счетчик меняется одним атомарным запросом, а строка остается
+    заблокированной до конца транзакции: параллельные загрузка и удаление
+    одного и того же файла выполняются строго по очереди.
+    '''
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def acquire(self, sha256: str, storage_path: str, size: int) -> int:
+        try:
+            # 1. INSERT ... ON CONFLICT: новый файл или +1 к существующему
+            stmt = (
+                insert(DocumentBlobORM)
+                .values(sha256=sha256, storage_path=storage_path, size=size)
+                .on_conflict_do_update(
+                    index_elements=[DocumentBlobORM.sha256],
+                    set_={'ref_count': DocumentBlobORM.ref_count + 1},
+                )
+                .returning(DocumentBlobORM.ref_count)
+            )
+            ref_count = (await self.session.execute(stmt)).scalar_one()
+
+            logger.info(f'ФАЙЛ ДОКУМЕНТА {sha256}: ссылок - {ref_count}')
+            return ref_count
+
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка при учете ФАЙЛА ДОКУМЕНТА {sha256}: {e}')
+            raise DatabaseErrorException(
+                f'Ошибка при учете ФАЙЛА ДОКУМЕНТА: {str(e)}'
+            )
+
+    async def release(self, sha256: str) -> int:
+        try:
+            # Запись с нулем ссылок остается: файл удаляет purge() после
+            # commit, повторно заблокировав строку
+            stmt = (
+                update(DocumentBlobORM)
+                .where(DocumentBlobORM.sha256 == sha256, DocumentBlobORM.ref_count > 0)
+                .values(ref_count=DocumentBlobORM.ref_count - 1)
+                .returning(DocumentBlobORM.ref_count)
+            )
+            ref_count = (await self.session.execute(stmt)).scalar_one_or_none()
+
+            if ref_count is None:
+                logger.warning(f'ФАЙЛ ДОКУМЕНТА {sha256} не найден при удалении ссылки')
+                return 0
+
+            logger.info(f'ФАЙЛ ДОКУМЕНТА {sha256}: осталось ссылок - {ref_count}')
+            return ref_count
+
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка при удалении ссылки на ФАЙЛ ДОКУМЕНТА {sha256}: {e}')
+            raise DatabaseErrorException(
+                f'Ошибка при удалении ссылки на ФАЙЛ ДОКУМЕНТА: {str(e)}'
+            )
+
+    async def purge(self, sha256: str) -> Optional[str]:
+        try:
+            # 1. Блокируем строку: параллельный acquire() того же файла ждет
+            # commit этой транзакции и затем заново запишет файл
+            stmt = (
+                select(DocumentBlobORM.ref_count, DocumentBlobORM.storage_path)
+                .where(DocumentBlobORM.sha256 == sha256)
+                .with_for_update()
+            )
+            row = (await self.session.execute(stmt)).first()
+
+            # 2. Файл снова кому-то нужен (или запись уже удалена)
+            if row is None or row.ref_count > 0:
+                return None
+
+            # 3. Ссылок по-прежнему нет - удаляем запись
+            await self.session.execute(
+                delete(DocumentBlobORM).where(DocumentBlobORM.sha256 == sha256)
+            )
+            logger.info(f'ФАЙЛ ДОКУМЕНТА {sha256} больше не используется')
+            return row.storage_path
+
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка при удалении ФАЙЛА ДОКУМЕНТА {sha256}: {e}')
+            raise DatabaseErrorException(
+                f'Ошибка при удалении ФАЙЛА ДОКУМЕНТА: {str(e)}'
+            )
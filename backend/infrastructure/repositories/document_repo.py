@@ -1,10 +1,13 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, cast, func, literal, literal_column, or_
+from sqlalchemy import delete, select, update
 
 from backend.core.logger import logger
+from backend.core.pagination import Page
 from backend.core.exceptions import (
     DatabaseErrorException,
     EntityNotFoundException,
@@ -15,11 +18,57 @@ from backend.infrastructure.models import DocumentORM
 from backend.application.interfaces.repositories.document_repo import (
     IDocumentMetadataRepository,
 )
+from backend.infrastructure.tools.entity_cache import entity_cache
+from backend.infrastructure.tools.pagination import paginate_keyset
+from backend.infrastructure.repositories.dashboard_repo import mark_dashboard_stale
+from backend.infrastructure.repositories.document_blob_repo import (
+    DocumentBlobRepository,
+)
 
 if TYPE_CHECKING:
     from backend.domain.entities.document import Document
 
 
+async def delete_documents(
+    session: AsyncSession, *conditions
+) -> List[Tuple[Optional[str], str]]:
+    '''
+    Массово удалить документы и снять их ссылки на файлы.
+
+    Для каскадных удалений (дело, учетная запись юриста): один
+    DELETE ... RETURNING, затем release() для каждого content_hash, как
+    при удалении одного документа. Файлы с диска здесь не удаляются.
+
+    Returns:
+        (content_hash, storage_path) файлов, на которые больше никто
+        не ссылается, - для DocumentService.purge_released() после commit
+    '''
+    # 1. Документы и их файлы
+    stmt = (
+        delete(DocumentORM)
+        .where(*conditions)
+        .returning(DocumentORM.content_hash, DocumentORM.storage_path)
+    )
+    rows = (await session.execute(stmt)).all()
+    if not rows:
+        return []
+
+    # 2. Ссылки снимаются в порядке хэшей - блокировки строк document_blobs
+    # берутся в одном порядке во всех транзакциях
+    blob_repo = DocumentBlobRepository(session)
+    released = []
+    for content_hash, storage_path in sorted(rows, key=lambda r: r[0] or ''):
+        # Документы до дедупликации владеют своим файлом единолично
+        remaining = await blob_repo.release(content_hash) if content_hash else 0
+        if remaining == 0:
+            released.append((content_hash, storage_path))
+
+    logger.info(
+        f'Удалено документов: {len(rows)}, освобождено файлов: {len(released)}'
+    )
+    return released
+
+
 class DocumentMetadataRepository(IDocumentMetadataRepository):
     '''
     Репозиторий для работы с информацией о документах в БД.
@@ -40,6 +89,7 @@ class DocumentMetadataRepository(IDocumentMetadataRepository):
 
             # 3. flush() — отправляем в БД, получаем ID
             await self.session.flush()
+            await mark_dashboard_stale(self.session, orm_document.attorney_id)
 
             # 4. Обновляем ID в доменном объекте
             document.id = orm_document.id
@@ -60,6 +110,11 @@ class DocumentMetadataRepository(IDocumentMetadataRepository):
             )
 
     async def get(self, id: int) -> 'Document':
+        # Повторное чтение в той же транзакции - из кэша сущностей
+        cached = entity_cache(self.session).get(Document, id)
+        if cached is not None:
+            return cached
+
         try:
             # 1. Получение записи из базы данных
             stmt = select(DocumentORM).where(DocumentORM.id == id)
@@ -74,7 +129,7 @@ class DocumentMetadataRepository(IDocumentMetadataRepository):
             document = DocumentMapper.to_domain(orm_document)
 
             logger.info(f'МЕТАДАННЫЕ ДОКУМЕНТА получены. ID - {document.id}')
-            return document
+            return entity_cache(self.session).put(document)
 
         except SQLAlchemyError as e:
             logger.error(
@@ -108,12 +163,148 @@ class DocumentMetadataRepository(IDocumentMetadataRepository):
                 f'Ошибка при получении МЕТАДАННЫХ ДОКУМЕНТА: {str(e)}'
             )
 
-    async def update(self, updated_document: Document) -> 'Document':
+    async def get_page_for_case(
+        self, case_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['Document']:
+        '''Получить страницу метаданных документов дела (keyset по created_at, id).'''
+        try:
+            # 1. Выборка страницы из базы данных
+            stmt = select(DocumentORM).where(DocumentORM.case_id == case_id)
+            page = await paginate_keyset(self.session, stmt, DocumentORM, limit, cursor)
+
+            # 2. Преобразование ORM объектов в доменные сущности
+            page.items = [
+                DocumentMapper.to_domain(orm_document) for orm_document in page.items
+            ]
+            return page
+
+        except SQLAlchemyError as e:
+            logger.error(
+                f'Ошибка БД при получении страницы МЕТАДАННЫХ ДОКУМЕНТОВ дела ID = {case_id}: {e}'
+            )
+            raise DatabaseErrorException(
+                f'Ошибка при получении МЕТАДАННЫХ ДОКУМЕНТА: {str(e)}'
+            )
+
+    # ========== ПОЛНОТЕКСТОВЫЙ ПОИСК ==========
+
+    @staticmethod
+    def _needs_text_index_clause() -> ColumnElement[bool]:
+        # Новый документ или метаданные менялись после индексации
+        return or_(
+            DocumentORM.text_indexed_at.is_(None),
+            DocumentORM.text_indexed_at < DocumentORM.updated_at,
+        )
+
+    async def needs_text_index(self, id: int) -> bool:
+        try:
+            stmt = select(DocumentORM.id).where(
+                DocumentORM.id == id, self._needs_text_index_clause()
+            )
+            return (await self.session.execute(stmt)).scalar_one_or_none() is not None
+
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка БД при проверке индекса ДОКУМЕНТА ID = {id}: {e}')
+            raise DatabaseErrorException(
+                f'Ошибка при проверке индекса ДОКУМЕНТА: {str(e)}'
+            )
+
+    async def get_ids_for_text_index(self, limit: int, after_id: int = 0) -> List[int]:
+        try:
+            stmt = (
+                select(DocumentORM.id)
+                .where(DocumentORM.id > after_id, self._needs_text_index_clause())
+                .order_by(DocumentORM.id)
+                .limit(limit)
+            )
+            return list((await self.session.execute(stmt)).scalars().all())
+
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка БД при выборке ДОКУМЕНТОВ для индексации: {e}')
+            raise DatabaseErrorException(
+                f'Ошибка при выборке ДОКУМЕНТОВ для индексации: {str(e)}'
+            )
+
+    async def set_search_text(self, id: int, text: str, config: str) -> None:
+        try:
+            cfg = cast(literal(config), REGCONFIG)
+
+            def weighted(value, weight: str):
+                return func.setweight(
+                    func.to_tsvector(cfg, value), literal_column(f"'{weight}'")
+                )
+
+            # 1. Вектор считается в Postgres одним UPDATE; updated_at не трогаем,
+            # иначе документ сразу снова считался бы измененным
+            vector = (
+                weighted(DocumentORM.file_name, 'A')
+                .op('||')(weighted(func.coalesce(DocumentORM.description, ''), 'B'))
+                .op('||')(weighted(literal(text), 'C'))
+            )
+            stmt = (
+                update(DocumentORM)
+                .where(DocumentORM.id == id)
+                .values(
+                    search_vector=vector,
+                    text_indexed_at=func.now(),
+                    updated_at=DocumentORM.updated_at,
+                )
+            )
+            await self.session.execute(stmt)
+
+            logger.info(
+                f'ТЕКСТ ДОКУМЕНТА проиндексирован. ID - {id}, символов - {len(text)}'
+            )
+
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка БД при индексации ТЕКСТА ДОКУМЕНТА ID = {id}: {e}')
+            raise DatabaseErrorException(
+                f'Ошибка при индексации ТЕКСТА ДОКУМЕНТА: {str(e)}'
+            )
+
+    async def search(
+        self, attorney_id: int, query: str, config: str, limit: int, offset: int = 0
+    ) -> List[Tuple['Document', float]]:
+        '''Поиск по GIN индексу search_vector, сортировка по ts_rank_cd.'''
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(DocumentORM).where(DocumentORM.id == updated_document.id)
+            cfg = cast(literal(config), REGCONFIG)
+            ts_query = func.websearch_to_tsquery(cfg, query)
+            rank = func.ts_rank_cd(DocumentORM.search_vector, ts_query).label('rank')
+
+            stmt = (
+                select(DocumentORM, rank)
+                .where(
+                    DocumentORM.attorney_id == attorney_id,
+                    DocumentORM.search_vector.op('@@')(ts_query),
+                )
+                .order_by(rank.desc(), DocumentORM.id.desc())
+                .limit(limit)
+                .offset(offset)
+            )
             result = await self.session.execute(stmt)
-            orm_document = result.scalars().first()
+
+            return [
+                (DocumentMapper.to_domain(orm_document), float(score))
+                for orm_document, score in result.all()
+            ]
+
+        except SQLAlchemyError as e:
+            logger.error(
+                f'Ошибка БД при поиске ДОКУМЕНТОВ юриста ID = {attorney_id}: {e}'
+            )
+            raise DatabaseErrorException(f'Ошибка при поиске ДОКУМЕНТОВ: {str(e)}')
+
+    async def update(self, updated_document: Document) -> 'Document':
+        try:
+            # 1. Обновление одной командой UPDATE ... RETURNING
+            stmt = (
+                update(DocumentORM)
+                .where(DocumentORM.id == updated_document.id)
+                .values(**DocumentMapper.update_values(updated_document))
+                .returning(DocumentORM)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            orm_document = (await self.session.execute(stmt)).scalar_one_or_none()
 
             # 2. Проверка наличия записи в БД
             if not orm_document:
@@ -124,15 +315,13 @@ class DocumentMetadataRepository(IDocumentMetadataRepository):
                     f'МЕТАДАННЫЕ ДОКУМЕНТА с ID {updated_document.id} не найдены.'
                 )
 
-            # 3. Обновление полей ORM-объекта из доменной сущности
-            DocumentMapper.update_orm(orm_document, updated_document)
-
-            # 4. Сохранение в БД
-            await self.session.flush()  # или session.commit() если нужна транзакция
+            await mark_dashboard_stale(self.session, orm_document.attorney_id)
 
-            # 5. Возврат доменного объекта
+            # 3. Возврат доменного объекта
             logger.info(f'МЕТАДАННЫЕ ДОКУМЕНТА обновлены. ID= {updated_document.id}')
-            return DocumentMapper.to_domain(orm_document)
+            return entity_cache(self.session).put(
+                DocumentMapper.to_domain(orm_document)
+            )
 
         except SQLAlchemyError as e:
             logger.error(
@@ -144,12 +333,15 @@ class DocumentMetadataRepository(IDocumentMetadataRepository):
 
     async def delete(self, id: int) -> bool:
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(DocumentORM).where(DocumentORM.id == id)
-            result = await self.session.execute(stmt)
-            orm_document = result.scalars().first()
+            # 1. Удаление одной командой DELETE ... RETURNING
+            stmt = (
+                delete(DocumentORM)
+                .where(DocumentORM.id == id)
+                .returning(DocumentORM.id, DocumentORM.attorney_id)
+            )
+            deleted = (await self.session.execute(stmt)).first()
 
-            if not orm_document:
+            if not deleted:
                 logger.warning(
                     f'МЕТАДАННЫЕ ДОКУМЕНТА с ID {id} не найдены при удалении.'
                 )
@@ -157,9 +349,10 @@ class DocumentMetadataRepository(IDocumentMetadataRepository):
                     f'МЕТАДАННЫЕ ДОКУМЕНТА с ID {id} не найдены при удалении.'
                 )
 
-            # 2. Удаление
-            await self.session.delete(orm_document)
-            await self.session.flush()
+            # 2. Сводка дашборда юриста устарела
+            await mark_dashboard_stale(self.session, deleted.attorney_id)
+
+            entity_cache(self.session).evict(Document, id)
 
             logger.info(f'МЕТАДАННЫЕ ДОКУМЕНТА с ID {id} успешно удалены.')
             return True
@@ -168,3 +361,22 @@ class DocumentMetadataRepository(IDocumentMetadataRepository):
             raise DatabaseErrorException(
                 f'Ошибка при удалении МЕТАДАННЫХ ДОКУМЕНТА: {str(e)}'
             )
+
+    async def delete_for_case(self, case_id: int) -> List[Tuple[Optional[str], str]]:
+        return await self._delete_where(DocumentORM.case_id == case_id)
+
+    async def delete_for_attorney(
+        self, attorney_id: int
+    ) -> List[Tuple[Optional[str], str]]:
+        return await self._delete_where(DocumentORM.attorney_id == attorney_id)
+
+    async def _delete_where(self, condition) -> List[Tuple[Optional[str], str]]:
+        try:
+            released = await delete_documents(self.session, condition)
+            entity_cache(self.session).evict_all(Document)
+            return released
+
+        except SQLAlchemyError as e:
+            raise DatabaseErrorException(
+                f'Ошибка при удалении МЕТАДАННЫХ ДОКУМЕНТОВ: {str(e)}'
+            )
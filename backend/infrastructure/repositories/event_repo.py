@@ -1,16 +1,20 @@
-from typing import List
+from typing import List, Optional
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.exceptions import DatabaseErrorException, EntityNotFoundException
 from backend.core.logger import logger
+from backend.core.pagination import Page
 from backend.domain.entities.event import Event
 from backend.infrastructure.mappers import EventMapper
 from backend.infrastructure.models import EventORM
 from backend.application.interfaces.repositories.event_repo import IEventRepository
+from backend.infrastructure.tools.entity_cache import entity_cache
+from backend.infrastructure.tools.pagination import paginate_keyset
+from backend.infrastructure.repositories.dashboard_repo import mark_dashboard_stale
 
 
 class EventRepository(IEventRepository):
@@ -27,6 +31,7 @@ class EventRepository(IEventRepository):
 
             # 3. flush() — отправляем в БД, получаем ID
             await self.session.flush()
+            await mark_dashboard_stale(self.session, orm_event.attorney_id)
 
             # 4. Обновляем ID в доменном объекте
             event.id = orm_event.id
@@ -43,6 +48,11 @@ class EventRepository(IEventRepository):
             raise DatabaseErrorException(f'Ошибка при сохранении СОБЫТИЯ: {str(e)}')
 
     async def get(self, id: int) -> 'Event':
+        # Повторное чтение в той же транзакции - из кэша сущностей
+        cached = entity_cache(self.session).get(Event, id)
+        if cached is not None:
+            return cached
+
         try:
             # 1. Получение записи из базы данных
             stmt = select(EventORM).where(EventORM.id == id)
@@ -57,7 +67,7 @@ class EventRepository(IEventRepository):
             event = EventMapper.to_domain(orm_event)
 
             logger.info(f'СОБЫТИЕ получено. ID - {event.id}')
-            return event
+            return entity_cache(self.session).put(event)
 
         except SQLAlchemyError as e:
             logger.error(f'Ошибка БД при получении СОБЫТИЯ. ID = {id}: {e}')
@@ -99,6 +109,42 @@ class EventRepository(IEventRepository):
             logger.error(f'Ошибка БД при получении СОБЫТИЯ. ID = {attorney_id}: {e}')
             raise DatabaseErrorException(f'Ошибка при получении СОБЫТИЯ: {str(e)}')
 
+    async def get_page_for_case(
+        self, case_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['Event']:
+        '''Получить страницу событий дела (keyset по created_at, id).'''
+        try:
+            # 1. Выборка страницы из базы данных
+            stmt = select(EventORM).where(EventORM.case_id == case_id)
+            page = await paginate_keyset(self.session, stmt, EventORM, limit, cursor)
+
+            # 2. Преобразование ORM объектов в доменные сущности
+            page.items = [EventMapper.to_domain(orm_event) for orm_event in page.items]
+            return page
+
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка БД при получении СОБЫТИЙ дела ID = {case_id}: {e}')
+            raise DatabaseErrorException(f'Ошибка при получении СОБЫТИЯ: {str(e)}')
+
+    async def get_page_for_attorney(
+        self, attorney_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['Event']:
+        '''Получить страницу событий адвоката (keyset по created_at, id).'''
+        try:
+            # 1. Выборка страницы из базы данных
+            stmt = select(EventORM).where(EventORM.attorney_id == attorney_id)
+            page = await paginate_keyset(self.session, stmt, EventORM, limit, cursor)
+
+            # 2. Преобразование ORM объектов в доменные сущности
+            page.items = [EventMapper.to_domain(orm_event) for orm_event in page.items]
+            return page
+
+        except SQLAlchemyError as e:
+            logger.error(
+                f'Ошибка БД при получении СОБЫТИЙ адвоката ID = {attorney_id}: {e}'
+            )
+            raise DatabaseErrorException(f'Ошибка при получении СОБЫТИЯ: {str(e)}')
+
     async def get_nearest_for_attorney(
         self, attorney_id: int, count: int
     ) -> List['Event']:
@@ -131,10 +177,15 @@ class EventRepository(IEventRepository):
 
     async def update(self, updated_event: Event) -> 'Event':
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(EventORM).where(EventORM.id == updated_event.id)
-            result = await self.session.execute(stmt)
-            orm_event = result.scalars().first()
+            # 1. Обновление одной командой UPDATE ... RETURNING
+            stmt = (
+                update(EventORM)
+                .where(EventORM.id == updated_event.id)
+                .values(**EventMapper.update_values(updated_event))
+                .returning(EventORM)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            orm_event = (await self.session.execute(stmt)).scalar_one_or_none()
 
             # 2. Проверка наличия записи в БД
             if not orm_event:
@@ -143,15 +194,11 @@ class EventRepository(IEventRepository):
                     f'СОБЫТИЕ с ID {updated_event.id} не найдено.'
                 )
 
-            # 3. Обновление полей ORM-объекта из доменной сущности
-            EventMapper.update_orm(orm_event, updated_event)
-
-            # 4. Сохранение в БД
-            await self.session.flush()  # или session.commit() если нужна транзакция
+            await mark_dashboard_stale(self.session, orm_event.attorney_id)
 
-            # 5. Возврат доменного объекта
+            # 3. Возврат доменного объекта
             logger.info(f'СОБЫТИЕ обновлено. ID= {updated_event.id}')
-            return EventMapper.to_domain(orm_event)
+            return entity_cache(self.session).put(EventMapper.to_domain(orm_event))
 
         except SQLAlchemyError as e:
             logger.error(
@@ -163,20 +210,24 @@ class EventRepository(IEventRepository):
 
     async def delete(self, id: int) -> bool:
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(EventORM).where(EventORM.id == id)
-            result = await self.session.execute(stmt)
-            orm_event = result.scalars().first()
+            # 1. Удаление одной командой DELETE ... RETURNING
+            stmt = (
+                delete(EventORM)
+                .where(EventORM.id == id)
+                .returning(EventORM.id, EventORM.attorney_id)
+            )
+            deleted = (await self.session.execute(stmt)).first()
 
-            if not orm_event:
+            if not deleted:
                 logger.warning(f'СОБЫТИЕ с ID {id} не найдено при удалении.')
                 raise EntityNotFoundException(
                     f'СОБЫТИЕ с ID {id} не найдено при удалении.'
                 )
 
-            # 2. Удаление
-            await self.session.delete(orm_event)
-            await self.session.flush()
+            # 2. Сводка дашборда юриста устарела
+            await mark_dashboard_stale(self.session, deleted.attorney_id)
+
+            entity_cache(self.session).evict(Event, id)
 
             logger.info(f'СОБЫТИЕ с ID {id} успешно удалено.')
             return True
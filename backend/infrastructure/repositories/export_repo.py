@@ -0,0 +1,170 @@
+from typing import Any, AsyncIterator, Dict
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.logger import logger
+from backend.core.exceptions import DatabaseErrorException, ValidationException
+from backend.infrastructure.models import (
+    CaseORM,
+    ClientORM,
+    ClientPaymentORM,
+    ContactORM,
+    DocumentORM,
+    EventORM,
+)
+from backend.application.interfaces.repositories.export_repo import IExportRepository
+
+
+class ExportRepository(IExportRepository):
+    '''
+    Репозиторий потоковой выгрузки данных юриста.
+
+    Строки читаются через серверный курсор (AsyncSession.stream) пачками
+    по batch_size и отдаются как словари колонок - без ORM-объектов,
+    маппинга в доменные сущности и накопления результата в памяти.
+    '''
+
+    # Раздел выгрузки -> (ORM-модель, колонка владельца, выгружаемые колонки).
+    # Колонки перечислены явно: служебные и индексные (поисковый вектор,
+    # отметка индексации, хэш файла) в выгрузку не попадают, а новые колонки
+    # появляются в ней только после добавления сюда
+    _SECTIONS = {
+        'clients': (
+            ClientORM,
+            ClientORM.owner_attorney_id,
+            (
+                ClientORM.id,
+                ClientORM.name,
+                ClientORM.type,
+                ClientORM.email,
+                ClientORM.phone,
+                ClientORM.personal_info,
+                ClientORM.address,
+                ClientORM.messenger,
+                ClientORM.messenger_handle,
+                ClientORM.owner_attorney_id,
+                ClientORM.created_at,
+                ClientORM.updated_at,
+            ),
+        ),
+        'cases': (
+            CaseORM,
+            CaseORM.attorney_id,
+            (
+                CaseORM.id,
+                CaseORM.name,
+                CaseORM.client_id,
+                CaseORM.attorney_id,
+                CaseORM.status,
+                CaseORM.description,
+                CaseORM.created_at,
+                CaseORM.updated_at,
+            ),
+        ),
+        'contacts': (
+            ContactORM,
+            ContactORM.attorney_id,
+            (
+                ContactORM.id,
+                ContactORM.name,
+                ContactORM.personal_info,
+                ContactORM.phone,
+                ContactORM.email,
+                ContactORM.attorney_id,
+                ContactORM.case_id,
+                ContactORM.created_at,
+                ContactORM.updated_at,
+            ),
+        ),
+        'events': (
+            EventORM,
+            EventORM.attorney_id,
+            (
+                EventORM.id,
+                EventORM.name,
+                EventORM.description,
+                EventORM.event_type,
+                EventORM.event_date,
+                EventORM.case_id,
+                EventORM.attorney_id,
+                EventORM.created_at,
+                EventORM.updated_at,
+            ),
+        ),
+        'payments': (
+            ClientPaymentORM,
+            ClientPaymentORM.attorney_id,
+            (
+                ClientPaymentORM.id,
+                ClientPaymentORM.name,
+                ClientPaymentORM.client_id,
+                ClientPaymentORM.attorney_id,
+                ClientPaymentORM.paid,
+                ClientPaymentORM.paid_str,
+                ClientPaymentORM.pade_date,
+                ClientPaymentORM.paid_deadline,
+                ClientPaymentORM.status,
+                ClientPaymentORM.taxable,
+                ClientPaymentORM.condition,
+                ClientPaymentORM.pdf_status,
+                ClientPaymentORM.created_at,
+                ClientPaymentORM.updated_at,
+            ),
+        ),
+        'documents': (
+            DocumentORM,
+            DocumentORM.attorney_id,
+            (
+                DocumentORM.id,
+                DocumentORM.file_name,
+                DocumentORM.storage_path,
+                DocumentORM.file_size,
+                DocumentORM.description,
+                DocumentORM.mime_type,
+                DocumentORM.case_id,
+                DocumentORM.attorney_id,
+                DocumentORM.created_at,
+                DocumentORM.updated_at,
+            ),
+        ),
+    }
+
+    def __init__(self, session: AsyncSession, batch_size: int = 1000):
+        self.session = session
+        self.batch_size = batch_size
+
+    async def stream_for_attorney(
+        self, section: str, attorney_id: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        if section not in self._SECTIONS:
+            raise ValidationException(f'Неизвестный раздел выгрузки: {section}')
+
+        model, owner_column, columns = self._SECTIONS[section]
+        try:
+            # 1. Core-запрос по колонкам раздела (без identity map ORM)
+            stmt = (
+                select(*columns)
+                .where(owner_column == attorney_id)
+                .order_by(model.id)
+                .execution_options(yield_per=self.batch_size)
+            )
+
+            # 2. Серверный курсор: в памяти держится не больше одной пачки
+            result = await self.session.stream(stmt)
+            count = 0
+            async for partition in result.mappings().partitions():
+                for row in partition:
+                    count += 1
+                    yield dict(row)
+
+            logger.info(
+                f'ВЫГРУЗКА раздела {section} для адвоката {attorney_id}: {count} строк'
+            )
+
+        except SQLAlchemyError as e:
+            logger.error(
+                f'Ошибка БД при выгрузке раздела {section} для адвоката {attorney_id}: {e}'
+            )
+            raise DatabaseErrorException(f'Ошибка при выгрузке данных: {str(e)}')
@@ -1,12 +1,25 @@
-from backend.application.interfaces.repositories.local_storage import IFileStorage
+from backend.application.interfaces.repositories.local_storage import (
+    DEFAULT_CHUNK_SIZE,
+    IFileStorage,
+    StoredFile,
+)
+from backend.core.exceptions import ValidationException
+from backend.infrastructure.tools.file_metadata import MIME_SNIFF_BYTES
 from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Optional
+import hashlib
 import os
+import uuid
 import aiofiles
+import aiofiles.os
 
 
 class LocalFileStorage(IFileStorage):
     '''Хранилище в файловой системе Linux/Windows'''
 
+    # Каталог недописанных загрузок - внутри base_path, чтобы rename был атомарным
+    TMP_DIR = '.tmp'
+
     def __init__(self, base_path: str = '/opt/CRM/storage/'):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
@@ -21,6 +34,91 @@ class LocalFileStorage(IFileStorage):
 
         return str(file_path)  # Возвращаем относительный путь для БД
 
+    async def save_stream(
+        self,
+        file_path: str,
+        chunks: AsyncIterable[bytes],
+        max_size: Optional[int] = None,
+    ) -> StoredFile:
+        '''
+        Пишет поток во временный файл, считая размер и SHA-256,
+        затем атомарно переименовывает его в file_path
+        '''
+        staged = await self.stage_stream(chunks, max_size)
+        full_path = self.base_path / file_path
+        try:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            await aiofiles.os.replace(self.base_path / staged.path, full_path)
+        except BaseException:
+            await self.delete_file(staged.path)
+            raise
+
+        return StoredFile(
+            path=str(file_path),
+            size=staged.size,
+            sha256=staged.sha256,
+            head=staged.head,
+        )
+
+    async def stage_stream(
+        self, chunks: AsyncIterable[bytes], max_size: Optional[int] = None
+    ) -> StoredFile:
+        '''Пишет поток в TMP_DIR, считая размер, SHA-256 и первые байты'''
+        tmp_dir = self.base_path / self.TMP_DIR
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        staged_path = f'{self.TMP_DIR}/{uuid.uuid4()}.part'
+        tmp_path = self.base_path / staged_path
+
+        digest = hashlib.sha256()
+        head = b''
+        size = 0
+
+        try:
+            # В памяти - только текущий чанк
+            async with aiofiles.open(tmp_path, 'wb') as f:
+                async for chunk in chunks:
+                    if not chunk:
+                        continue
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise ValidationException(
+                            f'Размер файла превышает максимальный '
+                            f'({max_size / 1024 / 1024:.0f} МБ)'
+                        )
+                    if len(head) < MIME_SNIFF_BYTES:
+                        head += chunk[: MIME_SNIFF_BYTES - len(head)]
+                    digest.update(chunk)
+                    await f.write(chunk)
+
+            if size == 0:
+                raise ValidationException('Файл пуст')
+
+        except BaseException:
+            # Недописанный файл не должен оставаться в хранилище
+            await self.delete_file(staged_path)
+            raise
+
+        return StoredFile(
+            path=staged_path, size=size, sha256=digest.hexdigest(), head=head
+        )
+
+    async def promote(self, staged_path: str, file_path: str) -> bool:
+        '''Переносит временный файл на место, если такого файла еще нет'''
+        full_path = self.base_path / file_path
+        if full_path.exists():
+            await self.delete_file(staged_path)
+            return False
+
+        try:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            # Гонка с параллельной загрузкой того же файла безопасна:
+            # replace атомарен, а содержимое у обоих одинаковое
+            await aiofiles.os.replace(self.base_path / staged_path, full_path)
+        except BaseException:
+            await self.delete_file(staged_path)
+            raise
+        return True
+
     async def delete_file(self, file_path: str) -> bool:
         '''Удаляет файл с диска'''
         full_path = self.base_path / file_path
@@ -37,3 +135,41 @@ class LocalFileStorage(IFileStorage):
 
         async with aiofiles.open(full_path, 'rb') as f:
             return await f.read()
+
+    async def get_size(self, file_path: str) -> int:
+        '''Размер файла в байтах'''
+        full_path = self.base_path / file_path
+        try:
+            stat = await aiofiles.os.stat(full_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f'Файл не найден: {file_path}')
+        return stat.st_size
+
+    async def iter_chunks(
+        self,
+        file_path: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        '''Читает файл (или диапазон байтов) чанками по chunk_size'''
+        full_path = self.base_path / file_path
+        if not full_path.exists():
+            raise FileNotFoundError(f'Файл не найден: {file_path}')
+
+        async with aiofiles.open(full_path, 'rb') as f:
+            await f.seek(start)
+            remaining = None if end is None else end - start + 1
+
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await f.read(size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def local_path(self, file_path: str) -> Optional[Path]:
+        '''Файлы лежат на диске - их можно отдать через FileResponse'''
+        return self.base_path / file_path
@@ -1,14 +1,16 @@
 '''Репозиторий для работы с Outbox.'''
 
 import json
+from datetime import timedelta
 from typing import Sequence
-from sqlalchemy import select, update
+from sqlalchemy import and_, case, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 from backend.core.logger import logger
 from backend.core.exceptions import DatabaseErrorException
 from backend.infrastructure.models.outbox import (
+    OUTBOX_NOTIFY_CHANNEL,
     OutboxORM,
     OutboxStatus,
     OutboxEventType,
@@ -36,6 +38,12 @@ class OutboxRepository(IOutboxRepository):
             self.session.add(outbox_event)
             await self.session.flush()
 
+            # NOTIFY транзакционный: воркер получит уведомление только после
+            # коммита, а при откате - не получит вовсе
+            await self.session.execute(
+                select(func.pg_notify(OUTBOX_NOTIFY_CHANNEL, str(outbox_event.id)))
+            )
+
             logger.info(
                 f'[OUTBOX] Событие сохранено: type={event_type}, id={outbox_event.id}'
             )
@@ -64,6 +72,121 @@ class OutboxRepository(IOutboxRepository):
             logger.error(f'[OUTBOX] Ошибка при получении событий: {e}')
             raise DatabaseErrorException(f'Ошибка при получении событий из Outbox: {e}')
 
+    async def claim_pending_events(
+        self, limit: int = 10, lease_seconds: int = 60, max_retries: int = 3
+    ) -> Sequence[OutboxORM]:
+        '''
+        Атомарно забрать события в обработку.
+
+        Одним UPDATE ... RETURNING переводит в PROCESSING события со статусом
+        PENDING и PROCESSING с истёкшей арендой. Подзапрос блокирует строки
+        FOR UPDATE SKIP LOCKED, поэтому параллельные воркеры получают
+        непересекающиеся наборы и не ждут друг друга.
+
+        Истёкшая аренда означает, что воркер упал или не уложился в срок,
+        поэтому повторный захват считается попыткой: retry_count растёт,
+        а событие, исчерпавшее max_retries, сразу переводится в FAILED.
+        Такие события тоже возвращаются (со статусом FAILED), чтобы вызывающий
+        отразил неудачу в связанной сущности, но обрабатывать их не нужно.
+        '''
+        try:
+            # 1. Кандидаты: новые события и брошенные упавшим воркером
+            candidates = (
+                select(OutboxORM.id)
+                .where(
+                    or_(
+                        OutboxORM.status == OutboxStatus.PENDING.value,
+                        and_(
+                            OutboxORM.status == OutboxStatus.PROCESSING.value,
+                            OutboxORM.locked_until < func.now(),
+                        ),
+                    )
+                )
+                .order_by(OutboxORM.created_at.asc())
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+
+            # 2. Повторный захват - ещё одна попытка; сверх лимита - FAILED.
+            # Правые части SET видят значения строки до обновления
+            reclaimed = OutboxORM.status == OutboxStatus.PROCESSING.value
+            exhausted = and_(reclaimed, OutboxORM.retry_count + 1 >= max_retries)
+
+            # 3. Захват с арендой на lease_seconds
+            stmt = (
+                update(OutboxORM)
+                .where(OutboxORM.id.in_(candidates))
+                .values(
+                    retry_count=OutboxORM.retry_count + case((reclaimed, 1), else_=0),
+                    status=case(
+                        (exhausted, OutboxStatus.FAILED.value),
+                        else_=OutboxStatus.PROCESSING.value,
+                    ),
+                    locked_until=case(
+                        (exhausted, None),
+                        else_=func.now() + timedelta(seconds=lease_seconds),
+                    ),
+                    error_message=case(
+                        (
+                            exhausted,
+                            f'Превышен лимит попыток ({max_retries}): '
+                            'аренда истекла до завершения обработки',
+                        ),
+                        else_=OutboxORM.error_message,
+                    ),
+                )
+                .returning(OutboxORM)
+                .execution_options(
+                    synchronize_session=False, populate_existing=True
+                )
+            )
+            result = await self.session.execute(stmt)
+            # RETURNING не гарантирует порядок - восстанавливаем очередность
+            events = sorted(result.scalars().all(), key=lambda e: e.created_at)
+            await self.session.flush()
+
+            failed = [e.id for e in events if e.status == OutboxStatus.FAILED.value]
+            if failed:
+                logger.warning(
+                    f'[OUTBOX] События {failed} помечены как FAILED: аренда '
+                    f'истекала {max_retries} раз'
+                )
+            logger.debug(f'[OUTBOX] Захвачено {len(events)} событий для обработки')
+            return events
+
+        except SQLAlchemyError as e:
+            logger.error(f'[OUTBOX] Ошибка при захвате событий: {e}')
+            raise DatabaseErrorException(f'Ошибка при захвате событий из Outbox: {e}')
+
+    async def extend_lease(self, event_id: int, lease_seconds: int = 60) -> bool:
+        '''
+        Продлить аренду события, которое ещё обрабатывается.
+
+        Возвращает False, если событие уже не в PROCESSING (завершено,
+        провалено или возвращено в очередь) - продлевать нечего.
+        '''
+        try:
+            stmt = (
+                update(OutboxORM)
+                .where(
+                    OutboxORM.id == event_id,
+                    OutboxORM.status == OutboxStatus.PROCESSING.value,
+                )
+                .values(locked_until=func.now() + timedelta(seconds=lease_seconds))
+                .returning(OutboxORM.id)
+            )
+            result = await self.session.execute(stmt)
+            extended = result.scalar_one_or_none() is not None
+            await self.session.flush()
+
+            logger.debug(f'[OUTBOX] Аренда события {event_id} продлена: {extended}')
+            return extended
+
+        except SQLAlchemyError as e:
+            logger.error(f'[OUTBOX] Ошибка при продлении аренды: {e}')
+            raise DatabaseErrorException(f'Ошибка при продлении аренды события: {e}')
+
     async def mark_as_processing(self, event_id: int) -> None:
         '''Пометить событие как обрабатываемое.'''
         try:
@@ -90,6 +213,7 @@ class OutboxRepository(IOutboxRepository):
                 .values(
                     status=OutboxStatus.COMPLETED.value,
                     processed_at=datetime.now(timezone.utc),
+                    locked_until=None,
                 )
             )
             await self.session.execute(stmt)
@@ -112,6 +236,7 @@ class OutboxRepository(IOutboxRepository):
                 .values(
                     status=OutboxStatus.FAILED.value,
                     error_message=error_message[:1000],  # Ограничение длины
+                    locked_until=None,
                 )
             )
             await self.session.execute(stmt)
@@ -128,27 +253,26 @@ class OutboxRepository(IOutboxRepository):
     async def increment_retry_count(self, event_id: int) -> int:
         '''Увеличить счетчик попыток обработки.'''
         try:
-            # Получаем текущее значение
-            stmt = select(OutboxORM).where(OutboxORM.id == event_id)
-            result = await self.session.execute(stmt)
-            event = result.scalar_one_or_none()
-
-            if not event:
-                raise DatabaseErrorException(f'Событие {event_id} не найдено')
-
-            new_count = event.retry_count + 1
-
-            # Обновляем счетчик и сбрасываем статус на PENDING для повторной попытки
-            update_stmt = (
+            # Инкремент на стороне БД: без предварительного SELECT и гонки
+            # между чтением и записью. Событие возвращается в PENDING
+            # и освобождается от аренды для повторной попытки
+            stmt = (
                 update(OutboxORM)
                 .where(OutboxORM.id == event_id)
                 .values(
-                    retry_count=new_count,
+                    retry_count=OutboxORM.retry_count + 1,
                     status=OutboxStatus.PENDING.value,
                     error_message=None,
+                    locked_until=None,
                 )
+                .returning(OutboxORM.retry_count)
             )
-            await self.session.execute(update_stmt)
+            result = await self.session.execute(stmt)
+            new_count = result.scalar_one_or_none()
+
+            if new_count is None:
+                raise DatabaseErrorException(f'Событие {event_id} не найдено')
+
             await self.session.flush()
 
             logger.debug(
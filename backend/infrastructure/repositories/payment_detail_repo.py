@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,6 +12,7 @@ from backend.application.interfaces.repositories.payment_detail_repo import (
 )
 from backend.infrastructure.mappers.payment_detail_mapper import PaymentDetailMapper
 from backend.infrastructure.models.payment_detail import PaymentDetailORM
+from backend.infrastructure.tools.entity_cache import entity_cache
 
 
 class PaymentDetailRepository(IPaymentDetailRepository):
@@ -51,6 +52,11 @@ class PaymentDetailRepository(IPaymentDetailRepository):
             )
 
     async def get(self, id: int) -> 'PaymentDetail':
+        # Повторное чтение в той же транзакции - из кэша сущностей
+        cached = entity_cache(self.session).get(PaymentDetail, id)
+        if cached is not None:
+            return cached
+
         try:
             # 1. Получение записи из базы данных
             stmt = select(PaymentDetailORM).where(PaymentDetailORM.id == id)
@@ -65,7 +71,7 @@ class PaymentDetailRepository(IPaymentDetailRepository):
             payment_detail = PaymentDetailMapper.to_domain(orm_payment_detail)
 
             logger.info(f'Платежная информация получена. ID - {payment_detail.id}')
-            return payment_detail
+            return entity_cache(self.session).put(payment_detail)
 
         except SQLAlchemyError as e:
             logger.error(f'Ошибка БД при получении платежной информации ID = {id}: {e}')
@@ -104,12 +110,15 @@ class PaymentDetailRepository(IPaymentDetailRepository):
 
     async def update(self, updated_payment_detail: PaymentDetail) -> 'PaymentDetail':
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(PaymentDetailORM).where(
-                PaymentDetailORM.id == updated_payment_detail.id
+            # 1. Обновление одной командой UPDATE ... RETURNING
+            stmt = (
+                update(PaymentDetailORM)
+                .where(PaymentDetailORM.id == updated_payment_detail.id)
+                .values(**PaymentDetailMapper.update_values(updated_payment_detail))
+                .returning(PaymentDetailORM)
+                .execution_options(synchronize_session=False, populate_existing=True)
             )
-            result = await self.session.execute(stmt)
-            orm_payment_detail = result.scalars().first()
+            orm_payment_detail = (await self.session.execute(stmt)).scalar_one_or_none()
 
             # 2. Проверка наличия записи в БД
             if not orm_payment_detail:
@@ -120,17 +129,14 @@ class PaymentDetailRepository(IPaymentDetailRepository):
                     f'Платежная информация с ID {updated_payment_detail.id} не найдена'
                 )
 
-            # 3. Обновление полей ORM-объекта из доменной сущности
-            PaymentDetailMapper.update_orm(orm_payment_detail, updated_payment_detail)
-
-            # 4. Сохранение в БД
-            await self.session.flush()
 
-            # 5. Возврат доменного объекта
+            # 3. Возврат доменного объекта
             logger.info(
                 f'Платежная информация обновлена. ID = {updated_payment_detail.id}'
             )
-            return PaymentDetailMapper.to_domain(orm_payment_detail)
+            return entity_cache(self.session).put(
+                PaymentDetailMapper.to_domain(orm_payment_detail)
+            )
 
         except SQLAlchemyError as e:
             logger.error(
@@ -142,12 +148,15 @@ class PaymentDetailRepository(IPaymentDetailRepository):
 
     async def delete(self, id: int) -> bool:
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(PaymentDetailORM).where(PaymentDetailORM.id == id)
-            result = await self.session.execute(stmt)
-            orm_payment_detail = result.scalars().first()
+            # 1. Удаление одной командой DELETE ... RETURNING
+            stmt = (
+                delete(PaymentDetailORM)
+                .where(PaymentDetailORM.id == id)
+                .returning(PaymentDetailORM.id)
+            )
+            deleted = (await self.session.execute(stmt)).first()
 
-            if not orm_payment_detail:
+            if not deleted:
                 logger.warning(
                     f'Платежная информация с ID {id} не найдена при удалении.'
                 )
@@ -155,9 +164,7 @@ class PaymentDetailRepository(IPaymentDetailRepository):
                     f'Платежная информация с ID {id} не найдена'
                 )
 
-            # 2. Удаление
-            await self.session.delete(orm_payment_detail)
-            await self.session.flush()
+            entity_cache(self.session).evict(PaymentDetail, id)
 
             logger.info(f'Платежная информация с ID {id} успешно удалена.')
             return True
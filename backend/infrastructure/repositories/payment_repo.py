@@ -1,15 +1,20 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.exceptions import DatabaseErrorException, EntityNotFoundException
 from backend.core.logger import logger
+from backend.core.pagination import Page
+from backend.domain.entities.auxiliary import PdfStatus
 from backend.domain.entities.client_payment import ClientPayment
 from backend.application.interfaces.repositories.payment_repo import IPaymentRepository
 from backend.infrastructure.mappers.payment_mapper import ClientPaymentMapper
 from backend.infrastructure.models.payment import ClientPaymentORM
+from backend.infrastructure.tools.entity_cache import entity_cache
+from backend.infrastructure.tools.pagination import paginate_keyset
+from backend.infrastructure.repositories.dashboard_repo import mark_dashboard_stale
 
 
 class ClientPaymentRepository(IPaymentRepository):
@@ -27,6 +32,7 @@ class ClientPaymentRepository(IPaymentRepository):
 
             # 3. flush() — отправляем в БД, получаем ID
             await self.session.flush()
+            await mark_dashboard_stale(self.session, orm_payment.attorney_id)
 
             # 4. Обновляем ID в доменном объекте
             payment.id = orm_payment.id
@@ -43,6 +49,11 @@ class ClientPaymentRepository(IPaymentRepository):
             raise DatabaseErrorException(f'Ошибка при сохранении ПЛАТЕЖА: {str(e)}')
 
     async def get(self, id: int) -> 'ClientPayment':
+        # Повторное чтение в той же транзакции - из кэша сущностей
+        cached = entity_cache(self.session).get(ClientPayment, id)
+        if cached is not None:
+            return cached
+
         try:
             # 1. Получение записи из базы данных
             stmt = select(ClientPaymentORM).where(ClientPaymentORM.id == id)
@@ -58,7 +69,7 @@ class ClientPaymentRepository(IPaymentRepository):
             payment = ClientPaymentMapper.to_domain(orm_payment)
 
             logger.info(f'ПЛАТЕЖ получен. ID - {payment.id}')
-            return payment
+            return entity_cache(self.session).put(payment)
 
         except SQLAlchemyError as e:
             logger.error(f'Ошибка БД при получении платежа ID = {id}: {e}')
@@ -87,14 +98,42 @@ class ClientPaymentRepository(IPaymentRepository):
             logger.error(f'Ошибка БД при получении всех ПЛАТЕЖЕЙ: {str(e)}')
             raise DatabaseErrorException(f'Ошибка при получении ПЛАТЕЖЕЙ: {str(e)}')
 
-    async def update(self, updated_payment: ClientPayment) -> 'ClientPayment':
+    async def get_page_for_attorney(
+        self, attorney_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page['ClientPayment']:
+        '''Получить страницу платежей адвоката (keyset по created_at, id).'''
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
+            # 1. Выборка страницы из базы данных
             stmt = select(ClientPaymentORM).where(
-                ClientPaymentORM.id == updated_payment.id
+                ClientPaymentORM.attorney_id == attorney_id
+            )
+            page = await paginate_keyset(
+                self.session, stmt, ClientPaymentORM, limit, cursor
             )
-            result = await self.session.execute(stmt)
-            orm_payment = result.scalars().first()
+
+            # 2. Преобразование ORM объектов в доменные сущности
+            page.items = [
+                ClientPaymentMapper.to_domain(orm_payment) for orm_payment in page.items
+            ]
+            return page
+
+        except SQLAlchemyError as e:
+            logger.error(
+                f'Ошибка БД при получении страницы ПЛАТЕЖЕЙ адвоката {attorney_id}: {str(e)}'
+            )
+            raise DatabaseErrorException(f'Ошибка при получении ПЛАТЕЖЕЙ: {str(e)}')
+
+    async def update(self, updated_payment: ClientPayment) -> 'ClientPayment':
+        try:
+            # 1. Обновление одной командой UPDATE ... RETURNING
+            stmt = (
+                update(ClientPaymentORM)
+                .where(ClientPaymentORM.id == updated_payment.id)
+                .values(**ClientPaymentMapper.update_values(updated_payment))
+                .returning(ClientPaymentORM)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            orm_payment = (await self.session.execute(stmt)).scalar_one_or_none()
 
             # 2. Проверка наличия записи в БД
             if not orm_payment:
@@ -103,15 +142,13 @@ class ClientPaymentRepository(IPaymentRepository):
                     f'Платеж с ID {updated_payment.id} не найден'
                 )
 
-            # 3. Обновление полей ORM-объекта из доменной сущности
-            ClientPaymentMapper.update_orm(orm_payment, updated_payment)
+            await mark_dashboard_stale(self.session, orm_payment.attorney_id)
 
-            # 4. Сохранение в БД
-            await self.session.flush()
-
-            # 5. Возврат доменного объекта
+            # 3. Возврат доменного объекта
             logger.info(f'Платеж обновлен. ID = {updated_payment.id}')
-            return ClientPaymentMapper.to_domain(orm_payment)
+            return entity_cache(self.session).put(
+                ClientPaymentMapper.to_domain(orm_payment)
+            )
 
         except SQLAlchemyError as e:
             logger.error(
@@ -119,20 +156,46 @@ class ClientPaymentRepository(IPaymentRepository):
             )
             raise DatabaseErrorException(f'Ошибка при обновлении платежа: {str(e)}')
 
+    async def set_pdf_status(self, payment_id: int, status: PdfStatus) -> None:
+        '''Обновить готовность PDF счета одним UPDATE, без загрузки платежа.'''
+        try:
+            stmt = (
+                update(ClientPaymentORM)
+                .where(ClientPaymentORM.id == payment_id)
+                .values(pdf_status=PdfStatus(status).value)
+            )
+            await self.session.execute(stmt)
+            await self.session.flush()
+            entity_cache(self.session).evict(ClientPayment, payment_id)
+
+            logger.info(f'Статус PDF ПЛАТЕЖА {payment_id}: {PdfStatus(status).value}')
+
+        except SQLAlchemyError as e:
+            logger.error(
+                f'Ошибка БД при обновлении статуса PDF платежа {payment_id}: {e}'
+            )
+            raise DatabaseErrorException(
+                f'Ошибка при обновлении статуса PDF платежа: {str(e)}'
+            )
+
     async def delete(self, id: int) -> bool:
         try:
-            # 1. Выполнение запроса на извлечение данных из БД
-            stmt = select(ClientPaymentORM).where(ClientPaymentORM.id == id)
-            result = await self.session.execute(stmt)
-            orm_payment = result.scalars().first()
+            # 1. Удаление одной командой DELETE ... RETURNING
+            stmt = (
+                delete(ClientPaymentORM)
+                .where(ClientPaymentORM.id == id)
+                .returning(ClientPaymentORM.id, ClientPaymentORM.attorney_id)
+            )
+            deleted = (await self.session.execute(stmt)).first()
 
-            if not orm_payment:
+            if not deleted:
                 logger.warning(f'Платеж с ID {id} не найден при удалении.')
                 raise EntityNotFoundException(f'Платеж с ID {id} не найден')
 
-            # 2. Удаление
-            await self.session.delete(orm_payment)
-            await self.session.flush()
+            # 2. Сводка дашборда юриста устарела
+            await mark_dashboard_stale(self.session, deleted.attorney_id)
+
+            entity_cache(self.session).evict(ClientPayment, id)
 
             logger.info(f'Платеж с ID {id} успешно удален.')
             return True
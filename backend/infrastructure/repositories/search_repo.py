@@ -0,0 +1,110 @@
+from typing import List
+
+from sqlalchemy import String, func, literal, or_, select, union_all
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.logger import logger
+from backend.core.exceptions import DatabaseErrorException
+from backend.infrastructure.models import CaseORM, ClientORM, ContactORM
+from backend.application.interfaces.repositories.search_repo import (
+    ISearchRepository,
+    SearchHit,
+)
+
+
+def _escape_like(value: str) -> str:
+    '''Экранировать спецсимволы LIKE (в Postgres escape по умолчанию - \\).'''
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class SearchRepository(ISearchRepository):
+    '''
+    Нечеткий поиск по клиентам, делам и контактам (pg_trgm).
+
+    Каждая колонка проверяется через ILIKE '%q%' (подстрока) и %>
+    (похожее слово, опечатки) - оба условия обслуживаются GIN индексами
+    gin_trgm_ops. Три выборки объединяются UNION ALL в один запрос
+    и сортируются по word_similarity.
+    '''
+
+    # Сущность -> (модель, колонка владельца, заголовок, подзаголовок, поля поиска)
+    _SOURCES = {
+        'client': (
+            ClientORM,
+            ClientORM.owner_attorney_id,
+            ClientORM.name,
+            ClientORM.phone,
+            (ClientORM.name, ClientORM.phone, ClientORM.email),
+        ),
+        'case': (
+            CaseORM,
+            CaseORM.attorney_id,
+            CaseORM.name,
+            CaseORM.description,
+            (CaseORM.name, CaseORM.description),
+        ),
+        'contact': (
+            ContactORM,
+            ContactORM.attorney_id,
+            ContactORM.name,
+            ContactORM.phone,
+            (ContactORM.name, ContactORM.phone),
+        ),
+    }
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search(
+        self, attorney_id: int, query: str, limit: int, offset: int = 0
+    ) -> List[SearchHit]:
+        try:
+            # 1. По одной выборке на тип сущности
+            pattern = f'%{_escape_like(query)}%'
+            selects = []
+            for entity_type, (model, owner, title, subtitle, fields) in (
+                self._SOURCES.items()
+            ):
+                matches = [field.ilike(pattern) for field in fields]
+                matches += [field.op('%>')(query) for field in fields]
+                score = func.greatest(
+                    *(
+                        func.word_similarity(query, func.coalesce(field, ''))
+                        for field in fields
+                    )
+                )
+                selects.append(
+                    select(
+                        literal(entity_type, String).label('type'),
+                        model.id.label('id'),
+                        title.label('title'),
+                        subtitle.label('subtitle'),
+                        score.label('score'),
+                    ).where(owner == attorney_id, or_(*matches))
+                )
+
+            # 2. Общая сортировка и страница
+            hits = union_all(*selects).subquery()
+            stmt = (
+                select(hits)
+                .order_by(hits.c.score.desc(), hits.c.title, hits.c.id)
+                .limit(limit)
+                .offset(offset)
+            )
+            result = await self.session.execute(stmt)
+
+            return [
+                SearchHit(
+                    type=row.type,
+                    id=row.id,
+                    title=row.title,
+                    subtitle=row.subtitle,
+                    score=float(row.score),
+                )
+                for row in result
+            ]
+
+        except SQLAlchemyError as e:
+            logger.error(f'Ошибка БД при поиске для юриста ID = {attorney_id}: {e}')
+            raise DatabaseErrorException(f'Ошибка при поиске: {str(e)}')
@@ -0,0 +1,56 @@
+from typing import Awaitable, Callable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.logger import logger
+
+# Ключ в session.info, под которым UnitOfWork публикует хуки для репозиториев
+AFTER_COMMIT_KEY = 'after_commit'
+
+Callback = Callable[[], Awaitable[None]]
+
+
+class AfterCommitHooks:
+    '''
+    Действия, которые выполняются только после успешного commit транзакции.
+
+    Нужны для побочных эффектов вне БД, прежде всего сброса кэша Redis.
+    Сброс до commit оставляет окно: параллельное чтение успевает вернуть
+    в кэш старую строку, а при откате кэш расходится с БД. После commit
+    в базе уже новые данные, а откат просто отменяет действия.
+    '''
+
+    def __init__(self) -> None:
+        self._callbacks: List[Callback] = []
+
+    def add(self, callback: Callback) -> None:
+        self._callbacks.append(callback)
+
+    def clear(self) -> None:
+        self._callbacks.clear()
+
+    async def run(self) -> None:
+        '''Выполнить и забыть накопленные действия; ошибки только логируются.'''
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                # Транзакция уже зафиксирована - откатывать нечего
+                logger.warning(f'Ошибка в действии после commit: {e}')
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+
+async def after_commit(session: AsyncSession, callback: Callback) -> None:
+    '''
+    Выполнить callback после commit транзакции, к которой привязана сессия.
+
+    Вне UnitOfWork транзакцией никто не управляет - callback выполняется сразу.
+    '''
+    hooks = session.info.get(AFTER_COMMIT_KEY)
+    if hooks is None:
+        await callback()
+    else:
+        hooks.add(callback)
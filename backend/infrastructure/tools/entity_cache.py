@@ -0,0 +1,98 @@
+from copy import copy
+from typing import Any, Dict, Hashable, Optional, Tuple, Type, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar('T')
+
+# Ключ в session.info, под которым UnitOfWork публикует кэш для репозиториев
+SESSION_INFO_KEY = 'entity_cache'
+
+
+class EntityCache:
+    '''
+    Кэш доменных сущностей на время одной транзакции (identity map UoW).
+
+    Политики, тело сценария и формирование ответа часто читают одну и ту же
+    запись по ID - повторные get() отдаются из кэша без SQL и маппинга.
+    update() репозиториев записывают результат в кэш, delete() - вытесняют.
+    Кэш живет только до commit/rollback, поэтому транзакционная семантика
+    не меняется: после фиксации или отката записи читаются из БД заново.
+
+    Сущности хранятся и выдаются копиями: сценарий может менять полученный
+    объект (case.update(cmd)), не затрагивая закэшированное состояние.
+    '''
+
+    # Счетчики по процессу (для /health)
+    total_hits = 0
+    total_misses = 0
+
+    def __init__(self) -> None:
+        self._entities: Dict[Tuple[type, Hashable], Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: Type[T], id: Hashable) -> Optional[T]:
+        '''Сущность kind с данным ID или None (промах).'''
+        entity = self._entities.get((kind, id))
+        if entity is None:
+            self.misses += 1
+            EntityCache.total_misses += 1
+            return None
+
+        self.hits += 1
+        EntityCache.total_hits += 1
+        return copy(entity)
+
+    def put(self, entity: T) -> T:
+        '''Запомнить сущность (write-through); возвращает ее же.'''
+        if entity is not None and entity.id is not None:
+            self._entities[(type(entity), entity.id)] = copy(entity)
+        return entity
+
+    def evict(self, kind: type, id: Hashable) -> None:
+        self._entities.pop((kind, id), None)
+
+    def evict_all(self, *kinds: type) -> None:
+        '''Вытеснить все сущности типов kinds (массовые и каскадные удаления).'''
+        for key in [key for key in self._entities if key[0] in kinds]:
+            del self._entities[key]
+
+    def clear(self) -> None:
+        self._entities.clear()
+
+    def metrics(self) -> Dict[str, int]:
+        '''Снимок метрик кэша текущей транзакции.'''
+        return {
+            'size': len(self._entities),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    @classmethod
+    def total_metrics(cls) -> Dict[str, int]:
+        '''Суммарные попадания и промахи по всем транзакциям процесса.'''
+        return {'hits': cls.total_hits, 'misses': cls.total_misses}
+
+
+class _NoEntityCache(EntityCache):
+    '''Заглушка для сессий без UnitOfWork: ничего не хранит и не считает.'''
+
+    def get(self, kind: Type[T], id: Hashable) -> Optional[T]:
+        return None
+
+    def put(self, entity: T) -> T:
+        return entity
+
+
+_NO_CACHE = _NoEntityCache()
+
+
+def entity_cache(session: AsyncSession) -> EntityCache:
+    '''
+    Кэш сущностей транзакции, к которой привязана сессия.
+
+    Вне UnitOfWork (воркеры, прямое использование репозиториев) кэша нет -
+    возвращается заглушка, и репозитории всегда читают из БД.
+    '''
+    return session.info.get(SESSION_INFO_KEY, _NO_CACHE)
@@ -16,6 +16,10 @@ except (ImportError, OSError):
     MAGIC_AVAILABLE = False
 
 
+# Сколько первых байт файла нужно для определения MIME типа по сигнатуре
+MIME_SNIFF_BYTES = 2048
+
+
 class FileMetadataExtractor:
     '''Сервис для извлечения метаданных из файлов'''
 
@@ -0,0 +1,41 @@
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, AsyncIterator
+
+
+def _json_default(value: Any) -> Any:
+    '''Сериализация типов, которые приходят из БД, но не поддерживаются json.'''
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f'Тип {type(value).__name__} не сериализуется в JSON')
+
+
+def encode_ndjson_line(record: dict) -> bytes:
+    '''Одна запись -> одна строка NDJSON (UTF-8, с переводом строки).'''
+    line = json.dumps(
+        record, ensure_ascii=False, separators=(',', ':'), default=_json_default
+    )
+    return line.encode('utf-8') + b'\n'
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    '''
+    Инкрементально сжать поток байтов в gzip.
+
+    Компрессор держит только своё окно, поэтому память не зависит
+    от общего объёма выгрузки.
+    '''
+    # wbits=31 -> gzip-заголовок и CRC32 (совместимо с gunzip)
+    compressor = zlib.compressobj(level=6, wbits=31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
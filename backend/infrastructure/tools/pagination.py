@@ -0,0 +1,55 @@
+from typing import Any, Optional
+
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.pagination import Page, decode_cursor, encode_cursor
+
+
+async def paginate_keyset(
+    session: AsyncSession,
+    stmt: Select,
+    model: Any,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Page:
+    '''
+    Выполнить запрос с keyset-пагинацией по (created_at, id) в порядке убывания.
+
+    Вместо OFFSET используется условие «строго после последней записи
+    предыдущей страницы», поэтому стоимость запроса не растёт с номером
+    страницы, а вставки между запросами не сдвигают выдачу.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        stmt: Базовый select (фильтры, options) без сортировки и limit
+        model: ORM-модель с колонками created_at и id
+        limit: Размер страницы
+        cursor: Курсор, полученный с предыдущей страницы
+
+    Returns:
+        Page: ORM-объекты страницы и курсор следующей страницы
+    '''
+    # 1. Условие продолжения с позиции курсора
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                model.created_at < created_at,
+                and_(model.created_at == created_at, model.id < last_id),
+            )
+        )
+
+    # 2. Стабильная сортировка + одна лишняя строка, чтобы понять, есть ли продолжение
+    stmt = stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+    result = await session.execute(stmt)
+    rows = list(result.scalars().all())
+
+    # 3. Формирование курсора по последней записи страницы
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+
+    return Page(items=rows, next_cursor=next_cursor)
@@ -0,0 +1,127 @@
+"""
+Извлечение текста из документов для полнотекстового поиска.
+Поддерживаются PDF (pypdf), DOCX (стандартные zipfile + xml) и текстовые файлы.
+"""
+
+import codecs
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+from xml.etree import ElementTree
+
+from pypdf import PdfReader
+
+from backend.core.logger import logger
+
+PDF_MIME_TYPE = 'application/pdf'
+DOCX_MIME_TYPE = (
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+)
+
+# Пространство имен основной разметки WordprocessingML
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+Source = Union[str, Path, BinaryIO]
+
+
+class TextExtractor:
+    '''
+    Извлекает текст из файла документа.
+
+    Работает с путем или файловым объектом: PDF и DOCX читаются
+    с диска по мере разбора, а не целиком в память. Результат обрезается
+    до max_chars - tsvector в Postgres ограничен 1 МБ.
+    '''
+
+    def __init__(self, max_chars: int = 500_000):
+        self.max_chars = max_chars
+
+    @staticmethod
+    def supports(mime_type: Optional[str], file_name: str = '') -> bool:
+        '''Можно ли извлечь текст из файла такого типа.'''
+        return TextExtractor._kind(mime_type, file_name) is not None
+
+    def extract(
+        self, source: Source, mime_type: Optional[str], file_name: str = ''
+    ) -> str:
+        '''
+        Извлечь текст (синхронно - вызывать через asyncio.to_thread).
+
+        Returns:
+            Текст документа или пустая строка для неподдерживаемых типов
+        '''
+        kind = self._kind(mime_type, file_name)
+        if kind == 'pdf':
+            return self._extract_pdf(source)
+        if kind == 'docx':
+            return self._extract_docx(source)
+        if kind == 'text':
+            return self._extract_plain(source)
+        return ''
+
+    @staticmethod
+    def _kind(mime_type: Optional[str], file_name: str) -> Optional[str]:
+        suffix = Path(file_name).suffix.lower()
+        if mime_type == PDF_MIME_TYPE or suffix == '.pdf':
+            return 'pdf'
+        if mime_type == DOCX_MIME_TYPE or suffix == '.docx':
+            return 'docx'
+        if (mime_type or '').startswith('text/') or suffix in ('.txt', '.md', '.csv'):
+            return 'text'
+        return None
+
+    def _extract_pdf(self, source: Source) -> str:
+        reader = PdfReader(source)
+        parts, length = [], 0
+        for number, page in enumerate(reader.pages, start=1):
+            try:
+                text = page.extract_text() or ''
+            except Exception as e:
+                # Битая страница не должна лишать поиска весь документ
+                logger.warning(f'Не удалось извлечь текст страницы {number}: {e}')
+                continue
+            parts.append(text)
+            length += len(text)
+            if length >= self.max_chars:
+                break
+        return self._limit('\n'.join(parts))
+
+    def _extract_docx(self, source: Source) -> str:
+        with zipfile.ZipFile(source) as archive:
+            with archive.open('word/document.xml') as xml:
+                paragraphs, length = [], 0
+                # iterparse - не строим дерево всего документа в памяти
+                for _, element in ElementTree.iterparse(xml):
+                    if element.tag != f'{_W_NS}p':
+                        continue
+                    text = ''.join(t.text or '' for t in element.iter(f'{_W_NS}t'))
+                    element.clear()
+                    if text:
+                        paragraphs.append(text)
+                        length += len(text)
+                        if length >= self.max_chars:
+                            break
+        return self._limit('\n'.join(paragraphs))
+
+    def _extract_plain(self, source: Source) -> str:
+        # В UTF-8 символ - до 4 байт
+        limit = self.max_chars * 4
+        if isinstance(source, (str, Path)):
+            with open(source, 'rb') as f:
+                raw = f.read(limit)
+        else:
+            raw = source.read(limit)
+
+        try:
+            # Лимит может разрезать последний символ: неполную последовательность
+            # в конце прочитанного отбрасываем, а не считаем ошибкой кодировки
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            text = decoder.decode(raw, final=len(raw) < limit)
+        except UnicodeDecodeError:
+            # Старые документы на русском часто в windows-1251
+            text = raw.decode('cp1251', errors='replace')
+        return self._limit(text)
+
+    def _limit(self, text: str) -> str:
+        # NUL в тексте Postgres не принимает
+        return text[: self.max_chars].replace('\x00', '')
@@ -3,17 +3,23 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from backend.core.logger import logger
+from backend.infrastructure.tools.after_commit import AFTER_COMMIT_KEY, AfterCommitHooks
+from backend.infrastructure.tools.entity_cache import EntityCache, SESSION_INFO_KEY
 
 from backend.infrastructure.repositories import (
     AttorneyRepository,
     CaseRepository,
     ClientRepository,
     ContactRepository,
+    DashboardRepository,
     DocumentMetadataRepository,
+    DocumentBlobRepository,
     EventRepository,
+    ExportRepository,
     OutboxRepository,
     ClientPaymentRepository,
     PaymentDetailRepository,
+    SearchRepository,
 )
 
 
@@ -25,6 +31,10 @@ class AsyncUnitOfWork:
     - Инициализируется с готовой сессией (не создает сама)
     - Управляет коммит/откат транзакции
     - Все репозитории используют ОДНУ сессию
+    - Кэш сущностей (entity_cache) живет до commit/rollback: повторные
+      get() одной записи в пределах транзакции не идут в БД
+    - Действия после commit (after_commit) - сброс кэшей Redis только
+      после фиксации; при откате они отменяются
     '''
 
     def __init__(self, session: AsyncSession) -> None:
@@ -34,16 +44,28 @@ class AsyncUnitOfWork:
         '''
         self.session = session
 
+        # Кэш сущностей транзакции; репозитории находят его через session.info
+        self.entity_cache = EntityCache()
+        session.info[SESSION_INFO_KEY] = self.entity_cache
+
+        # Действия после commit; репозитории регистрируют их через session.info
+        self.after_commit = AfterCommitHooks()
+        session.info[AFTER_COMMIT_KEY] = self.after_commit
+
         # Инициализация репозиториев с общей сессией
         self.attorney_repo = AttorneyRepository(session)
         self.case_repo = CaseRepository(session)
         self.client_repo = ClientRepository(session)
         self.contact_repo = ContactRepository(session)
+        self.dashboard_repo = DashboardRepository(session)
         self.doc_meta_repo = DocumentMetadataRepository(session)
+        self.blob_repo = DocumentBlobRepository(session)
         self.event_repo = EventRepository(session)
+        self.export_repo = ExportRepository(session)
         self.outbox_repo = OutboxRepository(session)
         self.payment_repo = ClientPaymentRepository(session)
         self.payment_detail_repo = PaymentDetailRepository(session)
+        self.search_repo = SearchRepository(session)
 
     async def __aenter__(self):
         '''Вход в async context manager.'''
@@ -62,14 +84,19 @@ class AsyncUnitOfWork:
                 await self.commit()
         finally:
             # Не закрываем сессию! Database отвечает за это
+            self.session.info.pop(SESSION_INFO_KEY, None)
+            self.session.info.pop(AFTER_COMMIT_KEY, None)
             logger.info('AsyncUnitOfWork завершил работу')
 
     async def commit(self) -> None:
         '''Фиксация изменений.'''
         if self.session:
             try:
+                logger.debug(f'Кэш сущностей UoW: {self.entity_cache.metrics()}')
+                self.entity_cache.clear()
                 await self.session.commit()
                 logger.info('Транзакция зафиксирована')
+                await self.after_commit.run()
             except Exception as e:
                 logger.error(f'❌ Ошибка при коммите: {e}')
                 raise
@@ -78,6 +105,8 @@ class AsyncUnitOfWork:
         '''Откат изменений.'''
         if self.session:
             try:
+                self.entity_cache.clear()
+                self.after_commit.clear()
                 await self.session.rollback()
                 logger.info('Транзакция откачена')
             except Exception as e:
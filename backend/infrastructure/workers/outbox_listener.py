@@ -0,0 +1,110 @@
+'''Пробуждение Outbox воркера через PostgreSQL LISTEN/NOTIFY.'''
+
+import asyncio
+from typing import Optional
+
+import asyncpg
+
+from backend.core.logger import logger
+from backend.infrastructure.models.outbox import OUTBOX_NOTIFY_CHANNEL
+
+
+class OutboxListener:
+    '''
+    Выделенное asyncpg-соединение, подписанное на канал Outbox.
+
+    OutboxRepository.save_event вызывает pg_notify в той же транзакции,
+    поэтому уведомление приходит сразу после коммита события. Воркер ждёт
+    уведомления вместо фиксированного sleep; таймаут ожидания остаётся
+    резервным опросом на случай потерянных уведомлений.
+
+    Соединение не берётся из пула SQLAlchemy: LISTEN живёт, пока живёт
+    соединение, и его нельзя возвращать в пул.
+    '''
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = OUTBOX_NOTIFY_CHANNEL,
+        reconnect_delay: float = 5.0,
+    ):
+        '''
+        Args:
+            dsn: DSN PostgreSQL в формате asyncpg (postgresql://...)
+            channel: Канал LISTEN
+            reconnect_delay: Пауза между попытками переподключения (в секундах)
+        '''
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._conn: Optional[asyncpg.Connection] = None
+        self._wakeup = asyncio.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    async def connect(self) -> bool:
+        '''Открыть соединение и подписаться на канал. Возвращает успех.'''
+        try:
+            conn = await asyncpg.connect(self.dsn)
+            await conn.add_listener(self.channel, self._on_notify)
+            conn.add_termination_listener(self._on_terminated)
+            self._conn = conn
+
+            # Пока соединения не было, уведомления могли потеряться - проверим очередь
+            self._wakeup.set()
+            logger.info(f'[OUTBOX LISTENER] LISTEN {self.channel} активен')
+            return True
+
+        except Exception as e:
+            logger.warning(f'[OUTBOX LISTENER] Не удалось подключиться: {e}')
+            self._conn = None
+            return False
+
+    async def close(self) -> None:
+        '''Закрыть соединение.'''
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            try:
+                await conn.remove_listener(self.channel, self._on_notify)
+                await conn.close()
+            except Exception as e:
+                logger.warning(f'[OUTBOX LISTENER] Ошибка при закрытии: {e}')
+        self.wake()
+
+    def wake(self) -> None:
+        '''Разбудить ожидающий воркер (например, при остановке).'''
+        self._wakeup.set()
+
+    async def wait(self, timeout: float) -> bool:
+        '''
+        Дождаться уведомления или таймаута.
+
+        Returns:
+            True - пришло уведомление, False - истёк таймаут
+        '''
+        # 1. Соединение потеряно - переподключаемся, а пока работаем опросом
+        if not self.connected and not await self.connect():
+            await asyncio.sleep(min(timeout, self.reconnect_delay))
+            return False
+
+        # 2. Ждём NOTIFY; сбрасываем флаг сразу после пробуждения, чтобы
+        # уведомления, пришедшие во время обработки батча, не потерялись
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._wakeup.clear()
+
+    def _on_notify(self, conn, pid: int, channel: str, payload: str) -> None:
+        logger.debug(f'[OUTBOX LISTENER] NOTIFY {channel}: {payload}')
+        self._wakeup.set()
+
+    def _on_terminated(self, conn) -> None:
+        logger.warning('[OUTBOX LISTENER] Соединение LISTEN разорвано')
+        if self._conn is conn:
+            self._conn = None
+        self._wakeup.set()
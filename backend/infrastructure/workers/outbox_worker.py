@@ -2,22 +2,36 @@
 
 import asyncio
 import json
+from io import BytesIO
 from typing import Optional
 from datetime import datetime, timezone
 
 from backend.core.logger import logger
+from backend.core.settings import settings
 from backend.core.db.database import database
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
+from backend.infrastructure.workers.outbox_listener import OutboxListener
 from backend.infrastructure.models.outbox import OutboxEventType, OutboxStatus
 from backend.application.services.verification_service import VerificationService
+from backend.application.interfaces.repositories.local_storage import IFileStorage
+from backend.domain.entities.auxiliary import PdfStatus
+from backend.infrastructure.pdf.pdf_generator import invoice_file_path, pdf_generator
+from backend.infrastructure.repositories.local_storage import LocalFileStorage
+from backend.infrastructure.tools.text_extractor import TextExtractor
 
 
 class OutboxWorker:
     '''
     Воркер для обработки событий из Outbox.
 
-    Читает события со статусом PENDING, обрабатывает их и обновляет статусы.
-    Работает в бесконечном цикле с интервалом между проверками.
+    Атомарно забирает батч событий (FOR UPDATE SKIP LOCKED) с арендой,
+    поэтому несколько экземпляров воркера не обрабатывают одно событие дважды.
+    События батча обрабатываются параллельно, не более concurrency одновременно;
+    каждое - в своём UnitOfWork, чтобы медленное событие не держало транзакцию
+    остальных.
+
+    С listener воркер просыпается по NOTIFY сразу после коммита события,
+    а poll_interval служит резервным опросом. Без listener - обычный опрос.
     '''
 
     def __init__(
@@ -26,6 +40,11 @@ class OutboxWorker:
         batch_size: int = 10,
         poll_interval: float = 5.0,
         max_retries: int = 3,
+        concurrency: int = 5,
+        lease_seconds: int = 60,
+        listener: Optional[OutboxListener] = None,
+        file_storage: Optional[IFileStorage] = None,
+        text_extractor: Optional[TextExtractor] = None,
     ):
         '''
         Args:
@@ -33,61 +52,153 @@ class OutboxWorker:
             batch_size: Количество событий для обработки за раз
             poll_interval: Интервал между проверками (в секундах)
             max_retries: Максимальное количество попыток обработки
+            concurrency: Сколько событий обрабатывается параллельно
+            lease_seconds: Время аренды события; после него событие,
+                застрявшее в PROCESSING, заберет другой воркер
+            listener: LISTEN-соединение для пробуждения по NOTIFY
+            file_storage: Хранилище PDF счетов и загруженных документов
+            text_extractor: Извлечение текста документов для поиска
         '''
         self.uow_factory = uow_factory
         self.batch_size = batch_size
         self.poll_interval = poll_interval
         self.max_retries = max_retries
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.listener = listener
+        self.file_storage = file_storage or LocalFileStorage(
+            base_path=settings.FILE_STORAGE_BASE_PATH
+        )
+        self.text_extractor = text_extractor or TextExtractor(
+            max_chars=settings.DOCUMENT_TEXT_MAX_CHARS
+        )
         self._running = False
+        self._semaphore: Optional[asyncio.Semaphore] = None
 
     async def start(self) -> None:
         '''Запустить воркер.'''
         self._running = True
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        if self.listener is not None:
+            await self.listener.connect()
         logger.info('[OUTBOX WORKER] Воркер запущен')
 
-        while self._running:
-            try:
-                await self._process_batch()
-            except Exception as e:
-                logger.error(f'[OUTBOX WORKER] Критическая ошибка: {e}', exc_info=True)
+        try:
+            while self._running:
+                claimed = 0
+                try:
+                    claimed = await self._process_batch()
+                except Exception as e:
+                    logger.error(
+                        f'[OUTBOX WORKER] Критическая ошибка: {e}', exc_info=True
+                    )
 
-            await asyncio.sleep(self.poll_interval)
+                # Полный батч - в очереди, скорее всего, есть ещё: забираем сразу
+                if claimed < self.batch_size and self._running:
+                    await self._wait_for_events()
+        finally:
+            if self.listener is not None:
+                await self.listener.close()
 
     async def stop(self) -> None:
         '''Остановить воркер.'''
         self._running = False
+        if self.listener is not None:
+            self.listener.wake()
         logger.info('[OUTBOX WORKER] Воркер остановлен')
 
-    async def _process_batch(self) -> None:
-        '''Обработать батч событий.'''
+    async def _wait_for_events(self) -> None:
+        '''Дождаться NOTIFY (или резервного таймаута), без listener - просто пауза.'''
+        if self.listener is None:
+            await asyncio.sleep(self.poll_interval)
+            return
+
+        notified = await self.listener.wait(self.poll_interval)
+        if not notified:
+            logger.debug('[OUTBOX WORKER] Резервный опрос очереди')
+
+    async def _process_batch(self) -> int:
+        '''Забрать и обработать батч событий. Возвращает размер батча.'''
+        # 1. Короткая транзакция: только захват, блокировки сразу отпускаются
         async with self.uow_factory.create() as uow:
-            # Получаем события для обработки
-            events = await uow.outbox_repo.get_pending_events(limit=self.batch_size)
+            events = await uow.outbox_repo.claim_pending_events(
+                limit=self.batch_size,
+                lease_seconds=self.lease_seconds,
+                max_retries=self.max_retries,
+            )
+            # События, чья аренда истекала max_retries раз, захват сразу
+            # переводит в FAILED - отражаем неудачу в той же транзакции
+            for event in events:
+                if event.status == OutboxStatus.FAILED.value:
+                    await self._on_event_failed(uow, event)
+            await uow.commit()
 
-            if not events:
-                return
+        if not events:
+            return 0
 
-            logger.info(f'[OUTBOX WORKER] Найдено {len(events)} событий для обработки')
+        claimed = [e for e in events if e.status == OutboxStatus.PROCESSING.value]
+        logger.info(f'[OUTBOX WORKER] Захвачено {len(claimed)} событий для обработки')
 
-            for event in events:
-                try:
+        # 2. Параллельная обработка под семафором
+        await asyncio.gather(*(self._run_event(event) for event in claimed))
+        return len(events)
+
+    async def _run_event(self, event) -> None:
+        '''Обработать событие в своём UnitOfWork, не более concurrency сразу.'''
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._semaphore:
+            # Пока обработчик работает, аренда продлевается: долгие PDF
+            # или письмо не отдадут событие второму воркеру
+            heartbeat = asyncio.create_task(self._keep_lease(event.id))
+            try:
+                async with self.uow_factory.create() as uow:
                     await self._process_event(uow, event)
-                except Exception as e:
-                    logger.error(
-                        f'[OUTBOX WORKER] Ошибка при обработке события {event.id}: {e}',
-                        exc_info=True,
+            except Exception as e:
+                # Событие останется в PROCESSING и вернется в очередь по аренде
+                logger.error(
+                    f'[OUTBOX WORKER] Ошибка при обработке события {event.id}: {e}',
+                    exc_info=True,
+                )
+            finally:
+                heartbeat.cancel()
+                try:
+                    await heartbeat
+                except asyncio.CancelledError:
+                    pass
+
+    async def _keep_lease(self, event_id: int) -> None:
+        '''Продлевать аренду события каждую треть lease_seconds.'''
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                # Отдельная короткая транзакция: транзакция обработчика
+                # зафиксируется только в конце
+                async with self.uow_factory.create() as uow:
+                    extended = await uow.outbox_repo.extend_lease(
+                        event_id, self.lease_seconds
                     )
+                    await uow.commit()
+            except Exception as e:
+                logger.warning(
+                    f'[OUTBOX WORKER] Не удалось продлить аренду события '
+                    f'{event_id}: {e}'
+                )
+                continue
+            if not extended:
+                return
 
     async def _process_event(self, uow, event) -> None:
-        '''Обработать одно событие.'''
-        # Помечаем как обрабатываемое
-        await uow.outbox_repo.mark_as_processing(event.id)
-        await uow.commit()
-
+        '''Обработать одно событие (уже захваченное в PROCESSING).'''
         try:
             # Обрабатываем событие в зависимости от типа
             if event.event_type == OutboxEventType.ATTORNEY_REGISTERED.value:
                 await self._handle_attorney_registered(event)
+            elif event.event_type == OutboxEventType.PAYMENT_CREATED.value:
+                await self._handle_payment_created(uow, event)
+            elif event.event_type == OutboxEventType.DOCUMENT_UPLOADED.value:
+                await self._handle_document_uploaded(uow, event)
             else:
                 logger.warning(
                     f'[OUTBOX WORKER] Неизвестный тип события: {event.event_type}'
@@ -110,6 +221,15 @@ class OutboxWorker:
                 f'[OUTBOX WORKER] Ошибка обработки события {event.id}: {error_msg}'
             )
 
+            # Транзакция обработчика после ошибки БД прервана, и все его
+            # изменения все равно не должны попасть в базу - откатываем ее,
+            # а попытку учитываем в отдельной транзакции
+            await uow.rollback()
+            await self._record_failure(event, error_msg)
+
+    async def _record_failure(self, event, error_msg: str) -> None:
+        '''Учесть неудачную попытку: вернуть событие в очередь или в FAILED.'''
+        async with self.uow_factory.create() as uow:
             # Увеличиваем счетчик попыток
             retry_count = await uow.outbox_repo.increment_retry_count(event.id)
 
@@ -119,6 +239,7 @@ class OutboxWorker:
                     event.id,
                     f'Превышен лимит попыток ({self.max_retries}): {error_msg}',
                 )
+                await self._on_event_failed(uow, event)
                 logger.warning(
                     f'[OUTBOX WORKER] Событие {event.id} помечено как FAILED '
                     f'после {retry_count} попыток'
@@ -132,6 +253,96 @@ class OutboxWorker:
 
             await uow.commit()
 
+    async def _on_event_failed(self, uow, event) -> None:
+        '''Отразить окончательную неудачу события в связанной сущности.'''
+        if event.event_type == OutboxEventType.PAYMENT_CREATED.value:
+            payload = json.loads(event.payload)
+            await uow.payment_repo.set_pdf_status(
+                payload['payment_id'], PdfStatus.failed
+            )
+        elif event.event_type == OutboxEventType.DOCUMENT_UPLOADED.value:
+            # Текст извлечь не удалось - ищем хотя бы по имени и описанию
+            payload = json.loads(event.payload)
+            await uow.doc_meta_repo.set_search_text(
+                payload['document_id'], '', settings.DOCUMENT_SEARCH_CONFIG
+            )
+
+    async def _handle_payment_created(self, uow, event) -> None:
+        '''Сгенерировать и сохранить PDF счета для созданного платежа.'''
+        payload = json.loads(event.payload)
+        payment_id = payload['payment_id']
+
+        # 1. Данные для счета
+        payment = await uow.payment_repo.get(payment_id)
+        if payment is None:
+            # Платеж удалён до обработки события - генерировать нечего
+            logger.warning(
+                f'[OUTBOX WORKER] Платеж {payment_id} не найден, PDF пропущен'
+            )
+            return
+
+        payment_detail = await uow.payment_detail_repo.get_for_attorney(
+            payment.attorney_id
+        )
+        if payment_detail is None:
+            raise ValueError(
+                f'Нет платежных реквизитов юриста {payment.attorney_id} '
+                f'для платежа {payment_id}'
+            )
+
+        # 2. Генерация в пуле процессов, не блокируя event loop воркера
+        pdf_bytes = await pdf_generator.render(payment, payment_detail)
+
+        # 3. Сохранение и отметка готовности
+        pdf_path = await self.file_storage.save_file(
+            file_path=invoice_file_path(payment_id), file_content=pdf_bytes
+        )
+        await uow.payment_repo.set_pdf_status(payment_id, PdfStatus.ready)
+
+        logger.info(
+            f'[OUTBOX WORKER] PDF счета платежа {payment_id} сохранён: {pdf_path}'
+        )
+
+    async def _handle_document_uploaded(self, uow, event) -> None:
+        '''Извлечь текст загруженного документа в поисковый индекс.'''
+        payload = json.loads(event.payload)
+        document_id = payload['document_id']
+
+        # 1. Инкрементально: пропускаем удаленные и уже проиндексированные
+        document = await uow.doc_meta_repo.get(document_id)
+        if document is None:
+            logger.warning(
+                f'[OUTBOX WORKER] Документ {document_id} не найден, '
+                'индексация пропущена'
+            )
+            return
+        if not await uow.doc_meta_repo.needs_text_index(document_id):
+            logger.info(f'[OUTBOX WORKER] Документ {document_id} уже проиндексирован')
+            return
+
+        # 2. Текст извлекается в потоке: разбор PDF не блокирует event loop
+        text = ''
+        if self.text_extractor.supports(document.mime_type, document.file_name):
+            source = self.file_storage.local_path(document.storage_path)
+            if source is None:
+                content = await self.file_storage.get_file(document.storage_path)
+                source = BytesIO(content)
+            text = await asyncio.to_thread(
+                self.text_extractor.extract,
+                source,
+                document.mime_type,
+                document.file_name,
+            )
+
+        # 3. Вектор (имя + описание + текст) строится в Postgres
+        await uow.doc_meta_repo.set_search_text(
+            document_id, text, settings.DOCUMENT_SEARCH_CONFIG
+        )
+        logger.info(
+            f'[OUTBOX WORKER] Документ {document_id} проиндексирован: '
+            f'{len(text)} символов текста'
+        )
+
     async def _handle_attorney_registered(self, event) -> None:
         '''Обработать событие регистрации адвоката.'''
         try:
@@ -158,7 +369,23 @@ class OutboxWorker:
 async def run_outbox_worker() -> None:
     '''Запустить Outbox воркер (для использования в отдельном процессе).'''
     uow_factory = UnitOfWorkFactory(database)
-    worker = OutboxWorker(uow_factory)
+
+    # С LISTEN опрос нужен только как страховка - интервал длинный
+    listener = None
+    poll_interval = settings.OUTBOX_POLL_INTERVAL
+    if settings.OUTBOX_LISTEN_ENABLED:
+        listener = OutboxListener(settings.asyncpg_dsn())
+        poll_interval = settings.OUTBOX_FALLBACK_POLL_INTERVAL
+
+    worker = OutboxWorker(
+        uow_factory,
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        poll_interval=poll_interval,
+        max_retries=settings.OUTBOX_MAX_RETRIES,
+        concurrency=settings.OUTBOX_CONCURRENCY,
+        lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+        listener=listener,
+    )
 
     try:
         await worker.start()
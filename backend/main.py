@@ -1,10 +1,19 @@
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from backend.core.logger import logger
 from backend.core.db.database import database
+from backend.core.exceptions import ServiceBusyException
+from backend.core.password_hasher import password_hasher
+from backend.core.rate_limit import RateLimitMiddleware
+from backend.core.token_cache import token_claims_cache
 from backend.infrastructure.redis.client import redis_client
+from backend.infrastructure.redis.revocation import revocation_registry
+from backend.infrastructure.email.smtp_pool import smtp_pool
+from backend.infrastructure.pdf.pdf_generator import pdf_generator
+from backend.infrastructure.tools.entity_cache import EntityCache
 
 from backend.presentation.api.v0.routes.auth import router as auth_router
 from backend.presentation.api.v0.routes.clients import router as client_router
@@ -19,6 +28,8 @@ from backend.presentation.api.v0.routes.payment_client import (
     router as payment_client_router,
 )
 from backend.presentation.api.v0.routes.contact import router as contact_router
+from backend.presentation.api.v0.routes.export import router as export_router
+from backend.presentation.api.v0.routes.search import router as search_router
 
 
 @asynccontextmanager
@@ -37,6 +48,9 @@ async def lifespan(app: FastAPI):
         await redis_client.connect()
         logger.info('[STARTUP] Redis подключен')
 
+        # Зеркало отозванных токенов (bloom-фильтр + pub/sub)
+        await revocation_registry.start()
+
         logger.info('[STARTUP] Приложение готово к работе!')
 
     except Exception as e:
@@ -49,7 +63,8 @@ async def lifespan(app: FastAPI):
     try:
         logger.info('[SHUTDOWN] Завершение приложения...')
 
-        # Отключиться от Redis
+        # Остановить подписку на отзывы токенов и отключиться от Redis
+        await revocation_registry.stop()
         await redis_client.disconnect()
         logger.info('[SHUTDOWN] Redis отключен')
 
@@ -57,6 +72,17 @@ async def lifespan(app: FastAPI):
         await database.dispose()
         logger.info('[SHUTDOWN] БД отключена')
 
+        # Остановить пул хеширования паролей
+        password_hasher.shutdown()
+        logger.info('[SHUTDOWN] Пул хеширования паролей остановлен')
+
+        # Остановить пул процессов генерации PDF
+        pdf_generator.shutdown()
+
+        # Закрыть SMTP соединения
+        await smtp_pool.close()
+        logger.info('[SHUTDOWN] SMTP соединения закрыты')
+
         logger.info('[SHUTDOWN] Приложение успешно завершено')
 
     except Exception as e:
@@ -70,6 +96,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Rate limiting по маршрутам и юристу (добавлен раньше CORS - ответ 429
+# тоже проходит через CORSMiddleware и доступен браузеру)
+app.add_middleware(RateLimitMiddleware)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -84,6 +114,17 @@ app.add_middleware(
     allow_headers=['*'],
 )
 
+# Перегрузка (например, пул хеширования паролей) -> 503 с Retry-After
+@app.exception_handler(ServiceBusyException)
+async def service_busy_handler(request: Request, exc: ServiceBusyException):
+    logger.warning(f'Сервис перегружен: {request.url.path}: {exc}')
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={'detail': str(exc)},
+        headers={'Retry-After': '1'},
+    )
+
+
 # Подключить роуты
 app.include_router(auth_router)
 app.include_router(client_router)
@@ -94,6 +135,8 @@ app.include_router(me_router)
 app.include_router(document_router)
 app.include_router(payment_detail_router)
 app.include_router(payment_client_router)
+app.include_router(export_router)
+app.include_router(search_router)
 
 
 # Health check endpoints
@@ -111,7 +154,17 @@ async def root():
 @app.get('/health')
 async def health():
     '''Проверка здоровья приложения'''
-    return {'status': 'OK', 'database': 'connected', 'redis': 'connected'}
+    return {
+        'status': 'OK',
+        'database': 'connected',
+        'redis': 'connected',
+        'password_hasher': password_hasher.metrics(),
+        'smtp_pool': smtp_pool.metrics(),
+        'entity_cache': EntityCache.total_metrics(),
+        'token_cache': token_claims_cache.metrics(),
+        'redis_client_cache': redis_client.client_cache.metrics(),
+        'token_revocation': revocation_registry.metrics(),
+    }
 
 
 # Точка входа
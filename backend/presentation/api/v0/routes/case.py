@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.core.dependencies import (
     get_uow_factory,
     get_current_attorney_id,
+    get_file_storage,
 )
+from backend.application.interfaces.repositories.local_storage import IFileStorage
 from backend.core.logger import logger
+from backend.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 from backend.core.exceptions import (
     ValidationException,
     EntityNotFoundException,
@@ -36,6 +40,7 @@ from backend.application.dto.case import (
     CaseResponse,
     DashboardResponse,
 )
+from backend.application.dto.pagination import PageResponse
 
 # ========== Router ==========
 router = APIRouter(prefix='/api/v0', tags=['cases'])
@@ -149,20 +154,32 @@ async def get_case(
 
 @router.get(
     '/cases',
-    response_model=list[CaseResponse],
+    response_model=PageResponse[CaseResponse],
     status_code=status.HTTP_200_OK,
     summary='Получение всех дел адвоката',
     responses={
-        200: {'description': 'Список дел'},
+        200: {'description': 'Страница списка дел'},
+        400: {'description': 'Некорректный курсор'},
         401: {'description': 'Требуется авторизация'},
     },
 )
 async def list_cases(
+    limit: int = Query(
+        default=DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Размер страницы',
+    ),
+    cursor: Optional[str] = Query(
+        default=None, description='Курсор next_cursor из предыдущей страницы'
+    ),
     current_attorney_id: int = Depends(get_current_attorney_id),
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
 ):
     '''
-    Получение списка всех дел текущего адвоката.
+    Получение списка дел текущего адвоката (keyset-пагинация).
+
+    Следующая страница запрашивается с ?cursor=<next_cursor>.
 
     Requires:
         - Authorization: Bearer <access_token>
@@ -170,15 +187,21 @@ async def list_cases(
     try:
         logger.info(f'Получение списка дел: адвокат={current_attorney_id}')
 
-        cmd = GetCasesForAttorneyQuery(attorney_id=current_attorney_id)
+        cmd = GetCasesForAttorneyQuery(
+            attorney_id=current_attorney_id, limit=limit, cursor=cursor
+        )
         use_case = GetlAllCasesUseCase(uow_factory)
         result = await use_case.execute(cmd)
 
         return result
 
+    except ValidationException as e:
+        logger.error(f'Некорректный курсор: {e}')
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except EntityNotFoundException as e:
         logger.warning(f'Нет дел: {e}')
-        return []  # Возвращаем пустой список вместо ошибки
+        # Возвращаем пустую страницу вместо ошибки
+        return PageResponse[CaseResponse](items=[], next_cursor=None)
     except Exception as e:
         logger.error(f'Ошибка при получении дел: {e}')
         raise HTTPException(
@@ -257,6 +280,7 @@ async def delete_case(
     case_id: int,
     current_attorney_id: int = Depends(get_current_attorney_id),
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
+    file_storage: IFileStorage = Depends(get_file_storage),
 ):
     '''
     Удаление дела.
@@ -268,7 +292,7 @@ async def delete_case(
         logger.info(f'Удаление дела: ID={case_id}')
 
         cmd = DeleteCaseCommand(case_id=case_id)
-        use_case = DeleteCaseUseCase(uow_factory)
+        use_case = DeleteCaseUseCase(uow_factory, file_storage)
         await use_case.execute(cmd)
 
         logger.info(f'Дело успешно удалено: ID={case_id}')
@@ -286,11 +310,11 @@ async def delete_case(
 
 @router.get(
     '/dashboard',
-    response_model=list[DashboardResponse],
+    response_model=DashboardResponse,
     status_code=status.HTTP_200_OK,
-    summary='Получение данных дашборда',
+    summary='Получение сводки дашборда',
     responses={
-        200: {'description': 'Данные дашборда'},
+        200: {'description': 'Сводка дашборда'},
         401: {'description': 'Требуется авторизация'},
     },
 )
@@ -299,10 +323,10 @@ async def get_dashboard(
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
 ):
     '''
-    Получение данных дашборда для текущего адвоката.
-    
-    Возвращает информацию о делах, клиентах, контактах, событиях и 
-    количестве ожидающих платежей.
+    Получение сводки дашборда для текущего адвоката.
+
+    Возвращает число дел по статусам, ближайшие события, ожидающие
+    и просроченные платежи и последние загруженные документы.
 
     Requires:
         - Authorization: Bearer <access_token>
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.core.dependencies import (
     get_uow_factory,
     get_current_attorney_id,
 )
 from backend.core.logger import logger
+from backend.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 from backend.core.exceptions import (
     ValidationException,
     EntityNotFoundException,
@@ -40,6 +42,7 @@ from backend.application.dto.client import (
     ClientUpdateRequest,
     ClientResponse,
 )
+from backend.application.dto.pagination import PageResponse
 
 
 # ========== Router ==========
@@ -152,20 +155,32 @@ async def get_client(
 
 @router.get(
     '/clients',
-    response_model=list[ClientResponse],
+    response_model=PageResponse[ClientResponse],
     status_code=status.HTTP_200_OK,
     summary='Получение всех клиентов адвоката',
     responses={
-        200: {'description': 'Список клиентов'},
+        200: {'description': 'Страница списка клиентов'},
+        400: {'description': 'Некорректный курсор'},
         401: {'description': 'Требуется авторизация'},
     },
 )
 async def list_clients(
+    limit: int = Query(
+        default=DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Размер страницы',
+    ),
+    cursor: Optional[str] = Query(
+        default=None, description='Курсор next_cursor из предыдущей страницы'
+    ),
     current_attorney_id: int = Depends(get_current_attorney_id),
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
 ):
     '''
-    Получение списка всех клиентов текущего адвоката.
+    Получение списка клиентов текущего адвоката (keyset-пагинация).
+
+    Следующая страница запрашивается с ?cursor=<next_cursor>.
 
     Requires:
         - Authorization: Bearer <access_token>
@@ -173,12 +188,17 @@ async def list_clients(
     try:
         logger.info(f'Получение списка клиентов: адвокат={current_attorney_id}')
 
-        cmd = GetClientsForAttorneyQuery(owner_attorney_id=current_attorney_id)
+        cmd = GetClientsForAttorneyQuery(
+            owner_attorney_id=current_attorney_id, limit=limit, cursor=cursor
+        )
         use_case = GetClientsForAttorneyUseCase(uow_factory)
         result = await use_case.execute(cmd)
 
         return result
 
+    except ValidationException as e:
+        logger.error(f'Некорректный курсор: {e}')
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f'Ошибка при получении клиентов: {e}')
         raise HTTPException(
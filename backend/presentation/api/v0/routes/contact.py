@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.core.dependencies import (
     get_uow_factory,
     get_current_attorney_id,
 )
 from backend.core.logger import logger
+from backend.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 from backend.core.exceptions import (
     ValidationException,
     EntityNotFoundException,
@@ -35,6 +37,7 @@ from backend.application.dto.contact import (
     ContactUpdateRequest,
     ContactResponse,
 )
+from backend.application.dto.pagination import PageResponse
 
 # ========== Router ==========
 router = APIRouter(prefix='/api/v0', tags=['contacts'])
@@ -158,20 +161,32 @@ async def get_contact(
 
 @router.get(
     '/contacts',
-    response_model=list[ContactResponse],
+    response_model=PageResponse[ContactResponse],
     status_code=status.HTTP_200_OK,
     summary='Получение всех контактов адвоката',
     responses={
-        200: {'description': 'Список контактов'},
+        200: {'description': 'Страница списка контактов'},
+        400: {'description': 'Некорректный курсор'},
         401: {'description': 'Требуется авторизация'},
     },
 )
 async def list_contacts(
+    limit: int = Query(
+        default=DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Размер страницы',
+    ),
+    cursor: Optional[str] = Query(
+        default=None, description='Курсор next_cursor из предыдущей страницы'
+    ),
     current_attorney_id: int = Depends(get_current_attorney_id),
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
 ):
     '''
-    Получение списка всех контактов текущего адвоката.
+    Получение списка контактов текущего адвоката (keyset-пагинация).
+
+    Следующая страница запрашивается с ?cursor=<next_cursor>.
 
     Requires:
         - Authorization: Bearer <access_token>
@@ -179,12 +194,17 @@ async def list_contacts(
     try:
         logger.info(f'Получение списка контактов: адвокат={current_attorney_id}')
 
-        cmd = GetContactsForAttorneyQuery(attorney_id=current_attorney_id)
+        cmd = GetContactsForAttorneyQuery(
+            attorney_id=current_attorney_id, limit=limit, cursor=cursor
+        )
         use_case = GetAllContactsUseCase(uow_factory)
         result = await use_case.execute(cmd)
 
         return result
 
+    except ValidationException as e:
+        logger.error(f'Некорректный курсор: {e}')
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f'Ошибка при получении контактов: {e}')
         raise HTTPException(
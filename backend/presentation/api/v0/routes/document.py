@@ -1,5 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from fastapi.responses import StreamingResponse
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    UploadFile,
+    File,
+    Form,
+    Header,
+    Query,
+)
+from typing import AsyncIterator, Optional
+from urllib.parse import quote
+from fastapi.responses import FileResponse, StreamingResponse
 from backend.core.dependencies import (
     get_current_attorney_id,
     get_uow_factory,
@@ -12,22 +24,34 @@ from backend.application.usecases.document.get import GetDocumentByIdUseCase
 from backend.application.usecases.document.get_all import GetDocumentsForCaseUseCase
 from backend.application.usecases.document.delete import DeleteDocumentUseCase
 from backend.application.usecases.document.download import DownloadDocumentUseCase
+from backend.application.usecases.document.search import SearchDocumentsUseCase
 from backend.application.dto.document import (
     DocumentCreateRequest,
     DocumentResponse,
     DocumentListResponse,
+    DocumentSearchResponse,
 )
 from backend.core.exceptions import (
     ValidationException,
     EntityNotFoundException,
     AccessDeniedException,
+    RangeNotSatisfiableException,
 )
+from backend.core.http_range import content_range, parse_range_header
 from backend.core.logger import logger
-from io import BytesIO
+from backend.core.settings import settings
+from backend.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 
 # ========== Router ==========
 router = APIRouter(prefix='/api/v0', tags=['documents'])
 
+
+async def _iter_upload(file: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+    '''Читает загруженный файл чанками (Starlette уже выгрузил его во временный файл)'''
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
 # ========== DOCUMENT ENDPOINTS ==========
 
 
@@ -55,12 +79,11 @@ async def upload_document(
     Загрузка документа в систему.
 
     Flow:
-    1. Получение файла из запроса
+    1. Ранняя проверка размера файла
     2. Валидация дела и прав доступа
-    3. Сохранение файла в хранилище
-    4. Извлечение метаданных (MIME тип, размер)
-    5. Сохранение метаданных в БД
-    6. Возврат данных документа
+    3. Потоковая запись файла в хранилище (размер, SHA-256, MIME тип)
+    4. Сохранение метаданных в БД
+    5. Возврат данных документа
 
     Requires:
         - Authorization: Bearer <access_token>
@@ -72,30 +95,25 @@ async def upload_document(
             f'для дела {case_id} (адвокат={current_attorney_id})'
         )
 
-        # 1. Читаем содержимое файла
-        file_content = await file.read()
-        if not file_content:
+        # 1. Ранний отказ по известному размеру (без чтения содержимого)
+        max_file_size = settings.DOCUMENT_MAX_FILE_SIZE
+        if file.size is not None and file.size > max_file_size:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail='Файл пуст',
+                detail=f'Размер файла превышает максимальный '
+                f'({max_file_size / 1024 / 1024:.0f} МБ)',
             )
 
-        # 2. Проверяем размер файла (например, максимум 50 МБ)
-        max_file_size = 50 * 1024 * 1024  # 50 МБ
-        if len(file_content) > max_file_size:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f'Размер файла превышает максимальный ({max_file_size / 1024 / 1024} МБ)',
-            )
-
-        # 3. Создаем use case и загружаем документ
+        # 2. Создаем use case и загружаем документ потоком
+        # (пустой файл и превышение размера проверяются при записи)
         use_case = CreateDocumentUseCase(uow_factory, file_storage)
         result = await use_case.execute(
             case_id=case_id,
             attorney_id=current_attorney_id,
             file_name=file.filename,
-            file_content=file_content,
+            file_chunks=_iter_upload(file, settings.DOCUMENT_UPLOAD_CHUNK_SIZE),
             description=description or '',
+            max_size=max_file_size,
         )
 
         logger.info(f'Документ успешно загружен: ID={result.id}, Файл={file.filename}')
@@ -123,18 +141,30 @@ async def upload_document(
     status_code=status.HTTP_200_OK,
     summary='Получение списка документов дела',
     responses={
-        200: {'description': 'Список документов'},
+        200: {'description': 'Страница списка документов'},
+        400: {'description': 'Некорректный курсор'},
         401: {'description': 'Требуется авторизация'},
         404: {'description': 'Дело не найдено'},
     },
 )
 async def get_case_documents(
     case_id: int,
+    limit: int = Query(
+        default=DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Размер страницы',
+    ),
+    cursor: Optional[str] = Query(
+        default=None, description='Курсор next_cursor из предыдущей страницы'
+    ),
     current_attorney_id: int = Depends(get_current_attorney_id),
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
 ):
     '''
-    Получение всех документов для дела.
+    Получение документов дела (keyset-пагинация).
+
+    Следующая страница запрашивается с ?cursor=<next_cursor>.
 
     Requires:
         - Authorization: Bearer <access_token>
@@ -146,10 +176,15 @@ async def get_case_documents(
         )
 
         use_case = GetDocumentsForCaseUseCase(uow_factory)
-        result = await use_case.execute(case_id, current_attorney_id)
+        result = await use_case.execute(
+            case_id, current_attorney_id, limit=limit, cursor=cursor
+        )
 
         return result
 
+    except ValidationException as e:
+        logger.error(f'Некорректный курсор: {e}')
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except EntityNotFoundException as e:
         logger.error(f'Сущность не найдена: {e}')
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -164,6 +199,58 @@ async def get_case_documents(
         )
 
 
+@router.get(
+    '/documents/search',
+    response_model=DocumentSearchResponse,
+    status_code=status.HTTP_200_OK,
+    summary='Полнотекстовый поиск по документам',
+    responses={
+        200: {'description': 'Найденные документы по убыванию релевантности'},
+        400: {'description': 'Пустой поисковый запрос'},
+        401: {'description': 'Требуется авторизация'},
+    },
+)
+async def search_documents(
+    q: str = Query(..., min_length=1, max_length=200, description='Поисковый запрос'),
+    limit: int = Query(
+        default=DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Размер страницы',
+    ),
+    offset: int = Query(default=0, ge=0, description='Смещение (next_offset)'),
+    current_attorney_id: int = Depends(get_current_attorney_id),
+    uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
+):
+    '''
+    Поиск по имени, описанию и тексту документов текущего адвоката.
+
+    Поддерживается синтаксис websearch: "точная фраза", OR, -исключение.
+    Текст файлов индексируется в фоне, поэтому только что загруженный
+    документ находится по содержимому через несколько секунд.
+
+    Requires:
+        - Authorization: Bearer <access_token>
+    '''
+    try:
+        logger.info(f'Поиск документов: "{q}" (адвокат={current_attorney_id})')
+
+        use_case = SearchDocumentsUseCase(uow_factory)
+        return await use_case.execute(
+            current_attorney_id, q, limit=limit, offset=offset
+        )
+
+    except ValidationException as e:
+        logger.error(f'Ошибка валидации: {e}')
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f'Неизвестная ошибка: {e}')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail='Ошибка при поиске документов',
+        )
+
+
 @router.get(
     '/documents/{document_id}',
     response_model=DocumentResponse,
@@ -215,8 +302,10 @@ async def get_document(
     summary='Скачивание документа',
     responses={
         200: {'description': 'Файл документа'},
+        206: {'description': 'Часть файла (запрос с заголовком Range)'},
         401: {'description': 'Требуется авторизация'},
         404: {'description': 'Документ не найден'},
+        416: {'description': 'Диапазон вне файла'},
     },
 )
 async def download_document(
@@ -224,10 +313,14 @@ async def download_document(
     current_attorney_id: int = Depends(get_current_attorney_id),
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
     file_storage: IFileStorage = Depends(get_file_storage),
+    range_header: Optional[str] = Header(None, alias='Range'),
 ):
     '''
     Скачивание файла документа.
 
+    Файл отдается потоком с постоянным расходом памяти. Поддерживаются
+    частичные запросы (Range: bytes=START-END) для докачки.
+
     Requires:
         - Authorization: Bearer <access_token>
     '''
@@ -237,19 +330,53 @@ async def download_document(
         )
 
         use_case = DownloadDocumentUseCase(uow_factory, file_storage)
-        file_content, file_name, mime_type = await use_case.execute(
-            document_id, current_attorney_id
-        )
+        document_file = await use_case.execute(document_id, current_attorney_id)
+
+        # 1. Локальное хранилище: FileResponse сам обрабатывает Range/If-Range
+        # и отдает файл через sendfile, если сервер это поддерживает
+        local_path = file_storage.local_path(document_file.storage_path)
+        if local_path is not None:
+            return FileResponse(
+                local_path,
+                media_type=document_file.mime_type,
+                filename=document_file.file_name,
+            )
+
+        # 2. Прочие хранилища: поток чанками с поддержкой одного диапазона
+        size = document_file.file_size
+        byte_range = parse_range_header(range_header, size)
+        headers = {
+            'Accept-Ranges': 'bytes',
+            'Content-Disposition': (
+                f"attachment; filename*=utf-8''{quote(document_file.file_name)}"
+            ),
+        }
+
+        if byte_range is None:
+            headers['Content-Length'] = str(size)
+            return StreamingResponse(
+                file_storage.iter_chunks(document_file.storage_path),
+                media_type=document_file.mime_type,
+                headers=headers,
+            )
 
-        # Возвращаем файл как поток
+        start, end = byte_range
+        headers['Content-Range'] = content_range(start, end, size)
+        headers['Content-Length'] = str(end - start + 1)
         return StreamingResponse(
-            BytesIO(file_content),
-            media_type=mime_type,
-            headers={
-                'Content-Disposition': f'attachment; filename="{file_name}"',
-            },
+            file_storage.iter_chunks(document_file.storage_path, start, end),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type=document_file.mime_type,
+            headers=headers,
         )
 
+    except RangeNotSatisfiableException as e:
+        logger.warning(f'Некорректный диапазон при скачивании {document_id}: {e}')
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail=str(e),
+            headers={'Content-Range': f'bytes */{document_file.file_size}'},
+        )
     except EntityNotFoundException as e:
         logger.error(f'Документ не найден: {e}')
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
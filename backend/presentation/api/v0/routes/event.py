@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 
@@ -31,10 +31,12 @@ from backend.application.dto.event import (
     EventResponse,
     EventResponseList,
 )
+from backend.application.dto.pagination import PageResponse
 from backend.domain.entities.auxiliary import EventType
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.core.exceptions import ValidationException, EntityNotFoundException
 from backend.core.logger import logger
+from backend.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 
 # ========== Router ==========
 router = APIRouter(prefix='/api/v0', tags=['events'])
@@ -128,27 +130,42 @@ async def get_event(
 # ====== READ BY ATTORNEY ======
 @router.get(
     '/events/attorney/{attorney_id}',
-    response_model=List[EventResponse],
+    response_model=PageResponse[EventResponse],
     status_code=status.HTTP_200_OK,
     summary='Получение данных события по ID юриста',
     responses={
-        200: {'description': 'Данные события'},
+        200: {'description': 'Страница событий'},
+        400: {'description': 'Некорректный курсор'},
         401: {'description': 'Требуется авторизация'},
         404: {'description': 'Событие не найдено'},
     },
 )
 async def get_events_by_attorney(
+    limit: int = Query(
+        default=DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Размер страницы',
+    ),
+    cursor: Optional[str] = Query(
+        default=None, description='Курсор next_cursor из предыдущей страницы'
+    ),
     current_attorney_id: int = Depends(get_current_attorney_id),
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
 ):
     try:
-        cmd = GetEventsForAttorneyQuery(attorney_id=current_attorney_id)
+        cmd = GetEventsForAttorneyQuery(
+            attorney_id=current_attorney_id, limit=limit, cursor=cursor
+        )
 
         use_case = GetEventByAttorneyUseCase(uow_factory)
         result = await use_case.execute(cmd)
 
-        return result if result else []
+        return result
 
+    except ValidationException as e:
+        logger.error(f'Некорректный курсор: {e}')
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except EntityNotFoundException as e:
         logger.error(f'Событие не найден: {e}')
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -201,28 +218,41 @@ async def get_nearest_events_by_attorney(
 # ====== READ BY CASE ======
 @router.get(
     '/events/cases/{case_id}',
-    response_model=List[EventResponse],
+    response_model=PageResponse[EventResponse],
     status_code=status.HTTP_200_OK,
     summary='Получение данных события по делу',
     responses={
-        200: {'description': 'Данные события'},
+        200: {'description': 'Страница событий дела'},
+        400: {'description': 'Некорректный курсор'},
         401: {'description': 'Требуется авторизация'},
         404: {'description': 'Событие не найдено'},
     },
 )
 async def get_events_by_case(
     case_id: int,
+    limit: int = Query(
+        default=DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Размер страницы',
+    ),
+    cursor: Optional[str] = Query(
+        default=None, description='Курсор next_cursor из предыдущей страницы'
+    ),
     current_attorney_id: int = Depends(get_current_attorney_id),
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
-) -> List['EventResponse']:
+) -> PageResponse['EventResponse']:
     try:
-        cmd = GetEventsForCaseQuery(case_id=case_id)
+        cmd = GetEventsForCaseQuery(case_id=case_id, limit=limit, cursor=cursor)
 
         use_case = GetEventByCaseUseCase(uow_factory)
         result = await use_case.execute(cmd)
 
-        return result if result else []
+        return result
 
+    except ValidationException as e:
+        logger.error(f'Некорректный курсор: {e}')
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except EntityNotFoundException as e:
         logger.error(f'Событие не найден: {e}')
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
+from backend.core.dependencies import (
+    get_uow_factory,
+    get_current_attorney_id,
+)
+from backend.core.logger import logger
+
+# ========== USE CASES ==========
+from backend.application.usecases.export import ExportAttorneyDataUseCase
+
+# ========== COMMANDS & QUERIES ==========
+from backend.application.commands.export import ExportAttorneyDataQuery
+
+
+# ========== Router ==========
+router = APIRouter(prefix='/api/v0', tags=['export'])
+
+
+# ========== EXPORT ENDPOINTS ==========
+@router.get(
+    '/export',
+    status_code=status.HTTP_200_OK,
+    summary='Потоковая выгрузка всех данных адвоката (NDJSON)',
+    responses={
+        200: {'description': 'Поток NDJSON (или gzip при compress=true)'},
+        401: {'description': 'Требуется авторизация'},
+    },
+)
+async def export_attorney_data(
+    compress: bool = Query(default=False, description='Сжать выгрузку gzip'),
+    current_attorney_id: int = Depends(get_current_attorney_id),
+    uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
+):
+    '''
+    Выгрузка клиентов, дел, контактов, событий, платежей и метаданных
+    документов текущего адвоката.
+
+    Каждая строка ответа - отдельный JSON: {"type": "clients", "data": {...}}.
+    Данные читаются из БД серверным курсором и отдаются по мере чтения.
+
+    Requires:
+        - Authorization: Bearer <access_token>
+    '''
+    try:
+        logger.info(
+            f'Выгрузка данных: адвокат={current_attorney_id}, gzip={compress}'
+        )
+
+        cmd = ExportAttorneyDataQuery(
+            attorney_id=current_attorney_id, compress=compress
+        )
+        use_case = ExportAttorneyDataUseCase(uow_factory)
+        stream = use_case.execute(cmd)
+
+        filename = f'export_{current_attorney_id}.ndjson'
+        if compress:
+            filename += '.gz'
+
+        return StreamingResponse(
+            stream,
+            media_type='application/gzip' if compress else 'application/x-ndjson',
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+        )
+
+    except Exception as e:
+        logger.error(f'Ошибка при выгрузке данных: {e}')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail='Ошибка при выгрузке данных',
+        )
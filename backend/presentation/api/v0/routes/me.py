@@ -5,7 +5,9 @@ from backend.core.dependencies import (
     get_uow_factory,
     get_current_attorney_id,
     get_current_access_token,
+    get_file_storage,
 )
+from backend.application.interfaces.repositories.local_storage import IFileStorage
 from backend.core.logger import logger
 from backend.core.exceptions import (
     ValidationException,
@@ -61,7 +63,7 @@ async def get_me(
         logger.info(f'Получение профиля: ID={current_attorney_id}')
 
         async with uow_factory.create() as uow:
-            attorney = await uow.attorney_repo.get(current_attorney_id)
+            attorney = await uow.attorney_repo.get_cached(current_attorney_id)
             if not attorney:
                 raise EntityNotFoundException(
                     f'Адвокат с ID {current_attorney_id} не найден'
@@ -171,6 +173,7 @@ async def delete_me(
     current_attorney_id: int = Depends(get_current_attorney_id),
     access_token: str = Depends(get_current_access_token),
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
+    file_storage: IFileStorage = Depends(get_file_storage),
 ):
     '''
     Удаление аккаунта адвоката.
@@ -192,7 +195,7 @@ async def delete_me(
         )
 
         # 2. Создаем UseCase и выполняем
-        use_case = DeleteAttorneyAccountUseCase(uow_factory)
+        use_case = DeleteAttorneyAccountUseCase(uow_factory, file_storage)
         result = await use_case.execute(cmd)
 
         logger.warning(f'Аккаунт успешно удален: ID={current_attorney_id}')
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from fastapi.responses import FileResponse, JSONResponse
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 
 from backend.application.services.payment_service import PaymentService
@@ -37,6 +38,7 @@ from backend.application.dto.client_payment import (
     FullPaymentResponse,
     PaymentClientChangeStatusRequest,
 )
+from backend.application.dto.pagination import PageResponse
 
 from backend.core.dependencies import (
     get_uow_factory,
@@ -45,7 +47,10 @@ from backend.core.dependencies import (
     get_file_storage,
 )
 
+from backend.domain.entities.auxiliary import PdfStatus
+from backend.infrastructure.pdf.pdf_generator import invoice_file_path, pdf_generator
 from backend.core.logger import logger
+from backend.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 
 router = APIRouter(prefix='/api/v0', tags=['client_payment'])
 
@@ -111,18 +116,32 @@ async def get_client_payment(
 
 @router.get(
     '/get-client-payment/attorneys/{attorney_id}',
-    response_model=list[PaymentClientResponse],
+    response_model=PageResponse[PaymentClientResponse],
     status_code=status.HTTP_200_OK,
     summary='Получение всех платежей для юриста',
 )
 async def get_all_client_payments_for_attorney(
+    limit: int = Query(
+        default=DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Размер страницы',
+    ),
+    cursor: Optional[str] = Query(
+        default=None, description='Курсор next_cursor из предыдущей страницы'
+    ),
     current_attorney_id: int = Depends(get_current_attorney_id),
     uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
 ):
     try:
         service = PaymentService(uow_factory)
-        result = await service.get_all_payments_for_attorney(attorney_id=get_current_attorney_id)
+        result = await service.get_all_payments_for_attorney(
+            attorney_id=current_attorney_id, limit=limit, cursor=cursor
+        )
         return result
+    except ValidationException as e:
+        logger.error(f'Некорректный курсор: {e}')
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f'Ошибка при получении платежей: {e}')
         raise HTTPException(
@@ -227,6 +246,10 @@ async def delete_client_payment(
     response_class=FileResponse,
     status_code=status.HTTP_200_OK,
     summary='Скачивание PDF документа платежа',
+    responses={
+        200: {'description': 'PDF документ'},
+        202: {'description': 'PDF ещё формируется (pdf_status=pending)'},
+    },
 )
 async def download_payment_pdf(
     payment_id: int,
@@ -236,7 +259,9 @@ async def download_payment_pdf(
 ):
     '''
     Скачивание PDF документа для платежа.
-    PDF должен быть сгенерирован при создании платежа.
+
+    PDF генерируется фоновым воркером после создания платежа. Пока он
+    не готов (pdf_status=pending), возвращается 202 с заголовком Retry-After.
     '''
     try:
         # Получаем информацию о платеже
@@ -247,14 +272,26 @@ async def download_payment_pdf(
         if payment.attorney_id != current_attorney_id:
             raise AccessDeniedException('Нет доступа к этому платежу')
 
+        # PDF ещё генерируется воркером
+        if payment.pdf_status == PdfStatus.pending:
+            return JSONResponse(
+                status_code=status.HTTP_202_ACCEPTED,
+                content={
+                    'payment_id': payment_id,
+                    'pdf_status': PdfStatus.pending.value,
+                    'detail': 'PDF документ формируется, повторите запрос позже',
+                },
+                headers={'Retry-After': '2'},
+            )
+
         # Стандартный путь к PDF файлу
-        pdf_path = f'payments/{payment_id}/invoice_{payment_id}.pdf'
+        pdf_path = invoice_file_path(payment_id)
 
         try:
             # Пытаемся прочитать файл из хранилища
             pdf_bytes = await file_storage.get_file(pdf_path)
         except FileNotFoundError:
-            # Если файл не найден, пытаемся сгенерировать его заново
+            # Воркер не справился или файл утерян - генерируем заново
             logger.info(
                 f'PDF файл не найден, генерируем заново для платежа {payment_id}'
             )
@@ -272,20 +309,14 @@ async def download_payment_pdf(
                         detail='Не удалось получить данные для генерации PDF',
                     )
 
-                # Создаем генератор PDF
-                from backend.infrastructure.pdf.pdf_generator import PDFGenerator
-
-                pdf_generator = PDFGenerator()
-
-                # Генерируем PDF
-                pdf_bytes = pdf_generator.fill_invoice_template(
+                # Генерируем PDF вне event loop
+                pdf_bytes = await pdf_generator.render(
                     payment=payment_entity, payment_detail=payment_detail_entity
                 )
 
                 # Сохраняем PDF
-                pdf_path = await file_storage.save_file(
-                    file_path=pdf_path, file_content=pdf_bytes
-                )
+                await file_storage.save_file(file_path=pdf_path, file_content=pdf_bytes)
+                await uow.payment_repo.set_pdf_status(payment_id, PdfStatus.ready)
 
         # Возвращаем файл
         from pathlib import Path
@@ -316,6 +347,8 @@ async def download_payment_pdf(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail='PDF документ не найден'
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f'Ошибка при скачивании PDF: {e}')
         raise HTTPException(
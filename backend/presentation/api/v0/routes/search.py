@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
+from backend.core.dependencies import (
+    get_uow_factory,
+    get_current_attorney_id,
+)
+from backend.core.exceptions import ValidationException
+from backend.core.logger import logger
+from backend.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+
+# ========== USE CASES ==========
+from backend.application.usecases.search import GlobalSearchUseCase
+
+# ========== COMMANDS & QUERIES ==========
+from backend.application.commands.search import GlobalSearchQuery
+
+# ========== DTO ==========
+from backend.application.dto.search import SearchResponse
+
+
+# ========== Router ==========
+router = APIRouter(prefix='/api/v0', tags=['search'])
+
+
+# ========== SEARCH ENDPOINTS ==========
+@router.get(
+    '/search',
+    response_model=SearchResponse,
+    status_code=status.HTTP_200_OK,
+    summary='Нечеткий поиск по клиентам, делам и контактам',
+    responses={
+        200: {'description': 'Найденные сущности по убыванию похожести'},
+        400: {'description': 'Слишком короткий запрос'},
+        401: {'description': 'Требуется авторизация'},
+    },
+)
+async def global_search(
+    q: str = Query(..., max_length=100, description='Часть имени, телефона, email'),
+    limit: int = Query(
+        default=DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Размер страницы',
+    ),
+    offset: int = Query(default=0, ge=0, description='Смещение (next_offset)'),
+    current_attorney_id: int = Depends(get_current_attorney_id),
+    uow_factory: UnitOfWorkFactory = Depends(get_uow_factory),
+):
+    '''
+    Поиск для автодополнения: клиенты (имя, телефон, email),
+    дела (название, описание) и контакты (имя, телефон) текущего адвоката.
+
+    Находит подстроки и слова с опечатками (pg_trgm).
+
+    Requires:
+        - Authorization: Bearer <access_token>
+    '''
+    try:
+        logger.info(f'Поиск: "{q}" (адвокат={current_attorney_id})')
+
+        cmd = GlobalSearchQuery(
+            attorney_id=current_attorney_id, query=q, limit=limit, offset=offset
+        )
+        use_case = GlobalSearchUseCase(uow_factory)
+        return await use_case.execute(cmd)
+
+    except ValidationException as e:
+        logger.error(f'Ошибка валидации: {e}')
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f'Неизвестная ошибка: {e}')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail='Ошибка при поиске',
+        )
@@ -0,0 +1,72 @@
+"""Микробенчмарк кодеков Redis: прежний JSON против TaggedCodec.
+
+Сравнивает скорость encode/decode и размер значения на типичных данных
+хранилищ: профиль юриста (AttorneyCache), сессия (SessionStorage),
+refresh token и код подтверждения (TokenManagementService,
+VerificationService). Redis не нужен - измеряется только сериализация.
+
+Запуск: python -m backend.scripts.bench_redis_codec
+"""
+
+import timeit
+
+from backend.core.security import SecurityService
+from backend.infrastructure.redis.codec import JsonCodec, RedisCodec, TaggedCodec
+
+ROUNDS = 50_000
+
+SAMPLES = {
+    'attorney': {
+        'id': 1042,
+        'first_name': 'Иван',
+        'last_name': 'Петров',
+        'patronymic': 'Сергеевич',
+        'email': 'ivan.petrov@example.com',
+        'phone': '+79991234567',
+        'license_id': '77/12345',
+        'is_active': True,
+        'is_verified': True,
+        'created_at': '2025-03-14T09:26:53.589793+00:00',
+        'updated_at': '2025-11-02T18:04:11.120931+00:00',
+    },
+    'session': {'id': 1042, 'email': 'ivan.petrov@example.com', 'name': 'Иван'},
+    'refresh_token': SecurityService.create_refresh_token('1042'),
+    'verification_code': '482915',
+}
+
+
+def as_bytes(raw) -> bytes:
+    '''Значение в том виде, в каком оно вернется из Redis.'''
+    return raw.encode() if isinstance(raw, str) else raw
+
+
+def bench(codec: RedisCodec, value) -> tuple:
+    raw = as_bytes(codec.encode(value))
+    encode = timeit.timeit(lambda: codec.encode(value), number=ROUNDS)
+    decode = timeit.timeit(lambda: codec.decode(raw), number=ROUNDS)
+    return len(raw), ROUNDS / encode, ROUNDS / decode
+
+
+def main():
+    codecs = [
+        ('json (прежний)', JsonCodec()),
+        ('msgpack + тег', TaggedCodec(use_msgpack=True)),
+        ('json + тег', TaggedCodec(use_msgpack=False)),
+    ]
+
+    print(f'{ROUNDS} операций на замер; ops/s - больше лучше')
+    print(
+        f'{"данные":<18} {"кодек":<16} {"байт":>6} '
+        f'{"encode ops/s":>14} {"decode ops/s":>14}'
+    )
+    for sample, value in SAMPLES.items():
+        for name, codec in codecs:
+            size, encode_ops, decode_ops = bench(codec, value)
+            print(
+                f'{sample:<18} {name:<16} {size:>6} '
+                f'{encode_ops:>14,.0f} {decode_ops:>14,.0f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
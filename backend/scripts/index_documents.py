@@ -0,0 +1,59 @@
+"""Скрипт постановки документов в очередь на индексацию текста.
+
+Нужен один раз после миграции add_document_search (документы, загруженные
+раньше, не имеют событий в Outbox) и после смены DOCUMENT_SEARCH_CONFIG.
+Сам текст извлекает Outbox воркер.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+from backend.core.db.database import database
+from backend.core.logger import logger
+from backend.domain.events.document_uploaded import DocumentUploadedEvent
+from backend.infrastructure.models.outbox import OutboxEventType
+from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
+
+BATCH_SIZE = 500
+
+
+async def main():
+    """Поставить события DOCUMENT_UPLOADED для непроиндексированных документов."""
+    await database.connect()
+    uow_factory = UnitOfWorkFactory(database)
+    total, last_id = 0, 0
+
+    try:
+        while True:
+            # Каждая пачка - своя транзакция: воркер начинает работу сразу
+            async with uow_factory.create() as uow:
+                ids = await uow.doc_meta_repo.get_ids_for_text_index(
+                    BATCH_SIZE, after_id=last_id
+                )
+                if not ids:
+                    break
+
+                for document_id in ids:
+                    document = await uow.doc_meta_repo.get(document_id)
+                    event = DocumentUploadedEvent(
+                        document_id=document_id,
+                        attorney_id=document.attorney_id,
+                        occurred_at=datetime.now(timezone.utc),
+                    )
+                    await uow.outbox_repo.save_event(
+                        event_type=OutboxEventType.DOCUMENT_UPLOADED.value,
+                        payload=event.to_dict(),
+                    )
+
+            total += len(ids)
+            last_id = ids[-1]
+            logger.info(f'[INDEX DOCUMENTS] В очереди {total} документов')
+
+    finally:
+        await database.dispose()
+
+    logger.info(f'[INDEX DOCUMENTS] Готово: поставлено {total} документов')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
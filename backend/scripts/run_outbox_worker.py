@@ -5,6 +5,7 @@ from backend.infrastructure.workers import run_outbox_worker
 from backend.core.logger import logger
 from backend.core.db.database import database
 from backend.infrastructure.redis.client import redis_client
+from backend.infrastructure.email.smtp_pool import smtp_pool
 
 
 async def main():
@@ -36,6 +37,12 @@ async def main():
         except Exception as e:
             logger.error(f'[OUTBOX WORKER] Ошибка при отключении Redis: {e}')
 
+        try:
+            await smtp_pool.close()
+            logger.info('[OUTBOX WORKER] SMTP соединения закрыты')
+        except Exception as e:
+            logger.error(f'[OUTBOX WORKER] Ошибка при закрытии SMTP: {e}')
+
         try:
             await database.dispose()
             logger.info('[OUTBOX WORKER] БД отключена')
@@ -207,7 +207,7 @@ async def attorney_id(test_uow_factory):
     async with test_uow_factory.create() as uow:
         from backend.core.security import SecurityService
 
-        hashed_password = SecurityService.hash_password('password123')
+        hashed_password = await SecurityService.hash_password('password123')
 
         attorney = Attorney.create(
             license_id='LIC123456',
@@ -15,6 +15,18 @@ class FakeRedisBackend:
     async def get(self, key):
         return self.store.get(key)
 
+    async def execute_command(self, *args, **options):
+        # RedisClient читает GET/MGET сырыми байтами (NEVER_DECODE)
+        command, *keys = args
+        if command == 'GET':
+            return await self.get(keys[0])
+        if command == 'MGET':
+            return await self.mget(keys)
+        raise NotImplementedError(command)
+
+    async def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
     async def delete(self, key):
         return 1 if self.store.pop(key, None) is not None else 0
 
@@ -32,10 +44,87 @@ class FakeRedisBackend:
         # В реальном Redis устанавливает TTL на существующий ключ
         return 1 if key in self.store else 0
 
+    async def pttl(self, key):
+        # TTL не храним: ключ без срока (-1) или отсутствует (-2)
+        return -1 if key in self.store else -2
+
+    async def zadd(self, key, mapping):
+        self.store.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def zremrangebyscore(self, key, min, max):
+        zset = self.store.get(key, {})
+        low = float(min)
+        high = float(max)
+        removed = [m for m, score in zset.items() if low <= score <= high]
+        for member in removed:
+            del zset[member]
+        return len(removed)
+
+    async def zrangebyscore(self, key, min, max):
+        zset = self.store.get(key, {})
+        low = float(min)
+        high = float(max)
+        ordered = sorted(zset.items(), key=lambda item: item[1])
+        return [member for member, score in ordered if low <= score <= high]
+
+    async def publish(self, channel, message):
+        # Подписчиков в тестах нет
+        return 0
+
+    def register_script(self, source):
+        # Lua не исполняем: эмулируем только скрипт скользящего окна
+        # (KEYS: журнал, блокировка; ARGV: now, window, limit, lockout, member)
+        async def script(keys, args):
+            log_key, lock_key = keys
+            limit, lockout = int(args[2]), int(args[3])
+            if lock_key in self.store:
+                return [0, 0, lockout]
+            events = self.store.setdefault(log_key, [])
+            if len(events) >= limit:
+                if lockout > 0:
+                    self.store[lock_key] = '1'
+                    self.store.pop(log_key, None)
+                return [0, len(events), lockout]
+            events.append(args[4])
+            return [1, len(events), 0]
+
+        return script
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
     async def close(self):
         return None
 
 
+class FakePipeline:
+    '''Копит вызовы команд и выполняет их по execute() (как redis Pipeline).'''
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.commands = []
+
+    def __getattr__(self, name):
+        command = getattr(self.backend, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        commands, self.commands = self.commands, []
+        return [await command(*args, **kwargs) for command, args, kwargs in commands]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.commands = []
+
+
 @pytest.fixture(autouse=True)
 def fake_redis(monkeypatch):
     '''
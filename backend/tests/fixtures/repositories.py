@@ -17,8 +17,10 @@ from backend.infrastructure.repositories import (
     ClientRepository,
     ContactRepository,
     DocumentMetadataRepository,
+    DocumentBlobRepository,
     EventRepository,
     OutboxRepository,
+    ClientPaymentRepository,
 )
 
 # =============== ДЛЯ ИНТЕГРАЦИОННЫХ ТЕСТОВ РЕПОЗИТОРИИ С СЕССИЕЙ РЕАЛЬНОЙ БД ===============
@@ -54,6 +56,12 @@ def document_repo(session):
     return DocumentMetadataRepository(session)
 
 
+@pytest.fixture
+def blob_repo(session):
+    '''Репозиторий с тестовой сессией'''
+    return DocumentBlobRepository(session)
+
+
 @pytest.fixture
 def event_repo(session):
     '''Репозиторий с тестовой сессией'''
@@ -66,6 +74,12 @@ def outbox_repo(session):
     return OutboxRepository(session)
 
 
+@pytest.fixture
+def payment_repo(session):
+    '''Репозиторий с тестовой сессией'''
+    return ClientPaymentRepository(session)
+
+
 # =========================================================================================
 # =============== ЗАМОКАННЫЕ РЕПОЗИТОРИИ ДЛЯ ЮНИТ - ТЕСТИРОВАНИЯ ==========================
 # AsyncMock, чтобы можно было await'ить методы
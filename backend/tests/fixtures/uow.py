@@ -5,6 +5,8 @@ from typing import AsyncGenerator
 
 from backend.core.logger import logger
 from backend.infrastructure.tools.uow import AsyncUnitOfWork
+from backend.infrastructure.tools.after_commit import AFTER_COMMIT_KEY, AfterCommitHooks
+from backend.infrastructure.tools.entity_cache import EntityCache, SESSION_INFO_KEY
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
 from backend.core.db.database import DataBaseConnection
 
@@ -13,9 +15,15 @@ from backend.infrastructure.repositories import (
     CaseRepository,
     ClientRepository,
     ContactRepository,
+    DashboardRepository,
     DocumentMetadataRepository,
+    DocumentBlobRepository,
     EventRepository,
+    ExportRepository,
     OutboxRepository,
+    ClientPaymentRepository,
+    PaymentDetailRepository,
+    SearchRepository,
 )
 
 # =============== ОПРЕДЕЛЕНИЯ КЛАССОВ  ===============
@@ -24,13 +32,23 @@ from backend.infrastructure.repositories import (
 class TestUnitOfWork:
     def __init__(self, session):
         self.session = session
+        self.entity_cache = EntityCache()
+        session.info[SESSION_INFO_KEY] = self.entity_cache
+        self.after_commit = AfterCommitHooks()
+        session.info[AFTER_COMMIT_KEY] = self.after_commit
         self.attorney_repo = AttorneyRepository(session)
         self.case_repo = CaseRepository(session)
         self.client_repo = ClientRepository(session)
         self.contact_repo = ContactRepository(session)
+        self.dashboard_repo = DashboardRepository(session)
         self.doc_meta_repo = DocumentMetadataRepository(session)
+        self.blob_repo = DocumentBlobRepository(session)
         self.event_repo = EventRepository(session)
+        self.export_repo = ExportRepository(session)
         self.outbox_repo = OutboxRepository(session)
+        self.payment_repo = ClientPaymentRepository(session)
+        self.payment_detail_repo = PaymentDetailRepository(session)
+        self.search_repo = SearchRepository(session)
 
     async def __aenter__(self):
         '''Вход в async context manager.'''
@@ -51,6 +69,7 @@ class TestUnitOfWork:
             # ℹ️ ВАЖНО: Используем flush() вместо commit()
             # flush() отправляет SQL на БД, но не коммитит транзакцию
             # Это позволяет избежать проблем с rollback в конце теста
+            self.entity_cache.clear()
             await self.session.flush()
 
             # ======= 🧪🧪🧪🧪🧪🧪🧪 ======= #
@@ -60,6 +79,9 @@ class TestUnitOfWork:
             # ======= 🧪🧪🧪🧪🧪🧪🧪 ======= #
 
             logger.debug('[TEST UoW] FLUSH выполнен (не commit!)')
+
+            # FLUSH здесь играет роль commit - выполняем действия после него
+            await self.after_commit.run()
         except Exception as e:
             logger.error(f'[TEST UoW] Ошибка при FLUSH: {e}')
             await self.rollback()
@@ -68,6 +90,8 @@ class TestUnitOfWork:
     async def rollback(self):
         '''Откатить изменения.'''
         try:
+            self.entity_cache.clear()
+            self.after_commit.clear()
             await self.session.rollback()
             logger.debug('[TEST UoW] ROLLBACK выполнен')
         except Exception:
@@ -95,6 +119,8 @@ async def test_uow(session):
     yield uow
     # Cleanup после теста
     await uow.rollback()
+    session.info.pop(SESSION_INFO_KEY, None)
+    session.info.pop(AFTER_COMMIT_KEY, None)
 
 
 @pytest.fixture
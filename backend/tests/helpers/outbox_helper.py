@@ -1,7 +1,7 @@
 import json
 from typing import Optional, Union
 from backend.infrastructure.tools.uow_factory import UnitOfWorkFactory
-from backend.infrastructure.models.outbox import OutboxEventType
+from backend.infrastructure.models.outbox import OutboxEventType, OutboxStatus
 from backend.application.services.verification_service import VerificationService
 from backend.tests.fixtures.uow import test_uow_factory
 
@@ -22,8 +22,8 @@ async def process_outbox_events(uow_factory: test_uow_factory) -> None:
         Exception: Если обработка события завершилась с ошибкой
     '''
     async with uow_factory.create() as uow:
-        # 1. Получаем все PENDING события
-        events = await uow.outbox_repo.get_pending_events(limit=100)
+        # 1. Забираем все PENDING события (как воркер)
+        events = await uow.outbox_repo.claim_pending_events(limit=100)
 
         if not events:
             logger.debug('[OUTBOX HELPER] Нет событий для обработки')
@@ -31,17 +31,15 @@ async def process_outbox_events(uow_factory: test_uow_factory) -> None:
 
         logger.info(f'[OUTBOX HELPER] Найдено {len(events)} событий для обработки')
 
-        # 2. Обрабатываем каждое событие
+        # 2. Обрабатываем каждое событие (исчерпавшие попытки уже FAILED)
         for event in events:
+            if event.status != OutboxStatus.PROCESSING.value:
+                continue
             try:
                 logger.info(
                     f'[OUTBOX HELPER] Обрабатываем событие: ID={event.id}, type={event.event_type}'
                 )
 
-                # Помечаем как обрабатываемое
-                await uow.outbox_repo.mark_as_processing(event.id)
-                await uow.commit()
-
                 # Обрабатываем в зависимости от типа события
                 if event.event_type == OutboxEventType.ATTORNEY_REGISTERED.value:
                     await _handle_attorney_registered(event)
@@ -152,3 +152,50 @@ class TestAttorneyRepository:
 
         verified_user = await attorney_repo.change_verify(attorney.id, True)
         assert verified_user.is_verified == True
+
+    # ========== CACHED GET ==========
+    @pytest.mark.asyncio
+    async def test_get_cached_populates_cache(self, attorney_repo, sample_attorney):
+        '''Тест: get_cached кладёт профиль в Redis без hashed_password'''
+        from backend.infrastructure.redis.client import redis_client
+        from backend.infrastructure.redis.keys import RedisKeys
+
+        saved = await attorney_repo.save(sample_attorney)
+
+        attorney = await attorney_repo.get_cached(saved.id)
+        assert attorney.id == saved.id
+        assert attorney.email == sample_attorney.email
+        assert attorney.hashed_password == ''
+
+        cached = await redis_client.get(RedisKeys.attorney_cache(saved.id))
+        assert cached['id'] == saved.id
+        assert 'hashed_password' not in cached
+
+    @pytest.mark.asyncio
+    async def test_change_verify_invalidates_cache(self, attorney_repo, sample_attorney):
+        '''Тест: изменение статуса верификации сбрасывает кэш юриста'''
+        saved = await attorney_repo.save(sample_attorney)
+
+        attorney = await attorney_repo.get_cached(saved.id)
+        assert attorney.is_verified == False
+
+        await attorney_repo.change_verify(saved.id, True)
+
+        attorney = await attorney_repo.get_cached(saved.id)
+        assert attorney.is_verified == True
+
+    @pytest.mark.asyncio
+    async def test_cache_invalidated_after_commit(self, test_uow, sample_attorney):
+        '''Тест: в UnitOfWork кэш сбрасывается только после commit'''
+        from backend.infrastructure.redis.client import redis_client
+        from backend.infrastructure.redis.keys import RedisKeys
+
+        saved = await test_uow.attorney_repo.save(sample_attorney)
+        await test_uow.attorney_repo.get_cached(saved.id)
+        key = RedisKeys.attorney_cache(saved.id)
+
+        await test_uow.attorney_repo.change_verify(saved.id, True)
+        assert await redis_client.get(key) is not None
+
+        await test_uow.commit()
+        assert await redis_client.get(key) is None
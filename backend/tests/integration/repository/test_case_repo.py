@@ -1,8 +1,11 @@
 import pytest
+from sqlalchemy import event
+
 from backend.domain.entities.case import Case
 from backend.core.logger import logger
 from backend.core.exceptions import (
     DatabaseErrorException,
+    EntityNotFoundException,
 )
 
 
@@ -100,3 +103,106 @@ class TestCaseRepository:
         check_empty = await case_repo.get(saved_case.id)
         logger.info(f'Запись удалилась, тут None == {check_empty}')
         assert check_empty is None
+
+    # ========== UPDATE ONE ROUND TRIP ==========
+    @pytest.mark.asyncio
+    async def test_update_single_statement(
+        self, session, case_repo, sample_case, sample_update_case
+    ):
+        '''Тест: Обновление - один UPDATE ... RETURNING без предварительного SELECT.'''
+        saved_case = await case_repo.save(sample_case)
+        sample_update_case.id = saved_case.id
+
+        connection = await session.connection()
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lstrip().split()[0].upper())
+
+        event.listen(connection.sync_connection, 'before_cursor_execute', capture)
+        try:
+            updated = await case_repo.update(sample_update_case)
+        finally:
+            event.remove(
+                connection.sync_connection, 'before_cursor_execute', capture
+            )
+
+        # UPDATE дела + сброс сводки дашборда (INSERT ... ON CONFLICT)
+        assert statements == ['UPDATE', 'INSERT']
+        assert updated.name == sample_update_case.name
+        assert updated.updated_at is not None
+
+    # ========== UPDATE NOT FOUND ==========
+    @pytest.mark.asyncio
+    async def test_update_not_found_raises(self, case_repo, sample_update_case):
+        '''Тест: Обновление несуществующего дела.'''
+        sample_update_case.id = 999999
+        with pytest.raises(EntityNotFoundException):
+            await case_repo.update(sample_update_case)
+
+    # ========== DELETE NOT FOUND ==========
+    @pytest.mark.asyncio
+    async def test_delete_not_found_raises(self, case_repo):
+        '''Тест: Удаление несуществующего дела.'''
+        with pytest.raises(EntityNotFoundException):
+            await case_repo.delete(999999)
+
+    # ========== DELETE WITH RELATED ==========
+    @pytest.mark.asyncio
+    async def test_delete_removes_related(
+        self,
+        case_repo,
+        document_repo,
+        event_repo,
+        sample_document,
+        sample_event,
+        persisted_case,
+    ):
+        '''Тест: Вместе с делом удаляются его документы и события.'''
+        document = await document_repo.save(sample_document)
+        saved_event = await event_repo.save(sample_event)
+
+        assert await case_repo.delete(persisted_case) is True
+
+        assert await case_repo.get(persisted_case) is None
+        assert await document_repo.get(document.id) is None
+        assert await event_repo.get(saved_event.id) is None
+
+    # ========== ENTITY CACHE ==========
+    @pytest.mark.asyncio
+    async def test_get_served_from_uow_entity_cache(
+        self, session, test_uow, sample_case, sample_update_case
+    ):
+        '''Тест: Внутри UoW повторный get() отдается из кэша сущностей.'''
+        repo = test_uow.case_repo
+        saved_case = await repo.save(sample_case)
+
+        connection = await session.connection()
+        selects = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith('SELECT'):
+                selects.append(statement)
+
+        event.listen(connection.sync_connection, 'before_cursor_execute', capture)
+        try:
+            first = await repo.get(saved_case.id)
+            second = await repo.get(saved_case.id)
+            assert len(selects) == 1
+            assert second == first
+
+            sample_update_case.id = saved_case.id
+            await repo.update(sample_update_case)
+            after_update = await repo.get(saved_case.id)
+            assert after_update.name == sample_update_case.name
+            assert len(selects) == 1
+
+            await repo.delete(saved_case.id)
+            assert await repo.get(saved_case.id) is None
+            assert len(selects) == 2
+        finally:
+            event.remove(
+                connection.sync_connection, 'before_cursor_execute', capture
+            )
+
+        assert test_uow.entity_cache.hits == 2
@@ -4,6 +4,7 @@ from backend.core import logger
 from backend.core.exceptions import (
     DatabaseErrorException,
     EntityNotFoundException,
+    ValidationException,
 )
 
 
@@ -101,6 +102,41 @@ class TestClientRepository:
             )
             assert client.owner_attorney_id == persisted_attorney_id
 
+    # ========== GET PAGE FOR ATTORNEY ==========
+    @pytest.mark.asyncio
+    async def test_get_page_for_attorney_walks_all_pages(
+        self, client_repo, clients_list, persisted_attorney_id
+    ):
+        '''Тест обхода всех страниц клиентов по курсору без пропусков и дублей'''
+        for client in clients_list:
+            await client_repo.save(client)
+
+        seen_ids = []
+        cursor = None
+        while True:
+            page = await client_repo.get_page_for_attorney(
+                persisted_attorney_id, limit=2, cursor=cursor
+            )
+            assert len(page.items) <= 2
+            seen_ids.extend(client.id for client in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        all_clients = await client_repo.get_all_for_attorney(persisted_attorney_id)
+        assert len(seen_ids) == len(set(seen_ids)) == len(clients_list)
+        assert set(seen_ids) == {client.id for client in all_clients}
+
+    @pytest.mark.asyncio
+    async def test_get_page_for_attorney_invalid_cursor(
+        self, client_repo, persisted_attorney_id
+    ):
+        '''Тест получения страницы с повреждённым курсором (ожидается исключение)'''
+        with pytest.raises(ValidationException):
+            await client_repo.get_page_for_attorney(
+                persisted_attorney_id, limit=2, cursor='not-a-cursor'
+            )
+
     # ========== GET FOR CASE ==========
     @pytest.mark.asyncio
     async def test_get_for_case_success(
@@ -181,6 +217,44 @@ class TestClientRepository:
         assert personal_info == client.personal_info
         assert client.owner_attorney_id == persisted_attorney_id
 
+    # ========== FIND CONFLICTS ==========
+    @pytest.mark.asyncio
+    async def test_find_conflicts(
+        self, client_repo, sample_client, persisted_attorney_id
+    ):
+        '''Тест: Все совпавшие уникальные поля находятся одним вызовом'''
+        saved = await client_repo.save(sample_client)
+
+        conflicts = await client_repo.find_conflicts(
+            persisted_attorney_id,
+            {
+                'email': saved.email,
+                'phone': saved.phone,
+                'personal_info': 'другое значение',
+            },
+        )
+        assert conflicts == {'email': saved.id, 'phone': saved.id}
+
+        # Сам клиент при обновлении конфликтом не считается
+        conflicts = await client_repo.find_conflicts(
+            persisted_attorney_id, {'email': saved.email}, exclude_id=saved.id
+        )
+        assert conflicts == {}
+
+    # ========== SAVE DUPLICATE FIELD ==========
+    @pytest.mark.asyncio
+    async def test_save_duplicate_phone(
+        self, client_repo, sample_client, sample_update_client
+    ):
+        '''Тест: Уникальный индекс не пускает второго клиента с тем же телефоном'''
+        await client_repo.save(sample_client)
+        sample_update_client.phone = sample_client.phone
+
+        with pytest.raises(ValidationException) as exc_info:
+            await client_repo.save(sample_update_client)
+
+        assert sample_client.phone in str(exc_info.value)
+
     # ========== DELETE SUCCESS ==========
     @pytest.mark.asyncio
     async def test_delete_success(self, client_repo, sample_client):
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.domain.entities.auxiliary import CaseStatus
+from backend.domain.entities.event import Event
+from backend.infrastructure.repositories import DashboardRepository
+
+
+@pytest.fixture
+def dashboard_repo(session):
+    return DashboardRepository(session)
+
+
+class TestDashboardRepository:
+    @pytest.mark.asyncio
+    async def test_refresh_builds_summary(
+        self, dashboard_repo, event_repo, persisted_case, persisted_attorney_id
+    ):
+        '''Тест: Сводка считает дела по статусам и ближайшие события.'''
+        event_date = datetime.now(timezone.utc) + timedelta(days=7)
+        await event_repo.save(
+            Event(
+                id=None,
+                name='Судебное заседание',
+                description='',
+                event_type='Суд',
+                event_date=event_date,
+                case_id=persisted_case,
+                attorney_id=persisted_attorney_id,
+            )
+        )
+
+        summary = await dashboard_repo.refresh(persisted_attorney_id)
+
+        assert summary['cases_total'] == 1
+        assert summary['cases_by_status'] == {CaseStatus.IN_PROGRESS.value: 1}
+        assert [e['case_id'] for e in summary['upcoming_events']] == [persisted_case]
+        assert summary['pending_payments_count'] == 0
+
+    @pytest.mark.asyncio
+    async def test_fresh_until_data_changes(
+        self, dashboard_repo, case_repo, persisted_case, persisted_attorney_id
+    ):
+        '''Тест: Сводка читается готовой, пока дела юриста не изменились.'''
+        assert await dashboard_repo.get_fresh(persisted_attorney_id) is None
+
+        summary = await dashboard_repo.refresh(persisted_attorney_id)
+        assert await dashboard_repo.get_fresh(persisted_attorney_id) == summary
+
+        case = await case_repo.get(persisted_case)
+        case.status = CaseStatus.COMPLETED
+        await case_repo.update(case)
+        assert await dashboard_repo.get_fresh(persisted_attorney_id) is None
+
+        summary = await dashboard_repo.refresh(persisted_attorney_id)
+        assert summary['cases_by_status'] == {CaseStatus.COMPLETED.value: 1}
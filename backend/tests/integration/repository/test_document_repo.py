@@ -111,3 +111,62 @@ class TestDocumentMetaRepository:
         check_empty = await document_repo.get(sample_document.id)
         logger.info(f'Запись удалилась, тут None == {check_empty}')
         assert check_empty is None
+
+
+class TestDocumentBlobRepository:
+    @pytest.mark.asyncio
+    async def test_acquire_and_release(self, blob_repo):
+        '''Тест: Счетчик ссылок растет при повторной загрузке и падает до нуля.'''
+        sha = 'a' * 64
+
+        assert await blob_repo.acquire(sha, f'blobs/aa/aa/{sha}', 10) == 1
+        assert await blob_repo.acquire(sha, f'blobs/aa/aa/{sha}', 10) == 2
+
+        assert await blob_repo.release(sha) == 1
+        assert await blob_repo.release(sha) == 0
+        # Счетчик не уходит ниже нуля
+        assert await blob_repo.release(sha) == 0
+
+    @pytest.mark.asyncio
+    async def test_purge(self, blob_repo):
+        '''Тест: purge удаляет только запись без ссылок.'''
+        sha = 'b' * 64
+        path = f'blobs/bb/bb/{sha}'
+        await blob_repo.acquire(sha, path, 10)
+
+        assert await blob_repo.purge(sha) is None
+
+        await blob_repo.release(sha)
+        # Файл снова загрузили до purge - он нужен
+        await blob_repo.acquire(sha, path, 10)
+        assert await blob_repo.purge(sha) is None
+
+        await blob_repo.release(sha)
+        assert await blob_repo.purge(sha) == path
+        assert await blob_repo.purge(sha) is None
+
+
+class TestDocumentSearch:
+    @pytest.mark.asyncio
+    async def test_search_by_extracted_text(self, document_repo, sample_document):
+        '''Тест: Документ находится по тексту файла после индексации.'''
+        saved = await document_repo.save(sample_document)
+        assert await document_repo.needs_text_index(saved.id)
+
+        await document_repo.set_search_text(
+            saved.id, 'Договор аренды нежилого помещения', 'russian'
+        )
+
+        assert not await document_repo.needs_text_index(saved.id)
+        assert saved.id not in await document_repo.get_ids_for_text_index(100)
+
+        hits = await document_repo.search(
+            saved.attorney_id, 'аренда помещений', 'russian', limit=10
+        )
+        assert [doc.id for doc, _ in hits] == [saved.id]
+        assert hits[0][1] > 0
+
+        # Чужие документы не находятся
+        assert not await document_repo.search(
+            saved.attorney_id + 1, 'аренда', 'russian', limit=10
+        )
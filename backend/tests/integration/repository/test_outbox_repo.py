@@ -0,0 +1,110 @@
+import pytest
+
+from backend.infrastructure.models.outbox import OutboxEventType, OutboxStatus
+
+
+class TestOutboxRepository:
+    # ========== CLAIM ==========
+    @pytest.mark.asyncio
+    async def test_claim_marks_events_processing(self, outbox_repo):
+        '''Тест: Захват переводит события в PROCESSING и ставит аренду.'''
+        for i in range(3):
+            await outbox_repo.save_event(
+                OutboxEventType.ATTORNEY_REGISTERED.value, {'n': i}
+            )
+
+        events = await outbox_repo.claim_pending_events(limit=2)
+
+        assert len(events) == 2
+        assert all(e.status == OutboxStatus.PROCESSING.value for e in events)
+        assert all(e.locked_until is not None for e in events)
+        assert events[0].created_at <= events[1].created_at
+
+    @pytest.mark.asyncio
+    async def test_claim_skips_already_claimed(self, outbox_repo):
+        '''Тест: Событие с действующей арендой повторно не захватывается.'''
+        await outbox_repo.save_event(
+            OutboxEventType.ATTORNEY_REGISTERED.value, {'n': 1}
+        )
+
+        first = await outbox_repo.claim_pending_events(limit=10)
+        second = await outbox_repo.claim_pending_events(limit=10)
+
+        assert len(first) == 1
+        assert second == []
+
+    @pytest.mark.asyncio
+    async def test_claim_reclaims_expired_lease(self, outbox_repo):
+        '''Тест: PROCESSING с истекшей арендой снова доступен для захвата.'''
+        await outbox_repo.save_event(
+            OutboxEventType.ATTORNEY_REGISTERED.value, {'n': 1}
+        )
+
+        first = await outbox_repo.claim_pending_events(limit=10, lease_seconds=-1)
+        second = await outbox_repo.claim_pending_events(limit=10)
+
+        assert len(second) == 1
+        assert second[0].id == first[0].id
+
+    @pytest.mark.asyncio
+    async def test_reclaim_counts_as_retry(self, outbox_repo):
+        '''Тест: Повторный захват по истекшей аренде увеличивает retry_count.'''
+        await outbox_repo.save_event(
+            OutboxEventType.ATTORNEY_REGISTERED.value, {'n': 1}
+        )
+
+        [first] = await outbox_repo.claim_pending_events(limit=10, lease_seconds=-1)
+        assert first.retry_count == 0
+
+        [second] = await outbox_repo.claim_pending_events(limit=10, max_retries=3)
+        assert second.retry_count == 1
+        assert second.status == OutboxStatus.PROCESSING.value
+
+    @pytest.mark.asyncio
+    async def test_reclaim_over_limit_marks_failed(self, outbox_repo):
+        '''Тест: Событие, чья аренда истекала max_retries раз, уходит в FAILED.'''
+        await outbox_repo.save_event(
+            OutboxEventType.ATTORNEY_REGISTERED.value, {'n': 1}
+        )
+
+        await outbox_repo.claim_pending_events(limit=10, lease_seconds=-1)
+        await outbox_repo.claim_pending_events(
+            limit=10, lease_seconds=-1, max_retries=2
+        )
+        [failed] = await outbox_repo.claim_pending_events(limit=10, max_retries=2)
+
+        assert failed.status == OutboxStatus.FAILED.value
+        assert failed.retry_count == 2
+        assert failed.locked_until is None
+        assert 'аренда истекла' in failed.error_message
+        assert await outbox_repo.claim_pending_events(limit=10) == []
+
+    @pytest.mark.asyncio
+    async def test_extend_lease(self, outbox_repo):
+        '''Тест: Продленная аренда не дает забрать событие повторно.'''
+        await outbox_repo.save_event(
+            OutboxEventType.ATTORNEY_REGISTERED.value, {'n': 1}
+        )
+        [event] = await outbox_repo.claim_pending_events(limit=10, lease_seconds=-1)
+
+        assert await outbox_repo.extend_lease(event.id, lease_seconds=60)
+        assert await outbox_repo.claim_pending_events(limit=10) == []
+
+        await outbox_repo.mark_as_completed(event.id)
+        assert not await outbox_repo.extend_lease(event.id, lease_seconds=60)
+
+    # ========== RETRY ==========
+    @pytest.mark.asyncio
+    async def test_increment_retry_count_returns_to_pending(self, outbox_repo):
+        '''Тест: Повторная попытка возвращает событие в очередь.'''
+        await outbox_repo.save_event(
+            OutboxEventType.ATTORNEY_REGISTERED.value, {'n': 1}
+        )
+        [event] = await outbox_repo.claim_pending_events(limit=10)
+
+        assert await outbox_repo.increment_retry_count(event.id) == 1
+        assert await outbox_repo.increment_retry_count(event.id) == 2
+
+        [again] = await outbox_repo.claim_pending_events(limit=10)
+        assert again.id == event.id
+        assert again.retry_count == 2
@@ -0,0 +1,168 @@
+'''
+Проверка планов запросов репозиториев (EXPLAIN).
+
+Запросы, которые выполняет метод репозитория, перехватываются на уровне
+драйвера и повторяются через EXPLAIN (FORMAT JSON) с теми же параметрами.
+На маленькой тестовой БД планировщик и так предпочитает Seq Scan, поэтому
+seqscan и sort отключаются: если подходящего индекса нет, в плане все равно
+останется Seq Scan или Sort - и тест упадет.
+'''
+
+import json
+from contextlib import asynccontextmanager
+from typing import Any, Iterator, List, Tuple
+
+import pytest
+from sqlalchemy import event
+
+# Узлы плана, означающие, что запрос не обслуживается индексом
+FORBIDDEN_NODES = ('Seq Scan', 'Sort', 'Incremental Sort')
+
+
+@asynccontextmanager
+async def captured_queries(session):
+    '''Собрать SELECT-запросы, выполненные в сессии внутри блока.'''
+    connection = await session.connection()
+    queries: List[Tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            queries.append((statement, parameters))
+
+    event.listen(connection.sync_connection, 'before_cursor_execute', capture)
+    try:
+        yield queries
+    finally:
+        event.remove(connection.sync_connection, 'before_cursor_execute', capture)
+
+
+def plan_nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get('Plans', []):
+        yield from plan_nodes(child)
+
+
+async def assert_uses_indexes(session, call) -> None:
+    '''Выполнить call() и проверить планы всех его запросов.'''
+    async with captured_queries(session) as queries:
+        await call()
+    assert queries, 'Метод не выполнил ни одного SELECT'
+
+    connection = await session.connection()
+    await connection.exec_driver_sql('SET LOCAL enable_seqscan = off')
+    await connection.exec_driver_sql('SET LOCAL enable_sort = off')
+
+    for statement, parameters in queries:
+        result = await connection.exec_driver_sql(
+            f'EXPLAIN (FORMAT JSON) {statement}', parameters
+        )
+        raw = result.scalar()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]['Plan']
+
+        bad = [
+            f"{node['Node Type']} {node.get('Relation Name', '')}".strip()
+            for node in plan_nodes(plan)
+            if node['Node Type'] in FORBIDDEN_NODES
+        ]
+        assert not bad, f'{bad} в плане запроса:\n{statement}'
+
+
+class TestQueryPlans:
+    @pytest.mark.asyncio
+    async def test_events(
+        self, session, event_repo, sample_event, persisted_case, persisted_attorney_id
+    ):
+        '''Тест: Выборки событий юриста и дела идут по индексам.'''
+        await event_repo.save(sample_event)
+
+        await assert_uses_indexes(
+            session,
+            lambda: event_repo.get_nearest_for_attorney(persisted_attorney_id, 5),
+        )
+        await assert_uses_indexes(
+            session, lambda: event_repo.get_all_for_attorney(persisted_attorney_id)
+        )
+        await assert_uses_indexes(
+            session,
+            lambda: event_repo.get_page_for_attorney(persisted_attorney_id, 10),
+        )
+        await assert_uses_indexes(
+            session, lambda: event_repo.get_page_for_case(persisted_case, 10)
+        )
+
+    @pytest.mark.asyncio
+    async def test_cases(
+        self, session, case_repo, persisted_case, persisted_attorney_id
+    ):
+        '''Тест: Списки дел юриста (со связями) идут по индексам.'''
+        await assert_uses_indexes(
+            session, lambda: case_repo.get_all_for_attorney(persisted_attorney_id)
+        )
+        await assert_uses_indexes(
+            session,
+            lambda: case_repo.get_page_for_attorney_with_relations(
+                persisted_attorney_id, 10
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_clients(
+        self, session, client_repo, persisted_client_id, persisted_attorney_id
+    ):
+        '''Тест: Списки клиентов и проверки уникальности идут по индексам.'''
+        client = await client_repo.get(persisted_client_id)
+
+        await assert_uses_indexes(
+            session, lambda: client_repo.get_all_for_attorney(persisted_attorney_id)
+        )
+        await assert_uses_indexes(
+            session,
+            lambda: client_repo.get_page_for_attorney(persisted_attorney_id, 10),
+        )
+        await assert_uses_indexes(
+            session,
+            lambda: client_repo.find_conflicts(
+                persisted_attorney_id,
+                {
+                    'email': client.email,
+                    'phone': client.phone,
+                    'personal_info': client.personal_info,
+                },
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_contacts_payments_documents(
+        self,
+        session,
+        contact_repo,
+        payment_repo,
+        document_repo,
+        persisted_case,
+        persisted_attorney_id,
+    ):
+        '''Тест: Списки контактов, платежей и документов идут по индексам.'''
+        await assert_uses_indexes(
+            session, lambda: contact_repo.get_all_for_attorney(persisted_attorney_id)
+        )
+        await assert_uses_indexes(
+            session, lambda: contact_repo.get_all_for_case(persisted_case)
+        )
+        await assert_uses_indexes(
+            session, lambda: payment_repo.get_all_for_attorney(persisted_attorney_id)
+        )
+        await assert_uses_indexes(
+            session, lambda: document_repo.get_all_for_case(persisted_case)
+        )
+        await assert_uses_indexes(
+            session, lambda: document_repo.get_page_for_case(persisted_case, 10)
+        )
+
+    @pytest.mark.asyncio
+    async def test_outbox_pending(self, session, outbox_repo):
+        '''Тест: Очередь outbox читается по частичному индексу.'''
+        await outbox_repo.save_event('test_event', {'key': 'value'})
+
+        await assert_uses_indexes(
+            session, lambda: outbox_repo.get_pending_events(10)
+        )
@@ -0,0 +1,49 @@
+import pytest
+
+from backend.infrastructure.repositories import SearchRepository
+
+
+@pytest.fixture
+def search_repo(session):
+    return SearchRepository(session)
+
+
+class TestSearchRepository:
+    @pytest.mark.asyncio
+    async def test_search_by_substring(
+        self, search_repo, persisted_case, persisted_client_id, persisted_attorney_id
+    ):
+        '''Тест: Клиент и его дело находятся по части строки.'''
+        hits = await search_repo.search(persisted_attorney_id, 'Петров', limit=10)
+
+        assert ('client', persisted_client_id) in {(h.type, h.id) for h in hits}
+        assert all(0 <= h.score <= 1 for h in hits)
+
+    @pytest.mark.asyncio
+    async def test_search_by_phone_and_typo(
+        self, search_repo, persisted_client_id, persisted_attorney_id
+    ):
+        '''Тест: Поиск по части телефона и по слову с опечаткой.'''
+        by_phone = await search_repo.search(persisted_attorney_id, '1234567', limit=10)
+        by_typo = await search_repo.search(persisted_attorney_id, 'Петрав', limit=10)
+
+        assert persisted_client_id in [h.id for h in by_phone if h.type == 'client']
+        assert persisted_client_id in [h.id for h in by_typo if h.type == 'client']
+
+    @pytest.mark.asyncio
+    async def test_search_scoped_by_attorney(
+        self, search_repo, persisted_client_id, persisted_attorney_id
+    ):
+        '''Тест: Чужие клиенты в выдачу не попадают.'''
+        hits = await search_repo.search(persisted_attorney_id + 1, 'Петров', limit=10)
+
+        assert hits == []
+
+    @pytest.mark.asyncio
+    async def test_like_wildcards_are_literal(
+        self, search_repo, persisted_client_id, persisted_attorney_id
+    ):
+        '''Тест: % и _ в запросе не работают как шаблоны LIKE.'''
+        hits = await search_repo.search(persisted_attorney_id, '%%', limit=10)
+
+        assert hits == []
@@ -13,6 +13,7 @@ from backend.application.commands.case import (
     GetCasesForAttorneyQuery,
     DeleteCaseCommand,
 )
+from backend.infrastructure.repositories.local_storage import LocalFileStorage
 from backend.core.logger import logger
 
 
@@ -77,11 +78,11 @@ async def test_get_all_case(test_uow_factory, create_case_command, verified_case
     cases = await get_all_cases_use_case.execute(query)
 
     assert cases is not None
-    assert len(cases) >= len(verified_cases_list)
+    assert len(cases.items) >= len(verified_cases_list)
 
 
 @pytest.mark.asyncio
-async def test_delete_case(test_uow_factory, create_case_command):
+async def test_delete_case(test_uow_factory, create_case_command, tmp_path):
     '''Тест удаления кейса'''
     # Создаем кейс
     create_use_case = CreateCaseUseCase(test_uow_factory)
@@ -90,7 +91,9 @@ async def test_delete_case(test_uow_factory, create_case_command):
 
     # Удаляем кейс
     cmd = DeleteCaseCommand(case_id=created_case.id)
-    delete_use_case = DeleteCaseUseCase(test_uow_factory)
+    delete_use_case = DeleteCaseUseCase(
+        test_uow_factory, LocalFileStorage(base_path=str(tmp_path))
+    )
     result = await delete_use_case.execute(cmd)
 
     # Проверяем, что дело удалено
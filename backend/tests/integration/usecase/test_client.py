@@ -14,6 +14,7 @@ from backend.application.commands.client import (
     UpdateClientCommand,
     DeleteClientCommand,
 )
+from backend.core.exceptions import ValidationException
 from backend.core.logger import logger
 
 
@@ -25,6 +26,21 @@ async def test_create_client(test_uow_factory, create_client_command):
     assert result.id is not None
 
 
+@pytest.mark.asyncio
+async def test_create_client_duplicate(test_uow_factory, create_client_command):
+    use_case = CreateClientUseCase(test_uow_factory)
+    await use_case.execute(create_client_command)
+
+    with pytest.raises(ValidationException) as exc_info:
+        await use_case.execute(create_client_command)
+
+    # Сообщение называет все занятые поля, а не только первое
+    message = str(exc_info.value)
+    assert create_client_command.email in message
+    assert create_client_command.phone in message
+    assert create_client_command.personal_info in message
+
+
 @pytest.mark.asyncio
 async def test_update_client(
     test_uow_factory, create_client_command, update_client_command
@@ -74,4 +90,5 @@ async def test_get_all_clients_for_attorney(test_uow_factory, create_client_comm
     )
     get_all_clients_use_case = GetClientsForAttorneyUseCase(test_uow_factory)
     result = await get_all_clients_use_case.execute(get_all_clients_command)
-    assert len(result) == 1
+    assert len(result.items) == 1
+    assert result.next_cursor is None
@@ -0,0 +1,100 @@
+import pytest
+
+from backend.application.services.doc_service import DocumentService
+from backend.infrastructure.repositories.local_storage import LocalFileStorage
+
+
+async def stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def doc_service(test_uow, tmp_path):
+    return DocumentService(
+        document_repo=test_uow.doc_meta_repo,
+        file_storage=LocalFileStorage(base_path=str(tmp_path)),
+        blob_repo=test_uow.blob_repo,
+    )
+
+
+@pytest.mark.asyncio
+async def test_duplicate_upload_shares_blob(
+    doc_service, test_uow, tmp_path, persisted_case, persisted_attorney_id
+):
+    '''Тест: Одинаковый файл хранится один раз и удаляется с последней ссылкой.'''
+    content = b'%PDF-1.4\n' + b'contract' * 1000
+
+    first = await doc_service.upload_document_stream(
+        persisted_case, persisted_attorney_id, 'contract.pdf', stream(content)
+    )
+    second = await doc_service.upload_document_stream(
+        persisted_case,
+        persisted_attorney_id,
+        'copy.pdf',
+        stream(content[:10], content[10:]),
+    )
+
+    assert first.id != second.id
+    assert first.content_hash == second.content_hash
+    assert first.storage_path == second.storage_path
+    blob = tmp_path / first.storage_path
+    assert blob.read_bytes() == content
+    assert not list((tmp_path / LocalFileStorage.TMP_DIR).iterdir())
+
+    # Первая ссылка снята - файл нужен второму документу
+    await doc_service.delete_document(first.id)
+    assert blob.exists()
+
+    # Последняя ссылка - файл удаляется только после commit
+    await doc_service.delete_document(second.id)
+    assert blob.exists()
+
+    await test_uow.commit()
+    assert await doc_service.purge_released() == 1
+    assert not blob.exists()
+
+
+@pytest.mark.asyncio
+async def test_delete_rollback_keeps_file(
+    doc_service, test_uow, tmp_path, persisted_case, persisted_attorney_id
+):
+    '''Тест: Откат удаления оставляет файл на диске.'''
+    content = b'%PDF-1.4\n' + b'claim' * 100
+
+    document = await doc_service.upload_document_stream(
+        persisted_case, persisted_attorney_id, 'claim.pdf', stream(content)
+    )
+    blob = tmp_path / document.storage_path
+
+    await doc_service.delete_document(document.id)
+    await test_uow.rollback()
+
+    assert blob.read_bytes() == content
+
+
+@pytest.mark.asyncio
+async def test_case_delete_releases_blobs(
+    doc_service, test_uow_factory, tmp_path, persisted_case, persisted_attorney_id
+):
+    '''Тест: Удаление дела снимает ссылки и удаляет файлы его документов.'''
+    from backend.application.commands.case import DeleteCaseCommand
+    from backend.application.usecases.case import DeleteCaseUseCase
+
+    content = b'%PDF-1.4\n' + b'power of attorney' * 100
+
+    first = await doc_service.upload_document_stream(
+        persisted_case, persisted_attorney_id, 'poa.pdf', stream(content)
+    )
+    await doc_service.upload_document_stream(
+        persisted_case, persisted_attorney_id, 'poa-copy.pdf', stream(content)
+    )
+    blob = tmp_path / first.storage_path
+
+    use_case = DeleteCaseUseCase(
+        test_uow_factory, LocalFileStorage(base_path=str(tmp_path))
+    )
+    assert await use_case.execute(DeleteCaseCommand(case_id=persisted_case)) is True
+
+    # Обе ссылки сняты - файл удален вместе с записью о нем
+    assert not blob.exists()
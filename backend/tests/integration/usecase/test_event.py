@@ -84,8 +84,8 @@ async def test_get_events_for_attorney(test_uow_factory, create_event_command):
     use_case = GetEventByAttorneyUseCase(test_uow_factory)
     events = await use_case.execute(cmd)
 
-    assert isinstance(events, list)
-    assert len(events) >= 2
+    assert isinstance(events.items, list)
+    assert len(events.items) >= 2
 
 
 @pytest.mark.asyncio
@@ -105,8 +105,8 @@ async def test_get_events_for_case(test_uow_factory, create_event_command):
     use_case = GetEventByCaseUseCase(test_uow_factory)
     events = await use_case.execute(cmd)
 
-    assert isinstance(events, list)
-    assert len(events) >= 2
+    assert isinstance(events.items, list)
+    assert len(events.items) >= 2
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,62 @@
+import gzip
+import json
+
+import pytest
+
+from backend.application.usecases.client import CreateClientUseCase
+from backend.application.usecases.case import CreateCaseUseCase
+from backend.application.usecases.export import ExportAttorneyDataUseCase
+from backend.application.commands.export import ExportAttorneyDataQuery
+
+
+async def _read_stream(stream) -> bytes:
+    return b''.join([chunk async for chunk in stream])
+
+
+@pytest.mark.asyncio
+async def test_export_attorney_data_ndjson(test_uow_factory, create_case_command):
+    case = await CreateCaseUseCase(test_uow_factory).execute(create_case_command)
+
+    cmd = ExportAttorneyDataQuery(attorney_id=case.attorney_id)
+    body = await _read_stream(ExportAttorneyDataUseCase(test_uow_factory).execute(cmd))
+
+    records = [json.loads(line) for line in body.decode('utf-8').splitlines()]
+    client_ids = {r['data']['id'] for r in records if r['type'] == 'clients'}
+    case_ids = {r['data']['id'] for r in records if r['type'] == 'cases'}
+
+    assert case.client_id in client_ids
+    assert case.id in case_ids
+    assert all(
+        r['data']['owner_attorney_id'] == case.attorney_id
+        for r in records
+        if r['type'] == 'clients'
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_attorney_data_gzip(test_uow_factory, create_client_command):
+    client = await CreateClientUseCase(test_uow_factory).execute(create_client_command)
+
+    cmd = ExportAttorneyDataQuery(attorney_id=client.owner_attorney_id, compress=True)
+    body = await _read_stream(ExportAttorneyDataUseCase(test_uow_factory).execute(cmd))
+
+    lines = gzip.decompress(body).decode('utf-8').splitlines()
+    assert any(json.loads(line)['data']['id'] == client.id for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_export_documents_without_index_columns(
+    test_uow, document_repo, sample_document
+):
+    saved = await document_repo.save(sample_document)
+
+    rows = [
+        row
+        async for row in test_uow.export_repo.stream_for_attorney(
+            'documents', saved.attorney_id
+        )
+    ]
+
+    assert [row['id'] for row in rows] == [saved.id]
+    assert rows[0]['file_name'] == sample_document.file_name
+    assert not {'search_vector', 'text_indexed_at', 'content_hash'} & rows[0].keys()
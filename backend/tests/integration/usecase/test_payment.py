@@ -0,0 +1,41 @@
+import json
+from datetime import date
+
+import pytest
+
+from backend.application.commands.client_payment import CreateClientPaymentCommand
+from backend.application.usecases.payment_client import CreatePaymentUseCase
+from backend.domain.entities.auxiliary import PdfStatus
+from backend.infrastructure.models.outbox import OutboxEventType
+
+
+@pytest.mark.asyncio
+async def test_create_payment_defers_pdf_to_outbox(
+    test_uow_factory, test_uow, persisted_client_id, persisted_attorney_id
+):
+    '''Тест: Платеж создаётся без PDF, генерация уходит событием в Outbox.'''
+    cmd = CreateClientPaymentCommand(
+        name='Консультация',
+        client_id=persisted_client_id,
+        attorney_id=persisted_attorney_id,
+        paid=15000.0,
+        paid_str='Пятнадцать тысяч рублей',
+        pade_date=date(2026, 1, 12),
+        paid_deadline=date(2026, 1, 21),
+    )
+
+    payment = await CreatePaymentUseCase(test_uow_factory).execute(cmd)
+
+    assert payment.pdf_status == PdfStatus.pending
+
+    events = await test_uow.outbox_repo.claim_pending_events(limit=100)
+    created = [
+        e for e in events if e.event_type == OutboxEventType.PAYMENT_CREATED.value
+    ]
+    assert len(created) == 1
+    assert json.loads(created[0].payload)['payment_id'] == payment.id
+
+    # Воркер отмечает готовность после сохранения файла
+    await test_uow.payment_repo.set_pdf_status(payment.id, PdfStatus.ready)
+    stored = await test_uow.payment_repo.get(payment.id)
+    assert stored.pdf_status == PdfStatus.ready
@@ -0,0 +1,57 @@
+import pytest
+
+from backend.infrastructure.email.template_registry import (
+    PASSWORD_RESET_TEMPLATE,
+    VERIFICATION_TEMPLATE,
+    CompiledTemplate,
+    EmailTemplateRegistry,
+    email_templates,
+)
+
+
+class TestCompiledTemplate:
+
+    def test_render_matches_string_template(self):
+        template = CompiledTemplate('<p>${greeting}, $name! Цена: $$5</p>')
+
+        assert template.names == ['greeting', 'name']
+        assert template.render({'greeting': 'Привет', 'name': 'Иван'}) == (
+            '<p>Привет, Иван! Цена: $5</p>'
+        )
+
+    def test_html_values_are_escaped(self):
+        template = CompiledTemplate('<p>${name}</p>', escape=True)
+
+        assert template.render({'name': '<b>x</b>'}) == '<p>&lt;b&gt;x&lt;/b&gt;</p>'
+
+    def test_missing_value_raises(self):
+        with pytest.raises(KeyError):
+            CompiledTemplate('${name}').render({})
+
+
+class TestEmailTemplateRegistry:
+
+    @pytest.mark.parametrize('name', [VERIFICATION_TEMPLATE, PASSWORD_RESET_TEMPLATE])
+    def test_builtin_templates_have_text_alternative(self, name):
+        rendered = email_templates.render(name, first_name='Иван', code='123456')
+
+        assert '123456' in rendered.html_content
+        assert 'Иван' in rendered.html_content
+        assert rendered.text_content is not None
+        assert '123456' in rendered.text_content
+        assert '<' not in rendered.text_content
+
+    def test_register_new_template(self, tmp_path):
+        (tmp_path / 'reminder.html').write_text('<p>${event}</p>', encoding='utf-8')
+        registry = EmailTemplateRegistry(tmp_path)
+        registry.register('reminder', 'Напоминание: ${event}')
+
+        rendered = registry.render('reminder', event='Суд')
+
+        assert rendered.subject == 'Напоминание: Суд'
+        assert rendered.html_content == '<p>Суд</p>'
+        assert rendered.text_content is None
+
+    def test_unknown_template_raises(self):
+        with pytest.raises(KeyError):
+            email_templates.render('unknown')
@@ -0,0 +1,130 @@
+import smtplib
+from email.message import EmailMessage
+
+import pytest
+
+from backend.infrastructure.email.smtp_pool import SMTPConnectionPool
+
+
+class FakeSMTP:
+    '''smtplib.SMTP без сети: запоминает отправленные письма.'''
+
+    def __init__(self, fail_after=None, refuse=()):
+        self.sent = []
+        self.closed = False
+        self.fail_after = fail_after
+        self.refuse = refuse
+
+    def send_message(self, message):
+        if self.closed or (
+            self.fail_after is not None and len(self.sent) >= self.fail_after
+        ):
+            raise smtplib.SMTPServerDisconnected('connection closed')
+        if message['To'] in self.refuse:
+            raise smtplib.SMTPRecipientsRefused({message['To']: (550, b'no')})
+        self.sent.append(message['To'])
+
+    def noop(self):
+        return (421, b'closing') if self.closed else (250, b'ok')
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+def make_message(to):
+    msg = EmailMessage()
+    msg['To'] = to
+    msg['Subject'] = 'test'
+    msg.set_content('hello')
+    return msg
+
+
+class TestSMTPConnectionPool:
+
+    @pytest.fixture
+    def connections(self):
+        return []
+
+    @pytest.fixture
+    async def pool(self, connections):
+        def factory():
+            conn = FakeSMTP()
+            connections.append(conn)
+            return conn
+
+        pool = SMTPConnectionPool(
+            host='localhost', port=25, use_tls=False, connection_factory=factory
+        )
+        yield pool
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_is_reused(self, pool, connections):
+        for i in range(5):
+            assert await pool.send(make_message(f'user{i}@test.com')) is True
+
+        assert len(connections) == 1
+        assert len(connections[0].sent) == 5
+        assert pool.metrics()['reused'] == 4
+
+    @pytest.mark.asyncio
+    async def test_send_many_uses_one_session(self, pool, connections):
+        messages = [make_message(f'user{i}@test.com') for i in range(10)]
+
+        results = await pool.send_many(messages)
+
+        assert results == [True] * 10
+        assert len(connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_reconnects_on_disconnect(self, pool, connections):
+        await pool.send(make_message('first@test.com'))
+        connections[0].closed = True  # Сервер закрыл соединение
+
+        assert await pool.send(make_message('second@test.com')) is True
+        assert len(connections) == 2
+        assert connections[1].sent == ['second@test.com']
+        assert pool.metrics()['reconnects'] == 1
+
+    @pytest.mark.asyncio
+    async def test_refused_recipient_keeps_connection(self, connections):
+        def factory():
+            conn = FakeSMTP(refuse=('bad@test.com',))
+            connections.append(conn)
+            return conn
+
+        pool = SMTPConnectionPool(
+            host='localhost', port=25, use_tls=False, connection_factory=factory
+        )
+        messages = [
+            make_message(to) for to in ('a@test.com', 'bad@test.com', 'b@test.com')
+        ]
+
+        assert await pool.send_many(messages) == [True, False, True]
+        assert len(connections) == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_is_replaced(self, pool, connections):
+        pool.idle_timeout = 0.0
+        await pool.send(make_message('first@test.com'))
+        await pool.send(make_message('second@test.com'))
+
+        assert len(connections) == 2
+        assert connections[0].closed is True
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server_fails_all(self):
+        def factory():
+            raise ConnectionRefusedError('refused')
+
+        pool = SMTPConnectionPool(
+            host='localhost', port=25, use_tls=False, connection_factory=factory
+        )
+        messages = [make_message(f'user{i}@test.com') for i in range(3)]
+
+        assert await pool.send_many(messages) == [False, False, False]
+        await pool.close()
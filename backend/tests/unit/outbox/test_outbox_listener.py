@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from backend.infrastructure.workers import outbox_listener
+from backend.infrastructure.workers.outbox_listener import OutboxListener
+
+
+class FakeConnection:
+    '''asyncpg.Connection без БД: хранит подписки, NOTIFY вызывается вручную.'''
+
+    def __init__(self):
+        self.listeners = {}
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def remove_listener(self, channel, callback):
+        self.listeners.pop(channel, None)
+
+    def add_termination_listener(self, callback):
+        self.on_terminated = callback
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    def notify(self, channel, payload):
+        self.listeners[channel](self, 1, channel, payload)
+
+
+class TestOutboxListener:
+
+    @pytest.fixture
+    def fake_connect(self, monkeypatch):
+        conns = []
+
+        async def connect(dsn):
+            conn = FakeConnection()
+            conns.append(conn)
+            return conn
+
+        monkeypatch.setattr(outbox_listener.asyncpg, 'connect', connect)
+        return conns
+
+    @pytest.mark.asyncio
+    async def test_wakes_on_notify(self, fake_connect):
+        listener = OutboxListener('postgresql://test')
+        await listener.connect()
+        # Первое ожидание сразу возвращается: проверка пропущенного при подключении
+        assert await listener.wait(timeout=1.0) is True
+
+        asyncio.get_running_loop().call_later(
+            0.01, fake_connect[0].notify, listener.channel, '42'
+        )
+        assert await listener.wait(timeout=1.0) is True
+        await listener.close()
+
+    @pytest.mark.asyncio
+    async def test_times_out_without_notify(self, fake_connect):
+        listener = OutboxListener('postgresql://test')
+        await listener.connect()
+        await listener.wait(timeout=1.0)
+
+        assert await listener.wait(timeout=0.01) is False
+        await listener.close()
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_termination(self, fake_connect):
+        listener = OutboxListener('postgresql://test')
+        await listener.connect()
+        await listener.wait(timeout=1.0)
+
+        fake_connect[0].closed = True
+        fake_connect[0].on_terminated(fake_connect[0])
+
+        assert await listener.wait(timeout=1.0) is True
+        assert listener.connected
+        assert len(fake_connect) == 2
+        await listener.close()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling_when_db_unavailable(self, monkeypatch):
+        async def connect(dsn):
+            raise OSError('connection refused')
+
+        monkeypatch.setattr(outbox_listener.asyncpg, 'connect', connect)
+        listener = OutboxListener('postgresql://test', reconnect_delay=0.01)
+
+        assert await listener.wait(timeout=1.0) is False
+        assert not listener.connected
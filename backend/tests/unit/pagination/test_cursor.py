@@ -0,0 +1,27 @@
+import pytest
+from datetime import datetime, timezone
+
+from backend.core.exceptions import ValidationException
+from backend.core.pagination import encode_cursor, decode_cursor
+
+
+class TestCursor:
+
+    def test_encode_decode_roundtrip(self):
+        '''Курсор раскодируется в ту же позицию (created_at, id)'''
+        created_at = datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        cursor = encode_cursor(created_at, 42)
+
+        assert decode_cursor(cursor) == (created_at, 42)
+
+    def test_cursor_is_url_safe(self):
+        '''Курсор можно передавать в query-параметре без экранирования'''
+        cursor = encode_cursor(datetime.now(timezone.utc), 10**9)
+
+        assert all(ch.isalnum() or ch in '-_' for ch in cursor)
+
+    @pytest.mark.parametrize('cursor', ['', 'not-a-cursor', 'eyJhIjoxfQ'])
+    def test_decode_invalid_cursor(self, cursor):
+        '''Повреждённый курсор приводит к ValidationException'''
+        with pytest.raises(ValidationException):
+            decode_cursor(cursor)
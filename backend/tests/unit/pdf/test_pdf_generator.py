@@ -0,0 +1,97 @@
+import json
+import os
+import shutil
+from datetime import date
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from pypdf import PdfReader
+
+from backend.core.settings import settings
+from backend.infrastructure.pdf.pdf_generator import PDFGenerator
+
+PDF_DIR = Path(__file__).parents[3] / 'infrastructure' / 'pdf'
+
+
+def make_invoice(i):
+    payment = SimpleNamespace(
+        id=i,
+        name=f'Консультация {i}',
+        paid=1000.0 + i,
+        paid_str='одна тысяча рублей',
+        pade_date=date(2025, 1, 10),
+        paid_deadline=date(2025, 2, 10),
+        condition='',
+        taxable=False,
+    )
+    detail = SimpleNamespace(
+        inn='7700000000',
+        kpp=None,
+        index_address='101000',
+        address='Москва',
+        bank_account='40802810000000000000',
+        correspondent_account='30101810000000000000',
+        bik='044525000',
+        bank_recipient='Банк',
+    )
+    return payment, detail
+
+
+def page_text(pdf_bytes):
+    return PdfReader(BytesIO(pdf_bytes)).pages[0].extract_text()
+
+
+class TestPDFGenerator:
+
+    @pytest.fixture
+    def generator(self, tmp_path, monkeypatch):
+        config = tmp_path / 'invoice_fields.json'
+        template = tmp_path / 'check_template.pdf'
+        shutil.copy(PDF_DIR / 'config' / 'invoice_fields.json', config)
+        shutil.copy(PDF_DIR / 'template' / 'check_template.pdf', template)
+        monkeypatch.setattr(settings, 'FILE_STORAGE_TEMPLATE', str(template))
+
+        generator = PDFGenerator(config, max_workers=2)
+        yield generator
+        generator.shutdown()
+
+    def test_template_is_parsed_once(self, generator):
+        generator.fill_invoice_template(*make_invoice(1))
+        reader = generator._get_template_reader()
+        generator.fill_invoice_template(*make_invoice(2))
+
+        assert generator._get_template_reader() is reader
+
+    def test_cached_template_gives_same_result(self, generator, tmp_path):
+        for i in range(1, 4):
+            generator.fill_invoice_template(*make_invoice(i))
+        cached = generator.fill_invoice_template(*make_invoice(5))
+
+        fresh = PDFGenerator(tmp_path / 'invoice_fields.json').fill_invoice_template(
+            *make_invoice(5)
+        )
+
+        assert page_text(cached) == page_text(fresh)
+
+    def test_config_reloaded_on_mtime_change(self, generator, tmp_path):
+        config_path = tmp_path / 'invoice_fields.json'
+        config = generator.config
+
+        changed = json.loads(config_path.read_text(encoding='utf-8'))
+        changed['fields']['dynamic'].pop('name', None)
+        config_path.write_text(json.dumps(changed), encoding='utf-8')
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert generator.config is not config
+        assert 'name' not in generator.config['fields']['dynamic']
+
+    def test_render_many_keeps_order(self, generator):
+        invoices = [make_invoice(i) for i in range(1, 5)]
+
+        results = generator.render_many(invoices)
+        expected = [generator.fill_invoice_template(*inv) for inv in invoices]
+
+        assert [page_text(r) for r in results] == [page_text(e) for e in expected]
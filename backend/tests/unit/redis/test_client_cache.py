@@ -0,0 +1,106 @@
+import pytest
+
+from backend.infrastructure.redis.client import RedisClient
+from backend.infrastructure.redis.client_cache import ClientSideCache
+from backend.tests.fixtures.redis import FakeRedisBackend
+
+
+def make_cache(**kwargs):
+    cache = ClientSideCache(prefixes=['attorney:'], max_size=10, ttl=60, **kwargs)
+    # Подписка на инвалидации "активна" без Redis
+    cache._active = True
+    return cache
+
+
+def read(cache, key, value):
+    '''Промах, чтение value из "Redis" и запись в кэш.'''
+    hit, _ = cache.lookup(key)
+    assert not hit
+    marker = cache.begin(key)
+    cache.finish(key, marker, value)
+
+
+class TestClientSideCache:
+
+    def test_hit_after_read(self):
+        '''Прочитанное значение отдается из памяти'''
+        cache = make_cache()
+        read(cache, 'attorney:1', '{"id": 1}')
+
+        assert cache.lookup('attorney:1') == (True, '{"id": 1}')
+        assert cache.metrics()['hits'] == 1
+
+    def test_only_tracked_prefixes(self):
+        '''Ключи вне префиксов и неактивный кэш не кэшируются'''
+        cache = make_cache()
+        read(cache, 'refresh_token:attorney:1', 'token')
+        assert cache.lookup('refresh_token:attorney:1') == (False, None)
+
+        cache._active = False
+        assert cache.begin('attorney:1') is None
+
+    def test_invalidation_during_read(self):
+        '''Инвалидация во время чтения не дает сохранить устаревшее значение'''
+        cache = make_cache()
+        marker = cache.begin('attorney:1')
+        cache._on_message(['message', '__redis__:invalidate', ['attorney:1']])
+        cache.finish('attorney:1', marker, 'old')
+
+        assert cache.lookup('attorney:1') == (False, None)
+
+    def test_invalidation_messages(self):
+        '''Сообщение с ключами вытесняет их, None - весь кэш (FLUSHALL)'''
+        cache = make_cache()
+        read(cache, 'attorney:1', 'a')
+        read(cache, 'attorney:2', 'b')
+
+        cache._on_message(['message', '__redis__:invalidate', ['attorney:1']])
+        assert cache.lookup('attorney:1') == (False, None)
+        assert cache.lookup('attorney:2') == (True, 'b')
+
+        cache._on_message(['message', '__redis__:invalidate', None])
+        assert cache.metrics()['size'] == 0
+
+
+class TestRedisClientBatch:
+
+    @pytest.fixture
+    def client(self):
+        client = RedisClient()
+        client._client = FakeRedisBackend()
+        client.client_cache = make_cache()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_set_many_get_many(self, client):
+        '''Пакетные запись и чтение, JSON декодируется, порядок сохраняется'''
+        await client.set_many({'attorney:1': {'id': 1}, 'other': 'x'}, ttl=60)
+
+        values = await client.get_many(['other', 'missing', 'attorney:1'])
+        assert values == ['x', None, {'id': 1}]
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_client_cache(self, client):
+        '''Закэшированные ключи не запрашиваются в Redis'''
+        await client.set('attorney:1', {'id': 1})
+        await client.get('attorney:1')
+
+        requested = []
+        mget = client._client.mget
+
+        async def tracking_mget(keys):
+            requested.append(list(keys))
+            return await mget(keys)
+
+        client._client.mget = tracking_mget
+        assert await client.get_many(['attorney:1', 'other']) == [{'id': 1}, None]
+        assert requested == [['other']]
+
+    @pytest.mark.asyncio
+    async def test_own_write_invalidates(self, client):
+        '''Запись через клиент сразу сбрасывает локальную копию'''
+        await client.set('attorney:1', {'id': 1})
+        await client.get('attorney:1')
+        await client.set('attorney:1', {'id': 2})
+
+        assert await client.get('attorney:1') == {'id': 2}
@@ -0,0 +1,64 @@
+import pytest
+
+from backend.infrastructure.redis.codec import JsonCodec, TaggedCodec, get_codec
+
+VALUES = [
+    {'id': 1, 'email': 'ivan@example.com', 'name': 'Иван', 'tags': [1, 2]},
+    [1, 'два', None],
+    42,
+    1.5,
+    True,
+]
+
+
+class TestTaggedCodec:
+
+    @pytest.fixture(params=[False, True], ids=['json', 'msgpack'])
+    def codec(self, request):
+        return TaggedCodec(use_msgpack=request.param)
+
+    @pytest.mark.parametrize('value', VALUES)
+    def test_roundtrip(self, codec, value):
+        '''Структуры и числа восстанавливаются с исходным типом'''
+        raw = codec.encode(value)
+
+        assert raw.startswith(TaggedCodec.TAG)
+        assert codec.decode(raw) == value
+
+    def test_strings_stored_raw(self, codec):
+        '''Строки пишутся как есть и не разбираются при чтении'''
+        for value in ('eyJhbGciOiJIUzI1NiJ9.payload.sig', '123456', '{"a": 1'):
+            raw = codec.encode(value)
+            assert raw == value.encode()
+            assert codec.decode(raw) == value
+
+    def test_tag_like_string(self, codec):
+        '''Строка, начинающаяся с TAG, не путается с закодированным значением'''
+        value = '\x00m-not-msgpack'
+        assert codec.decode(codec.encode(value)) == value
+
+    def test_json_like_string(self, codec):
+        '''Строка без тега, похожая на JSON, остается строкой'''
+        for value in ('{"id": 1}', '[1, 2]'):
+            assert codec.decode(value.encode()) == value
+        assert codec.decode(None) is None
+
+    def test_legacy_json_values(self):
+        '''С legacy_json объекты прежнего JSON-кодека читаются как dict'''
+        raw = JsonCodec().encode({'id': 1})
+
+        assert TaggedCodec(legacy_json=True).decode(raw.encode()) == {'id': 1}
+        assert TaggedCodec().decode(raw.encode()) == raw
+
+
+class TestGetCodec:
+
+    def test_by_name(self):
+        assert isinstance(get_codec('json'), JsonCodec)
+        assert isinstance(get_codec('msgpack'), TaggedCodec)
+        assert not get_codec('msgpack').legacy_json
+        assert get_codec('msgpack', legacy_json=True).legacy_json
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            get_codec('pickle')
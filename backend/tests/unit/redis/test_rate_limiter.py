@@ -0,0 +1,153 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.core.rate_limit import RateLimitMiddleware, default_rules
+from backend.core.security import SecurityService
+from backend.infrastructure.redis.rate_limiter import (
+    ApiRateLimiter,
+    LocalTokenBucket,
+    RateLimitRule,
+)
+from backend.infrastructure.redis.sliding_window import RateLimitResult
+
+
+class StubLimiter:
+    '''Вместо SlidingWindowRateLimiter: отвечает заданным образом.'''
+
+    def __init__(self, result=None, error=None, delay=0.0):
+        self.result = result
+        self.error = error
+        self.delay = delay
+        self.identities = []
+
+    async def hit(self, identity):
+        self.identities.append(identity)
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def make_limiter(stub):
+    limiter = ApiRateLimiter()
+    limiter._limiter = lambda rule: stub
+    return limiter
+
+
+RULE = RateLimitRule.route('upload', '/api/v0/cases/{case_id}/documents', 2)
+
+
+class TestRateLimitRule:
+
+    def test_route_pattern(self):
+        '''Параметры пути FastAPI сопоставляются с одним сегментом'''
+        assert RULE.matches('POST', '/api/v0/cases/5/documents')
+        assert not RULE.matches('POST', '/api/v0/cases/5/documents/1')
+
+    def test_default_rules_order(self):
+        '''Тяжелые маршруты получают свое правило, остальные - общее'''
+        middleware = RateLimitMiddleware(app=None, rules=default_rules())
+
+        assert middleware._match('POST', '/api/v0/cases/1/documents').name == 'upload'
+        assert middleware._match('GET', '/api/v0/cases/1/documents').name == 'api'
+        assert middleware._match('GET', '/api/v0/documents/1/download').name == (
+            'download'
+        )
+        assert middleware._match('GET', '/health') is None
+
+
+class TestApiRateLimiter:
+
+    def test_local_bucket(self):
+        '''Локальный бакет пропускает limit запросов, дальше - Retry-After'''
+        bucket = LocalTokenBucket(limit=2, window_seconds=60)
+
+        assert bucket.take().allowed
+        assert bucket.take().allowed
+        denied = bucket.take()
+        assert not denied.allowed
+        assert 0 < denied.retry_after <= 30
+
+    @pytest.mark.asyncio
+    async def test_redis_result_used(self):
+        '''Ответ Redis возвращается как есть'''
+        denied = RateLimitResult(allowed=False, count=2, retry_after=12)
+        limiter = make_limiter(StubLimiter(result=denied))
+
+        assert await limiter.hit(RULE, 'attorney:1') == denied
+
+    @pytest.mark.asyncio
+    async def test_fallback_on_error(self):
+        '''Ошибка Redis - локальный бакет, Redis временно не опрашивается'''
+        stub = StubLimiter(error=ConnectionError('down'))
+        limiter = make_limiter(stub)
+
+        results = [await limiter.hit(RULE, 'attorney:1') for _ in range(3)]
+
+        assert [r.allowed for r in results] == [True, True, False]
+        assert len(stub.identities) == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_on_timeout(self, monkeypatch):
+        '''Медленный Redis не задерживает запрос дольше таймаута'''
+        from backend.core.settings import settings
+
+        monkeypatch.setattr(settings, 'RATE_LIMIT_REDIS_TIMEOUT', 0.01)
+        limiter = make_limiter(StubLimiter(delay=1))
+
+        result = await asyncio.wait_for(limiter.hit(RULE, 'attorney:1'), 0.5)
+        assert result.allowed
+
+
+class TestRateLimitMiddleware:
+
+    @staticmethod
+    def make_client(limiter):
+        app = FastAPI()
+
+        @app.post('/api/v0/cases/{case_id}/documents')
+        async def upload(case_id: int):
+            return {'ok': True}
+
+        app.add_middleware(RateLimitMiddleware, rules=[RULE], limiter=limiter)
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url='http://test'
+        )
+
+    @pytest.mark.asyncio
+    async def test_429_with_retry_after(self):
+        '''Превышение лимита - 429 и Retry-After, запрос не доходит до роута'''
+        limiter = make_limiter(StubLimiter(error=ConnectionError('down')))
+
+        async with self.make_client(limiter) as client:
+            statuses = [
+                (await client.post('/api/v0/cases/1/documents')).status_code
+                for _ in range(2)
+            ]
+            denied = await client.post('/api/v0/cases/1/documents')
+
+        assert statuses == [200, 200]
+        assert denied.status_code == 429
+        assert int(denied.headers['Retry-After']) >= 1
+
+    @pytest.mark.asyncio
+    async def test_identity_from_access_token(self):
+        '''Запрос с access token засчитывается юристу, без токена - IP'''
+        stub = StubLimiter(result=RateLimitResult(True, 1, 0))
+        token = SecurityService.create_access_token('42')
+
+        async with self.make_client(make_limiter(stub)) as client:
+            await client.post(
+                '/api/v0/cases/1/documents',
+                headers={'Authorization': f'Bearer {token}'},
+            )
+            await client.post(
+                '/api/v0/cases/1/documents',
+                headers={'Authorization': 'Bearer forged'},
+            )
+
+        assert stub.identities[0] == 'attorney:42'
+        assert stub.identities[1].startswith('ip:')
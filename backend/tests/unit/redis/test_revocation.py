@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from backend.infrastructure.redis.client import RedisClient
+from backend.infrastructure.redis.keys import RedisKeys
+from backend.infrastructure.redis.revocation import BloomFilter, RevocationRegistry
+from backend.tests.fixtures.redis import FakeRedisBackend
+
+
+class FakePubSub:
+    '''Подписка без Redis: сообщения кладутся в очередь вручную.'''
+
+    def __init__(self):
+        self.messages = asyncio.Queue()
+        self.channels = []
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def get_message(self, ignore_subscribe_messages, timeout):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        return None
+
+
+@pytest.fixture
+def backend():
+    backend = FakeRedisBackend()
+    backend.pubsub_instance = FakePubSub()
+    backend.pubsub = lambda: backend.pubsub_instance
+    return backend
+
+
+@pytest.fixture
+def registry(backend):
+    client = RedisClient()
+    client._client = backend
+    return RevocationRegistry(client=client, reconnect_delay=0.01)
+
+
+async def wait_synced(registry):
+    for _ in range(100):
+        if registry.synced:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('Подписка не активировалась')
+
+
+class TestBloomFilter:
+
+    def test_no_false_negatives(self):
+        '''Добавленные элементы всегда находятся'''
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f'token-{i}' for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate(self):
+        '''Доля ложных срабатываний близка к расчетной'''
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f'token-{i}')
+
+        false_positives = sum(f'other-{i}' in bloom for i in range(10_000))
+        assert false_positives < 300
+
+
+class TestRevocationRegistry:
+
+    @pytest.mark.asyncio
+    async def test_unsynced_checks_redis(self, registry, backend):
+        '''Пока подписки нет, проверка идет в Redis'''
+        await registry.revoke('abc', ttl=60)
+
+        assert await registry.is_revoked('abc') is True
+        assert await registry.is_revoked('other') is False
+        assert registry.metrics()['redis_checks'] == 2
+
+    @pytest.mark.asyncio
+    async def test_synced_checks_locally(self, registry, backend):
+        '''С активной подпиской неотозванный токен проверяется без Redis'''
+        await registry.revoke('abc', ttl=60)
+        await registry.start()
+        try:
+            await wait_synced(registry)
+
+            assert await registry.is_revoked('other') is False
+            assert await registry.is_revoked('abc') is True
+            assert registry.metrics()['local_checks'] == 1
+            assert registry.metrics()['redis_checks'] == 1
+        finally:
+            await registry.stop()
+
+    @pytest.mark.asyncio
+    async def test_remote_revocation(self, registry, backend):
+        '''Отзыв из другого процесса приходит сообщением и попадает в фильтр'''
+        await registry.start()
+        try:
+            await wait_synced(registry)
+
+            await backend.setex(RedisKeys.token_blacklist('remote'), 60, '1')
+            await backend.pubsub_instance.messages.put({'data': 'remote'})
+            await asyncio.sleep(0.05)
+
+            assert await registry.is_revoked('remote') is True
+            assert registry.metrics()['revoked'] == 1
+        finally:
+            await registry.stop()
+
+    @pytest.mark.asyncio
+    async def test_reload_skips_expired(self, registry, backend):
+        '''Перестроение фильтра берет только не истекшие отзывы'''
+        await backend.zadd(RedisKeys.TOKEN_REVOCATIONS, {'old': 1, 'new': 2e12})
+
+        await registry.reload()
+
+        assert registry.metrics()['revoked'] == 1
@@ -0,0 +1,100 @@
+import pytest
+
+from backend.infrastructure.redis.sliding_window import (
+    SLIDING_WINDOW_SCRIPT,
+    SlidingWindowRateLimiter,
+)
+
+
+class StubRedisClient:
+    '''Записывает вызовы и возвращает заранее заданные ответы.'''
+
+    def __init__(self, script_result=None, pttl=-2):
+        self.script_result = script_result
+        self._pttl = pttl
+        self.calls = []
+
+    async def eval_script(self, source, keys, args):
+        self.calls.append(('eval_script', source, keys, args))
+        return self.script_result
+
+    async def pttl(self, key):
+        self.calls.append(('pttl', key))
+        return self._pttl
+
+    async def delete(self, key):
+        self.calls.append(('delete', key))
+        return 1
+
+
+def make_limiter(client, lockout_seconds=None):
+    return SlidingWindowRateLimiter(
+        'login',
+        limit=4,
+        window_seconds=900,
+        lockout_seconds=lockout_seconds,
+        client=client,
+    )
+
+
+class TestSlidingWindowRateLimiter:
+
+    @pytest.mark.asyncio
+    async def test_hit_is_single_script_call(self):
+        '''hit() - один вызов скрипта с ключами журнала и блокировки'''
+        client = StubRedisClient(script_result=[1, 2, 0])
+        limiter = make_limiter(client, lockout_seconds=600)
+
+        result = await limiter.hit('a@example.com')
+
+        assert result.allowed is True
+        assert result.count == 2
+        assert result.retry_after == 0
+        assert len(client.calls) == 1
+        _, source, keys, args = client.calls[0]
+        assert source == SLIDING_WINDOW_SCRIPT
+        assert keys == [
+            'rate_limit:login:a@example.com',
+            'rate_limit_lockout:login:a@example.com',
+        ]
+        assert args[1:4] == [900_000, 4, 600_000]
+
+    @pytest.mark.asyncio
+    async def test_hit_unique_members(self):
+        '''Одновременные события записываются разными элементами ZSET'''
+        client = StubRedisClient(script_result=[1, 1, 0])
+        limiter = make_limiter(client)
+
+        await limiter.hit('a@example.com')
+        await limiter.hit('a@example.com')
+
+        members = {call[3][4] for call in client.calls}
+        assert len(members) == 2
+
+    @pytest.mark.asyncio
+    async def test_hit_denied(self):
+        '''Отказ возвращает время до следующей попытки в секундах'''
+        client = StubRedisClient(script_result=[0, 4, 1500])
+        limiter = make_limiter(client)
+
+        result = await limiter.hit('a@example.com')
+
+        assert result.allowed is False
+        assert result.retry_after == 1.5
+
+    @pytest.mark.asyncio
+    async def test_locked_for(self):
+        '''locked_for() - PTTL ключа блокировки, отсутствие ключа = 0'''
+        locked = make_limiter(StubRedisClient(pttl=30_000), lockout_seconds=60)
+        free = make_limiter(StubRedisClient(pttl=-2), lockout_seconds=60)
+
+        assert await locked.locked_for('a@example.com') == 30
+        assert await free.locked_for('a@example.com') == 0
+
+    @pytest.mark.asyncio
+    async def test_reset_deletes_log(self):
+        '''reset() удаляет журнал событий'''
+        client = StubRedisClient()
+        await make_limiter(client).reset('a@example.com')
+
+        assert client.calls == [('delete', 'rate_limit:login:a@example.com')]
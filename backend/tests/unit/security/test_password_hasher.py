@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from backend.core.exceptions import ServiceBusyException
+from backend.core.password_hasher import PasswordHasher
+
+
+class TestPasswordHasher:
+
+    @pytest.fixture
+    def hasher(self):
+        hasher = PasswordHasher(
+            max_workers=2, max_pending=4, queue_timeout=5.0, rounds=4
+        )
+        yield hasher
+        hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self, hasher):
+        '''Хеш проверяется исходным паролем и не проверяется чужим'''
+        hashed = await hasher.hash('password123')
+
+        assert hashed != 'password123'
+        assert await hasher.verify('password123', hashed) is True
+        assert await hasher.verify('wrong-password', hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_verify_invalid_hash(self, hasher):
+        '''Повреждённый хеш не роняет проверку, а возвращает False'''
+        assert await hasher.verify('password123', 'not-a-bcrypt-hash') is False
+
+    @pytest.mark.asyncio
+    async def test_metrics_after_calls(self, hasher):
+        '''Метрики учитывают выполненные задачи и латентность'''
+        await asyncio.gather(*[hasher.hash('password123') for _ in range(3)])
+
+        metrics = hasher.metrics()
+        assert metrics['completed'] == 3
+        assert metrics['in_flight'] == 0
+        assert metrics['queue_depth'] == 0
+        assert metrics['latency_ms_max'] > 0
+
+    @pytest.mark.asyncio
+    async def test_backpressure_rejects_when_queue_is_full(self):
+        '''При переполнении очереди лишние задачи получают ServiceBusyException'''
+        hasher = PasswordHasher(
+            max_workers=1, max_pending=1, queue_timeout=0.001, rounds=12
+        )
+        try:
+            results = await asyncio.gather(
+                *[hasher.hash('password123') for _ in range(3)],
+                return_exceptions=True,
+            )
+        finally:
+            hasher.shutdown()
+
+        rejected = [r for r in results if isinstance(r, ServiceBusyException)]
+        assert len(rejected) >= 1
+        assert hasher.metrics()['rejected'] == len(rejected)
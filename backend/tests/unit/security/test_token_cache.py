@@ -0,0 +1,81 @@
+import time
+from datetime import timedelta
+
+import pytest
+
+from backend.core import security
+from backend.core.security import SecurityService
+from backend.core.token_cache import TokenClaimsCache, token_hash
+
+
+class TestTokenClaimsCache:
+
+    def test_hit_until_exp(self):
+        '''Claims выдаются до exp, истекшие - промах'''
+        cache = TokenClaimsCache(max_size=10)
+        cache.put('a', {'sub': '1', 'exp': time.time() + 60})
+        cache.put('b', {'sub': '2', 'exp': time.time() - 1})
+
+        assert cache.get('a')['sub'] == '1'
+        assert cache.get('b') is None
+        assert cache.metrics() == {'size': 1, 'hits': 1, 'misses': 1}
+
+    def test_lru_bound(self):
+        '''Размер ограничен, вытесняется давно не использованный токен'''
+        cache = TokenClaimsCache(max_size=2)
+        exp = time.time() + 60
+        cache.put('a', {'exp': exp})
+        cache.put('b', {'exp': exp})
+        cache.get('a')
+        cache.put('c', {'exp': exp})
+
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.get('c') is not None
+
+    def test_without_exp_not_cached(self):
+        '''Токен без exp не кэшируется'''
+        cache = TokenClaimsCache(max_size=10)
+        cache.put('a', {'sub': '1'})
+
+        assert cache.get('a') is None
+
+
+class TestDecodeTokenCache:
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        cache = TokenClaimsCache(max_size=10)
+        monkeypatch.setattr(security, 'token_claims_cache', cache)
+        return cache
+
+    def test_repeated_decode_skips_verification(self, monkeypatch, fresh_cache):
+        '''Повторная проверка того же токена не вызывает jwt.decode'''
+        token = SecurityService.create_access_token('42')
+        calls = []
+        decode = security.jwt.decode
+        monkeypatch.setattr(
+            security.jwt,
+            'decode',
+            lambda *args, **kwargs: calls.append(1) or decode(*args, **kwargs),
+        )
+
+        first = SecurityService.decode_token(token)
+        second = SecurityService.decode_token(token)
+
+        assert first == second
+        assert first['sub'] == '42'
+        assert len(calls) == 1
+        assert fresh_cache.get(token_hash(token)) is not None
+
+    def test_invalid_token_not_cached(self, fresh_cache):
+        '''Невалидный и истекший токены не попадают в кэш'''
+        expired = SecurityService.create_access_token(
+            '42', expires_delta=timedelta(seconds=-1)
+        )
+
+        for token in (expired, 'forged'):
+            with pytest.raises(ValueError):
+                SecurityService.decode_token(token)
+
+        assert fresh_cache.metrics()['size'] == 0
@@ -0,0 +1,132 @@
+import hashlib
+
+import pytest
+
+from backend.core.exceptions import RangeNotSatisfiableException, ValidationException
+from backend.core.http_range import content_range, parse_range_header
+from backend.infrastructure.repositories.local_storage import LocalFileStorage
+from backend.infrastructure.tools.file_metadata import MIME_SNIFF_BYTES
+
+
+@pytest.mark.parametrize(
+    'header, expected',
+    [
+        (None, None),
+        ('bytes=0-99', (0, 99)),
+        ('bytes=100-', (100, 999)),
+        ('bytes=-100', (900, 999)),
+        ('bytes=900-5000', (900, 999)),
+        ('bytes=-5000', (0, 999)),
+        ('bytes=0-9,20-29', None),  # несколько диапазонов - весь файл
+        ('items=0-9', None),
+        ('bytes=abc', None),
+        ('bytes=50-10', None),
+    ],
+)
+def test_parse_range_header(header, expected):
+    assert parse_range_header(header, 1000) == expected
+
+
+@pytest.mark.parametrize('header', ['bytes=1000-', 'bytes=2000-3000', 'bytes=-0'])
+def test_parse_range_header_unsatisfiable(header):
+    with pytest.raises(RangeNotSatisfiableException):
+        parse_range_header(header, 1000)
+
+
+@pytest.mark.parametrize('header', ['bytes=-100', 'bytes=0-', 'bytes=0-99'])
+def test_parse_range_header_empty_file(header):
+    with pytest.raises(RangeNotSatisfiableException):
+        parse_range_header(header, 0)
+
+
+def test_content_range():
+    assert content_range(0, 99, 1000) == 'bytes 0-99/1000'
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalFileStorage(base_path=str(tmp_path))
+
+
+async def collect(iterator):
+    return [chunk async for chunk in iterator]
+
+
+async def test_iter_chunks_whole_file(storage):
+    content = bytes(range(256)) * 40
+    await storage.save_file('cases/1/file.bin', content)
+
+    chunks = await collect(storage.iter_chunks('cases/1/file.bin', chunk_size=1000))
+
+    assert b''.join(chunks) == content
+    assert max(len(c) for c in chunks) == 1000
+    assert await storage.get_size('cases/1/file.bin') == len(content)
+
+
+async def test_iter_chunks_range(storage):
+    content = bytes(range(256)) * 40
+    await storage.save_file('file.bin', content)
+
+    chunks = await collect(
+        storage.iter_chunks('file.bin', start=100, end=2599, chunk_size=1000)
+    )
+
+    assert b''.join(chunks) == content[100:2600]
+    assert [len(c) for c in chunks] == [1000, 1000, 500]
+
+
+async def test_iter_chunks_missing_file(storage):
+    with pytest.raises(FileNotFoundError):
+        await collect(storage.iter_chunks('missing.bin'))
+
+
+def test_local_path(storage, tmp_path):
+    assert storage.local_path('cases/1/file.bin') == tmp_path / 'cases/1/file.bin'
+
+
+async def stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_save_stream(storage, tmp_path):
+    chunks = [b'%PDF-1.4\n' + b'a' * 5000, b'b' * 5000, b'c' * 10]
+    content = b''.join(chunks)
+
+    stored = await storage.save_stream('cases/7/doc.pdf', stream(*chunks))
+
+    assert stored.path == 'cases/7/doc.pdf'
+    assert stored.size == len(content)
+    assert stored.sha256 == hashlib.sha256(content).hexdigest()
+    assert stored.head == content[:MIME_SNIFF_BYTES]
+    assert (tmp_path / 'cases/7/doc.pdf').read_bytes() == content
+    assert not list((tmp_path / LocalFileStorage.TMP_DIR).iterdir())
+
+
+async def test_save_stream_too_large(storage, tmp_path):
+    with pytest.raises(ValidationException):
+        await storage.save_stream(
+            'cases/7/big.bin', stream(b'x' * 600, b'x' * 600), max_size=1000
+        )
+
+    assert not (tmp_path / 'cases/7/big.bin').exists()
+    assert not list((tmp_path / LocalFileStorage.TMP_DIR).iterdir())
+
+
+async def test_save_stream_empty(storage, tmp_path):
+    with pytest.raises(ValidationException):
+        await storage.save_stream('cases/7/empty.bin', stream())
+
+    assert not (tmp_path / 'cases/7/empty.bin').exists()
+
+
+async def test_stage_and_promote_skips_duplicate(storage, tmp_path):
+    first = await storage.stage_stream(stream(b'same content'))
+    second = await storage.stage_stream(stream(b'same ', b'content'))
+
+    assert first.sha256 == second.sha256
+    assert await storage.promote(first.path, 'blobs/x') is True
+    assert await storage.promote(second.path, 'blobs/x') is False
+
+    assert (tmp_path / 'blobs/x').read_bytes() == b'same content'
+    assert not list((tmp_path / LocalFileStorage.TMP_DIR).iterdir())
@@ -0,0 +1,79 @@
+import zipfile
+from io import BytesIO
+
+from reportlab.pdfgen import canvas
+
+from backend.infrastructure.tools.text_extractor import (
+    DOCX_MIME_TYPE,
+    PDF_MIME_TYPE,
+    TextExtractor,
+)
+
+
+def make_pdf(*pages):
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for text in pages:
+        pdf.drawString(72, 720, text)
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def make_docx(*paragraphs):
+    ns = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+    body = ''.join(
+        f'<w:p><w:r><w:t>{p[:5]}</w:t></w:r><w:r><w:t>{p[5:]}</w:t></w:r></w:p>'
+        for p in paragraphs
+    )
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr(
+            'word/document.xml',
+            f'<w:document xmlns:w="{ns}"><w:body>{body}</w:body></w:document>',
+        )
+    return buffer.getvalue()
+
+
+def test_extract_pdf(tmp_path):
+    path = tmp_path / 'contract.pdf'
+    path.write_bytes(make_pdf('Lease agreement', 'Second page'))
+
+    text = TextExtractor().extract(path, PDF_MIME_TYPE, 'contract.pdf')
+
+    assert 'Lease agreement' in text
+    assert 'Second page' in text
+
+
+def test_extract_docx_joins_runs():
+    source = BytesIO(make_docx('Договор аренды', 'Срок действия'))
+
+    text = TextExtractor().extract(source, DOCX_MIME_TYPE, 'contract.docx')
+
+    assert text.splitlines() == ['Договор аренды', 'Срок действия']
+
+
+def test_extract_plain_text_cp1251_fallback():
+    source = BytesIO('Исковое заявление'.encode('cp1251'))
+
+    assert TextExtractor().extract(source, 'text/plain') == 'Исковое заявление'
+
+
+def test_extract_limits_length():
+    source = BytesIO(b'a' * 1000)
+
+    assert TextExtractor(max_chars=100).extract(source, 'text/plain') == 'a' * 100
+
+
+def test_extract_plain_limit_splits_utf8_char():
+    # 11 * 4 = 44 байта - граница посередине двухбайтового символа
+    source = BytesIO(('Договор аренды ' * 20).encode('utf-8'))
+    assert TextExtractor(max_chars=11).extract(source, 'text/plain') == 'Договор аре'
+
+
+def test_unsupported_type():
+    extractor = TextExtractor()
+
+    assert not extractor.supports('image/png', 'scan.png')
+    assert extractor.extract(BytesIO(b'\x89PNG'), 'image/png', 'scan.png') == ''
+    assert extractor.supports(None, 'notes.TXT')
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.infrastructure.tools.after_commit import (
+    AFTER_COMMIT_KEY,
+    AfterCommitHooks,
+    after_commit,
+)
+
+
+class TestAfterCommitHooks:
+
+    @pytest.mark.asyncio
+    async def test_deferred_until_run(self):
+        '''В UnitOfWork действие откладывается до commit и выполняется один раз'''
+        calls = []
+        session = SimpleNamespace(info={AFTER_COMMIT_KEY: AfterCommitHooks()})
+
+        async def invalidate():
+            calls.append('invalidate')
+
+        await after_commit(session, invalidate)
+        assert calls == []
+
+        await session.info[AFTER_COMMIT_KEY].run()
+        await session.info[AFTER_COMMIT_KEY].run()
+        assert calls == ['invalidate']
+
+    @pytest.mark.asyncio
+    async def test_clear_on_rollback(self):
+        '''Откат отменяет накопленные действия'''
+        calls = []
+        hooks = AfterCommitHooks()
+        session = SimpleNamespace(info={AFTER_COMMIT_KEY: hooks})
+
+        async def invalidate():
+            calls.append('invalidate')
+
+        await after_commit(session, invalidate)
+        hooks.clear()
+        await hooks.run()
+
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_errors_do_not_stop_others(self):
+        '''Ошибка одного действия не мешает остальным'''
+        calls = []
+        hooks = AfterCommitHooks()
+
+        async def failing():
+            raise ConnectionError('redis down')
+
+        async def invalidate():
+            calls.append('invalidate')
+
+        hooks.add(failing)
+        hooks.add(invalidate)
+        await hooks.run()
+
+        assert calls == ['invalidate']
+        assert len(hooks) == 0
+
+    @pytest.mark.asyncio
+    async def test_session_without_uow(self):
+        '''Вне UnitOfWork действие выполняется сразу'''
+        calls = []
+
+        async def invalidate():
+            calls.append('invalidate')
+
+        await after_commit(SimpleNamespace(info={}), invalidate)
+        assert calls == ['invalidate']
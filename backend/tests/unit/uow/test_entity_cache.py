@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+from backend.domain.entities.auxiliary import CaseStatus
+from backend.domain.entities.case import Case
+from backend.domain.entities.event import Event
+from backend.infrastructure.tools.entity_cache import (
+    SESSION_INFO_KEY,
+    EntityCache,
+    entity_cache,
+)
+
+
+def make_case(id: int = 1) -> Case:
+    return Case(
+        id=id,
+        name='Дело о краже',
+        client_id=10,
+        attorney_id=20,
+        description='Описание дела',
+        status=CaseStatus.IN_PROGRESS,
+    )
+
+
+class TestEntityCache:
+
+    def test_miss_then_hit(self):
+        '''Первое чтение - промах, после put - попадание'''
+        cache = EntityCache()
+
+        assert cache.get(Case, 1) is None
+        cache.put(make_case())
+
+        assert cache.get(Case, 1) == make_case()
+        assert cache.metrics() == {'size': 1, 'hits': 1, 'misses': 1}
+
+    def test_returns_copies(self):
+        '''Изменение полученной сущности не меняет закэшированную'''
+        cache = EntityCache()
+        case = cache.put(make_case())
+        case.name = 'Изменено до сохранения'
+
+        cached = cache.get(Case, 1)
+        cached.status = CaseStatus.COMPLETED
+
+        again = cache.get(Case, 1)
+        assert again.name == 'Дело о краже'
+        assert again.status == CaseStatus.IN_PROGRESS
+
+    def test_keys_include_entity_type(self):
+        '''Сущности разных типов с одинаковым ID не смешиваются'''
+        cache = EntityCache()
+        cache.put(make_case())
+
+        assert cache.get(Event, 1) is None
+
+    def test_evict_and_clear(self):
+        '''evict убирает одну запись, evict_all - тип целиком, clear - все'''
+        cache = EntityCache()
+        cache.put(make_case(1))
+        cache.put(make_case(2))
+
+        cache.evict(Case, 1)
+        assert cache.get(Case, 1) is None
+        assert cache.get(Case, 2) is not None
+
+        cache.evict_all(Case)
+        assert cache.get(Case, 2) is None
+
+        cache.put(make_case(3))
+        cache.clear()
+        assert cache.metrics()['size'] == 0
+
+    def test_total_metrics(self):
+        '''Суммарные счетчики растут по всем экземплярам кэша'''
+        before = EntityCache.total_metrics()
+
+        EntityCache().get(Case, 1)
+        second = EntityCache()
+        second.put(make_case())
+        second.get(Case, 1)
+
+        after = EntityCache.total_metrics()
+        assert after['hits'] - before['hits'] == 1
+        assert after['misses'] - before['misses'] == 1
+
+    def test_session_without_uow(self):
+        '''Вне UnitOfWork кэша нет: put ничего не хранит, get всегда промах'''
+        session = SimpleNamespace(info={})
+        cache = entity_cache(session)
+
+        cache.put(make_case())
+        assert cache.get(Case, 1) is None
+
+        uow_cache = EntityCache()
+        session.info[SESSION_INFO_KEY] = uow_cache
+        assert entity_cache(session) is uow_cache